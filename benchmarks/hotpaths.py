@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+btools热点路径基准测试
+
+在5个独立进程中运行全部基准测试，合并后与保存的基准结果比较。
+变慢超过阈值和进程间噪声中的较大者时判定为回归，出现回归或基准结果文件不存在时退出码为1：
+
+    python benchmarks/hotpaths.py
+
+在基准机器（如CI节点）上生成或更新基准结果：
+
+    python benchmarks/hotpaths.py --save-baseline
+
+本地快速运行、不做比较：
+
+    python benchmarks/hotpaths.py --baseline "" --processes 1
+
+只运行部分基准测试：
+
+    python benchmarks/hotpaths.py -k "cache.*"
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from btools import (  # noqa: E402
+    CacheUtils,
+    CollectionUtils,
+    CryptoUtils,
+    CSVHandler,
+    DateTimeUtils,
+    DictUtil,
+    HTTPClient,
+    JSONUtils,
+    PerformanceTestUtils,
+)
+
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+suite = PerformanceTestUtils.BenchmarkSuite("btools hot paths")
+
+# 缓存
+memory_cache = CacheUtils.create_memory_cache(max_entries=10000)
+sharded_cache = CacheUtils.create_sharded_memory_cache(max_entries=10000)
+for i in range(1000):
+    memory_cache.set(f"key{i}", {"id": i})
+    sharded_cache.set(f"key{i}", {"id": i})
+
+suite.add("cache.memory.get_hit", memory_cache.get, "key500")
+suite.add("cache.memory.get_miss", memory_cache.get, "missing")
+suite.add("cache.memory.set", memory_cache.set, "key500", {"id": 500})
+suite.add("cache.sharded.get_hit", sharded_cache.get, "key500")
+suite.add("cache.sharded.set", sharded_cache.set, "key500", {"id": 500})
+
+# JSON
+document = {
+    "id": 1,
+    "name": "张三",
+    "tags": ["a", "b", "c"],
+    "profile": {"age": 30, "address": {"city": "上海", "zip": "200000"}},
+    "orders": [{"id": i, "amount": i * 1.5, "paid": i % 2 == 0} for i in range(20)],
+}
+suite.add("json.to_json", JSONUtils.to_json, document)
+suite.add("json.flatten", JSONUtils.flatten, document)
+
+# CSV
+csv_path = os.path.join(tempfile.mkdtemp(prefix="btools-bench-"), "data.csv")
+with open(csv_path, "w", encoding="utf-8", newline="") as f:
+    f.write("id,name,amount,created\n")
+    for i in range(1000):
+        f.write(f"{i},user{i},{i * 1.5},2024-01-{i % 28 + 1:02d}\n")
+suite.add("csv.read_csv_1000_rows", CSVHandler.read_csv, csv_path)
+
+# 日期时间
+suite.add(
+    "datetime.parse_auto_iso", DateTimeUtils.parse_datetime_auto, "2024-01-15 10:30:00"
+)
+suite.add("datetime.parse_auto_slash", DateTimeUtils.parse_datetime_auto, "2024/01/15")
+suite.add("datetime.parse_auto_compact", DateTimeUtils.parse_datetime_auto, "20240115")
+
+# 字典与集合
+nested = {"a": {"b": {"c": {"d": 1}}}}
+records = [{"id": i, "group": i % 10} for i in range(1000)]
+items = list(range(1000)) * 2
+suite.add("dict.get_nested", DictUtil.get_nested, nested, ["a", "b", "c", "d"])
+suite.add("dict.merge", DictUtil.merge, {"a": 1, "b": 2}, {"b": 3, "c": 4}, {"d": 5})
+suite.add("dict.group_by_1000", DictUtil.group_by, records, lambda r: r["group"])
+suite.add("collection.distinct_2000", CollectionUtils.distinct, items)
+suite.add("collection.chunk_2000", CollectionUtils.chunk, items, 100)
+
+# 哈希
+payload = "x" * 1024
+suite.add("crypto.md5_1k", CryptoUtils.md5, payload)
+suite.add("crypto.sha256_1k", CryptoUtils.sha256, payload)
+suite.add("crypto.hmac_sha256_1k", CryptoUtils.hmac_sha256, "secret", payload)
+
+# HTTP客户端URL构建
+http_client = HTTPClient("https://api.example.com/v1")
+suite.add(
+    "http.build_url",
+    http_client._build_url,
+    "/users/{user_id}/orders/{order_id}",
+    {"user_id": 42, "order_id": 7, "page": 2, "size": 50},
+)
+
+
+if __name__ == "__main__":
+    sys.exit(suite.main(baseline_file=BASELINE_FILE, processes=5))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+btools导入耗时基准测试
+
+在子进程中以 `python -X importtime` 执行导入语句，统计语句本身引入的模块耗时
+（扣除解释器启动时已经加载的模块），并检查是否加载了不应在导入阶段加载的重量级依赖。
+超出预算或加载了重量级依赖时退出码为1：
+
+    python benchmarks/import_time.py
+
+指定导入语句和预算（毫秒）：
+
+    python benchmarks/import_time.py -s "from btools import StringUtils" --budget 100
+
+显示耗时最多的模块：
+
+    python benchmarks/import_time.py --top 20
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# `import btools` 不应加载的第三方依赖，这些依赖只在首次使用对应工具类时导入
+HEAVY_MODULES = [
+    "PIL",
+    "appium",
+    "docker",
+    "docx",
+    "fastapi",
+    "faker",
+    "jinja2",
+    "kubernetes",
+    "numpy",
+    "openpyxl",
+    "paramiko",
+    "playwright",
+    "psutil",
+    "pyzbar",
+    "qrcode",
+    "redis",
+    "requests",
+    "selenium",
+    "aiohttp",
+    "httpx",
+]
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+
+def run_importtime(statement: str) -> List[Tuple[str, int, int, int]]:
+    """
+    在子进程中执行语句并解析 -X importtime 的输出
+
+    Args:
+        statement: 要执行的Python语句
+
+    Returns:
+        List[Tuple[str, int, int, int]]: 模块名、嵌套层级、自身耗时和累计耗时（微秒）
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (ROOT, env.get("PYTHONPATH")) if path
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"执行失败: {statement}\n{result.stderr}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, len(indent) // 2, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure(statement: str, repeat: int = 5) -> Dict[str, object]:
+    """
+    测量导入语句的耗时，取多次运行中的最小值
+
+    Args:
+        statement: 要执行的Python语句
+        repeat: 运行次数
+
+    Returns:
+        Dict[str, object]: 总耗时（毫秒）、新加载的模块及其自身耗时、加载的重量级依赖
+    """
+    startup = {name for name, _, _, _ in run_importtime("pass")}
+    best_total: Optional[float] = None
+    modules: Dict[str, int] = {}
+    for _ in range(repeat):
+        entries = [
+            entry for entry in run_importtime(statement) if entry[0] not in startup
+        ]
+        total = sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+        if best_total is None or total < best_total:
+            best_total = total
+            modules = {name: self_us for name, _, self_us, _ in entries}
+    heavy = sorted(name for name in modules if name.split(".", 1)[0] in HEAVY_MODULES)
+    return {
+        "total_ms": (best_total or 0) / 1000,
+        "modules": modules,
+        "heavy": heavy,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行入口
+
+    Args:
+        argv: 命令行参数
+
+    Returns:
+        int: 退出码，超出预算或加载了重量级依赖时为1
+    """
+    parser = argparse.ArgumentParser(description="btools导入耗时基准测试")
+    parser.add_argument("-s", "--statement", default="import btools", help="导入语句")
+    parser.add_argument(
+        "--budget", type=float, default=50.0, help="允许的最大导入耗时（毫秒）"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="运行次数，取最小值")
+    parser.add_argument("--top", type=int, default=10, help="显示自身耗时最多的模块数")
+    args = parser.parse_args(argv)
+
+    result = measure(args.statement, args.repeat)
+    modules = result["modules"]
+    print(f"{args.statement}: {result['total_ms']:.1f} ms, {len(modules)} 个模块")
+    for name, self_us in sorted(modules.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    failed = False
+    if result["heavy"]:
+        print(f"加载了重量级依赖: {', '.join(result['heavy'])}")
+        failed = True
+    if result["total_ms"] > args.budget:
+        print(f"超出预算: {result['total_ms']:.1f} ms > {args.budget:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
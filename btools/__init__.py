@@ -1,81 +1,15 @@
 # btools package
 __version__ = "1.0.0"
-# 导出核心模块
-from .core import (
-    AIUtils,
-    AnnotationUtil,
-    APIErrorResponse,
-    APIResponse,
-    AppiumUtils,
-    ArrayUtils,
-    AssertUtil,
-    BeanUtils,
-    CacheUtils,
-    CaptchaUtils,
-    ClassUtils,
-    ClipboardUtils,
-    CollectionUtils,
-    CompressUtils,
-    Config,
-    ContractTestUtils,
-    Converter,
-    CryptoUtils,
-    CSVHandler,
-    DatabaseUtils,
-    DateTimeUtils,
-    DecoratorUtil,
-    DictUtil,
-    DistributionUtils,
-    DockerUtils,
-    EncodeUtils,
-    EnumUtil,
-    ExcelHandler,
-    ExceptionUtils,
-    FakerUtils,
-    FastAPIUtils,
-    FileUtils,
-    GitUtils,
-    HtmlUtil,
-    HTTPClient,
-    I18nUtils,
-    ImageUtils,
-    IOUtils,
-    JSONPathUtils,
-    JSONUtils,
-    KubernetesUtils,
-    LoadTestUtils,
-    Logger,
-    MailUtils,
-    MathUtils,
-    MockUtils,
-    NetUtils,
-    PackagingUtils,
-    PerformanceTestUtils,
-    PlaywrightUtils,
-    ProjectUtils,
-    QrCodeUtils,
-    RandomUtil,
-    ReflectUtils,
-    RegexUtils,
-    ReleaseUtils,
-    ResourceUtils,
-    RuntimeUtil,
-    ScheduleUtils,
-    SeleniumUtils,
-    SSHClient,
-    StringUtils,
-    SystemUtils,
-    TemplateUtils,
-    ThreadUtils,
-    TypeUtils,
-    Validator,
-    XmlUtils,
-)
+# 导出核心模块，各类在首次访问时才导入（见 btools.core）
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
 
 __all__ = [
     "Logger",
     "Config",
     "HTTPClient",
+    "AsyncHTTPClient",
     "SSHClient",
     "CSVHandler",
     "ExcelHandler",
@@ -100,6 +34,9 @@ __all__ = [
     "BeanUtils",
     "ThreadUtils",
     "ScheduleUtils",
+    "MetricsUtils",
+    "RateLimitUtils",
+    "RateLimitError",
     "StringUtils",
     "CollectionUtils",
     "ArrayUtils",
@@ -142,3 +79,8 @@ __all__ = [
     "MockUtils",
     "ContractTestUtils",
 ]
+
+__getattr__, __dir__ = attach(__name__, dict.fromkeys(__all__, ".core"))
+
+if TYPE_CHECKING:
+    from .core import *  # noqa: F401,F403
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+包级别的延迟导入（PEP 562）
+
+包的 __init__ 只登记导出名称与所在模块的对应关系，首次访问某个名称时才导入对应模块，
+导入结果写回包的命名空间，之后的访问不再经过 __getattr__。
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def attach(
+    package: str, exports: Dict[str, str], optional: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    为包生成模块级的 __getattr__ 和 __dir__
+
+    Args:
+        package: 包名，一般传入 __name__
+        exports: 导出名称到模块的映射，模块可以是相对包的相对路径，如 ".basic.stringutils"
+        optional: 依赖可选第三方库的名称，导入失败时返回None而不是抛出ImportError
+
+    Returns:
+        Tuple[Callable, Callable]: __getattr__ 和 __dir__ 函数
+    """
+    optional = frozenset(optional)
+
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        try:
+            value = getattr(importlib.import_module(module_name, package), name)
+        except ImportError:
+            if name not in optional:
+                raise
+            value = None
+        # 写回包的命名空间，后续访问直接命中
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
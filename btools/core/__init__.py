@@ -1,108 +1,175 @@
 # Core module
-# 基础工具类
-from .basic.annotationutils import AnnotationUtil
-from .basic.arrayutils import ArrayUtils
-from .basic.assertutils import AssertUtil
-from .basic.beanutils import BeanUtils
-from .basic.classutils import ClassUtils
-from .basic.clipboardutils import ClipboardUtils
-from .basic.collectionutils import CollectionUtils
-from .basic.convertutils import Converter
-from .basic.decoratorutils import DecoratorUtil
-from .basic.dictutils import DictUtil
-from .basic.enumutils import EnumUtil
-from .basic.exceptionutils import ExceptionUtils
-from .basic.htmlutils import HtmlUtil
-from .basic.mathutils import MathUtils
-from .basic.randomutils import RandomUtil
-from .basic.reflectutils import ReflectUtils
-from .basic.resourceutils import ResourceUtils
-from .basic.runtimeutils import RuntimeUtil
-from .basic.stringutils import StringUtils
-from .basic.typeutils import TypeUtils
-from .basic.validatorutils import Validator
-from .data.cryptoutils import CryptoUtils
-from .data.csvutils import CSVHandler
-from .data.databaseutils import DatabaseUtils
-from .data.datetimeutils import DateTimeUtils
-from .data.encodeutils import EncodeUtils
-from .data.excelutils import ExcelHandler
+# 导出的类在首次访问时才导入对应模块，`import btools` 不会加载任何第三方依赖
+from typing import TYPE_CHECKING
 
-# 数据处理类
-from .data.fileutils import FileUtils
-from .data.ioutils import IOUtils
-from .data.jsonpathutils import JSONPathUtils
-from .data.jsonutils import JSONUtils
-from .data.regexutils import RegexUtils
-from .data.xmlutils import XmlUtils
-from .media.captchautils import CaptchaUtils
-from .media.compressutils import CompressUtils
+from .._lazy import attach
 
-# 媒体工具类
-from .media.imageutils import ImageUtils
-from .media.qrcodeutils import QrCodeUtils
-
-# 网络工具类
-from .network.httputils import HTTPClient
-from .network.mailutils import MailUtils
-from .network.netutils import NetUtils
-from .network.sshutils import SSHClient
-from .scheduler.scheduleutils import ScheduleUtils
+_EXPORTS = {
+    # 基础工具类
+    "StringUtils": ".basic.stringutils",
+    "CollectionUtils": ".basic.collectionutils",
+    "ArrayUtils": ".basic.arrayutils",
+    "MathUtils": ".basic.mathutils",
+    "ReflectUtils": ".basic.reflectutils",
+    "ExceptionUtils": ".basic.exceptionutils",
+    "Converter": ".basic.convertutils",
+    "Validator": ".basic.validatorutils",
+    "BeanUtils": ".basic.beanutils",
+    "AssertUtil": ".basic.assertutils",
+    "ResourceUtils": ".basic.resourceutils",
+    "TypeUtils": ".basic.typeutils",
+    "ClipboardUtils": ".basic.clipboardutils",
+    "ClassUtils": ".basic.classutils",
+    "EnumUtil": ".basic.enumutils",
+    "RuntimeUtil": ".basic.runtimeutils",
+    "RandomUtil": ".basic.randomutils",
+    "AnnotationUtil": ".basic.annotationutils",
+    "HtmlUtil": ".basic.htmlutils",
+    "DecoratorUtil": ".basic.decoratorutils",
+    "DictUtil": ".basic.dictutils",
+    # 系统工具类
+    "SystemUtils": ".system.systemutils",
+    "ThreadUtils": ".system.threadutils",
+    "ScheduleUtils": ".scheduler.scheduleutils",
+    "MetricsUtils": ".system.metricsutils",
+    "RateLimitUtils": ".system.ratelimitutils",
+    "RateLimitError": ".basic.decoratorutils",
+    # 网络工具类
+    "HTTPClient": ".network.httputils",
+    "AsyncHTTPClient": ".network.asynchttputils",
+    "SSHClient": ".network.sshutils",
+    "NetUtils": ".network.netutils",
+    "MailUtils": ".network.mailutils",
+    # 数据处理类
+    "FileUtils": ".data.fileutils",
+    "DateTimeUtils": ".data.datetimeutils",
+    "CryptoUtils": ".data.cryptoutils",
+    "DatabaseUtils": ".data.databaseutils",
+    "CSVHandler": ".data.csvutils",
+    "ExcelHandler": ".data.excelutils",
+    "EncodeUtils": ".data.encodeutils",
+    "RegexUtils": ".data.regexutils",
+    "XmlUtils": ".data.xmlutils",
+    "JSONUtils": ".data.jsonutils",
+    "JSONPathUtils": ".data.jsonpathutils",
+    "IOUtils": ".data.ioutils",
+    # 媒体工具类
+    "ImageUtils": ".media.imageutils",
+    "QrCodeUtils": ".media.qrcodeutils",
+    "CompressUtils": ".media.compressutils",
+    "CaptchaUtils": ".media.captchautils",
+    # 模板和国际化
+    "TemplateUtils": ".template.templateutils",
+    "I18nUtils": ".template.i18nutils",
+    # 缓存工具类
+    "CacheUtils": ".cache.cacheutils",
+    # 配置工具类
+    "Config": ".config.configutils",
+    # 日志工具类
+    "Logger": ".log.logutils",
+    # 自动化测试工具类
+    "SeleniumUtils": ".automation.seleniumutils",
+    "PlaywrightUtils": ".automation.playwrightutils",
+    "AppiumUtils": ".automation.appiumutils",
+    "FakerUtils": ".automation.fakerutils",
+    # AI工具类
+    "AIUtils": ".ai.aiutils",
+    # API工具类
+    "FastAPIUtils": ".api.fastapiutils",
+    "APIResponse": ".api.fastapiutils",
+    "APIErrorResponse": ".api.fastapiutils",
+    # 容器化支持工具类
+    "DockerUtils": ".container.dockerutils",
+    "KubernetesUtils": ".container.kubernetesutils",
+    # 项目管理工具类
+    "ProjectUtils": ".project.projectutils",
+    "GitUtils": ".project.gitutils",
+    # 打包与发布工具类
+    "PackagingUtils": ".release.packagingutils",
+    "ReleaseUtils": ".release.releaseutils",
+    "DistributionUtils": ".release.distributionutils",
+    # 高级测试工具类
+    "PerformanceTestUtils": ".test.performancetestutils",
+    "LoadTestUtils": ".test.loadtestutils",
+    "MockUtils": ".test.mockutils",
+    "ContractTestUtils": ".test.contracttestutils",
+    # 可选导入WordUtils，因为它依赖python-docx
+    "WordUtils": ".media.wordutils",
+}
 
-# 系统工具类
-from .system.systemutils import SystemUtils
-from .system.threadutils import ThreadUtils
+__getattr__, __dir__ = attach(__name__, _EXPORTS, optional=["WordUtils"])
 
-# 可选导入WordUtils，因为它依赖python-docx
-WordUtils = None
-try:
+if TYPE_CHECKING:
+    from .ai.aiutils import AIUtils
+    from .api.fastapiutils import APIErrorResponse, APIResponse, FastAPIUtils
+    from .automation.appiumutils import AppiumUtils
+    from .automation.fakerutils import FakerUtils
+    from .automation.playwrightutils import PlaywrightUtils
+    from .automation.seleniumutils import SeleniumUtils
+    from .basic.annotationutils import AnnotationUtil
+    from .basic.arrayutils import ArrayUtils
+    from .basic.assertutils import AssertUtil
+    from .basic.beanutils import BeanUtils
+    from .basic.classutils import ClassUtils
+    from .basic.clipboardutils import ClipboardUtils
+    from .basic.collectionutils import CollectionUtils
+    from .basic.convertutils import Converter
+    from .basic.decoratorutils import DecoratorUtil, RateLimitError
+    from .basic.dictutils import DictUtil
+    from .basic.enumutils import EnumUtil
+    from .basic.exceptionutils import ExceptionUtils
+    from .basic.htmlutils import HtmlUtil
+    from .basic.mathutils import MathUtils
+    from .basic.randomutils import RandomUtil
+    from .basic.reflectutils import ReflectUtils
+    from .basic.resourceutils import ResourceUtils
+    from .basic.runtimeutils import RuntimeUtil
+    from .basic.stringutils import StringUtils
+    from .basic.typeutils import TypeUtils
+    from .basic.validatorutils import Validator
+    from .cache.cacheutils import CacheUtils
+    from .config.configutils import Config
+    from .container.dockerutils import DockerUtils
+    from .container.kubernetesutils import KubernetesUtils
+    from .data.cryptoutils import CryptoUtils
+    from .data.csvutils import CSVHandler
+    from .data.databaseutils import DatabaseUtils
+    from .data.datetimeutils import DateTimeUtils
+    from .data.encodeutils import EncodeUtils
+    from .data.excelutils import ExcelHandler
+    from .data.fileutils import FileUtils
+    from .data.ioutils import IOUtils
+    from .data.jsonpathutils import JSONPathUtils
+    from .data.jsonutils import JSONUtils
+    from .data.regexutils import RegexUtils
+    from .data.xmlutils import XmlUtils
+    from .log.logutils import Logger
+    from .media.captchautils import CaptchaUtils
+    from .media.compressutils import CompressUtils
+    from .media.imageutils import ImageUtils
+    from .media.qrcodeutils import QrCodeUtils
     from .media.wordutils import WordUtils
-except ImportError:
-    pass
-
-# AI工具类
-from .ai.aiutils import AIUtils
-
-# API工具类
-from .api.fastapiutils import APIErrorResponse, APIResponse, FastAPIUtils
-from .automation.appiumutils import AppiumUtils
-from .automation.fakerutils import FakerUtils
-from .automation.playwrightutils import PlaywrightUtils
-
-# 自动化测试工具类
-from .automation.seleniumutils import SeleniumUtils
-
-# 缓存工具类
-from .cache.cacheutils import CacheUtils
-
-# 配置工具类
-from .config.configutils import Config
-
-# 容器化支持工具类
-from .container.dockerutils import DockerUtils
-from .container.kubernetesutils import KubernetesUtils
-
-# 日志工具类
-from .log.logutils import Logger
-from .project.gitutils import GitUtils
-
-# 项目管理工具类
-from .project.projectutils import ProjectUtils
-from .release.distributionutils import DistributionUtils
-
-# 打包与发布工具类
-from .release.packagingutils import PackagingUtils
-from .release.releaseutils import ReleaseUtils
-from .template.i18nutils import I18nUtils
-
-# 模板和国际化
-from .template.templateutils import TemplateUtils
-from .test.contracttestutils import ContractTestUtils
-from .test.loadtestutils import LoadTestUtils
-from .test.mockutils import MockUtils
-
-# 高级测试工具类
-from .test.performancetestutils import PerformanceTestUtils
+    from .network.asynchttputils import AsyncHTTPClient
+    from .network.httputils import HTTPClient
+    from .network.mailutils import MailUtils
+    from .network.netutils import NetUtils
+    from .network.sshutils import SSHClient
+    from .project.gitutils import GitUtils
+    from .project.projectutils import ProjectUtils
+    from .release.distributionutils import DistributionUtils
+    from .release.packagingutils import PackagingUtils
+    from .release.releaseutils import ReleaseUtils
+    from .scheduler.scheduleutils import ScheduleUtils
+    from .system.metricsutils import MetricsUtils
+    from .system.ratelimitutils import RateLimitUtils
+    from .system.systemutils import SystemUtils
+    from .system.threadutils import ThreadUtils
+    from .template.i18nutils import I18nUtils
+    from .template.templateutils import TemplateUtils
+    from .test.contracttestutils import ContractTestUtils
+    from .test.loadtestutils import LoadTestUtils
+    from .test.mockutils import MockUtils
+    from .test.performancetestutils import PerformanceTestUtils
 
 __all__ = [
     # 基础工具类
@@ -131,8 +198,12 @@ __all__ = [
     "SystemUtils",
     "ThreadUtils",
     "ScheduleUtils",
+    "MetricsUtils",
+    "RateLimitUtils",
+    "RateLimitError",
     # 网络工具类
     "HTTPClient",
+    "AsyncHTTPClient",
     "SSHClient",
     "NetUtils",
     "MailUtils",
@@ -1,4 +1,15 @@
 # AI工具类
-from .aiutils import AIUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "AIUtils": ".aiutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .aiutils import AIUtils
 
 __all__ = ["AIUtils"]
@@ -3,14 +3,30 @@
 API工具模块
 """
 
-from .fastapiutils import (
-    FastAPIUtils,
-    add_cors,
-    add_exception_handler,
-    add_middleware,
-    create_app,
-    create_router,
-)
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "FastAPIUtils": ".fastapiutils",
+    "add_cors": ".fastapiutils",
+    "add_exception_handler": ".fastapiutils",
+    "add_middleware": ".fastapiutils",
+    "create_app": ".fastapiutils",
+    "create_router": ".fastapiutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .fastapiutils import (
+        FastAPIUtils,
+        add_cors,
+        add_exception_handler,
+        add_middleware,
+        create_app,
+        create_router,
+    )
 
 __all__ = [
     "FastAPIUtils",
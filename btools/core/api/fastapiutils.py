@@ -165,6 +165,32 @@ class FastAPIUtils:
 
         return app
 
+    @staticmethod
+    def add_metrics_endpoint(
+        app: FastAPI, path: str = "/metrics", registry: Optional[Any] = None
+    ) -> FastAPI:
+        """
+        添加Prometheus指标抓取接口
+
+        Args:
+            app: FastAPI应用实例
+            path: 接口路径
+            registry: 指标注册表，默认为MetricsUtils的默认注册表
+
+        Returns:
+            FastAPI应用实例
+        """
+        from ..system.metricsutils import CONTENT_TYPE_LATEST, MetricsUtils
+
+        async def metrics() -> Response:
+            return Response(
+                content=MetricsUtils.to_prometheus(registry),
+                media_type=CONTENT_TYPE_LATEST,
+            )
+
+        app.add_api_route(path, metrics, methods=["GET"], include_in_schema=False)
+        return app
+
     @staticmethod
     def run_app(
         app: FastAPI,
@@ -384,6 +410,23 @@ def setup_error_handlers(app: FastAPI) -> FastAPI:
     return FastAPIUtils.setup_error_handlers(app=app)
 
 
+def add_metrics_endpoint(
+    app: FastAPI, path: str = "/metrics", registry: Optional[Any] = None
+) -> FastAPI:
+    """
+    添加Prometheus指标抓取接口
+
+    Args:
+        app: FastAPI应用实例
+        path: 接口路径
+        registry: 指标注册表，默认为MetricsUtils的默认注册表
+
+    Returns:
+        FastAPI应用实例
+    """
+    return FastAPIUtils.add_metrics_endpoint(app=app, path=path, registry=registry)
+
+
 def run_app(
     app: FastAPI,
     host: str = "0.0.0.0",
@@ -1,32 +1,68 @@
 # 自动化测试工具类
-from .appiumutils import AppiumUtils
-from .fakerutils import (
-    FakerUtils,
-    generate_test_data,
-    random_address,
-    random_bank_card,
-    random_boolean,
-    random_company,
-    random_credit_card,
-    random_date,
-    random_datetime,
-    random_email,
-    random_float,
-    random_id_card,
-    random_integer,
-    random_ip,
-    random_name,
-    random_order,
-    random_phone,
-    random_position,
-    random_product,
-    random_string,
-    random_url,
-    random_user,
-    random_user_agent,
-)
-from .playwrightutils import PlaywrightUtils
-from .seleniumutils import SeleniumUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "AppiumUtils": ".appiumutils",
+    "FakerUtils": ".fakerutils",
+    "generate_test_data": ".fakerutils",
+    "random_address": ".fakerutils",
+    "random_bank_card": ".fakerutils",
+    "random_boolean": ".fakerutils",
+    "random_company": ".fakerutils",
+    "random_credit_card": ".fakerutils",
+    "random_date": ".fakerutils",
+    "random_datetime": ".fakerutils",
+    "random_email": ".fakerutils",
+    "random_float": ".fakerutils",
+    "random_id_card": ".fakerutils",
+    "random_integer": ".fakerutils",
+    "random_ip": ".fakerutils",
+    "random_name": ".fakerutils",
+    "random_order": ".fakerutils",
+    "random_phone": ".fakerutils",
+    "random_position": ".fakerutils",
+    "random_product": ".fakerutils",
+    "random_string": ".fakerutils",
+    "random_url": ".fakerutils",
+    "random_user": ".fakerutils",
+    "random_user_agent": ".fakerutils",
+    "PlaywrightUtils": ".playwrightutils",
+    "SeleniumUtils": ".seleniumutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .appiumutils import AppiumUtils
+    from .fakerutils import (
+        FakerUtils,
+        generate_test_data,
+        random_address,
+        random_bank_card,
+        random_boolean,
+        random_company,
+        random_credit_card,
+        random_date,
+        random_datetime,
+        random_email,
+        random_float,
+        random_id_card,
+        random_integer,
+        random_ip,
+        random_name,
+        random_order,
+        random_phone,
+        random_position,
+        random_product,
+        random_string,
+        random_url,
+        random_user,
+        random_user_agent,
+    )
+    from .playwrightutils import PlaywrightUtils
+    from .seleniumutils import SeleniumUtils
 
 __all__ = [
     "SeleniumUtils",
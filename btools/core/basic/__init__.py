@@ -1,24 +1,54 @@
 # Basic utilities
-from .annotationutils import AnnotationUtil
-from .arrayutils import ArrayUtils
-from .assertutils import AssertUtil
-from .classutils import ClassUtils
-from .clipboardutils import ClipboardUtils
-from .collectionutils import CollectionUtils
-from .convertutils import Converter
-from .decoratorutils import DecoratorUtil
-from .dictutils import DictUtil
-from .enumutils import EnumUtil
-from .exceptionutils import ExceptionUtils
-from .htmlutils import HtmlUtil
-from .mathutils import MathUtils
-from .randomutils import RandomUtil
-from .reflectutils import ReflectUtils
-from .resourceutils import ResourceUtils
-from .runtimeutils import RuntimeUtil
-from .stringutils import StringUtils
-from .typeutils import TypeUtils
-from .validatorutils import Validator
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "AnnotationUtil": ".annotationutils",
+    "ArrayUtils": ".arrayutils",
+    "AssertUtil": ".assertutils",
+    "ClassUtils": ".classutils",
+    "ClipboardUtils": ".clipboardutils",
+    "CollectionUtils": ".collectionutils",
+    "Converter": ".convertutils",
+    "DecoratorUtil": ".decoratorutils",
+    "DictUtil": ".dictutils",
+    "EnumUtil": ".enumutils",
+    "ExceptionUtils": ".exceptionutils",
+    "HtmlUtil": ".htmlutils",
+    "MathUtils": ".mathutils",
+    "RandomUtil": ".randomutils",
+    "ReflectUtils": ".reflectutils",
+    "ResourceUtils": ".resourceutils",
+    "RuntimeUtil": ".runtimeutils",
+    "StringUtils": ".stringutils",
+    "TypeUtils": ".typeutils",
+    "Validator": ".validatorutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .annotationutils import AnnotationUtil
+    from .arrayutils import ArrayUtils
+    from .assertutils import AssertUtil
+    from .classutils import ClassUtils
+    from .clipboardutils import ClipboardUtils
+    from .collectionutils import CollectionUtils
+    from .convertutils import Converter
+    from .decoratorutils import DecoratorUtil
+    from .dictutils import DictUtil
+    from .enumutils import EnumUtil
+    from .exceptionutils import ExceptionUtils
+    from .htmlutils import HtmlUtil
+    from .mathutils import MathUtils
+    from .randomutils import RandomUtil
+    from .reflectutils import ReflectUtils
+    from .resourceutils import ResourceUtils
+    from .runtimeutils import RuntimeUtil
+    from .stringutils import StringUtils
+    from .typeutils import TypeUtils
+    from .validatorutils import Validator
 
 __all__ = [
     "StringUtils",
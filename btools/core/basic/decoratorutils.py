@@ -6,11 +6,21 @@
 提供装饰器相关的操作功能，包括创建、管理和使用装饰器
 """
 
+import asyncio
 import functools
+import hashlib
 import inspect
+import json
+import re
+import threading
 import time
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+from ..cache.cacheutils import CacheUtils
+
+# 日志函数参数的默认值，调用时才解析为print，使替换后的print同样生效
+_PRINT = object()
+
 
 class DecoratorUtil:
     """
@@ -36,30 +46,67 @@ class DecoratorUtil:
         return decorator
 
     @staticmethod
-    def timer(logger: Optional[Callable] = print) -> Callable:
+    def timer(
+        logger: Optional[Callable] = None,
+        metric_name: str = "function_duration_seconds",
+        registry: Optional[Any] = None,
+    ) -> Callable:
         """
         创建一个计时装饰器
 
+        耗时（秒）记录到指标注册表的直方图中，标签function为函数的模块和限定名称。
+
         Args:
-            logger: 日志函数
+            logger: 日志函数，指定时每次调用额外输出一行耗时日志
+            metric_name: 直方图名称
+            registry: 指标注册表，默认为MetricsUtils的默认注册表
 
         Returns:
             Callable: 计时装饰器
         """
 
         def decorator(func: Callable) -> Callable:
+            histogram = DecoratorUtil._function_histogram(func, metric_name, registry)
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                end_time = time.time()
-                logger(f"{func.__name__} 执行耗时: {end_time - start_time:.4f} 秒")
-                return result
+                start_time = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    duration = time.perf_counter() - start_time
+                    histogram.observe(duration)
+                    if logger is not None:
+                        logger(f"{func.__name__} 执行耗时: {duration:.4f} 秒")
 
             return wrapper
 
         return decorator
 
+    @staticmethod
+    def _function_histogram(
+        func: Callable, metric_name: str, registry: Optional[Any]
+    ) -> Any:
+        """
+        获取记录函数耗时的直方图
+
+        Args:
+            func: 被装饰的函数
+            metric_name: 直方图名称
+            registry: 指标注册表，None表示默认注册表
+
+        Returns:
+            MetricsUtils.Histogram: 直方图
+        """
+        from ..system.metricsutils import MetricsUtils
+
+        registry = registry or MetricsUtils.get_registry()
+        return registry.histogram(
+            metric_name,
+            {"function": f"{func.__module__}.{func.__qualname__}"},
+            "函数执行耗时（秒）",
+        )
+
     @staticmethod
     def logging(logger: Optional[Callable] = print) -> Callable:
         """
@@ -216,57 +263,77 @@ class DecoratorUtil:
         return decorator
 
     @staticmethod
-    def rate_limit(max_calls: int, period: float) -> Callable:
+    def rate_limit(
+        max_calls: int,
+        period: float,
+        algorithm: str = "token_bucket",
+        key: Optional[Callable[..., Any]] = None,
+        block: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Callable:
         """
-        创建一个速率限制装饰器
+        创建一个速率限制装饰器，线程安全，支持异步函数
+
+        默认使用容量为max_calls的令牌桶：允许连续调用max_calls次，空闲period秒后额度完全恢复。
+        滑动窗口计数器按上一窗口的调用数加权估算，额度在period之后才逐步恢复。
 
         Args:
             max_calls: 最大调用次数
             period: 时间周期（秒）
+            algorithm: 限流算法，"token_bucket"（令牌桶，默认）、"sliding_window"（滑动窗口计数器）
+                或 "gcra"
+            key: 根据调用参数计算限流键的函数，用于按客户端分别限流
+            block: 超过限制时是否等待，False表示抛出RateLimitError
+            timeout: 等待的最长时间（秒），超时后抛出RateLimitError
 
         Returns:
             Callable: 速率限制装饰器
         """
+        from ..system.ratelimitutils import RateLimitUtils
 
-        def decorator(func: Callable) -> Callable:
-            calls = []
-
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                current_time = time.time()
-                # 清理过期的调用记录
-                calls[:] = [t for t in calls if current_time - t < period]
-
-                if len(calls) >= max_calls:
-                    raise RateLimitError(f"超过速率限制: {max_calls} 次/ {period} 秒")
-
-                calls.append(current_time)
-                return func(*args, **kwargs)
-
-            return wrapper
-
-        return decorator
+        if algorithm == "sliding_window":
+            limiter = RateLimitUtils.SlidingWindowCounter(max_calls, period)
+        elif algorithm == "token_bucket":
+            limiter = RateLimitUtils.TokenBucket(max_calls / period, max_calls)
+        elif algorithm == "gcra":
+            limiter = RateLimitUtils.GCRA(max_calls / period, max_calls)
+        else:
+            raise ValueError(f"Unsupported rate limit algorithm: {algorithm}")
+        return RateLimitUtils.limit(limiter, key=key, block=block, timeout=timeout)
 
     @staticmethod
-    def async_timer(logger: Optional[Callable] = print) -> Callable:
+    def async_timer(
+        logger: Optional[Callable] = None,
+        metric_name: str = "function_duration_seconds",
+        registry: Optional[Any] = None,
+    ) -> Callable:
         """
         创建一个异步计时装饰器
 
+        耗时（秒）记录到指标注册表的直方图中，标签function为函数的模块和限定名称。
+
         Args:
-            logger: 日志函数
+            logger: 日志函数，指定时每次调用额外输出一行耗时日志
+            metric_name: 直方图名称
+            registry: 指标注册表，默认为MetricsUtils的默认注册表
 
         Returns:
             Callable: 异步计时装饰器
         """
 
         def decorator(func: Callable) -> Callable:
+            histogram = DecoratorUtil._function_histogram(func, metric_name, registry)
+
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
-                start_time = time.time()
-                result = await func(*args, **kwargs)
-                end_time = time.time()
-                logger(f"{func.__name__} 执行耗时: {end_time - start_time:.4f} 秒")
-                return result
+                start_time = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    duration = time.perf_counter() - start_time
+                    histogram.observe(duration)
+                    if logger is not None:
+                        logger(f"{func.__name__} 执行耗时: {duration:.4f} 秒")
 
             return wrapper
 
@@ -310,6 +377,198 @@ class DecoratorUtil:
 
         return decorator
 
+    @staticmethod
+    def cached(
+        cache: Optional[Any] = None,
+        ttl: Optional[int] = None,
+        key_prefix: Optional[str] = None,
+        key_func: Optional[Callable[..., str]] = None,
+        stale_ttl: Optional[int] = None,
+        ttl_param: Optional[str] = None,
+        logger: Optional[Callable] = None,
+    ) -> Callable:
+        """
+        创建一个基于CacheUtils缓存后端的缓存装饰器
+
+        缓存键由函数全名和绑定默认值后的参数生成，f(1)与f(x=1)命中同一个键。
+        设置stale_ttl后，结果过期后的stale_ttl秒内仍直接返回旧值，同时在后台刷新。
+        同步函数在后台线程刷新，异步函数在当前事件循环中创建任务刷新。
+        指定ttl_param后，调用时可通过该名称的关键字参数覆盖本次写入的过期时间，
+        该参数不会传给被装饰函数，因此不能与被装饰函数的参数同名。
+        后台刷新失败时保留旧值，失败次数和最近一次异常记录在wrapper.refresh_stats中。
+
+        Args:
+            cache: 缓存后端（MemoryCache、FileCache、RedisCache等），默认使用分片内存缓存
+            ttl: 结果有效期（秒），None表示使用缓存后端的默认值
+            key_prefix: 缓存键前缀，默认使用函数的模块名和限定名
+            key_func: 自定义缓存键生成函数，接收与被装饰函数相同的参数
+            stale_ttl: 结果过期后仍可返回旧值并后台刷新的时长（秒），需要同时指定ttl
+            ttl_param: 单次调用覆盖过期时间的关键字参数名，None表示不支持覆盖
+            logger: 日志函数，指定时后台刷新失败会输出一行错误日志
+
+        Returns:
+            Callable: 缓存装饰器
+
+        Raises:
+            ValueError: 指定了stale_ttl但未指定ttl，或ttl_param与被装饰函数的参数同名
+        """
+        if stale_ttl is not None and ttl is None:
+            raise ValueError("stale_ttl需要同时指定ttl")
+        backend = (
+            cache if cache is not None else CacheUtils.create_sharded_memory_cache()
+        )
+
+        def decorator(func: Callable) -> Callable:
+            # 默认前缀去掉<locals>等字符，保证文件缓存后端可用作文件名
+            prefix = key_prefix or re.sub(
+                r"[^\w.-]", "_", f"{func.__module__}.{func.__qualname__}"
+            )
+            signature = inspect.signature(func)
+            if ttl_param is not None and ttl_param in signature.parameters:
+                raise ValueError(f"ttl_param与函数参数同名: {ttl_param}")
+            refreshing = set()
+            refreshing_lock = threading.Lock()
+            refresh_stats = {"errors": 0, "last_error": None}
+
+            def pop_ttl(kwargs: Dict[str, Any]) -> Optional[int]:
+                return kwargs.pop(ttl_param, None) if ttl_param is not None else None
+
+            def make_key(*args, **kwargs) -> str:
+                if key_func is not None:
+                    return f"{prefix}-{key_func(*args, **kwargs)}"
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    payload = json.dumps(
+                        bound.arguments,
+                        sort_keys=True,
+                        default=repr,
+                        ensure_ascii=False,
+                    )
+                except TypeError:
+                    payload = repr((args, sorted(kwargs.items())))
+                digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+                return f"{prefix}-{digest}"
+
+            def backend_ttl(call_ttl: Optional[int]) -> Optional[int]:
+                fresh_ttl = call_ttl or ttl
+                return fresh_ttl + stale_ttl if fresh_ttl and stale_ttl else fresh_ttl
+
+            def wrap(value: Any, call_ttl: Optional[int]) -> Dict[str, Any]:
+                fresh_ttl = call_ttl or ttl
+                fresh_until = time.time() + fresh_ttl if fresh_ttl else None
+                return {"value": value, "fresh_until": fresh_until}
+
+            def store(key: str, value: Any, call_ttl: Optional[int]) -> None:
+                backend.set(key, wrap(value, call_ttl), backend_ttl(call_ttl))
+
+            def lookup(key: str):
+                entry = backend.get(key)
+                if not isinstance(entry, dict) or "value" not in entry:
+                    return None, False
+                fresh_until = entry.get("fresh_until")
+                return entry, fresh_until is None or time.time() < fresh_until
+
+            def claim_refresh(key: str) -> bool:
+                with refreshing_lock:
+                    if key in refreshing:
+                        return False
+                    refreshing.add(key)
+                    return True
+
+            def release_refresh(key: str) -> None:
+                with refreshing_lock:
+                    refreshing.discard(key)
+
+            def record_refresh_error(error: Exception) -> None:
+                with refreshing_lock:
+                    refresh_stats["errors"] += 1
+                    refresh_stats["last_error"] = error
+                if logger is not None:
+                    logger(f"{func.__name__} 后台刷新失败: {error}")
+
+            if inspect.iscoroutinefunction(func):
+
+                async def refresh_async(key, call_ttl, args, kwargs):
+                    try:
+                        store(key, await func(*args, **kwargs), call_ttl)
+                    except Exception as e:
+                        record_refresh_error(e)
+                    finally:
+                        release_refresh(key)
+
+                # 事件循环只保留任务的弱引用，需要持有后台刷新任务直到完成
+                refresh_tasks = set()
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    call_ttl = pop_ttl(kwargs)
+                    key = make_key(*args, **kwargs)
+                    entry, fresh = lookup(key)
+                    if entry is not None:
+                        if not fresh and claim_refresh(key):
+                            task = asyncio.ensure_future(
+                                refresh_async(key, call_ttl, args, kwargs)
+                            )
+                            refresh_tasks.add(task)
+                            task.add_done_callback(refresh_tasks.discard)
+                        return entry["value"]
+
+                    result = await func(*args, **kwargs)
+                    store(key, result, call_ttl)
+                    return result
+
+                wrapper = async_wrapper
+            else:
+
+                def refresh(key, call_ttl, args, kwargs):
+                    try:
+                        store(key, func(*args, **kwargs), call_ttl)
+                    except Exception as e:
+                        record_refresh_error(e)
+                    finally:
+                        release_refresh(key)
+
+                @functools.wraps(func)
+                def sync_wrapper(*args, **kwargs):
+                    call_ttl = pop_ttl(kwargs)
+                    key = make_key(*args, **kwargs)
+                    entry, fresh = lookup(key)
+                    if entry is not None:
+                        if not fresh and claim_refresh(key):
+                            threading.Thread(
+                                target=refresh,
+                                args=(key, call_ttl, args, kwargs),
+                                daemon=True,
+                            ).start()
+                        return entry["value"]
+
+                    if hasattr(backend, "get_or_load"):
+                        # 并发未命中时只执行一次被装饰函数
+                        entry = backend.get_or_load(
+                            key,
+                            lambda: wrap(func(*args, **kwargs), call_ttl),
+                            backend_ttl(call_ttl),
+                        )
+                        return entry["value"]
+
+                    result = func(*args, **kwargs)
+                    store(key, result, call_ttl)
+                    return result
+
+                wrapper = sync_wrapper
+
+            def invalidate(*args, **kwargs) -> None:
+                backend.delete(make_key(*args, **kwargs))
+
+            wrapper.cache = backend
+            wrapper.cache_key = make_key
+            wrapper.invalidate = invalidate
+            wrapper.refresh_stats = refresh_stats
+            return wrapper
+
+        return decorator
+
     @staticmethod
     def context_manager(context_manager: Any) -> Callable:
         """
@@ -334,58 +593,111 @@ class DecoratorUtil:
 
     @staticmethod
     def metric_collector(
-        metric_name: str, tags: Optional[Dict[str, str]] = None
+        metric_name: str,
+        tags: Optional[Dict[str, str]] = None,
+        registry: Optional[Any] = None,
+        logger: Optional[Callable] = None,
     ) -> Callable:
         """
         创建一个指标收集装饰器
 
+        每次调用的耗时（秒）记录到名为metric_name的直方图，标签为tags加上
+        success（"true"或"false"），支持异步函数。
+
         Args:
             metric_name: 指标名称
             tags: 指标标签
+            registry: 指标注册表，默认为MetricsUtils的默认注册表
+            logger: 日志函数，指定时每次调用额外输出一行指标日志
 
         Returns:
             Callable: 指标收集装饰器
         """
+        from ..system.metricsutils import MetricsUtils
+
+        target = registry or MetricsUtils.get_registry()
+        histograms = {
+            success: target.histogram(
+                metric_name, dict(tags or {}, success=str(success).lower())
+            )
+            for success in (True, False)
+        }
+
+        def record(duration: float, success: bool) -> None:
+            histograms[success].observe(duration)
+            if logger is not None:
+                logger(
+                    f"[指标] {metric_name}: 耗时={duration:.4f}s, 成功={success}, 标签={tags}"
+                )
 
         def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start_time = time.perf_counter()
+                    success = False
+                    try:
+                        result = await func(*args, **kwargs)
+                        success = True
+                        return result
+                    finally:
+                        record(time.perf_counter() - start_time, success)
+
+                return async_wrapper
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
-                success = True
-
+                start_time = time.perf_counter()
+                success = False
                 try:
                     result = func(*args, **kwargs)
+                    success = True
                     return result
-                except Exception as e:
-                    success = False
-                    raise
                 finally:
-                    end_time = time.time()
-                    duration = end_time - start_time
-
-                    # 这里可以集成到具体的指标收集系统
-                    # 例如 Prometheus、StatsD 等
-                    print(
-                        f"[指标] {metric_name}: 耗时={duration:.4f}s, 成功={success}, 标签={tags}"
-                    )
+                    record(time.perf_counter() - start_time, success)
 
             return wrapper
 
         return decorator
 
     @staticmethod
-    def profiler(enabled: bool = True) -> Callable:
+    def profiler(
+        enabled: bool = True,
+        sampling: bool = False,
+        interval: float = 0.005,
+        output: Optional[str] = None,
+        logger: Optional[Callable] = _PRINT,
+        save_interval: float = 10.0,
+    ) -> Callable:
         """
         创建一个性能分析装饰器
 
+        默认每次调用使用cProfile分析并输出完整报告，会使被装饰函数明显变慢。
+        sampling为True时所有调用共享一个采样分析器，首次调用时启动常驻的采样线程，
+        之后每次调用只登记和注销执行它的线程，只在函数执行期间采样。
+        样本跨调用累加，可通过被装饰函数的profiler属性获取，适合在生产环境中使用。
+
         Args:
             enabled: 是否启用性能分析
+            sampling: 是否使用采样分析
+            interval: 采样间隔（秒）
+            output: 采样分析结果的保存路径，.json保存为speedscope格式，其他保存为折叠调用栈；
+                距上次保存超过save_interval秒的调用结束时保存，进程退出时再保存一次，
+                也可调用被装饰函数的save_profile方法随时保存
+            logger: cProfile报告的输出函数，默认为调用时的print，None表示不输出
+            save_interval: 采样分析结果自动保存的最短间隔（秒）
 
         Returns:
             Callable: 性能分析装饰器
         """
 
         def decorator(func: Callable) -> Callable:
+            if sampling:
+                return DecoratorUtil._sampling_profiler(
+                    func, enabled, interval, output, save_interval
+                )
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 if enabled:
@@ -400,11 +712,13 @@ class DecoratorUtil:
                         result = func(*args, **kwargs)
                     finally:
                         pr.disable()
-                        s = io.StringIO()
-                        ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
-                        ps.print_stats()
-                        print(f"[性能分析] {func.__name__}:")
-                        print(s.getvalue())
+                        emit = print if logger is _PRINT else logger
+                        if emit is not None:
+                            s = io.StringIO()
+                            ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
+                            ps.print_stats()
+                            emit(f"[性能分析] {func.__name__}:")
+                            emit(s.getvalue())
                 else:
                     result = func(*args, **kwargs)
 
@@ -414,6 +728,85 @@ class DecoratorUtil:
 
         return decorator
 
+    @staticmethod
+    def _sampling_profiler(
+        func: Callable,
+        enabled: bool,
+        interval: float,
+        output: Optional[str],
+        save_interval: float,
+    ) -> Callable:
+        """
+        使用共享采样分析器包装函数
+
+        Args:
+            func: 被装饰的函数
+            enabled: 是否启用性能分析
+            interval: 采样间隔（秒）
+            output: 结果保存路径
+            save_interval: 自动保存的最短间隔（秒）
+
+        Returns:
+            Callable: 包装后的函数，profiler属性为采样分析器，save_profile方法保存结果
+        """
+        from ..test.performancetestutils import PerformanceTestUtils
+
+        profiler = PerformanceTestUtils.SamplingProfiler(
+            interval=interval, thread_ids=set()
+        )
+        lock = threading.Lock()
+        depths: Dict[int, int] = {}
+        state = {"started": False, "saved_at": time.monotonic(), "saved_samples": 0}
+
+        def save_profile(file_path: Optional[str] = None) -> Optional[str]:
+            path = file_path or output
+            if not path:
+                return None
+            state["saved_samples"] = profiler.samples
+            return profiler.save(path)
+
+        def autosave() -> None:
+            # 没有新样本时不重写文件
+            if profiler.samples != state["saved_samples"]:
+                save_profile()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            thread_id = threading.get_ident()
+            with lock:
+                depth = depths.get(thread_id, 0)
+                depths[thread_id] = depth + 1
+                if depth == 0:
+                    profiler.thread_ids.add(thread_id)
+                if not state["started"]:
+                    state["started"] = True
+                    profiler.start()
+                    if output:
+                        import atexit
+
+                        atexit.register(autosave)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                due = False
+                with lock:
+                    depths[thread_id] -= 1
+                    if depths[thread_id] == 0:
+                        del depths[thread_id]
+                        profiler.thread_ids.discard(thread_id)
+                    now = time.monotonic()
+                    if output and now - state["saved_at"] >= save_interval:
+                        state["saved_at"] = now
+                        due = True
+                if due:
+                    autosave()
+
+        wrapper.profiler = profiler
+        wrapper.save_profile = save_profile
+        return wrapper
+
     @staticmethod
     def combine(*decorators: Callable) -> Callable:
         """
@@ -1,4 +1,15 @@
 # Cache utilities
-from .cacheutils import CacheUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "CacheUtils": ".cacheutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .cacheutils import CacheUtils
 
 __all__ = ["CacheUtils"]
@@ -1,26 +1,305 @@
 """缓存工具类"""
 
+import heapq
+import itertools
 import json
 import os
+import pickle
+import struct
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional, Union
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 class CacheUtils:
     """缓存工具类"""
 
+    class EvictionPolicy:
+        """淘汰策略基类
+
+        缓存容量达到上限时，由策略决定淘汰哪个键。子类需要保证各回调的时间复杂度为O(1)。
+        """
+
+        def on_insert(self, key: str) -> None:
+            """
+            新键写入缓存时回调
+
+            Args:
+                key: 缓存键
+            """
+            raise NotImplementedError
+
+        def on_access(self, key: str) -> None:
+            """
+            键被命中或被覆盖写入时回调
+
+            Args:
+                key: 缓存键
+            """
+            raise NotImplementedError
+
+        def on_miss(self, key: str) -> None:
+            """
+            读取未命中时回调，默认忽略
+
+            Args:
+                key: 缓存键
+            """
+
+        def on_remove(self, key: str) -> None:
+            """
+            键被删除、过期或淘汰时回调
+
+            Args:
+                key: 缓存键
+            """
+            raise NotImplementedError
+
+        def victim(self) -> Optional[str]:
+            """
+            选出下一个被淘汰的键
+
+            Returns:
+                Optional[str]: 被淘汰的键，没有可淘汰的键时返回None
+            """
+            raise NotImplementedError
+
+        def admit(self, candidate: str, victim: str) -> bool:
+            """
+            判断新键是否允许挤掉淘汰候选键进入缓存
+
+            Args:
+                candidate: 待写入的新键
+                victim: 淘汰候选键
+
+            Returns:
+                bool: 允许写入返回True，否则返回False
+            """
+            return True
+
+        def clear(self) -> None:
+            """
+            清空策略状态
+            """
+            raise NotImplementedError
+
+    class LRUPolicy(EvictionPolicy):
+        """最近最少使用（LRU）淘汰策略"""
+
+        def __init__(self):
+            self._order: "OrderedDict[str, None]" = OrderedDict()
+
+        def on_insert(self, key: str) -> None:
+            self._order[key] = None
+
+        def on_access(self, key: str) -> None:
+            if key in self._order:
+                self._order.move_to_end(key)
+
+        def on_remove(self, key: str) -> None:
+            self._order.pop(key, None)
+
+        def victim(self) -> Optional[str]:
+            return next(iter(self._order), None)
+
+        def clear(self) -> None:
+            self._order.clear()
+
+    class LFUPolicy(EvictionPolicy):
+        """最不经常使用（LFU）淘汰策略
+
+        按访问频次分桶，同频次内按LRU顺序淘汰。非空的频次按升序串成双向链表，
+        删除任意键后无需查找新的最小频次，所有操作均为O(1)。
+        """
+
+        # 链表头的哨兵频次，_next[_HEAD]即为最小频次
+        _HEAD = 0
+
+        def __init__(self):
+            self._freq: Dict[str, int] = {}
+            self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+            self._next: Dict[int, int] = {}
+            self._prev: Dict[int, int] = {}
+
+        def _add(self, key: str, freq: int, after: int) -> None:
+            # 新频次桶紧跟在after之后，保持链表升序
+            bucket = self._buckets.get(freq)
+            if bucket is None:
+                bucket = self._buckets[freq] = OrderedDict()
+                following = self._next.get(after)
+                self._next[after] = freq
+                self._prev[freq] = after
+                if following is not None:
+                    self._next[freq] = following
+                    self._prev[following] = freq
+            bucket[key] = None
+            self._freq[key] = freq
+
+        def _discard(self, key: str, freq: int) -> None:
+            bucket = self._buckets[freq]
+            del bucket[key]
+            if bucket:
+                return
+            del self._buckets[freq]
+            previous = self._prev.pop(freq)
+            following = self._next.pop(freq, None)
+            if following is None:
+                self._next.pop(previous, None)
+            else:
+                self._next[previous] = following
+                self._prev[following] = previous
+
+        def on_insert(self, key: str) -> None:
+            self._add(key, 1, self._HEAD)
+
+        def on_access(self, key: str) -> None:
+            freq = self._freq.get(key)
+            if freq is not None:
+                self._add(key, freq + 1, freq)
+                self._discard(key, freq)
+
+        def on_remove(self, key: str) -> None:
+            freq = self._freq.pop(key, None)
+            if freq is not None:
+                self._discard(key, freq)
+
+        def victim(self) -> Optional[str]:
+            min_freq = self._next.get(self._HEAD)
+            if min_freq is None:
+                return None
+            return next(iter(self._buckets[min_freq]))
+
+        def clear(self) -> None:
+            self._freq.clear()
+            self._buckets.clear()
+            self._next.clear()
+            self._prev.clear()
+
+    class TinyLFUPolicy(LRUPolicy):
+        """TinyLFU淘汰策略
+
+        在LRU之上增加基于Count-Min Sketch的准入过滤：缓存已满时，只有历史访问频次高于
+        淘汰候选键的新键才会被写入，从而避免一次性扫描冲掉热点数据。
+        """
+
+        _DEPTH = 4
+        _MAX_COUNT = 15
+
+        def __init__(self, capacity: int = 1024):
+            """
+            初始化TinyLFU策略
+
+            Args:
+                capacity: 预期缓存容量，用于确定频次统计表的宽度和衰减周期
+            """
+            super().__init__()
+            width = 1
+            while width < max(capacity, 16):
+                width <<= 1
+            self._mask = width - 1
+            self._table = [[0] * width for _ in range(self._DEPTH)]
+            self._sample_size = max(capacity, 16) * 10
+            self._additions = 0
+
+        def _indexes(self, key: str):
+            h = hash(key)
+            for row in range(self._DEPTH):
+                h = (h * 0x9E3779B1 + row) & 0xFFFFFFFFFFFF
+                yield row, (h ^ (h >> 17)) & self._mask
+
+        def record(self, key: str) -> None:
+            """
+            记录一次访问频次
+
+            Args:
+                key: 缓存键
+            """
+            for row, index in self._indexes(key):
+                if self._table[row][index] < self._MAX_COUNT:
+                    self._table[row][index] += 1
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+        def frequency(self, key: str) -> int:
+            """
+            估算键的访问频次
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                int: 估算的访问频次
+            """
+            return min(self._table[row][index] for row, index in self._indexes(key))
+
+        def _reset(self) -> None:
+            # 周期性减半计数，让过时的热点逐渐失效
+            for row in self._table:
+                for i, count in enumerate(row):
+                    row[i] = count >> 1
+            self._additions //= 2
+
+        def on_access(self, key: str) -> None:
+            super().on_access(key)
+            self.record(key)
+
+        def on_miss(self, key: str) -> None:
+            self.record(key)
+
+        def admit(self, candidate: str, victim: str) -> bool:
+            self.record(candidate)
+            return self.frequency(candidate) > self.frequency(victim)
+
+        def clear(self) -> None:
+            super().clear()
+            for row in self._table:
+                for i in range(len(row)):
+                    row[i] = 0
+            self._additions = 0
+
     class MemoryCache:
-        """内存缓存实现"""
+        """内存缓存实现
+
+        支持按条目数或字节数限制容量，容量超限时按淘汰策略（lru/lfu/tinylfu）淘汰；
+        过期时间通过最小堆索引，清理过期项无需扫描全部键。
+        """
 
-        def __init__(self, default_ttl: int = 3600):
+        def __init__(
+            self,
+            default_ttl: int = 3600,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            eviction_policy: Union[str, "CacheUtils.EvictionPolicy"] = "lru",
+            sizeof: Optional[Callable[[Any], int]] = None,
+        ):
             """
             初始化内存缓存
 
             Args:
                 default_ttl: 默认过期时间（秒）
+                max_entries: 最大条目数，为None时不限制
+                max_bytes: 最大占用字节数，为None时不限制
+                eviction_policy: 淘汰策略，可选"lru"、"lfu"、"tinylfu"或EvictionPolicy实例
+                sizeof: 计算缓存值字节数的函数，默认使用sys.getsizeof
             """
             self._cache: Dict[str, Dict[str, Any]] = {}
             self._default_ttl = default_ttl
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._sizeof = sizeof or sys.getsizeof
+            self._policy = CacheUtils._create_policy(eviction_policy, max_entries)
+            self._expiry_heap: List[Tuple[float, int, str]] = []
+            self._counter = itertools.count()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.rejections = 0
 
         def get(self, key: str) -> Optional[Any]:
             """
@@ -32,14 +311,21 @@ class CacheUtils:
             Returns:
                 Any: 缓存值，如果不存在或已过期则返回None
             """
-            if key not in self._cache:
+            item = self._cache.get(key)
+            if item is None:
+                self.misses += 1
+                self._policy.on_miss(key)
                 return None
 
-            item = self._cache[key]
             if time.time() > item["expire_time"]:
-                del self._cache[key]
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                self._policy.on_miss(key)
                 return None
 
+            self.hits += 1
+            self._policy.on_access(key)
             return item["value"]
 
         def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -52,7 +338,33 @@ class CacheUtils:
                 ttl: 过期时间（秒），如果为None则使用默认值
             """
             expire_time = time.time() + (ttl or self._default_ttl)
-            self._cache[key] = {"value": value, "expire_time": expire_time}
+            size = self._sizeof(value) if self._max_bytes is not None else 0
+
+            old = self._cache.get(key)
+            if old is not None:
+                # 新值超过总容量时与新键一样拒绝写入，只删除旧值，不淘汰其他键
+                if self._max_bytes is not None and size > self._max_bytes:
+                    self._remove(key)
+                    self.rejections += 1
+                    return
+                self._bytes -= old["size"]
+                self._policy.on_access(key)
+            else:
+                self._clean_expired()
+                if not self._make_room(key, size):
+                    self.rejections += 1
+                    return
+                self._policy.on_insert(key)
+
+            self._cache[key] = {
+                "value": value,
+                "expire_time": expire_time,
+                "size": size,
+            }
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (expire_time, next(self._counter), key))
+            self._compact_heap()
+            self._evict_overflow()
 
         def delete(self, key: str) -> None:
             """
@@ -62,13 +374,16 @@ class CacheUtils:
                 key: 缓存键
             """
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
 
         def clear(self) -> None:
             """
             清空缓存
             """
             self._cache.clear()
+            self._policy.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
 
         def exists(self, key: str) -> bool:
             """
@@ -80,7 +395,8 @@ class CacheUtils:
             Returns:
                 bool: 如果存在且未过期则返回True，否则返回False
             """
-            return self.get(key) is not None
+            item = self._cache.get(key)
+            return item is not None and time.time() <= item["expire_time"]
 
         def size(self) -> int:
             """
@@ -93,19 +409,320 @@ class CacheUtils:
             self._clean_expired()
             return len(self._cache)
 
+        def memory_usage(self) -> int:
+            """
+            获取缓存值占用的字节数（仅在设置max_bytes时统计）
+
+            Returns:
+                int: 占用字节数
+            """
+            return self._bytes
+
+        def stats(self) -> Dict[str, Any]:
+            """
+            获取缓存统计信息
+
+            Returns:
+                Dict[str, Any]: 包含命中、未命中、淘汰、过期、拒绝写入次数及命中率的字典
+            """
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejections": self.rejections,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._cache),
+                "bytes": self._bytes,
+            }
+
+        def reset_stats(self) -> None:
+            """
+            重置统计计数
+            """
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.rejections = 0
+
+        def _remove(self, key: str) -> None:
+            item = self._cache.pop(key)
+            self._bytes -= item["size"]
+            self._policy.on_remove(key)
+
+        def _is_full(self, extra_entries: int = 0, extra_bytes: int = 0) -> bool:
+            if (
+                self._max_entries is not None
+                and len(self._cache) + extra_entries > self._max_entries
+            ):
+                return True
+            if (
+                self._max_bytes is not None
+                and self._bytes + extra_bytes > self._max_bytes
+            ):
+                return True
+            return False
+
+        def _make_room(self, key: str, size: int) -> bool:
+            """
+            为新键腾出空间，准入策略拒绝或值超过max_bytes时返回False
+            """
+            if self._max_bytes is not None and size > self._max_bytes:
+                return False
+            while self._cache and self._is_full(1, size):
+                victim = self._policy.victim()
+                if victim is None:
+                    break
+                if not self._policy.admit(key, victim):
+                    return False
+                self._remove(victim)
+                self.evictions += 1
+            return True
+
+        def _evict_overflow(self) -> None:
+            while self._cache and self._is_full():
+                victim = self._policy.victim()
+                if victim is None:
+                    break
+                self._remove(victim)
+                self.evictions += 1
+
+        def _compact_heap(self) -> None:
+            # 覆盖写入会在堆中留下失效记录，数量过多时重建堆
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._expiry_heap = [
+                    (item["expire_time"], next(self._counter), key)
+                    for key, item in self._cache.items()
+                ]
+                heapq.heapify(self._expiry_heap)
+
         def _clean_expired(self) -> None:
             """
             清理过期的缓存项
             """
-            expired_keys = []
+            heap = self._expiry_heap
             current_time = time.time()
 
-            for key, item in self._cache.items():
-                if current_time > item["expire_time"]:
-                    expired_keys.append(key)
+            while heap and heap[0][0] < current_time:
+                expire_time, _, key = heapq.heappop(heap)
+                item = self._cache.get(key)
+                # 跳过已被覆盖写入或删除的失效记录
+                if item is not None and item["expire_time"] == expire_time:
+                    self._remove(key)
+                    self.expirations += 1
+
+    class _Flight:
+        """正在进行中的加载任务，供等待同一个键的调用方共享结果"""
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.value: Any = None
+            self.error: Optional[BaseException] = None
+
+    class ShardedMemoryCache:
+        """线程安全的分片内存缓存
+
+        按键的哈希值将数据分散到多个MemoryCache分片，每个分片由独立的锁保护，
+        减少多线程访问时的锁竞争；get_or_load保证同一个键同时只有一个加载函数在执行。
+        """
+
+        def __init__(
+            self,
+            default_ttl: int = 3600,
+            shards: int = 16,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            eviction_policy: str = "lru",
+        ):
+            """
+            初始化分片内存缓存
+
+            Args:
+                default_ttl: 默认过期时间（秒）
+                shards: 分片数量，超过max_entries或max_bytes时按容量减少
+                max_entries: 最大条目数（所有分片合计），为None时不限制
+                max_bytes: 最大占用字节数（所有分片合计），为None时不限制
+                eviction_policy: 淘汰策略，可选"lru"、"lfu"、"tinylfu"
+            """
+            if shards < 1:
+                raise ValueError("分片数量必须大于0")
+            # 容量小于分片数时减少分片，保证每个分片至少能容纳一个条目
+            for limit in (max_entries, max_bytes):
+                if limit is not None:
+                    shards = max(1, min(shards, limit))
+
+            def per_shard(limit: Optional[int], index: int) -> Optional[int]:
+                # 余数分给前几个分片，各分片的容量之和恰好等于总容量
+                if limit is None:
+                    return None
+                return limit // shards + (1 if index < limit % shards else 0)
+
+            self._shards = [
+                CacheUtils.MemoryCache(
+                    default_ttl,
+                    per_shard(max_entries, index),
+                    per_shard(max_bytes, index),
+                    eviction_policy,
+                )
+                for index in range(shards)
+            ]
+            self._locks = [threading.Lock() for _ in range(shards)]
+            self._flights: List[Dict[str, "CacheUtils._Flight"]] = [
+                {} for _ in range(shards)
+            ]
+
+        def _index(self, key: str) -> int:
+            return hash(key) % len(self._shards)
+
+        def get(self, key: str) -> Optional[Any]:
+            """
+            获取缓存值
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                Any: 缓存值，如果不存在或已过期则返回None
+            """
+            index = self._index(key)
+            with self._locks[index]:
+                return self._shards[index].get(key)
+
+        def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+            """
+            设置缓存值
+
+            Args:
+                key: 缓存键
+                value: 缓存值
+                ttl: 过期时间（秒），如果为None则使用默认值
+            """
+            index = self._index(key)
+            with self._locks[index]:
+                self._shards[index].set(key, value, ttl)
+
+        def get_or_load(
+            self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None
+        ) -> Any:
+            """
+            获取缓存值，未命中时调用加载函数并写入缓存
 
-            for key in expired_keys:
-                del self._cache[key]
+            同一个键并发未命中时只有一个线程执行loader，其余线程等待并共享其结果；
+            loader抛出的异常会传递给所有等待的线程，且不会写入缓存。
+
+            Args:
+                key: 缓存键
+                loader: 无参加载函数
+                ttl: 过期时间（秒），如果为None则使用默认值
+
+            Returns:
+                Any: 缓存值或加载结果
+            """
+            index = self._index(key)
+            lock = self._locks[index]
+            flights = self._flights[index]
+
+            with lock:
+                value = self._shards[index].get(key)
+                if value is not None:
+                    return value
+                flight = flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = CacheUtils._Flight()
+                    flights[key] = flight
+
+            if not leader:
+                flight.event.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+
+            try:
+                flight.value = loader()
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with lock:
+                    if flight.error is None and flight.value is not None:
+                        self._shards[index].set(key, flight.value, ttl)
+                    del flights[key]
+                flight.event.set()
+            return flight.value
+
+        def delete(self, key: str) -> None:
+            """
+            删除缓存值
+
+            Args:
+                key: 缓存键
+            """
+            index = self._index(key)
+            with self._locks[index]:
+                self._shards[index].delete(key)
+
+        def clear(self) -> None:
+            """
+            清空缓存
+            """
+            for shard, lock in zip(self._shards, self._locks):
+                with lock:
+                    shard.clear()
+
+        def exists(self, key: str) -> bool:
+            """
+            检查缓存键是否存在且未过期
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                bool: 如果存在且未过期则返回True，否则返回False
+            """
+            index = self._index(key)
+            with self._locks[index]:
+                return self._shards[index].exists(key)
+
+        def size(self) -> int:
+            """
+            获取缓存大小
+
+            Returns:
+                int: 缓存中的键值对数量
+            """
+            total = 0
+            for shard, lock in zip(self._shards, self._locks):
+                with lock:
+                    total += shard.size()
+            return total
+
+        def stats(self) -> Dict[str, Any]:
+            """
+            获取所有分片汇总的统计信息
+
+            Returns:
+                Dict[str, Any]: 包含命中、未命中、淘汰、过期、拒绝写入次数及命中率的字典
+            """
+            totals = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+                "rejections": 0,
+                "size": 0,
+                "bytes": 0,
+            }
+            for shard, lock in zip(self._shards, self._locks):
+                with lock:
+                    shard_stats = shard.stats()
+                for name in totals:
+                    totals[name] += shard_stats[name]
+            lookups = totals["hits"] + totals["misses"]
+            totals["hit_rate"] = totals["hits"] / lookups if lookups else 0.0
+            return totals
 
     class FileCache:
         """文件缓存实现"""
@@ -247,6 +864,345 @@ class CacheUtils:
             except Exception:
                 pass
 
+    class BinaryFileCache:
+        """二进制日志文件缓存实现
+
+        所有键值以追加方式写入同一个日志文件，值使用pickle序列化；内存中维护
+        键到文件偏移量和过期时间的索引，读取只需一次定位读，清理过期项无需读取文件。
+        失效记录占比过高时自动压缩，压缩结果先写入临时文件再通过重命名原子替换。
+
+        同一缓存目录只能由一个实例独占使用：打开时对目录中的锁文件加排他文件锁，
+        其他进程（或同一进程中的另一个实例）打开同一目录会抛出RuntimeError，
+        close后释放。多进程共享缓存请使用Redis等外部缓存。
+
+        注意：pickle反序列化不安全，缓存目录只能由可信进程写入。
+        """
+
+        _LOG_NAME = "cache.log"
+        _LOCK_NAME = "cache.lock"
+        _HEADER = struct.Struct("<BdII")
+        _OP_SET = 1
+        _OP_DELETE = 2
+
+        def __init__(
+            self,
+            cache_dir: str = "./cache",
+            default_ttl: int = 3600,
+            compact_threshold: float = 0.5,
+            compact_min_bytes: int = 1024 * 1024,
+        ):
+            """
+            初始化二进制日志文件缓存
+
+            Args:
+                cache_dir: 缓存目录
+                default_ttl: 默认过期时间（秒）
+                compact_threshold: 失效数据占日志文件的比例超过该值时触发压缩
+                compact_min_bytes: 日志文件小于该字节数时不触发自动压缩
+
+            Raises:
+                RuntimeError: 缓存目录已被其他实例占用
+            """
+            self._cache_dir = cache_dir
+            self._default_ttl = default_ttl
+            self._compact_threshold = compact_threshold
+            self._compact_min_bytes = compact_min_bytes
+            self._path = os.path.join(cache_dir, self._LOG_NAME)
+            self._lock = threading.RLock()
+            # 键 -> (值偏移量, 值长度, 过期时间, 记录长度)
+            self._index: Dict[str, Tuple[int, int, float, int]] = {}
+            self._expiry_heap: List[Tuple[float, str]] = []
+            self._dead_bytes = 0
+
+            os.makedirs(self._cache_dir, exist_ok=True)
+            self._lock_file = self._acquire_dir_lock()
+            try:
+                self._file = open(self._path, "a+b")
+                self._load_index()
+            except BaseException:
+                self._release_dir_lock()
+                raise
+
+        def _acquire_dir_lock(self):
+            """
+            对缓存目录的锁文件加非阻塞排他锁，防止多个进程交错追加导致索引偏移量错乱
+
+            Returns:
+                已加锁的锁文件对象
+            """
+            lock_path = os.path.join(self._cache_dir, self._LOCK_NAME)
+            lock_file = open(lock_path, "a+b")
+            try:
+                if sys.platform == "win32":
+                    import msvcrt
+
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise RuntimeError(f"缓存目录已被其他实例占用: {self._cache_dir}")
+            return lock_file
+
+        def _release_dir_lock(self) -> None:
+            """
+            释放缓存目录的文件锁
+            """
+            if self._lock_file.closed:
+                return
+            try:
+                if sys.platform == "win32":
+                    import msvcrt
+
+                    self._lock_file.seek(0)
+                    msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._lock_file.close()
+
+        def _load_index(self) -> None:
+            """
+            扫描日志文件重建索引，只读取记录头和键，跳过值内容
+            """
+            header_size = self._HEADER.size
+            file_size = self._file_size()
+            self._file.seek(0)
+            offset = 0
+            while True:
+                header = self._file.read(header_size)
+                if len(header) < header_size:
+                    break
+                op, expire_time, key_len, value_len = self._HEADER.unpack(header)
+                key_bytes = self._file.read(key_len)
+                record_len = header_size + key_len + value_len
+                if len(key_bytes) < key_len or offset + record_len > file_size:
+                    break
+                key = key_bytes.decode("utf-8")
+                old = self._index.pop(key, None)
+                if old is not None:
+                    self._dead_bytes += old[3]
+                if op == self._OP_SET:
+                    value_offset = offset + header_size + key_len
+                    self._index[key] = (
+                        value_offset,
+                        value_len,
+                        expire_time,
+                        record_len,
+                    )
+                    heapq.heappush(self._expiry_heap, (expire_time, key))
+                else:
+                    self._dead_bytes += record_len
+                self._file.seek(value_len, os.SEEK_CUR)
+                offset += record_len
+
+            # 截断进程崩溃时写了一半的尾部记录
+            if offset < file_size:
+                self._file.truncate(offset)
+            self._file.seek(0, os.SEEK_END)
+
+        def _file_size(self) -> int:
+            return os.fstat(self._file.fileno()).st_size
+
+        def _read_at(self, offset: int, length: int) -> bytes:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+        def _append(self, op: int, key: str, expire_time: float, payload: bytes) -> int:
+            key_bytes = key.encode("utf-8")
+            record = (
+                self._HEADER.pack(op, expire_time, len(key_bytes), len(payload))
+                + key_bytes
+                + payload
+            )
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(record)
+            self._file.flush()
+            return offset + self._HEADER.size + len(key_bytes)
+
+        def _drop(self, key: str) -> None:
+            entry = self._index.pop(key, None)
+            if entry is not None:
+                self._dead_bytes += entry[3]
+
+        def get(self, key: str) -> Optional[Any]:
+            """
+            获取缓存值
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                Any: 缓存值，如果不存在或已过期则返回None
+            """
+            with self._lock:
+                entry = self._index.get(key)
+                if entry is None:
+                    return None
+                value_offset, value_len, expire_time, _ = entry
+                if time.time() > expire_time:
+                    self._drop(key)
+                    return None
+                try:
+                    return pickle.loads(self._read_at(value_offset, value_len))
+                except Exception:
+                    return None
+
+        def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+            """
+            设置缓存值
+
+            Args:
+                key: 缓存键
+                value: 缓存值
+                ttl: 过期时间（秒），如果为None则使用默认值
+            """
+            expire_time = time.time() + (ttl or self._default_ttl)
+            try:
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                return
+
+            with self._lock:
+                try:
+                    value_offset = self._append(self._OP_SET, key, expire_time, payload)
+                except Exception:
+                    return
+                self._drop(key)
+                record_len = self._HEADER.size + len(key.encode("utf-8")) + len(payload)
+                self._index[key] = (value_offset, len(payload), expire_time, record_len)
+                heapq.heappush(self._expiry_heap, (expire_time, key))
+                self._maybe_compact()
+
+        def delete(self, key: str) -> None:
+            """
+            删除缓存值
+
+            Args:
+                key: 缓存键
+            """
+            with self._lock:
+                if key not in self._index:
+                    return
+                try:
+                    self._append(self._OP_DELETE, key, 0.0, b"")
+                except Exception:
+                    return
+                self._drop(key)
+                self._dead_bytes += self._HEADER.size + len(key.encode("utf-8"))
+                self._maybe_compact()
+
+        def clear(self) -> None:
+            """
+            清空缓存
+            """
+            with self._lock:
+                self._index.clear()
+                self._expiry_heap.clear()
+                self._rewrite()
+
+        def exists(self, key: str) -> bool:
+            """
+            检查缓存键是否存在且未过期
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                bool: 如果存在且未过期则返回True，否则返回False
+            """
+            with self._lock:
+                entry = self._index.get(key)
+                return entry is not None and time.time() <= entry[2]
+
+        def size(self) -> int:
+            """
+            获取缓存大小
+
+            Returns:
+                int: 缓存中的键值对数量
+            """
+            with self._lock:
+                self._clean_expired()
+                return len(self._index)
+
+        def compact(self) -> None:
+            """
+            压缩日志文件，只保留未过期的有效记录
+            """
+            with self._lock:
+                self._clean_expired()
+                self._rewrite()
+
+        def close(self) -> None:
+            """
+            关闭日志文件并释放缓存目录的文件锁
+            """
+            with self._lock:
+                if not self._file.closed:
+                    self._file.close()
+                self._release_dir_lock()
+
+        def _maybe_compact(self) -> None:
+            file_size = self._file_size()
+            if (
+                file_size >= self._compact_min_bytes
+                and self._dead_bytes > file_size * self._compact_threshold
+            ):
+                self.compact()
+
+        def _rewrite(self) -> None:
+            """
+            将有效记录写入临时文件，然后原子替换日志文件
+            """
+            tmp_path = self._path + ".tmp"
+            new_index: Dict[str, Tuple[int, int, float, int]] = {}
+            with open(tmp_path, "wb") as tmp:
+                for key, (
+                    value_offset,
+                    value_len,
+                    expire_time,
+                    _,
+                ) in self._index.items():
+                    key_bytes = key.encode("utf-8")
+                    payload = self._read_at(value_offset, value_len)
+                    header = self._HEADER.pack(
+                        self._OP_SET, expire_time, len(key_bytes), value_len
+                    )
+                    new_offset = tmp.tell() + len(header) + len(key_bytes)
+                    tmp.write(header + key_bytes + payload)
+                    record_len = len(header) + len(key_bytes) + value_len
+                    new_index[key] = (new_offset, value_len, expire_time, record_len)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            self._file.close()
+            os.replace(tmp_path, self._path)
+            self._file = open(self._path, "a+b")
+            self._index = new_index
+            self._expiry_heap = [(entry[2], key) for key, entry in new_index.items()]
+            heapq.heapify(self._expiry_heap)
+            self._dead_bytes = 0
+
+        def _clean_expired(self) -> None:
+            """
+            清理过期的缓存项，只操作内存索引
+            """
+            heap = self._expiry_heap
+            current_time = time.time()
+
+            while heap and heap[0][0] < current_time:
+                expire_time, key = heapq.heappop(heap)
+                entry = self._index.get(key)
+                if entry is not None and entry[2] == expire_time:
+                    self._drop(key)
+
     class RedisCache:
         """Redis缓存实现"""
 
@@ -257,6 +1213,7 @@ class CacheUtils:
             db: int = 0,
             password: Optional[str] = None,
             default_ttl: int = 3600,
+            client: Optional[Any] = None,
         ):
             """
             初始化Redis缓存
@@ -267,7 +1224,14 @@ class CacheUtils:
                 db: Redis数据库
                 password: Redis密码
                 default_ttl: 默认过期时间（秒）
+                client: 已创建的Redis客户端（需设置decode_responses=True），传入时忽略连接参数
             """
+            if client is not None:
+                self._redis = client
+                self._default_ttl = default_ttl
+                self._available = True
+                return
+
             try:
                 import redis
 
@@ -324,6 +1288,72 @@ class CacheUtils:
             except Exception:
                 pass
 
+        def mget(self, keys: List[str]) -> Dict[str, Any]:
+            """
+            批量获取缓存值，一次网络往返完成
+
+            Args:
+                keys: 缓存键列表
+
+            Returns:
+                Dict[str, Any]: 存在的键及其缓存值
+            """
+            if not self._available or not keys:
+                return {}
+
+            try:
+                values = self._redis.mget(keys)
+            except Exception:
+                return {}
+
+            result = {}
+            for key, value in zip(keys, values):
+                if value:
+                    try:
+                        result[key] = json.loads(value)
+                    except Exception:
+                        pass
+            return result
+
+        def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+            """
+            批量设置缓存值，通过管道一次网络往返完成
+
+            Args:
+                mapping: 键值对字典
+                ttl: 过期时间（秒），如果为None则使用默认值
+            """
+            if not self._available or not mapping:
+                return
+
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for key, value in mapping.items():
+                    pipe.setex(
+                        key,
+                        ttl or self._default_ttl,
+                        json.dumps(value, ensure_ascii=False),
+                    )
+                pipe.execute()
+            except Exception:
+                pass
+
+        def publish(self, channel: str, message: str) -> None:
+            """
+            向频道发布消息
+
+            Args:
+                channel: 频道名称
+                message: 消息内容
+            """
+            if not self._available:
+                return
+
+            try:
+                self._redis.publish(channel, message)
+            except Exception:
+                pass
+
         def delete(self, key: str) -> None:
             """
             删除缓存值
@@ -400,18 +1430,279 @@ class CacheUtils:
             except Exception:
                 return False
 
+    class TieredCache:
+        """两级缓存实现
+
+        在RedisCache前放置一个容量有限的进程内近端缓存，读请求优先命中本地内存，
+        避免网络往返和JSON解码；写入和删除通过Redis发布订阅通知其他进程失效本地副本。
+        """
+
+        def __init__(
+            self,
+            redis_cache: "CacheUtils.RedisCache",
+            near_max_entries: int = 1024,
+            near_ttl: int = 60,
+            channel: str = "btools:cache:invalidate",
+            subscribe: bool = True,
+        ):
+            """
+            初始化两级缓存
+
+            Args:
+                redis_cache: 远端Redis缓存实例
+                near_max_entries: 近端缓存最大条目数
+                near_ttl: 近端缓存过期时间（秒），限制未收到失效通知时的最大不一致时长
+                channel: 失效通知使用的发布订阅频道
+                subscribe: 是否订阅失效通知
+            """
+            self._remote = redis_cache
+            self._near = CacheUtils.ShardedMemoryCache(
+                default_ttl=near_ttl, max_entries=near_max_entries
+            )
+            self._near_ttl = near_ttl
+            self._channel = channel
+            self._origin = uuid.uuid4().hex
+            self._pubsub = None
+            self._listener = None
+
+            if subscribe and redis_cache._available:
+                try:
+                    self._pubsub = redis_cache._redis.pubsub(
+                        ignore_subscribe_messages=True
+                    )
+                    self._pubsub.subscribe(**{channel: self._on_message})
+                    self._listener = self._pubsub.run_in_thread(
+                        sleep_time=0.01, daemon=True
+                    )
+                except Exception:
+                    self._pubsub = None
+                    self._listener = None
+
+        def _on_message(self, message: Dict[str, Any]) -> None:
+            data = message.get("data")
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            if not isinstance(data, str):
+                return
+            origin, _, key = data.partition(":")
+            if origin == self._origin:
+                return
+            if key == "*":
+                self._near.clear()
+            else:
+                self._near.delete(key)
+
+        def _invalidate(self, keys: List[str]) -> None:
+            for key in keys:
+                self._remote.publish(self._channel, f"{self._origin}:{key}")
+
+        def get(self, key: str) -> Optional[Any]:
+            """
+            获取缓存值，近端未命中时回源Redis并回填近端缓存
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                Any: 缓存值，如果不存在则返回None
+            """
+            value = self._near.get(key)
+            if value is not None:
+                return value
+
+            value = self._remote.get(key)
+            if value is not None:
+                self._near.set(key, value)
+            return value
+
+        def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+            """
+            设置缓存值
+
+            Args:
+                key: 缓存键
+                value: 缓存值
+                ttl: 远端过期时间（秒），如果为None则使用默认值
+            """
+            self._remote.set(key, value, ttl)
+            self._near.set(key, value, min(ttl, self._near_ttl) if ttl else None)
+            self._invalidate([key])
+
+        def mget(self, keys: List[str]) -> Dict[str, Any]:
+            """
+            批量获取缓存值，只对近端未命中的键访问Redis
+
+            Args:
+                keys: 缓存键列表
+
+            Returns:
+                Dict[str, Any]: 存在的键及其缓存值
+            """
+            result = {}
+            missing = []
+            for key in keys:
+                value = self._near.get(key)
+                if value is not None:
+                    result[key] = value
+                else:
+                    missing.append(key)
+
+            if missing:
+                fetched = self._remote.mget(missing)
+                for key, value in fetched.items():
+                    self._near.set(key, value)
+                result.update(fetched)
+            return result
+
+        def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+            """
+            批量设置缓存值
+
+            Args:
+                mapping: 键值对字典
+                ttl: 远端过期时间（秒），如果为None则使用默认值
+            """
+            self._remote.mset(mapping, ttl)
+            near_ttl = min(ttl, self._near_ttl) if ttl else None
+            for key, value in mapping.items():
+                self._near.set(key, value, near_ttl)
+            self._invalidate(list(mapping))
+
+        def delete(self, key: str) -> None:
+            """
+            删除缓存值
+
+            Args:
+                key: 缓存键
+            """
+            self._remote.delete(key)
+            self._near.delete(key)
+            self._invalidate([key])
+
+        def clear(self) -> None:
+            """
+            清空缓存
+            """
+            self._remote.clear()
+            self._near.clear()
+            self._invalidate(["*"])
+
+        def exists(self, key: str) -> bool:
+            """
+            检查缓存键是否存在
+
+            Args:
+                key: 缓存键
+
+            Returns:
+                bool: 如果存在则返回True，否则返回False
+            """
+            return self._near.exists(key) or self._remote.exists(key)
+
+        def size(self) -> int:
+            """
+            获取远端缓存大小
+
+            Returns:
+                int: 缓存中的键值对数量
+            """
+            return self._remote.size()
+
+        def stats(self) -> Dict[str, Any]:
+            """
+            获取近端缓存统计信息
+
+            Returns:
+                Dict[str, Any]: 近端缓存的命中、未命中、淘汰次数及命中率
+            """
+            return self._near.stats()
+
+        def close(self) -> None:
+            """
+            停止失效通知监听
+            """
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            if self._pubsub is not None:
+                try:
+                    self._pubsub.close()
+                except Exception:
+                    pass
+                self._pubsub = None
+
+    @staticmethod
+    def _create_policy(
+        policy: Union[str, "CacheUtils.EvictionPolicy"], capacity: Optional[int]
+    ) -> "CacheUtils.EvictionPolicy":
+        """
+        根据名称创建淘汰策略实例
+
+        Args:
+            policy: 策略名称或策略实例
+            capacity: 预期容量
+
+        Returns:
+            EvictionPolicy: 淘汰策略实例
+        """
+        if isinstance(policy, CacheUtils.EvictionPolicy):
+            return policy
+        name = str(policy).lower()
+        if name == "lru":
+            return CacheUtils.LRUPolicy()
+        if name == "lfu":
+            return CacheUtils.LFUPolicy()
+        if name == "tinylfu":
+            return CacheUtils.TinyLFUPolicy(capacity or 1024)
+        raise ValueError(f"不支持的淘汰策略: {policy}")
+
     @staticmethod
-    def create_memory_cache(default_ttl: int = 3600) -> MemoryCache:
+    def create_memory_cache(
+        default_ttl: int = 3600,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Union[str, "CacheUtils.EvictionPolicy"] = "lru",
+    ) -> MemoryCache:
         """
         创建内存缓存实例
 
         Args:
             default_ttl: 默认过期时间（秒）
+            max_entries: 最大条目数，为None时不限制
+            max_bytes: 最大占用字节数，为None时不限制
+            eviction_policy: 淘汰策略，可选"lru"、"lfu"、"tinylfu"或EvictionPolicy实例
 
         Returns:
             MemoryCache: 内存缓存实例
         """
-        return CacheUtils.MemoryCache(default_ttl)
+        return CacheUtils.MemoryCache(
+            default_ttl, max_entries, max_bytes, eviction_policy
+        )
+
+    @staticmethod
+    def create_sharded_memory_cache(
+        default_ttl: int = 3600,
+        shards: int = 16,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: str = "lru",
+    ) -> ShardedMemoryCache:
+        """
+        创建线程安全的分片内存缓存实例
+
+        Args:
+            default_ttl: 默认过期时间（秒）
+            shards: 分片数量
+            max_entries: 最大条目数（所有分片合计），为None时不限制
+            max_bytes: 最大占用字节数（所有分片合计），为None时不限制
+            eviction_policy: 淘汰策略，可选"lru"、"lfu"、"tinylfu"
+
+        Returns:
+            ShardedMemoryCache: 分片内存缓存实例
+        """
+        return CacheUtils.ShardedMemoryCache(
+            default_ttl, shards, max_entries, max_bytes, eviction_policy
+        )
 
     @staticmethod
     def create_file_cache(
@@ -429,6 +1720,22 @@ class CacheUtils:
         """
         return CacheUtils.FileCache(cache_dir, default_ttl)
 
+    @staticmethod
+    def create_binary_file_cache(
+        cache_dir: str = "./cache", default_ttl: int = 3600
+    ) -> BinaryFileCache:
+        """
+        创建二进制日志文件缓存实例
+
+        Args:
+            cache_dir: 缓存目录
+            default_ttl: 默认过期时间（秒）
+
+        Returns:
+            BinaryFileCache: 二进制日志文件缓存实例
+        """
+        return CacheUtils.BinaryFileCache(cache_dir, default_ttl)
+
     @staticmethod
     def create_redis_cache(
         host: str = "localhost",
@@ -451,3 +1758,24 @@ class CacheUtils:
             RedisCache: Redis缓存实例
         """
         return CacheUtils.RedisCache(host, port, db, password, default_ttl)
+
+    @staticmethod
+    def create_tiered_cache(
+        redis_cache: RedisCache,
+        near_max_entries: int = 1024,
+        near_ttl: int = 60,
+        channel: str = "btools:cache:invalidate",
+    ) -> TieredCache:
+        """
+        创建两级缓存实例
+
+        Args:
+            redis_cache: 远端Redis缓存实例
+            near_max_entries: 近端缓存最大条目数
+            near_ttl: 近端缓存过期时间（秒）
+            channel: 失效通知使用的发布订阅频道
+
+        Returns:
+            TieredCache: 两级缓存实例
+        """
+        return CacheUtils.TieredCache(redis_cache, near_max_entries, near_ttl, channel)
@@ -1,4 +1,15 @@
 # Config utilities
-from .configutils import Config
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "Config": ".configutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .configutils import Config
 
 __all__ = ["Config"]
@@ -1,16 +1,38 @@
 # Data utilities
-from .cryptoutils import CryptoUtils
-from .csvutils import CSVHandler
-from .databaseutils import DatabaseUtils
-from .datetimeutils import DateTimeUtils
-from .encodeutils import EncodeUtils
-from .excelutils import ExcelHandler
-from .fileutils import FileUtils
-from .ioutils import IOUtils
-from .jsonpathutils import JSONPathUtils
-from .jsonutils import JSONUtils
-from .regexutils import RegexUtils
-from .xmlutils import XmlUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "CryptoUtils": ".cryptoutils",
+    "CSVHandler": ".csvutils",
+    "DatabaseUtils": ".databaseutils",
+    "DateTimeUtils": ".datetimeutils",
+    "EncodeUtils": ".encodeutils",
+    "ExcelHandler": ".excelutils",
+    "FileUtils": ".fileutils",
+    "IOUtils": ".ioutils",
+    "JSONPathUtils": ".jsonpathutils",
+    "JSONUtils": ".jsonutils",
+    "RegexUtils": ".regexutils",
+    "XmlUtils": ".xmlutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .cryptoutils import CryptoUtils
+    from .csvutils import CSVHandler
+    from .databaseutils import DatabaseUtils
+    from .datetimeutils import DateTimeUtils
+    from .encodeutils import EncodeUtils
+    from .excelutils import ExcelHandler
+    from .fileutils import FileUtils
+    from .ioutils import IOUtils
+    from .jsonpathutils import JSONPathUtils
+    from .jsonutils import JSONUtils
+    from .regexutils import RegexUtils
+    from .xmlutils import XmlUtils
 
 __all__ = [
     "FileUtils",
@@ -1,37 +1,621 @@
 """数据库工具类"""
 
 import sqlite3
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
 class DatabaseUtils:
     """数据库工具类"""
 
-    class SQLiteDatabase:
+    class ConnectionPool:
+        """线程安全的数据库连接池
+
+        空闲连接按后进先出复用，使常用连接保持活跃；空闲超时的连接在借出和归还时回收，
+        但保留至少min_size个连接。借出时可执行健康检查，失效连接会被丢弃并重新创建。
+        """
+
+        def __init__(
+            self,
+            factory: Callable[[], Any],
+            min_size: int = 1,
+            max_size: int = 10,
+            timeout: float = 30.0,
+            idle_timeout: float = 300.0,
+            health_check: Optional[Callable[[Any], bool]] = None,
+        ):
+            """
+            初始化连接池
+
+            Args:
+                factory: 创建新连接的函数
+                min_size: 最小连接数，初始化时预先创建
+                max_size: 最大连接数
+                timeout: 连接耗尽时等待空闲连接的超时时间（秒）
+                idle_timeout: 空闲连接的最长保留时间（秒），为None时不回收
+                health_check: 借出连接时执行的健康检查函数，返回False或抛出异常表示连接失效
+            """
+            if max_size < 1 or min_size < 0 or min_size > max_size:
+                raise ValueError(
+                    "连接池大小必须满足 0 <= min_size <= max_size 且 max_size >= 1"
+                )
+
+            self._factory = factory
+            self._min_size = min_size
+            self._max_size = max_size
+            self._timeout = timeout
+            self._idle_timeout = idle_timeout
+            self._health_check = health_check
+            self._condition = threading.Condition()
+            # 空闲连接及其归还时间
+            self._idle: "deque[Tuple[Any, float]]" = deque()
+            self._size = 0
+            self._in_use = 0
+            self._closed = False
+            self._metrics = {
+                "checkouts": 0,
+                "waits": 0,
+                "wait_time_total": 0.0,
+                "wait_time_max": 0.0,
+                "timeouts": 0,
+                "created": 0,
+                "closed": 0,
+                "health_check_failures": 0,
+            }
+
+            for _ in range(min_size):
+                self._idle.append((self._create(), time.monotonic()))
+
+        def _create(self) -> Any:
+            conn = self._factory()
+            self._size += 1
+            self._metrics["created"] += 1
+            return conn
+
+        def _discard(self, conn: Any) -> None:
+            self._size -= 1
+            self._metrics["closed"] += 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+        def _evict_idle(self) -> None:
+            # 最早归还的连接位于队首
+            if self._idle_timeout is None:
+                return
+            deadline = time.monotonic() - self._idle_timeout
+            while (
+                self._idle
+                and self._size > self._min_size
+                and self._idle[0][1] < deadline
+            ):
+                conn, _ = self._idle.popleft()
+                self._discard(conn)
+
+        def _is_healthy(self, conn: Any) -> bool:
+            if self._health_check is None:
+                return True
+            try:
+                return bool(self._health_check(conn))
+            except Exception:
+                return False
+
+        def acquire(self, timeout: Optional[float] = None) -> Any:
+            """
+            借出一个连接
+
+            Args:
+                timeout: 等待超时时间（秒），为None时使用连接池默认值
+
+            Returns:
+                Any: 数据库连接
+
+            Raises:
+                TimeoutError: 超时仍没有可用连接
+                RuntimeError: 连接池已关闭
+            """
+            timeout = self._timeout if timeout is None else timeout
+            with self._condition:
+                waited = 0.0
+                deadline = None
+                while True:
+                    if self._closed:
+                        raise RuntimeError("连接池已关闭")
+                    self._evict_idle()
+
+                    while self._idle:
+                        conn, _ = self._idle.pop()
+                        if self._is_healthy(conn):
+                            return self._checkout(conn, waited)
+                        self._metrics["health_check_failures"] += 1
+                        self._discard(conn)
+
+                    if self._size < self._max_size:
+                        # 新建连接期间占用名额，避免其他线程超额创建
+                        self._size += 1
+                        break
+
+                    now = time.monotonic()
+                    if deadline is None:
+                        deadline = now + timeout
+                        self._metrics["waits"] += 1
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._metrics["timeouts"] += 1
+                        self._record_wait(waited)
+                        raise TimeoutError(f"等待数据库连接超时: {timeout} 秒")
+                    self._condition.wait(remaining)
+                    waited = time.monotonic() - (deadline - timeout)
+
+            try:
+                conn = self._factory()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._metrics["created"] += 1
+                return self._checkout(conn, waited)
+
+        def _checkout(self, conn: Any, waited: float) -> Any:
+            self._in_use += 1
+            self._metrics["checkouts"] += 1
+            self._record_wait(waited)
+            return conn
+
+        def _record_wait(self, waited: float) -> None:
+            if waited > 0:
+                self._metrics["wait_time_total"] += waited
+                self._metrics["wait_time_max"] = max(
+                    self._metrics["wait_time_max"], waited
+                )
+
+        def release(self, conn: Any, discard: bool = False) -> None:
+            """
+            归还连接，未提交的事务会被回滚
+
+            Args:
+                conn: 数据库连接
+                discard: 为True时关闭该连接而不放回连接池
+            """
+            if not discard:
+                try:
+                    conn.rollback()
+                except Exception:
+                    discard = True
+
+            with self._condition:
+                self._in_use -= 1
+                if discard or self._closed:
+                    self._discard(conn)
+                else:
+                    self._idle.append((conn, time.monotonic()))
+                    self._evict_idle()
+                self._condition.notify()
+
+        @contextmanager
+        def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+            """
+            借出连接的上下文管理器，退出时自动归还
+
+            Args:
+                timeout: 等待超时时间（秒），为None时使用连接池默认值
+
+            Yields:
+                Any: 数据库连接
+            """
+            conn = self.acquire(timeout)
+            try:
+                yield conn
+            except BaseException:
+                self.release(conn)
+                raise
+            else:
+                self.release(conn)
+
+        def metrics(self) -> Dict[str, Any]:
+            """
+            获取连接池指标
+
+            Returns:
+                Dict[str, Any]: 包括借出次数、等待次数、总等待时间、最长等待时间、超时次数、
+                    新建和关闭的连接数、健康检查失败次数以及当前连接数、使用中和空闲连接数
+            """
+            with self._condition:
+                metrics = dict(self._metrics)
+                metrics["size"] = self._size
+                metrics["in_use"] = self._in_use
+                metrics["idle"] = len(self._idle)
+                return metrics
+
+        def close(self) -> None:
+            """
+            关闭连接池及所有空闲连接，使用中的连接在归还时关闭
+            """
+            with self._condition:
+                self._closed = True
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    self._discard(conn)
+                self._condition.notify_all()
+
+    class _BaseDatabase:
+        """各数据库实现的公共逻辑：连接池、事务和批量写入
+
+        启用连接池后，数据库操作需要在checkout()上下文中执行，上下文期间当前线程独占一个连接。
+        """
+
+        _placeholder = "%s"
+        _pool: Optional["DatabaseUtils.ConnectionPool"] = None
+        _single_conn: Any = None
+        _local: Optional[threading.local] = None
+
+        @property
+        def _conn(self) -> Any:
+            if self._pool is not None:
+                return getattr(self._local, "conn", None)
+            return self._single_conn
+
+        @_conn.setter
+        def _conn(self, value: Any) -> None:
+            self._single_conn = value
+
+        def _create_connection(self) -> Any:
+            raise NotImplementedError
+
+        def _ping(self, conn: Any) -> bool:
+            raise NotImplementedError
+
+        def _ensure_connection(self) -> bool:
+            """
+            启用连接池时检查当前线程是否已借出连接
+
+            Returns:
+                bool: 启用连接池时返回True
+            """
+            if self._pool is None:
+                return False
+            if self._conn is None:
+                raise RuntimeError("已启用连接池，请在checkout()上下文中执行数据库操作")
+            return True
+
+        def create_pool(
+            self,
+            min_size: int = 1,
+            max_size: int = 10,
+            timeout: float = 30.0,
+            idle_timeout: Optional[float] = 300.0,
+            health_check: bool = True,
+        ) -> "DatabaseUtils.ConnectionPool":
+            """
+            启用连接池
+
+            Args:
+                min_size: 最小连接数
+                max_size: 最大连接数
+                timeout: 等待空闲连接的超时时间（秒）
+                idle_timeout: 空闲连接的最长保留时间（秒），为None时不回收
+                health_check: 借出连接时是否执行健康检查
+
+            Returns:
+                ConnectionPool: 连接池实例
+            """
+            self._local = threading.local()
+            self._pool = DatabaseUtils.ConnectionPool(
+                self._create_connection,
+                min_size,
+                max_size,
+                timeout,
+                idle_timeout,
+                self._ping if health_check else None,
+            )
+            return self._pool
+
+        def close_pool(self) -> None:
+            """
+            关闭连接池
+            """
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+        @contextmanager
+        def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+            """
+            借出一个连接并绑定到当前线程，上下文内的数据库操作都使用该连接
+
+            未启用连接池时直接使用单一连接；嵌套调用时复用外层借出的连接。
+
+            Args:
+                timeout: 等待超时时间（秒），为None时使用连接池默认值
+
+            Yields:
+                数据库实例自身
+            """
+            if self._pool is None:
+                self.connect()
+                yield self
+                return
+            if self._conn is not None:
+                yield self
+                return
+
+            pool = self._pool
+            with pool.connection(timeout) as conn:
+                self._local.conn = conn
+                try:
+                    yield self
+                finally:
+                    self._local.conn = None
+
+        def _tx_holder(self) -> Any:
+            # 启用连接池时事务状态跟随当前线程借出的连接
+            return self._local if self._pool is not None else self
+
+        def _in_transaction(self) -> bool:
+            return getattr(self._tx_holder(), "_tx_depth", 0) > 0
+
+        @contextmanager
+        def transaction(self) -> Iterator[Any]:
+            """
+            事务上下文，期间insert/update/delete等方法不再逐条提交，
+            正常退出时统一提交，发生异常时回滚；嵌套调用时只有最外层提交。
+
+            Yields:
+                数据库实例自身
+            """
+            with self.checkout():
+                holder = self._tx_holder()
+                depth = getattr(holder, "_tx_depth", 0)
+                holder._tx_depth = depth + 1
+                try:
+                    yield self
+                except BaseException:
+                    holder._tx_depth = depth
+                    if depth == 0:
+                        self._conn.rollback()
+                    raise
+                else:
+                    holder._tx_depth = depth
+                    if depth == 0:
+                        self._conn.commit()
+
+        def _upsert_sql(
+            self,
+            table: str,
+            columns: List[str],
+            conflict_columns: List[str],
+            update_columns: List[str],
+        ) -> str:
+            placeholders = ", ".join([self._placeholder] * len(columns))
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            if not update_columns:
+                return f"{sql} ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+            assignments = ", ".join(
+                [f"{col} = excluded.{col}" for col in update_columns]
+            )
+            return (
+                f"{sql} ON CONFLICT ({', '.join(conflict_columns)}) "
+                f"DO UPDATE SET {assignments}"
+            )
+
+        def _write_batches(
+            self,
+            rows: Iterable[Dict[str, Any]],
+            batch_size: int,
+            build_sql: Callable[[List[str]], str],
+        ) -> int:
+            """
+            按批次调用executemany写入数据，所有批次在同一个事务中提交
+
+            Args:
+                rows: 数据字典的可迭代对象，所有字典的键与第一行相同
+                batch_size: 每批行数
+                build_sql: 根据列名列表生成SQL语句的函数
+
+            Returns:
+                int: 写入的行数
+            """
+            iterator = iter(rows)
+            first = next(iterator, None)
+            if first is None:
+                return 0
+
+            columns = list(first.keys())
+            sql = build_sql(columns)
+            total = 0
+            with self.transaction():
+                batch = [tuple(first[col] for col in columns)]
+                for row in iterator:
+                    if len(batch) >= batch_size:
+                        self._execute_batch(sql, batch)
+                        total += len(batch)
+                        batch = []
+                    batch.append(tuple(row[col] for col in columns))
+                self._execute_batch(sql, batch)
+                total += len(batch)
+            return total
+
+        def _execute_batch(self, sql: str, batch: List[Tuple[Any, ...]]) -> None:
+            cursor = self.executemany(sql, batch)
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+        def insert_many(
+            self,
+            table: str,
+            rows: Iterable[Dict[str, Any]],
+            batch_size: int = 1000,
+        ) -> int:
+            """
+            批量插入数据，支持生成器，数据按批次写入并在同一个事务中提交
+
+            Args:
+                table: 表名
+                rows: 数据字典的可迭代对象，所有字典的键与第一行相同
+                batch_size: 每批行数
+
+            Returns:
+                int: 插入的行数
+            """
+
+            def build_sql(columns: List[str]) -> str:
+                placeholders = ", ".join([self._placeholder] * len(columns))
+                return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+            return self._write_batches(rows, batch_size, build_sql)
+
+        def upsert_many(
+            self,
+            table: str,
+            rows: Iterable[Dict[str, Any]],
+            conflict_columns: List[str],
+            update_columns: Optional[List[str]] = None,
+            batch_size: int = 1000,
+        ) -> int:
+            """
+            批量插入或更新数据，与已有数据冲突时更新指定列
+
+            Args:
+                table: 表名
+                rows: 数据字典的可迭代对象，所有字典的键与第一行相同
+                conflict_columns: 判断冲突的唯一键列
+                update_columns: 冲突时更新的列，默认为除冲突列外的所有列，传入空列表表示冲突时忽略
+                batch_size: 每批行数
+
+            Returns:
+                int: 写入的行数
+            """
+
+            def build_sql(columns: List[str]) -> str:
+                updates = (
+                    [col for col in columns if col not in conflict_columns]
+                    if update_columns is None
+                    else update_columns
+                )
+                return self._upsert_sql(table, columns, conflict_columns, updates)
+
+            return self._write_batches(rows, batch_size, build_sql)
+
+    class SQLiteDatabase(_BaseDatabase):
         """SQLite数据库实现"""
 
-        def __init__(self, db_path: str = ":memory:"):
+        _placeholder = "?"
+
+        # 适合批量导入的PRAGMA设置：WAL日志允许读写并发，NORMAL同步级别只在检查点时fsync
+        BULK_LOAD_PRAGMAS = {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "temp_store": "MEMORY",
+        }
+
+        def __init__(
+            self, db_path: str = ":memory:", pragmas: Optional[Dict[str, Any]] = None
+        ):
             """
             初始化SQLite数据库连接
 
             Args:
                 db_path: 数据库文件路径，默认使用内存数据库
+                pragmas: 每个新连接上执行的PRAGMA设置，如 SQLiteDatabase.BULK_LOAD_PRAGMAS
             """
             self._db_path = db_path
+            self._pragmas = dict(pragmas or {})
             self._conn = None
 
+        def _create_connection(self) -> sqlite3.Connection:
+            # 连接池中的连接会在不同线程间传递；create_pool在创建连接池之前先设置_local，
+            # 初始化时预先创建的连接同样需要关闭线程检查
+            conn = sqlite3.connect(self._db_path, check_same_thread=self._local is None)
+            conn.row_factory = sqlite3.Row
+            for name, value in self._pragmas.items():
+                conn.execute(f"PRAGMA {name} = {value}")
+            return conn
+
+        def apply_pragmas(self, pragmas: Dict[str, Any]) -> None:
+            """
+            在当前连接上执行PRAGMA设置，并在之后新建的连接上生效
+
+            Args:
+                pragmas: PRAGMA名称和值的字典
+            """
+            self._pragmas.update(pragmas)
+            self.connect()
+            for name, value in pragmas.items():
+                self._conn.execute(f"PRAGMA {name} = {value}")
+
+        def _ping(self, conn: sqlite3.Connection) -> bool:
+            conn.execute("SELECT 1")
+            return True
+
+        def create_pool(
+            self,
+            min_size: int = 1,
+            max_size: int = 10,
+            timeout: float = 30.0,
+            idle_timeout: Optional[float] = 300.0,
+            health_check: bool = True,
+        ) -> "DatabaseUtils.ConnectionPool":
+            """
+            启用连接池
+
+            内存数据库（以及空路径的临时数据库）的每个连接都是一个独立的空数据库，
+            连接池中的连接之间看不到彼此的数据，因此只支持数据库文件。
+
+            Args:
+                min_size: 最小连接数
+                max_size: 最大连接数
+                timeout: 等待空闲连接的超时时间（秒）
+                idle_timeout: 空闲连接的最长保留时间（秒），为None时不回收
+                health_check: 借出连接时是否执行健康检查
+
+            Returns:
+                ConnectionPool: 连接池实例
+
+            Raises:
+                ValueError: 数据库路径为 ":memory:" 或空字符串
+            """
+            if self._db_path in (":memory:", ""):
+                raise ValueError(
+                    "SQLite内存数据库的每个连接都是独立的空数据库，不能启用连接池，请使用数据库文件"
+                )
+            return super().create_pool(
+                min_size, max_size, timeout, idle_timeout, health_check
+            )
+
         def connect(self) -> None:
             """
             连接到SQLite数据库
             """
+            if self._ensure_connection():
+                return
             if self._conn is None:
-                self._conn = sqlite3.connect(self._db_path)
-                self._conn.row_factory = sqlite3.Row
+                self._conn = self._create_connection()
 
         def disconnect(self) -> None:
             """
-            断开SQLite数据库连接
+            断开SQLite数据库连接，启用连接池时关闭连接池
             """
+            if self._pool is not None:
+                self.close_pool()
+                return
             if self._conn:
                 self._conn.close()
                 self._conn = None
@@ -70,9 +654,9 @@ class DatabaseUtils:
 
         def commit(self) -> None:
             """
-            提交事务
+            提交事务，在transaction()上下文中不立即提交
             """
-            if self._conn:
+            if self._conn and not self._in_transaction():
                 self._conn.commit()
 
         def rollback(self) -> None:
@@ -220,7 +804,7 @@ class DatabaseUtils:
             sql = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
             return self.fetch_one(sql, (table,)) is not None
 
-    class MySQLDatabase:
+    class MySQLDatabase(_BaseDatabase):
         """MySQL数据库实现"""
 
         def __init__(
@@ -251,30 +835,42 @@ class DatabaseUtils:
             self._charset = charset
             self._conn = None
 
+        def _create_connection(self) -> Any:
+            try:
+                import pymysql
+            except ImportError:
+                raise ImportError("Please install pymysql: pip install pymysql")
+
+            return pymysql.connect(
+                host=self._host,
+                port=self._port,
+                user=self._user,
+                password=self._password,
+                database=self._database,
+                charset=self._charset,
+                cursorclass=pymysql.cursors.DictCursor,
+            )
+
+        def _ping(self, conn: Any) -> bool:
+            conn.ping(reconnect=False)
+            return True
+
         def connect(self) -> None:
             """
             连接到MySQL数据库
             """
+            if self._ensure_connection():
+                return
             if self._conn is None:
-                try:
-                    import pymysql
-
-                    self._conn = pymysql.connect(
-                        host=self._host,
-                        port=self._port,
-                        user=self._user,
-                        password=self._password,
-                        database=self._database,
-                        charset=self._charset,
-                        cursorclass=pymysql.cursors.DictCursor,
-                    )
-                except ImportError:
-                    raise ImportError("Please install pymysql: pip install pymysql")
+                self._conn = self._create_connection()
 
         def disconnect(self) -> None:
             """
-            断开MySQL数据库连接
+            断开MySQL数据库连接，启用连接池时关闭连接池
             """
+            if self._pool is not None:
+                self.close_pool()
+                return
             if self._conn:
                 self._conn.close()
                 self._conn = None
@@ -313,9 +909,9 @@ class DatabaseUtils:
 
         def commit(self) -> None:
             """
-            提交事务
+            提交事务，在transaction()上下文中不立即提交
             """
-            if self._conn:
+            if self._conn and not self._in_transaction():
                 self._conn.commit()
 
         def rollback(self) -> None:
@@ -459,7 +1055,24 @@ class DatabaseUtils:
             sql = "SELECT table_name FROM information_schema.tables WHERE table_schema = %s AND table_name = %s"
             return self.fetch_one(sql, (self._database, table)) is not None
 
-    class PostgreSQLDatabase:
+        def _upsert_sql(
+            self,
+            table: str,
+            columns: List[str],
+            conflict_columns: List[str],
+            update_columns: List[str],
+        ) -> str:
+            # MySQL根据表上的主键或唯一索引判断冲突，conflict_columns只用于确定默认更新列
+            placeholders = ", ".join(["%s"] * len(columns))
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            if not update_columns:
+                return sql.replace("INSERT INTO", "INSERT IGNORE INTO", 1)
+            assignments = ", ".join(
+                [f"{col} = VALUES({col})" for col in update_columns]
+            )
+            return f"{sql} ON DUPLICATE KEY UPDATE {assignments}"
+
+    class PostgreSQLDatabase(_BaseDatabase):
         """PostgreSQL数据库实现"""
 
         def __init__(
@@ -487,32 +1100,48 @@ class DatabaseUtils:
             self._database = database
             self._conn = None
 
+        def _create_connection(self) -> Any:
+            try:
+                import psycopg2
+                from psycopg2.extras import RealDictCursor
+            except ImportError:
+                raise ImportError(
+                    "Please install psycopg2: pip install psycopg2-binary"
+                )
+
+            self._cursor_factory = RealDictCursor
+            return psycopg2.connect(
+                host=self._host,
+                port=self._port,
+                user=self._user,
+                password=self._password,
+                database=self._database,
+            )
+
+        def _ping(self, conn: Any) -> bool:
+            if conn.closed:
+                return False
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+
         def connect(self) -> None:
             """
             连接到PostgreSQL数据库
             """
+            if self._ensure_connection():
+                return
             if self._conn is None:
-                try:
-                    import psycopg2
-                    from psycopg2.extras import RealDictCursor
-
-                    self._conn = psycopg2.connect(
-                        host=self._host,
-                        port=self._port,
-                        user=self._user,
-                        password=self._password,
-                        database=self._database,
-                    )
-                    self._cursor_factory = RealDictCursor
-                except ImportError:
-                    raise ImportError(
-                        "Please install psycopg2: pip install psycopg2-binary"
-                    )
+                self._conn = self._create_connection()
 
         def disconnect(self) -> None:
             """
-            断开PostgreSQL数据库连接
+            断开PostgreSQL数据库连接，启用连接池时关闭连接池
             """
+            if self._pool is not None:
+                self.close_pool()
+                return
             if self._conn:
                 self._conn.close()
                 self._conn = None
@@ -551,9 +1180,9 @@ class DatabaseUtils:
 
         def commit(self) -> None:
             """
-            提交事务
+            提交事务，在transaction()上下文中不立即提交
             """
-            if self._conn:
+            if self._conn and not self._in_transaction():
                 self._conn.commit()
 
         def rollback(self) -> None:
@@ -712,17 +1341,20 @@ class DatabaseUtils:
             return self.fetch_one(sql, (table,)) is not None
 
     @staticmethod
-    def create_sqlite_database(db_path: str = ":memory:") -> SQLiteDatabase:
+    def create_sqlite_database(
+        db_path: str = ":memory:", pragmas: Optional[Dict[str, Any]] = None
+    ) -> SQLiteDatabase:
         """
         创建SQLite数据库实例
 
         Args:
             db_path: 数据库文件路径
+            pragmas: 每个新连接上执行的PRAGMA设置
 
         Returns:
             SQLiteDatabase: SQLite数据库实例
         """
-        return DatabaseUtils.SQLiteDatabase(db_path)
+        return DatabaseUtils.SQLiteDatabase(db_path, pragmas)
 
     @staticmethod
     def create_mysql_database(
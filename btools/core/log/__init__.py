@@ -1,4 +1,15 @@
 # Log utilities
-from .logutils import Logger
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "Logger": ".logutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .logutils import Logger
 
 __all__ = ["Logger"]
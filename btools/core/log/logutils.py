@@ -1,14 +1,22 @@
-import inspect
+import atexit
+import functools
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
-from datetime import datetime
+import threading
 
 
 class Logger:
     """
     日志记录器类，提供简单的日志记录功能
 
+    默认由调用线程直接格式化并写入控制台和文件；开启队列模式后调用线程只把日志记录放入有界队列，
+    格式化和写入由后台线程完成。文件日志支持按大小或按时间轮转，轮转出的文件可以在后台压缩。
+
     Attributes:
         name (str): 日志记录器名称
         level (int): 日志级别
@@ -23,7 +31,231 @@ class Logger:
     ERROR = logging.ERROR
     CRITICAL = logging.CRITICAL
 
-    def __init__(self, name=None, level=logging.INFO, file_path=None):
+    # 队列已满时的处理策略
+    OVERFLOW_BLOCK = "block"
+    OVERFLOW_DROP = "drop"
+    OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP)
+
+    # 自动获取名称时用于识别项目根目录的文件
+    PROJECT_MARKERS = ("setup.py", "pyproject.toml", "requirements.txt", "README.md")
+
+    # 同名实例共享同一个logging.Logger，记录当前持有各名称的实例，新实例创建时关闭旧实例
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    class QueueHandler(logging.handlers.QueueHandler):
+        """
+        写入有界队列的日志处理器
+
+        队列已满时按策略处理：block表示等待队列有空位，drop表示丢弃当前记录并计数。
+        """
+
+        def __init__(self, log_queue, overflow="block"):
+            """
+            初始化队列日志处理器
+
+            Args:
+                log_queue (queue.Queue): 日志记录队列
+                overflow (str): 队列已满时的处理策略，"block" 或 "drop"
+            """
+            if overflow not in Logger.OVERFLOW_POLICIES:
+                raise ValueError(f"Invalid overflow policy: {overflow}")
+            super().__init__(log_queue)
+            self.overflow = overflow
+            self.dropped = 0
+            self._dropped_lock = threading.Lock()
+
+        def prepare(self, record):
+            # 只在调用线程合并消息参数，避免参数对象之后被修改；
+            # 异常信息保留给后台线程格式化，不再在调用线程格式化和复制记录
+            record.msg = record.getMessage()
+            record.args = None
+            return record
+
+        def enqueue(self, record):
+            if self.overflow == Logger.OVERFLOW_BLOCK:
+                self.queue.put(record)
+                return
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                with self._dropped_lock:
+                    self.dropped += 1
+
+    class QueueListener(logging.handlers.QueueListener):
+        """
+        从有界队列读取日志记录并交给实际处理器的后台线程
+        """
+
+        def enqueue_sentinel(self):
+            # 队列已满时等待后台线程腾出空位，保证停止前写完队列中的记录
+            self.queue.put(self._sentinel)
+
+    class GzipRotator:
+        """
+        轮转文件的后台压缩器
+
+        轮转时只在调用线程中重命名文件，压缩在后台线程中完成；下一次轮转前等待上一次压缩结束，
+        保证序号或日期后缀的移动不会与压缩交错。
+        """
+
+        def __init__(self):
+            self._thread = None
+
+        @staticmethod
+        def namer(name):
+            """
+            轮转文件名添加 .gz 后缀
+            """
+            return name + ".gz"
+
+        def rotate(self, source, dest):
+            """
+            把当前日志文件重命名为未压缩的轮转文件，并在后台压缩为dest
+
+            Args:
+                source (str): 当前日志文件路径
+                dest (str): 压缩后的轮转文件路径
+            """
+            if not os.path.exists(source):
+                return
+            plain = dest[: -len(".gz")]
+            os.replace(source, plain)
+            self._thread = threading.Thread(
+                target=self._compress, args=(plain, dest), name="btools-log-compress"
+            )
+            self._thread.start()
+
+        @staticmethod
+        def _compress(plain, dest):
+            """
+            压缩文件，写完后再替换为目标文件名
+            """
+            temp = dest + ".tmp"
+            try:
+                with open(plain, "rb") as src, gzip.open(temp, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(temp, dest)
+                os.remove(plain)
+            except OSError:
+                # 压缩失败时保留未压缩的文件
+                if os.path.exists(temp):
+                    os.remove(temp)
+
+        def wait(self):
+            """
+            等待正在进行的压缩结束
+            """
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+    class RotatingFileHandler(logging.handlers.RotatingFileHandler):
+        """
+        按大小轮转的文件处理器，可选在后台压缩轮转文件
+        """
+
+        def __init__(
+            self,
+            filename,
+            max_bytes,
+            backup_count=5,
+            compress=False,
+            encoding="utf-8",
+        ):
+            """
+            初始化按大小轮转的文件处理器
+
+            Args:
+                filename (str): 日志文件路径
+                max_bytes (int): 单个文件的最大字节数
+                backup_count (int): 保留的轮转文件数量
+                compress (bool): 是否压缩轮转文件
+                encoding (str): 文件编码
+            """
+            super().__init__(
+                filename,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding=encoding,
+            )
+            self.compressor = Logger.GzipRotator() if compress else None
+            if self.compressor:
+                self.namer = self.compressor.namer
+                self.rotator = self.compressor.rotate
+
+        def doRollover(self):
+            if self.compressor:
+                self.compressor.wait()
+            super().doRollover()
+
+        def close(self):
+            super().close()
+            if self.compressor:
+                self.compressor.wait()
+
+    class TimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+        """
+        按时间轮转的文件处理器，可选在后台压缩轮转文件
+        """
+
+        def __init__(
+            self,
+            filename,
+            when="midnight",
+            interval=1,
+            backup_count=5,
+            compress=False,
+            encoding="utf-8",
+        ):
+            """
+            初始化按时间轮转的文件处理器
+
+            Args:
+                filename (str): 日志文件路径
+                when (str): 轮转周期单位，如 "S"、"M"、"H"、"D"、"midnight"、"W0"
+                interval (int): 轮转周期
+                backup_count (int): 保留的轮转文件数量
+                compress (bool): 是否压缩轮转文件
+                encoding (str): 文件编码
+            """
+            super().__init__(
+                filename,
+                when=when,
+                interval=interval,
+                backupCount=backup_count,
+                encoding=encoding,
+            )
+            self.compressor = Logger.GzipRotator() if compress else None
+            if self.compressor:
+                self.namer = self.compressor.namer
+                self.rotator = self.compressor.rotate
+
+        def doRollover(self):
+            if self.compressor:
+                self.compressor.wait()
+            super().doRollover()
+
+        def close(self):
+            super().close()
+            if self.compressor:
+                self.compressor.wait()
+
+    def __init__(
+        self,
+        name=None,
+        level=logging.INFO,
+        file_path=None,
+        *,
+        use_queue=False,
+        queue_size=10000,
+        overflow=OVERFLOW_BLOCK,
+        max_bytes=0,
+        when=None,
+        interval=1,
+        backup_count=5,
+        compress=False,
+    ):
         """
         初始化Logger实例
 
@@ -31,55 +263,45 @@ class Logger:
             name (str): 日志记录器名称，默认为当前调用方的项目名称
             level (int): 日志级别，默认为logging.INFO
             file_path (str): 日志文件路径，默认为None（仅输出到控制台）
+            use_queue (bool): 是否开启队列模式，由后台线程格式化和写入日志
+            queue_size (int): 队列模式下队列的最大长度
+            overflow (str): 队列已满时的处理策略，"block" 表示等待，"drop" 表示丢弃
+            max_bytes (int): 日志文件的最大字节数，超过后按大小轮转，0表示不按大小轮转
+            when (str): 按时间轮转的周期单位，如 "H"、"midnight"，None表示不按时间轮转
+            interval (int): 按时间轮转的周期
+            backup_count (int): 保留的轮转文件数量
+            compress (bool): 是否在后台将轮转文件压缩为 .gz
+
+        Raises:
+            ValueError: overflow无效或同时指定了按大小和按时间轮转
         """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+        if max_bytes and when:
+            raise ValueError("max_bytes and when cannot be used together")
+
         # 如果未指定name，自动获取当前调用方的项目名称
         if name is None:
-            # 获取调用栈
-            stack = inspect.stack()
-            # 找到调用方的帧（跳过Logger.__init__和Logger的其他方法）
-            caller_frame = None
-            for frame_info in stack[1:]:  # 从栈的第二个元素开始查找
-                frame_file = frame_info.filename
-                # 跳过当前文件和Python标准库文件
-                if __file__ not in frame_file and "site-packages" not in frame_file:
-                    caller_frame = frame_info
-                    break
-
-            if caller_frame:
-                # 获取调用方文件的目录路径
-                caller_dir = os.path.dirname(os.path.abspath(caller_frame.filename))
-                # 尝试获取项目根目录（寻找常见的项目文件如setup.py、pyproject.toml等）
-                project_root = caller_dir
-                while project_root and project_root != os.path.dirname(project_root):
-                    if any(
-                        os.path.exists(os.path.join(project_root, f))
-                        for f in [
-                            "setup.py",
-                            "pyproject.toml",
-                            "requirements.txt",
-                            "README.md",
-                        ]
-                    ):
-                        break
-                    project_root = os.path.dirname(project_root)
-                # 使用项目根目录名称作为name
-                name = (
-                    os.path.basename(project_root)
-                    if project_root
-                    else os.path.basename(caller_dir)
-                )
-            else:
-                # 如果无法获取调用方信息，使用默认值
-                name = "Default_AppName"
+            name = self._get_caller_project_name()
 
         self.name = name
         self.level = level
         self.file_path = file_path
+        self._queue_handler = None
+        self._listener = None
+        self._closed = False
 
         # 创建logger实例
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
 
+        # 同名的旧实例停止后台线程并关闭文件，避免线程和文件句柄泄漏
+        with Logger._instances_lock:
+            previous = Logger._instances.get(name)
+            Logger._instances[name] = self
+        if previous is not None:
+            previous.close()
+
         # 清除已有的handler
         self.logger.handlers.clear()
 
@@ -92,7 +314,7 @@ class Logger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # 如果指定了文件路径，创建文件handler
         if file_path:
@@ -102,10 +324,88 @@ class Logger:
                 exist_ok=True,
             )
 
-            file_handler = logging.FileHandler(file_path, encoding="utf-8")
+            if max_bytes:
+                file_handler = self.RotatingFileHandler(
+                    file_path, max_bytes, backup_count, compress
+                )
+            elif when:
+                file_handler = self.TimedRotatingFileHandler(
+                    file_path, when, interval, backup_count, compress
+                )
+            else:
+                file_handler = logging.FileHandler(file_path, encoding="utf-8")
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        if use_queue:
+            log_queue = queue.Queue(maxsize=queue_size)
+            self._queue_handler = self.QueueHandler(log_queue, overflow)
+            self._listener = self.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            # 进程退出前写完队列中的日志
+            atexit.register(self._listener.stop)
+            self.logger.addHandler(self._queue_handler)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+    @staticmethod
+    def _get_caller_project_name():
+        """
+        获取调用方所在项目的名称
+
+        只遍历调用栈的帧对象而不读取源码，项目根目录的查找结果按调用方文件缓存。
+
+        Returns:
+            str: 项目名称，无法获取调用方信息时返回 "Default_AppName"
+        """
+        frame = sys._getframe(1)
+        # 跳过当前文件和第三方库文件
+        while frame is not None and (
+            __file__ in frame.f_code.co_filename
+            or "site-packages" in frame.f_code.co_filename
+        ):
+            frame = frame.f_back
+        if frame is None:
+            return "Default_AppName"
+        return Logger._find_project_name(frame.f_code.co_filename)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _find_project_name(caller_file):
+        """
+        从调用方文件所在目录向上查找项目根目录，返回其名称
+
+        Args:
+            caller_file (str): 调用方文件路径
+
+        Returns:
+            str: 项目根目录名称，找不到时返回调用方文件所在目录的名称
+        """
+        caller_dir = os.path.dirname(os.path.abspath(caller_file))
+        project_root = caller_dir
+        while project_root and project_root != os.path.dirname(project_root):
+            if any(
+                os.path.exists(os.path.join(project_root, marker))
+                for marker in Logger.PROJECT_MARKERS
+            ):
+                break
+            project_root = os.path.dirname(project_root)
+        return (
+            os.path.basename(project_root)
+            if project_root
+            else os.path.basename(caller_dir)
+        )
+
+    @property
+    def dropped(self):
+        """
+        队列模式下因队列已满被丢弃的日志数量
+        """
+        return self._queue_handler.dropped if self._queue_handler else 0
 
     def debug(self, message):
         """记录调试级别日志"""
@@ -127,10 +427,34 @@ class Logger:
         """记录严重错误级别日志"""
         self.logger.critical(message, stacklevel=2)
 
+    def flush(self):
+        """
+        等待队列中的日志全部写入并刷新处理器
+        """
+        if self._listener is not None and self._listener._thread is not None:
+            self._listener.queue.join()
+        handlers = self._listener.handlers if self._listener else self.logger.handlers
+        for handler in handlers:
+            handler.flush()
+
     def close(self):
         """
-        关闭所有日志处理器
+        关闭所有日志处理器，队列模式下先写完队列中的日志
+
+        已被同名的新实例替换或已关闭的实例再次调用时不做任何处理
         """
+        if self._closed:
+            return
+        self._closed = True
+        with Logger._instances_lock:
+            if Logger._instances.get(self.name) is self:
+                del Logger._instances[self.name]
+        if self._listener is not None:
+            if self._listener._thread is not None:
+                self._listener.stop()
+            atexit.unregister(self._listener.stop)
+            for handler in self._listener.handlers:
+                handler.close()
         for handler in self.logger.handlers:
             handler.close()
         self.logger.handlers.clear()
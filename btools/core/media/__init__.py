@@ -1,7 +1,21 @@
 # Media utilities
-from .compressutils import CompressUtils
-from .imageutils import ImageUtils
-from .qrcodeutils import QrCodeUtils
-from .colorutils import ColorUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "CompressUtils": ".compressutils",
+    "ImageUtils": ".imageutils",
+    "QrCodeUtils": ".qrcodeutils",
+    "ColorUtils": ".colorutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .compressutils import CompressUtils
+    from .imageutils import ImageUtils
+    from .qrcodeutils import QrCodeUtils
+    from .colorutils import ColorUtils
 
 __all__ = ["ImageUtils", "QrCodeUtils", "CompressUtils", "ColorUtils"]
@@ -1,12 +1,31 @@
 # Network utilities
-from .emailutils import EmailSenderUtils, EmailTemplateUtils
-from .httputils import HTTPClient
-from .mailutils import MailUtils
-from .netutils import NetUtils
-from .sshutils import SSHClient
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "AsyncHTTPClient": ".asynchttputils",
+    "EmailSenderUtils": ".emailutils",
+    "EmailTemplateUtils": ".emailutils",
+    "HTTPClient": ".httputils",
+    "MailUtils": ".mailutils",
+    "NetUtils": ".netutils",
+    "SSHClient": ".sshutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .asynchttputils import AsyncHTTPClient
+    from .emailutils import EmailSenderUtils, EmailTemplateUtils
+    from .httputils import HTTPClient
+    from .mailutils import MailUtils
+    from .netutils import NetUtils
+    from .sshutils import SSHClient
 
 __all__ = [
     "HTTPClient",
+    "AsyncHTTPClient",
     "SSHClient",
     "NetUtils",
     "MailUtils",
@@ -0,0 +1,468 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .httputils import HTTPClient
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class AsyncHTTPClient:
+    """
+    异步HTTP客户端类，基于aiohttp库实现，接口与HTTPClient保持一致
+
+    Attributes:
+        base_url (str): 基础URL
+        headers (dict): 默认请求头
+        timeout (int): 请求超时时间（秒）
+        session (aiohttp.ClientSession): 请求会话，首次请求时在当前事件循环中创建
+    """
+
+    # 复用同步客户端的URL构建和请求头合并逻辑
+    _build_url = HTTPClient._build_url
+    _merge_headers = HTTPClient._merge_headers
+
+    def __init__(
+        self,
+        base_url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        retry_enabled: bool = False,
+        retry_total: int = 3,
+        retry_backoff_factor: float = 0.1,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        host_limits: Optional[Dict[str, int]] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[Any] = None,
+        rate_limit_by_host: bool = False,
+        rate_limit_timeout: Optional[float] = None,
+    ):
+        """
+        初始化AsyncHTTPClient实例
+
+        Args:
+            base_url (str): 基础URL
+            headers (dict): 默认请求头
+            timeout (int): 请求超时时间（秒）
+            retry_enabled (bool): 是否启用重试
+            retry_total (int): 最大重试次数
+            retry_backoff_factor (float): 重试退避因子
+            max_connections (int): 连接池总连接数上限，0表示不限制
+            max_connections_per_host (int): 每个主机的默认连接数上限，0表示不限制
+            host_limits (dict): 指定主机的连接数上限，可高于max_connections_per_host，
+                如 {"api.example.com": 50}，仍受max_connections约束
+            max_concurrency (int): 全局并发请求上限，None表示不限制
+            rate_limiter (RateLimitUtils.RateLimiter): 限流器，发送每个请求前异步等待许可
+            rate_limit_by_host (bool): 是否以主机名作为限流键，分别限制每个主机的请求速率
+            rate_limit_timeout (float): 等待许可的最长时间（秒），超时抛出RateLimitError，None表示一直等待
+        """
+        self.base_url = base_url
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.retry_enabled = retry_enabled
+        self.retry_total = retry_total
+        self.retry_backoff_factor = retry_backoff_factor
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.host_limits = host_limits or {}
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.rate_limit_by_host = rate_limit_by_host
+        self.rate_limit_timeout = rate_limit_timeout
+        self.session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._cap_other_hosts = False
+
+    async def _get_session(self):
+        """
+        获取会话，不存在时在当前事件循环中创建
+
+        Returns:
+            aiohttp.ClientSession: 请求会话
+        """
+        if self.session is None or self.session.closed:
+            import aiohttp
+
+            # 连接器的主机上限取所有主机上限的最大值，其余主机的默认上限由信号量保证
+            limit_per_host = self.max_connections_per_host
+            if limit_per_host and self.host_limits:
+                limit_per_host = max(limit_per_host, *self.host_limits.values())
+            self._cap_other_hosts = limit_per_host != self.max_connections_per_host
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=limit_per_host,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            if self.max_concurrency:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._host_semaphores = {
+                host: asyncio.Semaphore(limit)
+                for host, limit in self.host_limits.items()
+            }
+        return self.session
+
+    def add_headers(self, headers: Dict[str, str]) -> "AsyncHTTPClient":
+        """
+        添加请求头（保留原有的请求头）
+
+        Args:
+            headers (dict): 要添加的请求头
+
+        Returns:
+            AsyncHTTPClient: 返回自身，支持链式调用
+        """
+        self.headers.update(headers)
+        return self
+
+    def set_headers(self, headers: Dict[str, str]) -> "AsyncHTTPClient":
+        """
+        设置请求头（替换原有的所有请求头）
+
+        Args:
+            headers (dict): 要设置的请求头
+
+        Returns:
+            AsyncHTTPClient: 返回自身，支持链式调用
+        """
+        self.headers = headers.copy()
+        return self
+
+    def clear_headers(self) -> "AsyncHTTPClient":
+        """
+        清空所有请求头
+
+        Returns:
+            AsyncHTTPClient: 返回自身，支持链式调用
+        """
+        self.headers = {}
+        return self
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送HTTP请求，响应体读取完毕后立即归还连接
+
+        返回的响应对象已缓存响应体，可直接调用 await response.json() 或 await response.text()。
+
+        Args:
+            method (str): 请求方法
+            url (str): 请求URL
+            params (dict): URL参数或路径参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数，如data、json
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        full_url = self._build_url(url, params)
+        headers = self._merge_headers(headers)
+        session = await self._get_session()
+
+        attempts = self.retry_total + 1 if self.retry_enabled else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            await self._throttle(full_url)
+            try:
+                async with self._limit(full_url):
+                    async with session.request(
+                        method, full_url, headers=headers, **kwargs
+                    ) as response:
+                        await response.read()
+                if last_attempt or response.status not in RETRY_STATUS_CODES:
+                    return response
+            except Exception as e:
+                import aiohttp
+
+                if last_attempt or not isinstance(
+                    e, (aiohttp.ClientError, asyncio.TimeoutError)
+                ):
+                    raise
+            await asyncio.sleep(self.retry_backoff_factor * (2**attempt))
+
+    async def _throttle(self, full_url: str) -> None:
+        """
+        从限流器获取发送请求的许可
+
+        Args:
+            full_url (str): 完整URL
+
+        Raises:
+            RateLimitError: 等待超时
+        """
+        if self.rate_limiter is None:
+            return
+        key = urlsplit(full_url).hostname if self.rate_limit_by_host else None
+        if not await self.rate_limiter.acquire_async(
+            key, timeout=self.rate_limit_timeout
+        ):
+            from ..basic.decoratorutils import RateLimitError
+
+            raise RateLimitError(
+                f"等待 {self.rate_limit_timeout} 秒后仍超过速率限制: {full_url}"
+            )
+
+    def _limit(self, full_url: str) -> "_Limiter":
+        """
+        获取请求的并发限制上下文
+
+        Args:
+            full_url (str): 完整URL
+
+        Returns:
+            _Limiter: 同时受全局和主机并发上限约束的上下文管理器
+        """
+        host = urlsplit(full_url).hostname or ""
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None and self._cap_other_hosts:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                self.max_connections_per_host
+            )
+        return _Limiter(self._semaphore, host_semaphore)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送GET请求
+
+        Args:
+            url (str): 请求URL
+            params (dict): URL参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        return await self.request("GET", url, params, headers, **kwargs)
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送POST请求
+
+        Args:
+            url (str): 请求URL
+            data (dict): 表单数据
+            json (dict): JSON数据
+            params (dict): URL参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        return await self.request(
+            "POST", url, params, headers, data=data, json=json, **kwargs
+        )
+
+    async def put(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送PUT请求
+
+        Args:
+            url (str): 请求URL
+            data (dict): 表单数据
+            json (dict): JSON数据
+            params (dict): URL参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        return await self.request(
+            "PUT", url, params, headers, data=data, json=json, **kwargs
+        )
+
+    async def patch(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送PATCH请求
+
+        Args:
+            url (str): 请求URL
+            data (dict): 表单数据
+            json (dict): JSON数据
+            params (dict): URL参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        return await self.request(
+            "PATCH", url, params, headers, data=data, json=json, **kwargs
+        )
+
+    async def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        发送DELETE请求
+
+        Args:
+            url (str): 请求URL
+            params (dict): URL参数
+            headers (dict): 请求头
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            aiohttp.ClientResponse: 响应对象
+        """
+        return await self.request("DELETE", url, params, headers, **kwargs)
+
+    async def gather_requests(
+        self, requests: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        并发发送一批请求，并发度受连接池和并发上限约束
+
+        Args:
+            requests (list): 请求描述列表，每项为包含method、url及其他request参数的字典，
+                如 {"method": "GET", "url": "/users/{id}", "params": {"id": 1}}
+            return_exceptions (bool): 为True时失败的请求以异常对象返回，否则抛出第一个异常
+
+        Returns:
+            list: 与请求顺序一致的响应对象列表
+        """
+        tasks = []
+        for item in requests:
+            options = dict(item)
+            method = options.pop("method", "GET")
+            url = options.pop("url")
+            tasks.append(self.request(method, url, **options))
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    async def download_file(
+        self,
+        url: str,
+        save_path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> str:
+        """
+        下载文件
+
+        Args:
+            url (str): 请求URL
+            save_path (str): 保存文件的路径
+            params (dict): URL参数
+            headers (dict): 请求头
+            chunk_size (int): 下载块大小，默认为65536字节
+            **kwargs: 其他aiohttp参数
+
+        Returns:
+            str: 保存的文件路径
+        """
+        full_url = self._build_url(url, params)
+        headers = self._merge_headers(headers)
+        session = await self._get_session()
+
+        os.makedirs(
+            os.path.dirname(save_path) if os.path.dirname(save_path) else ".",
+            exist_ok=True,
+        )
+
+        await self._throttle(full_url)
+        async with self._limit(full_url):
+            async with session.get(full_url, headers=headers, **kwargs) as response:
+                response.raise_for_status()
+                with open(save_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+
+        return save_path
+
+    async def close(self):
+        """
+        关闭会话
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        """
+        支持异步上下文管理器
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        退出异步上下文管理器时关闭会话
+        """
+        await self.close()
+
+
+class _Limiter:
+    """
+    依次获取全局和主机信号量的异步上下文管理器
+    """
+
+    def __init__(
+        self,
+        global_semaphore: Optional[asyncio.Semaphore],
+        host_semaphore: Optional[asyncio.Semaphore],
+    ):
+        self._semaphores = [s for s in (global_semaphore, host_semaphore) if s]
+
+    async def __aenter__(self):
+        acquired = []
+        try:
+            for semaphore in self._semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+        except BaseException:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        for semaphore in reversed(self._semaphores):
+            semaphore.release()
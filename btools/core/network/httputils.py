@@ -1,7 +1,20 @@
+import bisect
+import functools
+import hashlib
+import json
 import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import DEFAULT_RETRIES, HTTPAdapter
+
+# 请求耗时直方图的桶上界（秒）
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 
 class HTTPClient:
@@ -26,6 +39,13 @@ class HTTPClient:
         retry_enabled: bool = False,
         retry_total: int = 3,
         retry_backoff_factor: float = 0.1,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+        rate_limiter: Optional[Any] = None,
+        rate_limit_by_host: bool = False,
+        rate_limit_timeout: Optional[float] = None,
     ):
         """
         初始化HTTPClient实例
@@ -40,6 +60,13 @@ class HTTPClient:
             retry_enabled (bool): 是否启用重试
             retry_total (int): 最大重试次数
             retry_backoff_factor (float): 重试退避因子
+            pool_connections (int): 缓存的主机连接池数量
+            pool_maxsize (int): 每个主机连接池保留的最大连接数，多线程共享客户端时应不小于线程数
+            pool_block (bool): 连接池耗尽时是否阻塞等待空闲连接，而不是创建用完即弃的新连接
+            host_pool_sizes (dict): 指定主机的连接池大小，键为URL前缀，如 {"https://api.example.com": 50}
+            rate_limiter (RateLimitUtils.RateLimiter): 限流器，发送每个请求前获取许可，超过限制时等待
+            rate_limit_by_host (bool): 是否以主机名作为限流键，分别限制每个主机的请求速率
+            rate_limit_timeout (float): 等待许可的最长时间（秒），超时抛出RateLimitError，None表示一直等待
         """
         self.base_url = base_url
         self.headers = headers or {}
@@ -56,8 +83,8 @@ class HTTPClient:
         self.session.headers.update(self.headers)
 
         # 配置重试机制
+        retry = DEFAULT_RETRIES
         if retry_enabled:
-            from requests.adapters import HTTPAdapter
             from urllib3.util.retry import Retry
 
             retry = Retry(
@@ -75,9 +102,42 @@ class HTTPClient:
                     "PATCH",
                 ],
             )
-            adapter = HTTPAdapter(max_retries=retry)
-            self.session.mount("http://", adapter)
-            self.session.mount("https://", adapter)
+
+        # 配置连接池，指定限流器时在发送请求前获取许可
+        if rate_limiter is not None:
+            adapter_class = functools.partial(
+                _RateLimitedAdapter,
+                rate_limiter,
+                rate_limit_by_host,
+                rate_limit_timeout,
+            )
+        else:
+            adapter_class = HTTPAdapter
+        adapter = adapter_class(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        for prefix, size in (host_pool_sizes or {}).items():
+            self.session.mount(
+                prefix,
+                adapter_class(
+                    pool_connections=1,
+                    pool_maxsize=size,
+                    max_retries=retry,
+                    pool_block=pool_block,
+                ),
+            )
+
+        # 请求统计
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self._latency_total = 0.0
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.session.hooks["response"].append(self._record_response)
 
     def add_headers(self, headers: Dict[str, str]) -> "HTTPClient":
         """
@@ -343,40 +403,263 @@ class HTTPClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         chunk_size: int = 8192,
+        segments: int = 1,
+        resume: bool = False,
+        checksum: Optional[str] = None,
+        checksum_algorithm: str = "crc32",
+        max_retries: int = 3,
         **kwargs,
     ) -> str:
         """
         下载文件
 
+        segments大于1或resume为True时使用HTTP Range请求：先下载到预分配的 save_path.part 文件，
+        进度记录在 save_path.part.json 中，中断后再次调用可从断点继续，全部完成后重命名为save_path。
+        服务器不支持HEAD或Range请求时自动退化为单连接下载。
+
+        校验值在接收数据时同步计算，无需下载后再读一遍文件。多段下载时每段独立计算CRC32，
+        最后合并为整个文件的CRC32，因此只支持crc32；单连接下载可使用hashlib支持的任意算法，
+        其中segments为1的断点续传在下载完成后读取文件计算校验值。
+
         Args:
             url (str): 请求URL
             save_path (str): 保存文件的路径
             params (dict): URL参数
             headers (dict): 请求头
             chunk_size (int): 下载块大小，默认为8192字节
+            segments (int): 并行下载的分段数
+            resume (bool): 是否启用断点续传
+            checksum (str): 期望的校验值（十六进制字符串），为None时不校验
+            checksum_algorithm (str): 校验算法，默认为crc32
+            max_retries (int): 分段下载时每段的最大重试次数
             **kwargs: 其他requests参数
 
         Returns:
             str: 保存的文件路径
+
+        Raises:
+            ValueError: 校验失败，或多段下载时指定了crc32以外的校验算法
         """
         full_url = self._build_url(url, params)
         headers = self._merge_headers(headers)
 
-        response = self.session.get(
-            full_url, headers=headers, timeout=self.timeout, stream=True, **kwargs
-        )
-        response.raise_for_status()
-
         os.makedirs(
             os.path.dirname(save_path) if os.path.dirname(save_path) else ".",
             exist_ok=True,
         )
 
+        if segments > 1 or resume:
+            head = self.session.head(
+                full_url,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=True,
+                **kwargs,
+            )
+            # 拒绝HEAD请求（如405、403）的服务器同样退化为单连接GET下载
+            size = int(head.headers.get("Content-Length") or 0) if head.ok else 0
+            if size > 0 and head.headers.get("Accept-Ranges", "").lower() == "bytes":
+                crc32 = checksum_algorithm.lower() == "crc32"
+                if checksum and not crc32 and segments > 1:
+                    raise ValueError("分段下载只支持crc32校验")
+                validator = head.headers.get("ETag") or head.headers.get(
+                    "Last-Modified", ""
+                )
+                self._download_ranges(
+                    full_url,
+                    save_path,
+                    headers,
+                    size,
+                    validator,
+                    max(segments, 1),
+                    chunk_size,
+                    resume,
+                    checksum if crc32 else None,
+                    max_retries,
+                    **kwargs,
+                )
+                if checksum and not crc32:
+                    hasher = _new_hasher(checksum_algorithm)
+                    with open(save_path, "rb") as f:
+                        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                            hasher.update(chunk)
+                    if hasher.hexdigest() != checksum.lower():
+                        os.remove(save_path)
+                        raise ValueError(f"文件校验失败: {save_path}")
+                return save_path
+
+        response = self.session.get(
+            full_url, headers=headers, timeout=self.timeout, stream=True, **kwargs
+        )
+        response.raise_for_status()
+
+        hasher = _new_hasher(checksum_algorithm) if checksum else None
         with open(save_path, "wb") as f:
             for chunk in response.iter_content(chunk_size=chunk_size):
                 if chunk:
                     f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+
+        if hasher is not None and hasher.hexdigest() != checksum.lower():
+            os.remove(save_path)
+            raise ValueError(f"文件校验失败: {save_path}")
+
+        return save_path
 
+    def _download_ranges(
+        self,
+        full_url: str,
+        save_path: str,
+        headers: Dict[str, str],
+        size: int,
+        validator: str,
+        segments: int,
+        chunk_size: int,
+        resume: bool,
+        checksum: Optional[str],
+        max_retries: int,
+        **kwargs,
+    ) -> str:
+        """
+        使用Range请求分段并行下载文件，支持断点续传
+
+        Args:
+            full_url (str): 完整URL
+            save_path (str): 保存文件的路径
+            headers (dict): 请求头
+            size (int): 文件大小
+            validator (str): 用于判断远端文件是否变化的ETag或Last-Modified
+            segments (int): 分段数
+            chunk_size (int): 下载块大小
+            resume (bool): 是否从已有进度继续
+            checksum (str): 期望的CRC32校验值
+            max_retries (int): 每段的最大重试次数
+            **kwargs: 其他requests参数
+
+        Returns:
+            str: 保存的文件路径
+        """
+        part_path = save_path + ".part"
+        state_path = save_path + ".part.json"
+        state_lock = threading.Lock()
+
+        state = None
+        if resume and os.path.exists(state_path) and os.path.exists(part_path):
+            try:
+                with open(state_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                if (state["url"], state["size"], state["validator"]) != (
+                    full_url,
+                    size,
+                    validator,
+                ):
+                    state = None
+            except Exception:
+                state = None
+
+        if state is None:
+            segment_size = -(-size // segments)
+            state = {
+                "url": full_url,
+                "size": size,
+                "validator": validator,
+                "segments": [
+                    {
+                        "start": start,
+                        "end": min(start + segment_size, size) - 1,
+                        "downloaded": 0,
+                        "crc": 0,
+                    }
+                    for start in range(0, size, segment_size)
+                ],
+            }
+            # 预分配文件，各分段直接写入自己的偏移位置
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+
+        def save_state() -> None:
+            tmp_path = state_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, state_path)
+
+        save_state()
+
+        def fetch(segment: Dict[str, Any]) -> None:
+            last_error: Optional[Exception] = None
+            for _ in range(max_retries + 1):
+                with state_lock:
+                    downloaded = segment["downloaded"]
+                    crc = segment["crc"]
+                start = segment["start"] + downloaded
+                if start > segment["end"]:
+                    return
+                range_headers = dict(headers)
+                range_headers["Range"] = f"bytes={start}-{segment['end']}"
+                try:
+                    with self.session.get(
+                        full_url,
+                        headers=range_headers,
+                        timeout=self.timeout,
+                        stream=True,
+                        **kwargs,
+                    ) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            raise requests.HTTPError(
+                                f"服务器未返回分段内容: {response.status_code}"
+                            )
+                        with open(part_path, "r+b") as f:
+                            f.seek(start)
+                            last_saved = time.monotonic()
+                            for chunk in response.iter_content(chunk_size=chunk_size):
+                                remaining = (
+                                    segment["end"] - (segment["start"] + downloaded) + 1
+                                )
+                                chunk = chunk[:remaining]
+                                if not chunk:
+                                    continue
+                                f.write(chunk)
+                                crc = zlib.crc32(chunk, crc)
+                                downloaded += len(chunk)
+                                # 只记录已写入磁盘的进度，保证断点信息与文件内容一致
+                                if time.monotonic() - last_saved >= 1.0:
+                                    f.flush()
+                                    with state_lock:
+                                        segment["downloaded"] = downloaded
+                                        segment["crc"] = crc
+                                        save_state()
+                                    last_saved = time.monotonic()
+                            f.flush()
+                except (requests.RequestException, OSError) as e:
+                    last_error = e
+                with state_lock:
+                    segment["downloaded"] = downloaded
+                    segment["crc"] = crc
+                    save_state()
+                if segment["start"] + downloaded > segment["end"]:
+                    return
+            raise last_error or requests.HTTPError(f"分段下载未完成: {full_url}")
+
+        with ThreadPoolExecutor(max_workers=len(state["segments"])) as executor:
+            futures = [executor.submit(fetch, seg) for seg in state["segments"]]
+            for future in futures:
+                future.result()
+
+        if checksum:
+            crc = 0
+            for segment in state["segments"]:
+                crc = _crc32_combine(
+                    crc, segment["crc"], segment["end"] - segment["start"] + 1
+                )
+            if f"{crc:08x}" != checksum.lower():
+                os.remove(part_path)
+                os.remove(state_path)
+                raise ValueError(f"文件校验失败: {save_path}")
+
+        os.replace(part_path, save_path)
+        os.remove(state_path)
         return save_path
 
     def _build_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
@@ -432,6 +715,82 @@ class HTTPClient:
         merged_headers.update(headers)
         return merged_headers
 
+    def _record_response(self, response: requests.Response, *args, **kwargs) -> None:
+        """
+        记录请求耗时的响应钩子
+
+        Args:
+            response (requests.Response): 响应对象
+        """
+        elapsed = response.elapsed.total_seconds()
+        index = bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+        with self._stats_lock:
+            self._request_count += 1
+            self._latency_total += elapsed
+            self._latency_counts[index] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取连接池和请求耗时统计，用于根据实际负载调整连接池大小
+
+        Returns:
+            dict: 统计信息，包括：
+                requests: 已完成的请求数
+                connections_created: 新建连接数
+                connections_reused: 复用连接的请求数
+                pools: 每个主机连接池的新建连接数和请求数
+                latency: 请求耗时（至收到响应头）的平均值和累积直方图，键为桶上界（秒）
+        """
+        pools = {}
+        adapters = {id(a): a for a in self.session.adapters.values()}
+        for adapter in adapters.values():
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in poolmanager.pools.keys():
+                pool = poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                name = f"{pool.scheme}://{pool.host}:{pool.port}"
+                entry = pools.setdefault(name, {"connections": 0, "requests": 0})
+                entry["connections"] += pool.num_connections
+                entry["requests"] += pool.num_requests
+
+        created = sum(p["connections"] for p in pools.values())
+        pool_requests = sum(p["requests"] for p in pools.values())
+
+        with self._stats_lock:
+            count = self._request_count
+            total = self._latency_total
+            counts = list(self._latency_counts)
+
+        histogram = {}
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS + (float("inf"),), counts):
+            cumulative += bucket_count
+            histogram[bound] = cumulative
+
+        return {
+            "requests": count,
+            "connections_created": created,
+            "connections_reused": max(pool_requests - created, 0),
+            "pools": pools,
+            "latency": {
+                "count": count,
+                "avg": total / count if count else 0.0,
+                "histogram": histogram,
+            },
+        }
+
+    def reset_stats(self) -> None:
+        """
+        重置请求耗时统计（连接池计数随连接池生命周期保留）
+        """
+        with self._stats_lock:
+            self._request_count = 0
+            self._latency_total = 0.0
+            self._latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
     def close(self):
         """
         关闭会话
@@ -449,3 +808,113 @@ class HTTPClient:
         退出上下文管理器时关闭会话
         """
         self.close()
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    发送请求前从限流器获取许可的连接适配器
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Any,
+        by_host: bool,
+        timeout: Optional[float],
+        **kwargs,
+    ):
+        self.rate_limiter = rate_limiter
+        self.by_host = by_host
+        self.rate_limit_timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        key = urlsplit(request.url).hostname if self.by_host else None
+        if not self.rate_limiter.acquire(key, timeout=self.rate_limit_timeout):
+            from ..basic.decoratorutils import RateLimitError
+
+            raise RateLimitError(
+                f"等待 {self.rate_limit_timeout} 秒后仍超过速率限制: {request.url}"
+            )
+        return super().send(request, **kwargs)
+
+
+class _CRC32:
+    """
+    与hashlib接口一致的CRC32计算器
+    """
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data: bytes) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def _new_hasher(algorithm: str):
+    """
+    创建校验计算器
+
+    Args:
+        algorithm (str): 算法名称，crc32或hashlib支持的算法
+
+    Returns:
+        校验计算器对象
+    """
+    if algorithm.lower() == "crc32":
+        return _CRC32()
+    return hashlib.new(algorithm)
+
+
+def _gf2_matrix_times(matrix: List[int], vector: int) -> int:
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_square(matrix: List[int]) -> List[int]:
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def _crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """
+    合并两段数据的CRC32（移植自zlib的crc32_combine）
+
+    Args:
+        crc1 (int): 前一段数据的CRC32
+        crc2 (int): 后一段数据的CRC32
+        len2 (int): 后一段数据的长度
+
+    Returns:
+        int: 两段数据拼接后的CRC32
+    """
+    if len2 <= 0:
+        return crc1
+
+    # 表示在CRC寄存器后追加一个0比特的运算矩阵
+    odd = [0xEDB88320] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    while True:
+        even = _gf2_matrix_square(odd)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+        odd = _gf2_matrix_square(even)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+
+    return crc1 ^ crc2
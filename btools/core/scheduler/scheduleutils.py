@@ -1,12 +1,34 @@
 # -*- coding: utf-8 -*-
 """
 定时任务工具模块
+
+调度线程在条件变量上等待到最早的截止时间，到期任务交给有界的工作线程池执行，
+协程函数在事件循环中执行。定时器保存在最小堆中，增删均为O(log n)，
+可以支撑数万个定时器。固定速率和cron任务按触发器计算的绝对时间执行，
+支持错过触发的处理策略、单任务并发实例上限和随机抖动。
+配置任务存储后任务定义和下次执行时间被持久化，重启后自动恢复，
+多个进程共享存储时通过租约保证同一次触发只执行一次。
 """
 
-import sched
+import asyncio
+import base64
+import bisect
+import functools
+import heapq
+import inspect
+import itertools
+import json
+import math
+import os
+import pickle
+import random
+import socket
 import threading
 import time
-from typing import Any, Callable, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 class ScheduleUtils:
@@ -15,191 +37,1823 @@ class ScheduleUtils:
     提供定时任务的创建、管理和执行功能
     """
 
-    def __init__(self):
+    # 错过触发的处理策略：跳过超过宽限时间的触发、合并为一次执行、逐次补执行
+    MISFIRE_SKIP = "skip"
+    MISFIRE_COALESCE = "coalesce"
+    MISFIRE_CATCH_UP = "catch_up"
+    MISFIRE_POLICIES = (MISFIRE_SKIP, MISFIRE_COALESCE, MISFIRE_CATCH_UP)
+
+    class Trigger:
+        """
+        触发器基类，根据上一次的计划时间计算下一次触发时间
+        """
+
+        def next_after(self, timestamp: float) -> Optional[float]:
+            """
+            计算晚于给定时间的第一个触发时间
+
+            Args:
+                timestamp: 时间戳（秒）
+
+            Returns:
+                Optional[float]: 触发时间戳，没有后续触发时返回None
+            """
+            raise NotImplementedError
+
+        def get_state(self) -> Dict[str, Any]:
+            """
+            获取可JSON序列化的触发器状态，用于持久化
+
+            Returns:
+                Dict[str, Any]: 触发器状态
+            """
+            return dict(vars(self))
+
+        @classmethod
+        def from_state(cls, state: Dict[str, Any]) -> "ScheduleUtils.Trigger":
+            """
+            根据get_state返回的状态恢复触发器
+
+            Args:
+                state: 触发器状态
+
+            Returns:
+                Trigger: 触发器
+            """
+            trigger = cls.__new__(cls)
+            trigger.__dict__.update(state)
+            return trigger
+
+    class DateTrigger(Trigger):
+        """
+        在指定时间触发一次
+        """
+
+        def __init__(self, run_at: Union[datetime, float]):
+            """
+            初始化一次性触发器
+
+            Args:
+                run_at: 触发时间，datetime或时间戳，不带时区的datetime按本地时间处理
+            """
+            self.run_at = run_at.timestamp() if isinstance(run_at, datetime) else run_at
+
+        def next_after(self, timestamp: float) -> Optional[float]:
+            return self.run_at if self.run_at > timestamp else None
+
+    class IntervalTrigger(Trigger):
+        """
+        固定速率触发器，触发时间为 start + k * interval，不会因任务执行时间累积漂移
+        """
+
+        def __init__(self, interval: float, start: float):
+            """
+            初始化固定速率触发器
+
+            Args:
+                interval: 触发间隔（秒）
+                start: 第一次触发的时间戳
+            """
+            if interval <= 0:
+                raise ValueError("interval must be positive")
+            self.interval = interval
+            self.start = start
+
+        def next_after(self, timestamp: float) -> Optional[float]:
+            if timestamp < self.start:
+                return self.start
+            periods = math.floor((timestamp - self.start) / self.interval) + 1
+            next_time = self.start + periods * self.interval
+            # 浮点误差可能使结果等于给定时间，此时顺延一个周期
+            return next_time if next_time > timestamp else next_time + self.interval
+
+    class CronTrigger(Trigger):
+        """
+        cron表达式触发器
+
+        支持5个字段（分 时 日 月 周）或6个字段（秒 分 时 日 月 周），字段支持 *、?、
+        列表、范围和步长，月份和星期支持英文缩写，星期中0和7都表示周日；
+        同时支持 @yearly、@monthly、@weekly、@daily、@hourly 等宏。
+        日和周都被限制时两者满足其一即可触发，与标准cron一致。
+        表达式在创建时编译为有序的取值表，计算下一次触发时间时按字段跳转，不逐秒扫描。
+        """
+
+        MACROS = {
+            "@yearly": "0 0 1 1 *",
+            "@annually": "0 0 1 1 *",
+            "@monthly": "0 0 1 * *",
+            "@weekly": "0 0 * * 0",
+            "@daily": "0 0 * * *",
+            "@midnight": "0 0 * * *",
+            "@hourly": "0 * * * *",
+        }
+        MONTH_NAMES = {
+            name: index
+            for index, name in enumerate(
+                "jan feb mar apr may jun jul aug sep oct nov dec".split(), 1
+            )
+        }
+        WEEKDAY_NAMES = {
+            name: index
+            for index, name in enumerate("sun mon tue wed thu fri sat".split())
+        }
+
+        def __init__(self, expression: str, tz: Optional[tzinfo] = None):
+            """
+            初始化cron触发器
+
+            Args:
+                expression: cron表达式
+                tz: 时区，None表示本地时间
+
+            Raises:
+                ValueError: 表达式格式错误
+            """
+            self.expression = expression
+            self.tz = tz
+            (
+                self.seconds,
+                self.minutes,
+                self.hours,
+                self.days,
+                self.months,
+                self.weekdays,
+                self._day_any,
+                self._weekday_any,
+            ) = ScheduleUtils.CronTrigger.compile(expression)
+
+        def get_state(self) -> Dict[str, Any]:
+            if self.tz is None:
+                tz_state = None
+            elif getattr(self.tz, "key", None):
+                # zoneinfo.ZoneInfo
+                tz_state = {"key": self.tz.key}
+            elif isinstance(self.tz, timezone):
+                tz_state = {"offset": self.tz.utcoffset(None).total_seconds()}
+            else:
+                raise ValueError(f"Unsupported timezone for persistence: {self.tz}")
+            return {"expression": self.expression, "tz": tz_state}
+
+        @classmethod
+        def from_state(cls, state: Dict[str, Any]) -> "ScheduleUtils.CronTrigger":
+            tz_state = state.get("tz")
+            if tz_state is None:
+                tz = None
+            elif "key" in tz_state:
+                from zoneinfo import ZoneInfo
+
+                tz = ZoneInfo(tz_state["key"])
+            else:
+                tz = timezone(timedelta(seconds=tz_state["offset"]))
+            return cls(state["expression"], tz)
+
+        @staticmethod
+        @functools.lru_cache(maxsize=256)
+        def compile(expression: str) -> tuple:
+            """
+            编译cron表达式，相同的表达式只编译一次
+
+            Args:
+                expression: cron表达式
+
+            Returns:
+                tuple: 秒、分、时、日、月、周的有序取值表，以及日、周字段是否不限
+            """
+            cls = ScheduleUtils.CronTrigger
+            text = cls.MACROS.get(expression.strip().lower(), expression)
+            fields = text.split()
+            if len(fields) == 5:
+                fields.insert(0, "0")
+            if len(fields) != 6:
+                raise ValueError(f"Invalid cron expression: {expression}")
+            second, minute, hour, day, month, weekday = fields
+            weekdays = cls._parse_field(weekday, 0, 7, cls.WEEKDAY_NAMES)
+            return (
+                cls._parse_field(second, 0, 59),
+                cls._parse_field(minute, 0, 59),
+                cls._parse_field(hour, 0, 23),
+                cls._parse_field(day, 1, 31),
+                cls._parse_field(month, 1, 12, cls.MONTH_NAMES),
+                tuple(sorted({value % 7 for value in weekdays})),
+                day in ("*", "?"),
+                weekday in ("*", "?"),
+            )
+
+        @staticmethod
+        def _parse_field(
+            field: str, low: int, high: int, names: Optional[Dict[str, int]] = None
+        ) -> Tuple[int, ...]:
+            """
+            解析单个cron字段
+
+            Args:
+                field: 字段文本
+                low: 最小值
+                high: 最大值
+                names: 名称到数值的映射
+
+            Returns:
+                Tuple[int, ...]: 有序的取值表
+            """
+
+            def parse_value(text: str) -> int:
+                text = text.lower()
+                if names and text in names:
+                    return names[text]
+                if not text.isdigit():
+                    raise ValueError(f"Invalid cron field: {field}")
+                return int(text)
+
+            values = set()
+            for part in field.split(","):
+                step = 1
+                if "/" in part:
+                    part, step_text = part.split("/", 1)
+                    if not step_text.isdigit() or int(step_text) == 0:
+                        raise ValueError(f"Invalid cron step: {field}")
+                    step = int(step_text)
+                if part in ("*", "?"):
+                    start, end = low, high
+                elif "-" in part:
+                    start_text, end_text = part.split("-", 1)
+                    start, end = parse_value(start_text), parse_value(end_text)
+                else:
+                    start = parse_value(part)
+                    end = high if step > 1 else start
+                if not low <= start <= end <= high:
+                    raise ValueError(f"Cron field out of range: {field}")
+                values.update(range(start, end + 1, step))
+            return tuple(sorted(values))
+
+        def _day_matches(self, value: datetime) -> bool:
+            """
+            判断日期是否满足日和周字段
+            """
+            day_ok = value.day in self.days
+            weekday_ok = value.isoweekday() % 7 in self.weekdays
+            if self._day_any:
+                return weekday_ok
+            if self._weekday_any:
+                return day_ok
+            return day_ok or weekday_ok
+
+        def next_after(self, timestamp: float) -> Optional[float]:
+            value = datetime.fromtimestamp(timestamp, self.tz).replace(microsecond=0)
+            value += timedelta(seconds=1)
+            # 2月29日等稀有日期最多相隔8年
+            last_year = value.year + 8
+            while value.year <= last_year:
+                if value.month not in self.months:
+                    index = bisect.bisect_right(self.months, value.month)
+                    if index == len(self.months):
+                        value = value.replace(
+                            year=value.year + 1,
+                            month=self.months[0],
+                            day=1,
+                            hour=0,
+                            minute=0,
+                            second=0,
+                        )
+                    else:
+                        value = value.replace(
+                            month=self.months[index], day=1, hour=0, minute=0, second=0
+                        )
+                    continue
+                if not self._day_matches(value):
+                    value = value.replace(hour=0, minute=0, second=0) + timedelta(
+                        days=1
+                    )
+                    continue
+                if value.hour not in self.hours:
+                    index = bisect.bisect_right(self.hours, value.hour)
+                    if index == len(self.hours):
+                        value = value.replace(hour=0, minute=0, second=0)
+                        value += timedelta(days=1)
+                    else:
+                        value = value.replace(
+                            hour=self.hours[index], minute=0, second=0
+                        )
+                    continue
+                if value.minute not in self.minutes:
+                    index = bisect.bisect_right(self.minutes, value.minute)
+                    if index == len(self.minutes):
+                        value = value.replace(minute=0, second=0)
+                        value += timedelta(hours=1)
+                    else:
+                        value = value.replace(minute=self.minutes[index], second=0)
+                    continue
+                if value.second not in self.seconds:
+                    index = bisect.bisect_right(self.seconds, value.second)
+                    if index == len(self.seconds):
+                        value = value.replace(second=0) + timedelta(minutes=1)
+                    else:
+                        value = value.replace(second=self.seconds[index])
+                    continue
+                return value.timestamp()
+            return None
+
+    class JobStore:
+        """
+        任务存储基类
+
+        每个任务保存任务ID、下次执行时间、租约和序列化后的任务定义。调度器启动后按下次执行时间
+        分批加载即将到期的任务，执行前通过租约认领本次触发，避免多个进程重复执行同一任务。
+        """
+
+        def add_job(self, job_id: str, next_run: float, state: str) -> None:
+            """
+            保存任务，任务ID已存在时覆盖任务定义和下次执行时间
+
+            Args:
+                job_id: 任务ID
+                next_run: 下次执行时间戳
+                state: 序列化后的任务定义
+            """
+            raise NotImplementedError
+
+        def remove_job(self, job_id: str) -> None:
+            """
+            删除任务
+
+            Args:
+                job_id: 任务ID
+            """
+            raise NotImplementedError
+
+        def remove_all_jobs(self) -> None:
+            """
+            删除所有任务
+            """
+            raise NotImplementedError
+
+        def get_job(self, job_id: str) -> Optional[Tuple[float, str]]:
+            """
+            获取任务
+
+            Args:
+                job_id: 任务ID
+
+            Returns:
+                Optional[Tuple[float, str]]: 下次执行时间和任务定义，不存在时返回None
+            """
+            raise NotImplementedError
+
+        def get_due_jobs(
+            self, until: float, limit: Optional[int] = None
+        ) -> List[Tuple[str, float, str]]:
+            """
+            按下次执行时间升序获取在指定时间之前到期的任务
+
+            Args:
+                until: 截止时间戳
+                limit: 最多返回的任务数量
+
+            Returns:
+                List[Tuple[str, float, str]]: 任务ID、下次执行时间和任务定义的列表
+            """
+            raise NotImplementedError
+
+        def get_next_run_time(self) -> Optional[float]:
+            """
+            获取最早的下次执行时间
+
+            Returns:
+                Optional[float]: 时间戳，没有任务时返回None
+            """
+            raise NotImplementedError
+
+        def acquire(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: float,
+            new_next_run: Optional[float],
+            lease_time: float,
+            now: float,
+        ) -> bool:
+            """
+            认领一次触发：下次执行时间仍为next_run且没有其他进程持有有效租约时，
+            设置租约并把下次执行时间推进到new_next_run
+
+            Args:
+                job_id: 任务ID
+                owner: 调度器标识
+                next_run: 本次触发的计划时间
+                new_next_run: 新的下次执行时间，None表示保持不变
+                lease_time: 租约时长（秒）
+                now: 当前时间戳
+
+            Returns:
+                bool: 是否认领成功
+            """
+            raise NotImplementedError
+
+        def release(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: Optional[float] = None,
+            remove: bool = False,
+        ) -> None:
+            """
+            释放租约，租约已被其他进程接管时不做任何修改
+
+            Args:
+                job_id: 任务ID
+                owner: 调度器标识
+                next_run: 新的下次执行时间，None表示保持不变
+                remove: 是否删除任务
+            """
+            raise NotImplementedError
+
+        def close(self) -> None:
+            """
+            关闭存储
+            """
+
+    class SQLiteJobStore(JobStore):
+        """
+        基于DatabaseUtils.SQLiteDatabase的任务存储，下次执行时间列建有索引，
+        多个进程可以共享同一个数据库文件
+        """
+
+        def __init__(self, db_path: str, table: str = "scheduled_jobs"):
+            """
+            初始化SQLite任务存储
+
+            Args:
+                db_path: 数据库文件路径
+                table: 表名
+            """
+            from ..data.databaseutils import DatabaseUtils
+
+            self.table = table
+            # 多个进程写同一个文件时等待锁释放，而不是立即报错
+            self._db = DatabaseUtils.create_sqlite_database(
+                db_path, {"busy_timeout": 5000}
+            )
+            # 单连接连接池：连接可以在调度线程和工作线程之间共享
+            self._db.create_pool(
+                min_size=1, max_size=1, idle_timeout=None, health_check=False
+            )
+            with self._db.transaction() as db:
+                db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "id TEXT PRIMARY KEY, next_run REAL NOT NULL, "
+                    "lease_owner TEXT, lease_until REAL, state TEXT NOT NULL)"
+                )
+                db.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_next_run "
+                    f"ON {table} (next_run)"
+                )
+
+        def add_job(self, job_id: str, next_run: float, state: str) -> None:
+            with self._db.transaction() as db:
+                db.execute(
+                    f"INSERT INTO {self.table} (id, next_run, state) VALUES (?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET "
+                    "next_run = excluded.next_run, state = excluded.state",
+                    (job_id, next_run, state),
+                )
+
+        def remove_job(self, job_id: str) -> None:
+            with self._db.transaction() as db:
+                db.execute(f"DELETE FROM {self.table} WHERE id = ?", (job_id,))
+
+        def remove_all_jobs(self) -> None:
+            with self._db.transaction() as db:
+                db.execute(f"DELETE FROM {self.table}")
+
+        def get_job(self, job_id: str) -> Optional[Tuple[float, str]]:
+            with self._db.checkout() as db:
+                row = db.fetch_one(
+                    f"SELECT next_run, state FROM {self.table} WHERE id = ?", (job_id,)
+                )
+            return (row["next_run"], row["state"]) if row else None
+
+        def get_due_jobs(
+            self, until: float, limit: Optional[int] = None
+        ) -> List[Tuple[str, float, str]]:
+            sql = (
+                f"SELECT id, next_run, state FROM {self.table} "
+                "WHERE next_run <= ? ORDER BY next_run"
+            )
+            params: Tuple[Any, ...] = (until,)
+            if limit is not None:
+                sql += " LIMIT ?"
+                params += (limit,)
+            with self._db.checkout() as db:
+                rows = db.fetch_all(sql, params)
+            return [(row["id"], row["next_run"], row["state"]) for row in rows]
+
+        def get_next_run_time(self) -> Optional[float]:
+            with self._db.checkout() as db:
+                row = db.fetch_one(
+                    f"SELECT MIN(next_run) AS next_run FROM {self.table}"
+                )
+            return row["next_run"] if row else None
+
+        def acquire(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: float,
+            new_next_run: Optional[float],
+            lease_time: float,
+            now: float,
+        ) -> bool:
+            with self._db.transaction() as db:
+                cursor = db.execute(
+                    f"UPDATE {self.table} SET lease_owner = ?, lease_until = ?, "
+                    "next_run = COALESCE(?, next_run) "
+                    "WHERE id = ? AND next_run = ? AND "
+                    "(lease_owner IS NULL OR lease_owner = ? OR lease_until < ?)",
+                    (
+                        owner,
+                        now + lease_time,
+                        new_next_run,
+                        job_id,
+                        next_run,
+                        owner,
+                        now,
+                    ),
+                )
+                return cursor.rowcount == 1
+
+        def release(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: Optional[float] = None,
+            remove: bool = False,
+        ) -> None:
+            with self._db.transaction() as db:
+                if remove:
+                    db.execute(
+                        f"DELETE FROM {self.table} WHERE id = ? AND lease_owner = ?",
+                        (job_id, owner),
+                    )
+                else:
+                    db.execute(
+                        f"UPDATE {self.table} SET lease_owner = NULL, "
+                        "lease_until = NULL, next_run = COALESCE(?, next_run) "
+                        "WHERE id = ? AND lease_owner = ?",
+                        (next_run, job_id, owner),
+                    )
+
+        def close(self) -> None:
+            self._db.disconnect()
+
+    class RedisJobStore(JobStore):
+        """
+        基于Redis的任务存储
+
+        下次执行时间保存在有序集合中，任务定义保存在哈希表中，租约为带过期时间的独立键，
+        通过 SET NX 原子获取。
+        """
+
+        def __init__(
+            self,
+            host: str = "localhost",
+            port: int = 6379,
+            db: int = 0,
+            password: Optional[str] = None,
+            prefix: str = "btools:jobs",
+            client: Optional[Any] = None,
+        ):
+            """
+            初始化Redis任务存储
+
+            Args:
+                host: Redis主机
+                port: Redis端口
+                db: Redis数据库
+                password: Redis密码
+                prefix: 键前缀
+                client: 已创建的Redis客户端（需设置decode_responses=True），传入时忽略连接参数
+            """
+            if client is None:
+                import redis
+
+                client = redis.Redis(
+                    host=host,
+                    port=port,
+                    db=db,
+                    password=password,
+                    decode_responses=True,
+                )
+            self._redis = client
+            self._next_runs_key = f"{prefix}:next_run"
+            self._jobs_key = f"{prefix}:jobs"
+            self._lease_prefix = f"{prefix}:lease:"
+
+        def add_job(self, job_id: str, next_run: float, state: str) -> None:
+            pipe = self._redis.pipeline()
+            pipe.hset(self._jobs_key, job_id, state)
+            pipe.zadd(self._next_runs_key, {job_id: next_run})
+            pipe.execute()
+
+        def remove_job(self, job_id: str) -> None:
+            pipe = self._redis.pipeline()
+            pipe.hdel(self._jobs_key, job_id)
+            pipe.zrem(self._next_runs_key, job_id)
+            pipe.delete(self._lease_prefix + job_id)
+            pipe.execute()
+
+        def remove_all_jobs(self) -> None:
+            leases = list(self._redis.scan_iter(match=self._lease_prefix + "*"))
+            self._redis.delete(self._jobs_key, self._next_runs_key, *leases)
+
+        def get_job(self, job_id: str) -> Optional[Tuple[float, str]]:
+            pipe = self._redis.pipeline()
+            pipe.zscore(self._next_runs_key, job_id)
+            pipe.hget(self._jobs_key, job_id)
+            next_run, state = pipe.execute()
+            if next_run is None or state is None:
+                return None
+            return next_run, state
+
+        def get_due_jobs(
+            self, until: float, limit: Optional[int] = None
+        ) -> List[Tuple[str, float, str]]:
+            entries = self._redis.zrangebyscore(
+                self._next_runs_key,
+                "-inf",
+                until,
+                start=0 if limit is not None else None,
+                num=limit,
+                withscores=True,
+            )
+            if not entries:
+                return []
+            states = self._redis.hmget(
+                self._jobs_key, [job_id for job_id, _ in entries]
+            )
+            return [
+                (job_id, next_run, state)
+                for (job_id, next_run), state in zip(entries, states)
+                if state is not None
+            ]
+
+        def get_next_run_time(self) -> Optional[float]:
+            entries = self._redis.zrange(self._next_runs_key, 0, 0, withscores=True)
+            return entries[0][1] if entries else None
+
+        def acquire(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: float,
+            new_next_run: Optional[float],
+            lease_time: float,
+            now: float,
+        ) -> bool:
+            lease_key = self._lease_prefix + job_id
+            lease_ms = max(int(lease_time * 1000), 1)
+            if not self._redis.set(lease_key, owner, nx=True, px=lease_ms):
+                if self._redis.get(lease_key) != owner:
+                    return False
+                self._redis.set(lease_key, owner, xx=True, px=lease_ms)
+            # 只有租约持有者会修改下次执行时间
+            if self._redis.zscore(self._next_runs_key, job_id) != next_run:
+                self._release_lease(lease_key, owner)
+                return False
+            if new_next_run is not None:
+                self._redis.zadd(self._next_runs_key, {job_id: new_next_run})
+            return True
+
+        def _release_lease(
+            self, lease_key: str, owner: str, update: Optional[Callable] = None
+        ) -> None:
+            """
+            在仍持有租约时删除租约并执行附加的修改
+            """
+            import redis
+
+            with self._redis.pipeline() as pipe:
+                try:
+                    pipe.watch(lease_key)
+                    if pipe.get(lease_key) != owner:
+                        return
+                    pipe.multi()
+                    pipe.delete(lease_key)
+                    if update is not None:
+                        update(pipe)
+                    pipe.execute()
+                except redis.WatchError:
+                    # 租约在此期间过期并被其他进程获取
+                    pass
+
+        def release(
+            self,
+            job_id: str,
+            owner: str,
+            next_run: Optional[float] = None,
+            remove: bool = False,
+        ) -> None:
+            def update(pipe) -> None:
+                if remove:
+                    pipe.hdel(self._jobs_key, job_id)
+                    pipe.zrem(self._next_runs_key, job_id)
+                elif next_run is not None:
+                    pipe.zadd(self._next_runs_key, {job_id: next_run})
+
+            self._release_lease(self._lease_prefix + job_id, owner, update)
+
+        def close(self) -> None:
+            self._redis.close()
+
+    class TaskStats:
+        """
+        任务执行统计
+
+        延迟（lateness）为实际开始时间与计划时间之差，运行时间为函数的执行耗时。
+        因错过触发或达到并发实例上限而未执行的触发计入skipped。
+        """
+
+        __slots__ = (
+            "runs",
+            "failures",
+            "skipped",
+            "last_error",
+            "last_lateness",
+            "max_lateness",
+            "total_lateness",
+            "last_runtime",
+            "max_runtime",
+            "total_runtime",
+        )
+
+        def __init__(self):
+            """
+            初始化任务执行统计
+            """
+            self.runs = 0
+            self.failures = 0
+            self.skipped = 0
+            self.last_error: Optional[BaseException] = None
+            self.last_lateness = 0.0
+            self.max_lateness = 0.0
+            self.total_lateness = 0.0
+            self.last_runtime = 0.0
+            self.max_runtime = 0.0
+            self.total_runtime = 0.0
+
+        def record(
+            self, lateness: float, runtime: float, error: Optional[BaseException]
+        ) -> None:
+            """
+            记录一次执行
+
+            Args:
+                lateness: 开始延迟（秒）
+                runtime: 运行时间（秒）
+                error: 执行时抛出的异常，成功时为None
+            """
+            self.runs += 1
+            if error is not None:
+                self.failures += 1
+                self.last_error = error
+            self.last_lateness = lateness
+            self.total_lateness += lateness
+            if lateness > self.max_lateness:
+                self.max_lateness = lateness
+            self.last_runtime = runtime
+            self.total_runtime += runtime
+            if runtime > self.max_runtime:
+                self.max_runtime = runtime
+
+        def to_dict(self) -> Dict[str, Any]:
+            """
+            转换为字典
+
+            Returns:
+                Dict[str, Any]: 执行次数、失败次数、跳过次数以及延迟和运行时间的最近值、平均值、最大值
+            """
+            runs = self.runs
+            return {
+                "runs": runs,
+                "failures": self.failures,
+                "skipped": self.skipped,
+                "last_error": self.last_error,
+                "last_lateness": self.last_lateness,
+                "avg_lateness": self.total_lateness / runs if runs else 0.0,
+                "max_lateness": self.max_lateness,
+                "last_runtime": self.last_runtime,
+                "avg_runtime": self.total_runtime / runs if runs else 0.0,
+                "max_runtime": self.max_runtime,
+            }
+
+    class Task:
+        """
+        定时任务
+        """
+
+        __slots__ = (
+            "task_id",
+            "func",
+            "args",
+            "kwargs",
+            "interval",
+            "trigger",
+            "misfire_policy",
+            "misfire_grace_time",
+            "max_instances",
+            "jitter",
+            "deferred",
+            "job_id",
+            "next_run",
+            "seq",
+            "running",
+            "cancelled",
+            "is_coroutine",
+            "stats",
+            "histograms",
+        )
+
+        def __init__(
+            self,
+            task_id: int,
+            func: Callable,
+            args: tuple,
+            kwargs: dict,
+            interval: Optional[float] = None,
+            trigger: Optional["ScheduleUtils.Trigger"] = None,
+            misfire_policy: str = "coalesce",
+            misfire_grace_time: float = 1.0,
+            max_instances: int = 1,
+            jitter: float = 0.0,
+        ):
+            """
+            初始化定时任务
+
+            Args:
+                task_id: 任务ID
+                func: 要执行的函数，可以是协程函数
+                args: 函数参数
+                kwargs: 函数关键字参数
+                interval: 每次执行完成后的等待时间（秒），与trigger二选一
+                trigger: 按绝对时间触发的触发器
+                misfire_policy: 错过触发的处理策略，仅对trigger生效
+                misfire_grace_time: skip策略下允许的最大延迟（秒）
+                max_instances: 同时执行的最大实例数，仅对trigger生效
+                jitter: 每次触发随机推迟的最大时间（秒），仅对trigger生效
+            """
+            if misfire_policy not in ScheduleUtils.MISFIRE_POLICIES:
+                raise ValueError(f"Unsupported misfire policy: {misfire_policy}")
+            if max_instances < 1:
+                raise ValueError("max_instances must be at least 1")
+            self.task_id = task_id
+            self.func = func
+            self.args = args
+            self.kwargs = kwargs
+            self.interval = interval
+            self.trigger = trigger
+            self.misfire_policy = misfire_policy
+            self.misfire_grace_time = misfire_grace_time
+            self.max_instances = max_instances
+            self.jitter = jitter
+            # catch_up策略下因达到并发上限而等待补执行
+            self.deferred = False
+            # 持久化任务ID，未配置任务存储时为None
+            self.job_id: Optional[str] = None
+            self.next_run: Optional[float] = None
+            # 堆中有效条目的序号，用于惰性删除过期条目
+            self.seq = -1
+            self.running = 0
+            self.cancelled = False
+            self.is_coroutine = inspect.iscoroutinefunction(func)
+            self.stats = ScheduleUtils.TaskStats()
+            self.histograms: Optional[Tuple[Any, Any]] = None
+
+        @property
+        def name(self) -> str:
+            """
+            任务名称，取函数的限定名
+            """
+            return getattr(self.func, "__qualname__", repr(self.func))
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        error_handler: Optional[Callable[[Optional[int], BaseException], None]] = None,
+        registry: Any = None,
+        clock: Callable[[], float] = time.time,
+        job_store: Optional["ScheduleUtils.JobStore"] = None,
+        lease_time: float = 300.0,
+        sync_interval: float = 60.0,
+    ):
         """
         初始化定时任务工具
+
+        Args:
+            max_workers: 执行普通函数的最大工作线程数，同时也是并发协程数的上限
+            loop: 执行协程函数的事件循环，None表示按需在后台线程中创建
+            error_handler: 任务抛出异常时的回调，参数为任务ID和异常，
+                任务存储访问失败时任务ID为None
+            registry: MetricsUtils.Registry，指定时记录任务的延迟和运行时间直方图
+            clock: 时间函数，返回秒数
+            job_store: 任务存储，指定时持久化所有任务并在启动时恢复
+            lease_time: 执行持久化任务时持有租约的时长（秒），应大于任务的最长执行时间
+            sync_interval: 从任务存储加载即将到期任务的间隔（秒）
         """
-        self._scheduler = sched.scheduler(time.time, time.sleep)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.error_handler = error_handler
+        self.registry = registry
+        self.clock = clock
+        self.job_store = job_store
+        self.lease_time = lease_time
+        self.sync_interval = sync_interval
+        # 调度器标识，用于任务存储中的租约
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
         self._running = False
         self._thread = None
-        self._tasks = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop = loop
+        self._own_loop = False
+        self._loop_thread = None
+        self._semaphore = None
+        self._tasks: Dict[int, "ScheduleUtils.Task"] = {}
+        # 持久化任务ID到任务ID的映射
+        self._jobs: Dict[str, int] = {}
+        self._next_sync: Optional[float] = None
+        self._heap: List[Tuple[float, int, "ScheduleUtils.Task"]] = []
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._summary = ScheduleUtils.TaskStats()
+        self._active = 0
         self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+
+    def set_job_store(self, job_store: Optional["ScheduleUtils.JobStore"]) -> None:
+        """
+        设置任务存储，需要在启动调度器之前调用
+
+        Args:
+            job_store: 任务存储，None表示不持久化
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("Cannot change job store while scheduler is running")
+            self.job_store = job_store
 
     def start(self):
         """
-        启动调度器
+        启动调度器，配置了任务存储时立即加载到期和即将到期的任务
         """
         with self._lock:
             if not self._running:
                 self._running = True
+                if self.job_store is not None:
+                    self._next_sync = self.clock()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="schedule-worker"
+                )
                 self._thread = threading.Thread(target=self._run_scheduler, daemon=True)
                 self._thread.start()
 
     def stop(self):
         """
-        停止调度器
+        停止调度器，清除内存中的所有任务，正在执行的任务会继续执行完成
+
+        任务存储中的任务不会被删除，下次启动时恢复。
         """
-        with self._lock:
-            if self._running:
-                self._running = False
-                self._scheduler.empty()
-                if self._thread:
-                    self._thread.join(timeout=1.0)
-                self._tasks.clear()
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+            loop_thread, self._loop_thread = self._loop_thread, None
+            loop = self._loop
+            if self._own_loop:
+                self._loop = None
+                self._own_loop = False
+                self._semaphore = None
+            self._next_sync = None
+            self._tasks.clear()
+            self._jobs.clear()
+            self._heap.clear()
+
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        if executor:
+            executor.shutdown(wait=False)
+        if loop_thread:
+            loop.call_soon_threadsafe(loop.stop)
+            if loop_thread is not threading.current_thread():
+                loop_thread.join(timeout=1.0)
 
     def _run_scheduler(self):
         """
-        运行调度器的线程函数
+        运行调度器的线程函数，等待到最早的截止时间后分发所有到期任务
+        """
+        heap = self._heap
+        with self._condition:
+            while self._running:
+                now = self.clock()
+                if self._next_sync is not None and now >= self._next_sync:
+                    self._next_sync = now + self.sync_interval
+                    self._executor.submit(self._sync_jobs)
+                while heap and heap[0][0] <= now:
+                    when, seq, task = heapq.heappop(heap)
+                    if task.cancelled or task.seq != seq:
+                        continue
+                    if task.trigger is None:
+                        deadline, task.next_run = task.next_run, None
+                        self._dispatch(task, when, (deadline, None))
+                    else:
+                        self._fire(task, when, now)
+                timeout = heap[0][0] - now if heap else None
+                if self._next_sync is not None:
+                    sync_wait = self._next_sync - now
+                    timeout = sync_wait if timeout is None else min(timeout, sync_wait)
+                self._condition.wait(timeout)
+
+    def _fire(self, task: "ScheduleUtils.Task", when: float, now: float) -> None:
+        """
+        处理触发器任务的一次触发并计算下一次触发时间，调用方需持有锁
+
+        Args:
+            task: 定时任务
+            when: 本次触发的执行时间（含抖动）
+            now: 当前时间
+        """
+        deadline = task.next_run
+        policy = task.misfire_policy
+        full = task.running >= task.max_instances
+        if full and policy == ScheduleUtils.MISFIRE_CATCH_UP:
+            # 保留本次触发时间，等正在执行的实例完成后补执行
+            task.deferred = True
+            return
+        run = not full and not (
+            policy == ScheduleUtils.MISFIRE_SKIP
+            and now - when > task.misfire_grace_time
+        )
+
+        # catch_up从本次计划时间往后逐次触发，其他策略直接跳到当前时间之后
+        base = deadline if policy == ScheduleUtils.MISFIRE_CATCH_UP else now
+        next_time = task.trigger.next_after(base)
+        if next_time is not None:
+            self._push(task, next_time)
+        else:
+            task.next_run = None
+
+        if run:
+            self._dispatch(task, when, (deadline, next_time))
+            return
+        self._record_skip(task)
+        if task.job_id is not None:
+            # 在任务存储中同样跳过本次触发
+            self._executor.submit(self._advance_job, task, (deadline, next_time))
+        if next_time is None and not task.running:
+            self._discard(task)
+
+    def _record_skip(self, task: "ScheduleUtils.Task") -> None:
+        """
+        记录一次未执行的触发，调用方需持有锁
+
+        Args:
+            task: 定时任务
+        """
+        task.stats.skipped += 1
+        self._summary.skipped += 1
+
+    def _discard(self, task: "ScheduleUtils.Task") -> None:
+        """
+        从内存中移除任务，调用方需持有锁
+
+        Args:
+            task: 定时任务
+        """
+        if self._tasks.get(task.task_id) is task:
+            del self._tasks[task.task_id]
+        if task.job_id is not None and self._jobs.get(task.job_id) == task.task_id:
+            del self._jobs[task.job_id]
+
+    def _push(
+        self, task: "ScheduleUtils.Task", deadline: float, jitter: bool = True
+    ) -> None:
+        """
+        将任务按截止时间放入堆中，调用方需持有锁
+
+        Args:
+            task: 定时任务
+            deadline: 计划时间
+            jitter: 是否按任务设置随机推迟执行时间
+        """
+        seq = next(self._seq)
+        task.seq = seq
+        task.next_run = deadline
+        when = deadline
+        if jitter and task.jitter:
+            when += random.uniform(0, task.jitter)
+        entry = (when, seq, task)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            # 新的最早截止时间，唤醒调度线程重新计算等待时间
+            self._condition.notify()
+
+    def _add_task(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        first_run: float,
+        job_id: Optional[str] = None,
+        **options,
+    ) -> int:
+        """
+        创建任务并加入调度，配置了任务存储时先写入存储
+
+        Args:
+            func: 要执行的函数
+            args: 函数参数
+            kwargs: 函数关键字参数
+            first_run: 首次执行时间
+            job_id: 持久化任务ID，None表示自动生成
+            **options: 任务参数，见Task
+
+        Returns:
+            任务ID
+        """
+        task = ScheduleUtils.Task(next(self._ids), func, args, kwargs, **options)
+        if self.job_store is not None:
+            task.job_id = job_id or uuid.uuid4().hex
+            self.job_store.add_job(task.job_id, first_run, self._serialize(task))
+        with self._lock:
+            if task.job_id is not None:
+                # 相同任务ID的旧任务被新定义替换
+                old = self._tasks.get(self._jobs.get(task.job_id))
+                if old is not None:
+                    old.cancelled = True
+                    self._discard(old)
+                self._jobs[task.job_id] = task.task_id
+            self._tasks[task.task_id] = task
+            self._push(task, first_run)
+            return task.task_id
+
+    @staticmethod
+    def _callable_ref(obj: Any) -> str:
+        """
+        获取函数或类的引用字符串 "模块:限定名"
+
+        Args:
+            obj: 函数或类
+
+        Returns:
+            str: 引用字符串
+
+        Raises:
+            ValueError: 对象无法通过模块路径导入，如lambda、局部函数和绑定方法
+        """
+        ref = f"{getattr(obj, '__module__', None)}:{getattr(obj, '__qualname__', None)}"
+        try:
+            resolved = ScheduleUtils._resolve_ref(ref)
+        except (ImportError, AttributeError, ValueError):
+            resolved = None
+        if resolved is not obj:
+            raise ValueError(
+                f"Persistent jobs require an importable module-level callable: {obj!r}"
+            )
+        return ref
+
+    @staticmethod
+    def _resolve_ref(ref: str) -> Any:
+        """
+        根据引用字符串导入函数或类
+
+        Args:
+            ref: "模块:限定名" 格式的引用字符串
+
+        Returns:
+            Any: 函数或类
+        """
+        import importlib
+
+        module_name, _, qualname = ref.partition(":")
+        obj = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+        return obj
+
+    def _serialize(self, task: "ScheduleUtils.Task") -> str:
+        """
+        序列化任务定义，参数使用pickle编码
+
+        Args:
+            task: 定时任务
+
+        Returns:
+            str: JSON字符串
         """
-        while self._running:
-            if self._scheduler.queue:
-                self._scheduler.run(blocking=False)
-            time.sleep(0.1)
+        trigger = None
+        if task.trigger is not None:
+            trigger = {
+                "class": self._callable_ref(type(task.trigger)),
+                "state": task.trigger.get_state(),
+            }
+        return json.dumps(
+            {
+                "func": self._callable_ref(task.func),
+                "args": base64.b64encode(pickle.dumps(task.args)).decode("ascii"),
+                "kwargs": base64.b64encode(pickle.dumps(task.kwargs)).decode("ascii"),
+                "interval": task.interval,
+                "trigger": trigger,
+                "misfire_policy": task.misfire_policy,
+                "misfire_grace_time": task.misfire_grace_time,
+                "max_instances": task.max_instances,
+                "jitter": task.jitter,
+            }
+        )
+
+    def _restore(self, job_id: str, state: str) -> "ScheduleUtils.Task":
+        """
+        根据序列化的任务定义恢复任务
+
+        Args:
+            job_id: 持久化任务ID
+            state: JSON字符串
+
+        Returns:
+            Task: 定时任务
+        """
+        data = json.loads(state)
+        trigger = None
+        if data["trigger"] is not None:
+            trigger_class = self._resolve_ref(data["trigger"]["class"])
+            trigger = trigger_class.from_state(data["trigger"]["state"])
+        task = ScheduleUtils.Task(
+            next(self._ids),
+            self._resolve_ref(data["func"]),
+            pickle.loads(base64.b64decode(data["args"])),
+            pickle.loads(base64.b64decode(data["kwargs"])),
+            interval=data["interval"],
+            trigger=trigger,
+            misfire_policy=data["misfire_policy"],
+            misfire_grace_time=data["misfire_grace_time"],
+            max_instances=data["max_instances"],
+            jitter=data["jitter"],
+        )
+        task.job_id = job_id
+        return task
+
+    def _sync_jobs(self) -> None:
+        """
+        在工作线程中从任务存储加载到期和即将到期的任务
+
+        只查询下次执行时间早于 当前时间 + sync_interval 的任务，依赖下次执行时间上的索引，
+        不会加载全部任务；错过的触发按任务的处理策略执行。
+        """
+        try:
+            jobs = self.job_store.get_due_jobs(self.clock() + self.sync_interval)
+        except Exception as e:
+            self._report_error(None, e)
+            return
+        for job_id, next_run, state in jobs:
+            with self._lock:
+                if not self._running:
+                    return
+                if job_id in self._jobs:
+                    continue
+            try:
+                task = self._restore(job_id, state)
+            except Exception as e:
+                self._report_error(None, e)
+                continue
+            with self._lock:
+                if self._running and job_id not in self._jobs:
+                    self._jobs[job_id] = task.task_id
+                    self._tasks[task.task_id] = task
+                    self._push(task, next_run)
+
+    def _claim(self, task: "ScheduleUtils.Task", claim: Tuple) -> bool:
+        """
+        在任务存储中认领本次触发，失败时说明已由其他进程执行或任务已被删除，
+        此时移除内存中的任务，下次同步时按存储中的状态重新加载
+
+        Args:
+            task: 定时任务
+            claim: 本次触发的计划时间和新的下次执行时间
+
+        Returns:
+            bool: 是否认领成功
+        """
+        deadline, next_run = claim
+        try:
+            acquired = self.job_store.acquire(
+                task.job_id,
+                self.owner,
+                deadline,
+                next_run,
+                self.lease_time,
+                self.clock(),
+            )
+        except Exception as e:
+            self._report_error(task.task_id, e)
+            acquired = False
+        if not acquired:
+            with self._lock:
+                task.cancelled = True
+                self._discard(task)
+        return acquired
+
+    def _advance_job(self, task: "ScheduleUtils.Task", claim: Tuple) -> None:
+        """
+        在任务存储中跳过一次触发
+
+        Args:
+            task: 定时任务
+            claim: 本次触发的计划时间和新的下次执行时间
+        """
+        if not self._claim(task, claim):
+            return
+        with self._lock:
+            # 仍有实例在执行时由该实例释放租约
+            if task.running:
+                return
+        self._release_job(task, None, claim[1] is None)
+
+    def _release_job(
+        self, task: "ScheduleUtils.Task", next_run: Optional[float], remove: bool
+    ) -> None:
+        """
+        释放任务存储中的租约
+
+        Args:
+            task: 定时任务
+            next_run: 新的下次执行时间，None表示保持不变
+            remove: 是否删除任务
+        """
+        try:
+            self.job_store.release(task.job_id, self.owner, next_run, remove)
+        except Exception as e:
+            self._report_error(task.task_id, e)
+
+    def _report_error(self, task_id: Optional[int], error: BaseException) -> None:
+        """
+        调用错误回调
+
+        Args:
+            task_id: 任务ID
+            error: 异常
+        """
+        if self.error_handler is not None:
+            self.error_handler(task_id, error)
+
+    def _dispatch(
+        self, task: "ScheduleUtils.Task", scheduled: float, claim: Tuple
+    ) -> None:
+        """
+        将到期任务交给工作线程池或事件循环执行，调用方需持有锁
+
+        Args:
+            task: 定时任务
+            scheduled: 计划执行时间
+            claim: 本次触发的计划时间和新的下次执行时间，持久化任务执行前用于认领
+        """
+        task.running += 1
+        self._active += 1
+        if task.job_id is None:
+            claim = None
+        if task.is_coroutine:
+            asyncio.run_coroutine_threadsafe(
+                self._execute_async(task, scheduled, claim), self._get_loop()
+            )
+        else:
+            self._executor.submit(self._execute, task, scheduled, claim)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        获取执行协程的事件循环，未指定时在后台线程中创建，调用方需持有锁
+
+        Returns:
+            asyncio.AbstractEventLoop: 事件循环
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._own_loop = True
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, daemon=True
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    def _execute(
+        self,
+        task: "ScheduleUtils.Task",
+        scheduled: float,
+        claim: Optional[Tuple] = None,
+    ) -> None:
+        """
+        在工作线程中执行任务
+
+        Args:
+            task: 定时任务
+            scheduled: 计划执行时间
+            claim: 持久化任务的认领参数
+        """
+        if claim is not None and not self._claim(task, claim):
+            self._abandon(task)
+            return
+        started = self.clock()
+        error = None
+        try:
+            task.func(*task.args, **task.kwargs)
+        except Exception as e:
+            error = e
+        self._finish(task, started - scheduled, self.clock() - started, error)
+
+    async def _execute_async(
+        self,
+        task: "ScheduleUtils.Task",
+        scheduled: float,
+        claim: Optional[Tuple] = None,
+    ):
+        """
+        在事件循环中执行协程任务，并发数不超过max_workers
+
+        Args:
+            task: 定时任务
+            scheduled: 计划执行时间
+            claim: 持久化任务的认领参数
+        """
+        if claim is not None:
+            loop = asyncio.get_event_loop()
+            if not await loop.run_in_executor(None, self._claim, task, claim):
+                self._abandon(task)
+                return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        async with self._semaphore:
+            started = self.clock()
+            error = None
+            try:
+                await task.func(*task.args, **task.kwargs)
+            except Exception as e:
+                error = e
+            self._finish(task, started - scheduled, self.clock() - started, error)
+
+    def _abandon(self, task: "ScheduleUtils.Task") -> None:
+        """
+        放弃认领失败的执行
+
+        Args:
+            task: 定时任务
+        """
+        with self._lock:
+            task.running -= 1
+            self._active -= 1
+            self._record_skip(task)
+
+    def _finish(
+        self,
+        task: "ScheduleUtils.Task",
+        lateness: float,
+        runtime: float,
+        error: Optional[BaseException],
+    ) -> None:
+        """
+        记录执行结果，为周期任务安排下一次执行，并释放持久化任务的租约
+
+        Args:
+            task: 定时任务
+            lateness: 开始延迟（秒）
+            runtime: 运行时间（秒）
+            error: 执行时抛出的异常
+        """
+        release = None
+        with self._lock:
+            task.running -= 1
+            self._active -= 1
+            task.stats.record(lateness, runtime, error)
+            self._summary.record(lateness, runtime, error)
+            owned = not task.cancelled and self._tasks.get(task.task_id) is task
+            persistent = task.job_id is not None and not task.cancelled
+            if task.trigger is not None:
+                if owned and task.deferred:
+                    task.deferred = False
+                    self._push(task, task.next_run, jitter=False)
+                elif owned and task.next_run is None and not task.running:
+                    self._discard(task)
+                if persistent and not task.running:
+                    release = (None, task.next_run is None)
+            else:
+                next_run = self.clock() + task.interval
+                if owned and self._running:
+                    self._push(task, next_run)
+                if persistent:
+                    release = (next_run, False)
+
+        if release is not None:
+            self._release_job(task, *release)
+
+        if self.registry is not None:
+            if task.histograms is None:
+                tags = {"task": task.name}
+                task.histograms = (
+                    self.registry.histogram(
+                        "schedule_task_lateness_seconds", tags, "任务开始延迟"
+                    ),
+                    self.registry.histogram(
+                        "schedule_task_runtime_seconds", tags, "任务运行时间"
+                    ),
+                )
+            task.histograms[0].observe(lateness)
+            task.histograms[1].observe(runtime)
+        if error is not None:
+            self._report_error(task.task_id, error)
 
     def schedule_once(
-        self, delay: float, func: Callable, *args: Any, **kwargs: Any
+        self,
+        delay: float,
+        func: Callable,
+        *args: Any,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
     ) -> int:
         """
         安排一次性任务
 
         Args:
             delay: 延迟时间（秒）
-            func: 要执行的函数
+            func: 要执行的函数，可以是协程函数
             *args: 函数参数
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
             **kwargs: 函数关键字参数
 
         Returns:
             任务ID
         """
-        with self._lock:
-            task_id = id(func)
-            event = self._scheduler.enter(
-                delay, 1, self._wrap_task, (task_id, func, args, kwargs)
-            )
-            self._tasks[task_id] = event
-            return task_id
+        run_at = self.clock() + max(delay, 0)
+        trigger = ScheduleUtils.DateTrigger(run_at)
+        return self._add_task(func, args, kwargs, run_at, job_id, trigger=trigger)
 
-    def schedule_interval(
-        self, interval: float, func: Callable, *args: Any, **kwargs: Any
+    def schedule_at(
+        self,
+        run_at: Union[datetime, float],
+        func: Callable,
+        *args: Any,
+        misfire_policy: str = "coalesce",
+        misfire_grace_time: float = 1.0,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
     ) -> int:
         """
-        安排周期性任务
+        安排在指定时间执行的一次性任务
 
         Args:
-            interval: 执行间隔（秒）
-            func: 要执行的函数
+            run_at: 执行时间，datetime或时间戳
+            func: 要执行的函数，可以是协程函数
             *args: 函数参数
+            misfire_policy: 错过触发的处理策略，skip表示延迟超过宽限时间时不再执行
+            misfire_grace_time: skip策略下允许的最大延迟（秒）
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
             **kwargs: 函数关键字参数
 
         Returns:
             任务ID
         """
-        with self._lock:
-            task_id = id(func)
+        trigger = ScheduleUtils.DateTrigger(run_at)
+        # 已经过去的时间按错过触发处理
+        return self._add_task(
+            func,
+            args,
+            kwargs,
+            trigger.run_at,
+            job_id,
+            trigger=trigger,
+            misfire_policy=misfire_policy,
+            misfire_grace_time=misfire_grace_time,
+        )
 
-            def interval_task():
-                try:
-                    func(*args, **kwargs)
-                finally:
-                    if self._running and task_id in self._tasks:
-                        self._tasks[task_id] = self._scheduler.enter(
-                            interval, 1, interval_task
-                        )
+    def schedule_interval(
+        self,
+        interval: float,
+        func: Callable,
+        *args: Any,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        安排周期性任务，每次执行完成后等待interval秒再执行
+
+        Args:
+            interval: 执行间隔（秒）
+            func: 要执行的函数，可以是协程函数
+            *args: 函数参数
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
+            **kwargs: 函数关键字参数
 
-            event = self._scheduler.enter(interval, 1, interval_task)
-            self._tasks[task_id] = event
-            return task_id
+        Returns:
+            任务ID
+        """
+        first_run = self.clock() + interval
+        return self._add_task(func, args, kwargs, first_run, job_id, interval=interval)
 
     def schedule_at_fixed_rate(
-        self, interval: float, func: Callable, *args: Any, **kwargs: Any
+        self,
+        interval: float,
+        func: Callable,
+        *args: Any,
+        misfire_policy: str = "coalesce",
+        misfire_grace_time: float = 1.0,
+        max_instances: int = 1,
+        jitter: float = 0.0,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
     ) -> int:
         """
         按固定速率安排任务（不考虑任务执行时间）
 
+        第k次执行的计划时间为 首次执行时间 + k * interval，执行时间不会累积漂移。
+
         Args:
             interval: 执行间隔（秒）
-            func: 要执行的函数
+            func: 要执行的函数，可以是协程函数
             *args: 函数参数
+            misfire_policy: 错过触发的处理策略，"skip"、"coalesce" 或 "catch_up"
+            misfire_grace_time: skip策略下允许的最大延迟（秒）
+            max_instances: 同时执行的最大实例数
+            jitter: 每次执行随机推迟的最大时间（秒）
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
             **kwargs: 函数关键字参数
 
         Returns:
             任务ID
         """
-        return self.schedule_interval(interval, func, *args, **kwargs)
+        trigger = ScheduleUtils.IntervalTrigger(interval, self.clock() + interval)
+        return self.schedule_trigger(
+            trigger,
+            func,
+            *args,
+            misfire_policy=misfire_policy,
+            misfire_grace_time=misfire_grace_time,
+            max_instances=max_instances,
+            jitter=jitter,
+            job_id=job_id,
+            **kwargs,
+        )
 
     def schedule_with_fixed_delay(
-        self, delay: float, func: Callable, *args: Any, **kwargs: Any
+        self,
+        delay: float,
+        func: Callable,
+        *args: Any,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
     ) -> int:
         """
-        按固定延迟安排任务（考虑任务执行时间）
+        按固定延迟安排任务（考虑任务执行时间），每次执行完成后等待delay秒再执行
 
         Args:
             delay: 执行延迟（秒）
             func: 要执行的函数
             *args: 函数参数
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
             **kwargs: 函数关键字参数
 
         Returns:
             任务ID
         """
-        with self._lock:
-            task_id = id(func)
+        first_run = self.clock() + delay
+        return self._add_task(func, args, kwargs, first_run, job_id, interval=delay)
 
-            def delay_task():
-                start_time = time.time()
-                try:
-                    func(*args, **kwargs)
-                finally:
-                    if self._running and task_id in self._tasks:
-                        execution_time = time.time() - start_time
-                        next_delay = max(0, delay - execution_time)
-                        self._tasks[task_id] = self._scheduler.enter(
-                            next_delay, 1, delay_task
-                        )
+    def schedule_cron(
+        self,
+        expression: str,
+        func: Callable,
+        *args: Any,
+        tz: Optional[tzinfo] = None,
+        misfire_policy: str = "coalesce",
+        misfire_grace_time: float = 1.0,
+        max_instances: int = 1,
+        jitter: float = 0.0,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        按cron表达式安排任务
+
+        Args:
+            expression: cron表达式，如 "0 * * * *" 表示每小时整点
+            func: 要执行的函数，可以是协程函数
+            *args: 函数参数
+            tz: 时区，None表示本地时间
+            misfire_policy: 错过触发的处理策略，"skip"、"coalesce" 或 "catch_up"
+            misfire_grace_time: skip策略下允许的最大延迟（秒）
+            max_instances: 同时执行的最大实例数
+            jitter: 每次执行随机推迟的最大时间（秒）
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
+            **kwargs: 函数关键字参数
 
-            event = self._scheduler.enter(delay, 1, delay_task)
-            self._tasks[task_id] = event
-            return task_id
+        Returns:
+            任务ID
+        """
+        return self.schedule_trigger(
+            ScheduleUtils.CronTrigger(expression, tz),
+            func,
+            *args,
+            misfire_policy=misfire_policy,
+            misfire_grace_time=misfire_grace_time,
+            max_instances=max_instances,
+            jitter=jitter,
+            job_id=job_id,
+            **kwargs,
+        )
 
-    def cancel_task(self, task_id: int):
+    def schedule_trigger(
+        self,
+        trigger: "ScheduleUtils.Trigger",
+        func: Callable,
+        *args: Any,
+        misfire_policy: str = "coalesce",
+        misfire_grace_time: float = 1.0,
+        max_instances: int = 1,
+        jitter: float = 0.0,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
         """
-        取消指定任务
+        按触发器安排任务
 
         Args:
-            task_id: 任务ID
+            trigger: 触发器
+            func: 要执行的函数，可以是协程函数
+            *args: 函数参数
+            misfire_policy: 错过触发的处理策略，"skip"、"coalesce" 或 "catch_up"
+            misfire_grace_time: skip策略下允许的最大延迟（秒）
+            max_instances: 同时执行的最大实例数
+            jitter: 每次执行随机推迟的最大时间（秒）
+            job_id: 持久化任务ID，配置了任务存储时生效，相同ID的任务会被替换
+            **kwargs: 函数关键字参数
+
+        Returns:
+            任务ID
+
+        Raises:
+            ValueError: 触发器没有后续触发时间或参数无效
         """
-        with self._lock:
-            if task_id in self._tasks:
-                try:
-                    self._scheduler.cancel(self._tasks[task_id])
-                except ValueError:
-                    pass  # 任务可能已经执行
-                del self._tasks[task_id]
+        # 触发时间恰好为当前时间的任务立即执行
+        first_run = trigger.next_after(self.clock() - 1e-6)
+        if first_run is None:
+            raise ValueError("Trigger will never fire")
+        return self._add_task(
+            func,
+            args,
+            kwargs,
+            first_run,
+            job_id,
+            trigger=trigger,
+            misfire_policy=misfire_policy,
+            misfire_grace_time=misfire_grace_time,
+            max_instances=max_instances,
+            jitter=jitter,
+        )
 
-    def cancel_all(self):
+    def cancel_task(self, task_id: Union[int, str]):
         """
-        取消所有任务
+        取消指定任务，正在执行的任务会执行完成但不再安排下一次
+
+        Args:
+            task_id: 任务ID，或持久化任务ID（同时从任务存储中删除，即使任务尚未加载）
         """
+        job_id = task_id if isinstance(task_id, str) else None
         with self._lock:
-            self._scheduler.empty()
-            self._tasks.clear()
+            if job_id is not None:
+                task_id = self._jobs.get(job_id)
+            task = self._tasks.get(task_id)
+            if task is not None:
+                task.cancelled = True
+                self._discard(task)
+                job_id = task.job_id
+                # 堆中的条目惰性删除，过期条目过多时重建堆
+                if len(self._heap) > 2 * len(self._tasks) + 64:
+                    self._heap[:] = [
+                        entry
+                        for entry in self._heap
+                        if not entry[2].cancelled and entry[2].seq == entry[1]
+                    ]
+                    heapq.heapify(self._heap)
+        if job_id is not None and self.job_store is not None:
+            self.job_store.remove_job(job_id)
 
-    def _wrap_task(self, task_id: int, func: Callable, args: tuple, kwargs: dict):
+    def cancel_all(self):
         """
-        包装任务执行
-
-        Args:
-            task_id: 任务ID
-            func: 要执行的函数
-            args: 函数参数
-            kwargs: 函数关键字参数
+        取消所有任务，配置了任务存储时同时清空存储
         """
-        try:
-            func(*args, **kwargs)
-        finally:
-            with self._lock:
-                if task_id in self._tasks:
-                    del self._tasks[task_id]
+        with self._lock:
+            for task in self._tasks.values():
+                task.cancelled = True
+            self._tasks.clear()
+            self._jobs.clear()
+            self._heap.clear()
+        if self.job_store is not None:
+            self.job_store.remove_all_jobs()
 
     def is_running(self) -> bool:
         """
@@ -220,6 +1874,49 @@ class ScheduleUtils:
         with self._lock:
             return len(self._tasks)
 
+    def get_task_stats(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        获取任务的执行统计
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 任务名称、持久化任务ID、下次执行时间、
+            正在执行的实例数以及执行统计，任务不存在（已完成或已取消）时返回None
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            stats = task.stats.to_dict()
+            stats.update(
+                task_id=task_id,
+                name=task.name,
+                job_id=task.job_id,
+                next_run=task.next_run,
+                running=task.running,
+            )
+            return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取调度器的汇总统计，包括已完成的一次性任务
+
+        Returns:
+            Dict[str, Any]: 任务数量、等待中的定时器数量、正在执行的实例数以及执行统计
+        """
+        with self._lock:
+            stats = self._summary.to_dict()
+            stats.update(
+                tasks=len(self._tasks),
+                pending=sum(
+                    1 for task in self._tasks.values() if task.next_run is not None
+                ),
+                running=self._active,
+            )
+            return stats
+
 
 # 全局调度器实例
 global_scheduler = ScheduleUtils()
@@ -299,6 +1996,42 @@ def schedule_with_fixed_delay(
     return global_scheduler.schedule_with_fixed_delay(delay, func, *args, **kwargs)
 
 
+def schedule_at(
+    run_at: Union[datetime, float], func: Callable, *args: Any, **kwargs: Any
+) -> int:
+    """
+    安排在指定时间执行的一次性任务（使用全局调度器）
+
+    Args:
+        run_at: 执行时间，datetime或时间戳
+        func: 要执行的函数
+        *args: 函数参数
+        **kwargs: 函数关键字参数及 ScheduleUtils.schedule_at 的选项
+
+    Returns:
+        任务ID
+    """
+    global_scheduler.start()
+    return global_scheduler.schedule_at(run_at, func, *args, **kwargs)
+
+
+def schedule_cron(expression: str, func: Callable, *args: Any, **kwargs: Any) -> int:
+    """
+    按cron表达式安排任务（使用全局调度器）
+
+    Args:
+        expression: cron表达式
+        func: 要执行的函数
+        *args: 函数参数
+        **kwargs: 函数关键字参数及 ScheduleUtils.schedule_cron 的选项
+
+    Returns:
+        任务ID
+    """
+    global_scheduler.start()
+    return global_scheduler.schedule_cron(expression, func, *args, **kwargs)
+
+
 def cancel_task(task_id: int):
     """
     取消指定任务（使用全局调度器）
@@ -1,4 +1,15 @@
 # System utilities
-from .systemutils import SystemUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "SystemUtils": ".systemutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .systemutils import SystemUtils
 
 __all__ = ["SystemUtils"]
@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+指标工具类
+
+提供进程内的计数器、仪表和直方图指标，支持按名称和标签聚合并导出为Prometheus文本格式
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus文本格式的Content-Type
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 默认直方图桶上界（秒），与Prometheus客户端一致
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class MetricsUtils:
+    """
+    指标工具类
+
+    计数器和直方图的写入不加锁：每个线程只写自己的计数单元，读取时再汇总，
+    因此在热点路径上记录指标只有一次字典查找和一次加法的开销。
+    """
+
+    class Counter:
+        """
+        只增不减的计数器
+        """
+
+        def __init__(self):
+            self._cells: Dict[int, List[float]] = {}
+
+        def inc(self, amount: float = 1) -> None:
+            """
+            增加计数
+
+            Args:
+                amount: 增加量，不能为负数
+            """
+            if amount < 0:
+                raise ValueError(
+                    "Counter can only be incremented by non-negative amounts"
+                )
+            ident = threading.get_ident()
+            cell = self._cells.get(ident)
+            if cell is None:
+                cell = self._cells.setdefault(ident, [0])
+            cell[0] += amount
+
+        @property
+        def value(self) -> float:
+            """
+            当前计数
+            """
+            return sum(cell[0] for cell in list(self._cells.values()))
+
+        def reset(self) -> None:
+            """
+            清零计数
+            """
+            self._cells = {}
+
+    class Gauge:
+        """
+        可增可减的仪表，也可以绑定一个取值函数，在导出时调用
+        """
+
+        def __init__(self):
+            self._value = 0.0
+            self._function: Optional[Callable[[], float]] = None
+            self._lock = threading.Lock()
+
+        def set(self, value: float) -> None:
+            """
+            设置当前值
+
+            Args:
+                value: 当前值
+            """
+            self._value = float(value)
+
+        def inc(self, amount: float = 1) -> None:
+            """
+            增加当前值
+
+            Args:
+                amount: 增加量
+            """
+            with self._lock:
+                self._value += amount
+
+        def dec(self, amount: float = 1) -> None:
+            """
+            减少当前值
+
+            Args:
+                amount: 减少量
+            """
+            with self._lock:
+                self._value -= amount
+
+        def set_function(self, function: Callable[[], float]) -> None:
+            """
+            绑定取值函数，之后读取value时调用该函数
+
+            Args:
+                function: 返回当前值的函数
+            """
+            self._function = function
+
+        @property
+        def value(self) -> float:
+            """
+            当前值
+            """
+            if self._function is not None:
+                return float(self._function())
+            return self._value
+
+        @contextmanager
+        def track_inprogress(self) -> Iterator[None]:
+            """
+            在代码块执行期间将仪表加一，用于统计进行中的请求数
+            """
+            self.inc()
+            try:
+                yield
+            finally:
+                self.dec()
+
+    class Histogram:
+        """
+        按桶统计观测值分布的直方图
+        """
+
+        def __init__(self, buckets: Optional[Sequence[float]] = None):
+            """
+            初始化直方图
+
+            Args:
+                buckets: 递增的桶上界，默认为DEFAULT_BUCKETS，+Inf桶会自动添加
+            """
+            bounds = [float(b) for b in (buckets or DEFAULT_BUCKETS)]
+            if bounds and math.isinf(bounds[-1]):
+                bounds.pop()
+            if any(b >= a for a, b in zip(bounds[1:], bounds)):
+                raise ValueError("Histogram buckets must be in increasing order")
+            self.buckets: Tuple[float, ...] = tuple(bounds)
+            self._size = len(bounds) + 1
+            self._cells: Dict[int, List[float]] = {}
+
+        def observe(self, value: float) -> None:
+            """
+            记录一个观测值
+
+            Args:
+                value: 观测值
+            """
+            ident = threading.get_ident()
+            cell = self._cells.get(ident)
+            if cell is None:
+                # 前面是各桶计数（最后一个为+Inf桶），最后一项是观测值之和
+                cell = self._cells.setdefault(ident, [0] * self._size + [0.0])
+            cell[bisect_left(self.buckets, value)] += 1
+            cell[-1] += value
+
+        @contextmanager
+        def time(self) -> Iterator[None]:
+            """
+            记录代码块的执行耗时（秒）
+            """
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.observe(time.perf_counter() - start)
+
+        def snapshot(self) -> Dict[str, Any]:
+            """
+            汇总所有线程的观测值
+
+            Returns:
+                dict: 包含累积桶计数buckets（(上界, 计数)列表）、sum和count的字典
+            """
+            counts = [0] * self._size
+            total = 0.0
+            for cell in list(self._cells.values()):
+                for i in range(self._size):
+                    counts[i] += cell[i]
+                total += cell[-1]
+            cumulative = []
+            running = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                running += count
+                cumulative.append((bound, running))
+            return {"buckets": cumulative, "sum": total, "count": running}
+
+        def reset(self) -> None:
+            """
+            清空观测值
+            """
+            self._cells = {}
+
+    class Registry:
+        """
+        指标注册表，按名称和标签管理指标
+        """
+
+        def __init__(self):
+            self._families: Dict[str, Dict[str, Any]] = {}
+            # (名称, 标签) -> (类型, 指标)，记录指标时无需加锁即可查找
+            self._metrics: Dict[Tuple[str, tuple], Tuple[str, Any]] = {}
+            self._lock = threading.Lock()
+
+        def counter(
+            self,
+            name: str,
+            tags: Optional[Dict[str, Any]] = None,
+            description: str = "",
+        ) -> "MetricsUtils.Counter":
+            """
+            获取或创建计数器
+
+            Args:
+                name: 指标名称
+                tags: 指标标签
+                description: 指标说明
+
+            Returns:
+                Counter: 计数器
+            """
+            return self._get("counter", name, tags, description)
+
+        def gauge(
+            self,
+            name: str,
+            tags: Optional[Dict[str, Any]] = None,
+            description: str = "",
+        ) -> "MetricsUtils.Gauge":
+            """
+            获取或创建仪表
+
+            Args:
+                name: 指标名称
+                tags: 指标标签
+                description: 指标说明
+
+            Returns:
+                Gauge: 仪表
+            """
+            return self._get("gauge", name, tags, description)
+
+        def histogram(
+            self,
+            name: str,
+            tags: Optional[Dict[str, Any]] = None,
+            description: str = "",
+            buckets: Optional[Sequence[float]] = None,
+        ) -> "MetricsUtils.Histogram":
+            """
+            获取或创建直方图，同名直方图共用第一次创建时的桶
+
+            Args:
+                name: 指标名称
+                tags: 指标标签
+                description: 指标说明
+                buckets: 桶上界
+
+            Returns:
+                Histogram: 直方图
+            """
+            return self._get("histogram", name, tags, description, buckets)
+
+        def _get(
+            self,
+            kind: str,
+            name: str,
+            tags: Optional[Dict[str, Any]],
+            description: str,
+            buckets: Optional[Sequence[float]] = None,
+        ) -> Any:
+            """
+            按名称和标签查找指标，不存在时创建
+            """
+            tag_key = (
+                tuple(sorted((str(k), str(v)) for k, v in tags.items())) if tags else ()
+            )
+            entry = self._metrics.get((name, tag_key))
+            if entry is not None and entry[0] == kind:
+                return entry[1]
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = self._families[name] = {
+                        "type": kind,
+                        "description": description,
+                        "buckets": buckets,
+                        "children": {},
+                    }
+                elif family["type"] != kind:
+                    raise ValueError(
+                        f"Metric {name} is already registered as a {family['type']}"
+                    )
+                metric = family["children"].get(tag_key)
+                if metric is None:
+                    if kind == "counter":
+                        metric = MetricsUtils.Counter()
+                    elif kind == "gauge":
+                        metric = MetricsUtils.Gauge()
+                    else:
+                        metric = MetricsUtils.Histogram(family["buckets"])
+                    family["children"][tag_key] = metric
+                    self._metrics[(name, tag_key)] = (kind, metric)
+                return metric
+
+        def unregister(self, name: str) -> None:
+            """
+            删除指定名称的所有指标
+
+            Args:
+                name: 指标名称
+            """
+            with self._lock:
+                family = self._families.pop(name, None)
+                if family is not None:
+                    for tag_key in family["children"]:
+                        self._metrics.pop((name, tag_key), None)
+
+        def clear(self) -> None:
+            """
+            删除所有指标
+            """
+            with self._lock:
+                self._families = {}
+                self._metrics = {}
+
+        def collect(self) -> List[Dict[str, Any]]:
+            """
+            读取所有指标的当前值
+
+            Returns:
+                list: 每项包含name、type、description和samples（(标签字典, 值)列表）的字典，
+                    直方图的值为Histogram.snapshot()的结果
+            """
+            with self._lock:
+                families = [
+                    (name, family, list(family["children"].items()))
+                    for name, family in sorted(self._families.items())
+                ]
+            result = []
+            for name, family, children in families:
+                samples = []
+                for tag_key, metric in sorted(children, key=lambda item: item[0]):
+                    value = (
+                        metric.snapshot()
+                        if family["type"] == "histogram"
+                        else metric.value
+                    )
+                    samples.append((dict(tag_key), value))
+                result.append(
+                    {
+                        "name": name,
+                        "type": family["type"],
+                        "description": family["description"],
+                        "samples": samples,
+                    }
+                )
+            return result
+
+        def to_prometheus(self) -> str:
+            """
+            导出为Prometheus文本格式
+
+            Returns:
+                str: Prometheus文本格式的指标
+            """
+            lines = []
+            for family in self.collect():
+                name = MetricsUtils._metric_name(family["name"])
+                if family["description"]:
+                    description = (
+                        family["description"].replace("\\", "\\\\").replace("\n", "\\n")
+                    )
+                    lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {family['type']}")
+                for tags, value in family["samples"]:
+                    if family["type"] != "histogram":
+                        lines.append(
+                            f"{name}{MetricsUtils._labels(tags)} "
+                            f"{MetricsUtils._format_value(value)}"
+                        )
+                        continue
+                    for bound, count in value["buckets"]:
+                        labels = MetricsUtils._labels(
+                            dict(tags, le=MetricsUtils._format_value(bound))
+                        )
+                        lines.append(f"{name}_bucket{labels} {count}")
+                    labels = MetricsUtils._labels(tags)
+                    lines.append(
+                        f"{name}_sum{labels} {MetricsUtils._format_value(value['sum'])}"
+                    )
+                    lines.append(f"{name}_count{labels} {value['count']}")
+            return "\n".join(lines) + "\n" if lines else ""
+
+    _default_registry: Optional["MetricsUtils.Registry"] = None
+    _default_lock = threading.Lock()
+
+    @staticmethod
+    def get_registry() -> "MetricsUtils.Registry":
+        """
+        获取默认注册表，DecoratorUtil的计时和指标装饰器默认记录到该注册表
+
+        Returns:
+            Registry: 默认注册表
+        """
+        if MetricsUtils._default_registry is None:
+            with MetricsUtils._default_lock:
+                if MetricsUtils._default_registry is None:
+                    MetricsUtils._default_registry = MetricsUtils.Registry()
+        return MetricsUtils._default_registry
+
+    @staticmethod
+    def counter(
+        name: str, tags: Optional[Dict[str, Any]] = None, description: str = ""
+    ) -> "MetricsUtils.Counter":
+        """
+        在默认注册表中获取或创建计数器
+
+        Args:
+            name: 指标名称
+            tags: 指标标签
+            description: 指标说明
+
+        Returns:
+            Counter: 计数器
+        """
+        return MetricsUtils.get_registry().counter(name, tags, description)
+
+    @staticmethod
+    def gauge(
+        name: str, tags: Optional[Dict[str, Any]] = None, description: str = ""
+    ) -> "MetricsUtils.Gauge":
+        """
+        在默认注册表中获取或创建仪表
+
+        Args:
+            name: 指标名称
+            tags: 指标标签
+            description: 指标说明
+
+        Returns:
+            Gauge: 仪表
+        """
+        return MetricsUtils.get_registry().gauge(name, tags, description)
+
+    @staticmethod
+    def histogram(
+        name: str,
+        tags: Optional[Dict[str, Any]] = None,
+        description: str = "",
+        buckets: Optional[Sequence[float]] = None,
+    ) -> "MetricsUtils.Histogram":
+        """
+        在默认注册表中获取或创建直方图
+
+        Args:
+            name: 指标名称
+            tags: 指标标签
+            description: 指标说明
+            buckets: 桶上界
+
+        Returns:
+            Histogram: 直方图
+        """
+        return MetricsUtils.get_registry().histogram(name, tags, description, buckets)
+
+    @staticmethod
+    def timed(
+        name: str,
+        tags: Optional[Dict[str, Any]] = None,
+        registry: Optional["MetricsUtils.Registry"] = None,
+    ) -> Callable:
+        """
+        创建将函数耗时（秒）记录到直方图的装饰器，支持异步函数
+
+        Args:
+            name: 直方图名称
+            tags: 指标标签
+            registry: 注册表，默认为默认注册表
+
+        Returns:
+            Callable: 装饰器
+        """
+
+        def decorator(func: Callable) -> Callable:
+            import inspect
+
+            histogram = (registry or MetricsUtils.get_registry()).histogram(name, tags)
+
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        histogram.observe(time.perf_counter() - start)
+
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def to_prometheus(registry: Optional["MetricsUtils.Registry"] = None) -> str:
+        """
+        将注册表导出为Prometheus文本格式
+
+        Args:
+            registry: 注册表，默认为默认注册表
+
+        Returns:
+            str: Prometheus文本格式的指标
+        """
+        return (registry or MetricsUtils.get_registry()).to_prometheus()
+
+    @staticmethod
+    def start_http_server(
+        port: int = 9100,
+        host: str = "127.0.0.1",
+        registry: Optional["MetricsUtils.Registry"] = None,
+        path: str = "/metrics",
+    ):
+        """
+        在后台线程中启动供Prometheus抓取的HTTP服务
+
+        Args:
+            port: 监听端口，0表示随机端口
+            host: 监听地址
+            registry: 注册表，默认为默认注册表
+            path: 指标路径
+
+        Returns:
+            ThreadingHTTPServer: HTTP服务，server_address为实际监听地址，调用shutdown()停止
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != path:
+                    self.send_error(404)
+                    return
+                body = MetricsUtils.to_prometheus(registry).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="btools-metrics-server", daemon=True
+        ).start()
+        return server
+
+    @staticmethod
+    def _metric_name(name: str) -> str:
+        """
+        将指标名称转换为Prometheus允许的字符
+        """
+        chars = [c if c.isascii() and (c.isalnum() or c in "_:") else "_" for c in name]
+        if chars and chars[0].isdigit():
+            chars.insert(0, "_")
+        return "".join(chars)
+
+    @staticmethod
+    def _labels(tags: Dict[str, Any]) -> str:
+        """
+        生成Prometheus标签字符串
+        """
+        if not tags:
+            return ""
+        parts = []
+        for key, value in tags.items():
+            value = (
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+            )
+            parts.append(f'{MetricsUtils._metric_name(key)}="{value}"')
+        return "{" + ",".join(parts) + "}"
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        """
+        生成Prometheus数值字符串
+        """
+        if isinstance(value, int):
+            return str(value)
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(float(value))
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+限流工具类
+
+提供令牌桶、GCRA和滑动窗口计数器限流器，每次判断为O(1)，线程安全并支持asyncio
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+from ..basic.decoratorutils import RateLimitError
+
+
+class RateLimitUtils:
+    """
+    限流工具类
+    """
+
+    class RateLimiter:
+        """
+        限流器基类
+
+        每个键维护独立的限流状态，key为None时使用全局状态。键的数量超过max_keys时
+        淘汰最久未使用的键，被淘汰的键再次出现时从空闲状态开始计算。
+        """
+
+        def __init__(
+            self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic
+        ):
+            """
+            初始化限流器
+
+            Args:
+                max_keys: 最多保留的键状态数量
+                clock: 单调时钟函数
+            """
+            self.max_keys = max_keys
+            self.clock = clock
+            self._states: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+            self._lock = threading.Lock()
+
+        def _new_state(self, now: float) -> List[float]:
+            """
+            创建键的初始状态
+            """
+            raise NotImplementedError
+
+        def _attempt(self, state: List[float], tokens: float, now: float) -> float:
+            """
+            尝试获取许可，成功时更新状态
+
+            Returns:
+                float: 0表示已获取，否则为距离可以获取的估计等待时间（秒）
+            """
+            raise NotImplementedError
+
+        def _check_tokens(self, tokens: float) -> None:
+            """
+            检查单次请求的许可数是否可能被满足
+            """
+
+        def reserve(self, key: Hashable = None, tokens: float = 1) -> float:
+            """
+            尝试获取许可，不等待
+
+            Args:
+                key: 限流键，如客户端标识
+                tokens: 需要的许可数
+
+            Returns:
+                float: 0表示已获取，否则为建议的等待时间（秒），此时不消耗许可
+            """
+            self._check_tokens(tokens)
+            with self._lock:
+                now = self.clock()
+                state = self._states.get(key)
+                if state is None:
+                    state = self._states[key] = self._new_state(now)
+                    if len(self._states) > self.max_keys:
+                        self._states.popitem(last=False)
+                else:
+                    self._states.move_to_end(key)
+                return self._attempt(state, tokens, now)
+
+        def try_acquire(self, key: Hashable = None, tokens: float = 1) -> bool:
+            """
+            尝试获取许可，不等待
+
+            Args:
+                key: 限流键
+                tokens: 需要的许可数
+
+            Returns:
+                bool: 是否获取成功
+            """
+            return self.reserve(key, tokens) == 0
+
+        def check(self, key: Hashable = None, tokens: float = 1) -> None:
+            """
+            获取许可，超过限制时抛出异常
+
+            Args:
+                key: 限流键
+                tokens: 需要的许可数
+
+            Raises:
+                RateLimitError: 超过速率限制，retry_after属性为建议的等待时间（秒）
+            """
+            wait = self.reserve(key, tokens)
+            if wait:
+                error = RateLimitError(f"超过速率限制，请在 {wait:.3f} 秒后重试")
+                error.retry_after = wait
+                raise error
+
+        def acquire(
+            self,
+            key: Hashable = None,
+            tokens: float = 1,
+            timeout: Optional[float] = None,
+        ) -> bool:
+            """
+            获取许可，必要时阻塞等待
+
+            Args:
+                key: 限流键
+                tokens: 需要的许可数
+                timeout: 最长等待时间（秒），None表示一直等待
+
+            Returns:
+                bool: 是否在超时前获取成功
+            """
+            deadline = None if timeout is None else self.clock() + timeout
+            while True:
+                wait = self.reserve(key, tokens)
+                if not wait:
+                    return True
+                if deadline is not None:
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                time.sleep(wait)
+
+        async def acquire_async(
+            self,
+            key: Hashable = None,
+            tokens: float = 1,
+            timeout: Optional[float] = None,
+        ) -> bool:
+            """
+            获取许可，必要时在事件循环中异步等待
+
+            Args:
+                key: 限流键
+                tokens: 需要的许可数
+                timeout: 最长等待时间（秒），None表示一直等待
+
+            Returns:
+                bool: 是否在超时前获取成功
+            """
+            deadline = None if timeout is None else self.clock() + timeout
+            while True:
+                wait = self.reserve(key, tokens)
+                if not wait:
+                    return True
+                if deadline is not None:
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                await asyncio.sleep(wait)
+
+        def reset(self, key: Hashable = None) -> None:
+            """
+            清除键的限流状态
+
+            Args:
+                key: 限流键
+            """
+            with self._lock:
+                self._states.pop(key, None)
+
+        def __len__(self) -> int:
+            return len(self._states)
+
+    class TokenBucket(RateLimiter):
+        """
+        令牌桶限流器，令牌以rate的速率补充，最多积累capacity个，允许突发
+        """
+
+        def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None,
+            max_keys: int = 10000,
+            clock: Callable[[], float] = time.monotonic,
+        ):
+            """
+            初始化令牌桶
+
+            Args:
+                rate: 每秒补充的令牌数
+                capacity: 桶容量，即最大突发量，默认等于rate
+                max_keys: 最多保留的键状态数量
+                clock: 单调时钟函数
+            """
+            super().__init__(max_keys, clock)
+            if rate <= 0:
+                raise ValueError("rate must be positive")
+            self.rate = rate
+            self.capacity = capacity if capacity is not None else max(rate, 1)
+
+        def _new_state(self, now: float) -> List[float]:
+            # [当前令牌数, 上次补充时间]
+            return [self.capacity, now]
+
+        def _check_tokens(self, tokens: float) -> None:
+            if tokens > self.capacity:
+                raise ValueError(f"tokens exceeds bucket capacity {self.capacity}")
+
+        def _attempt(self, state: List[float], tokens: float, now: float) -> float:
+            available = min(self.capacity, state[0] + (now - state[1]) * self.rate)
+            state[1] = now
+            if available >= tokens:
+                state[0] = available - tokens
+                return 0.0
+            state[0] = available
+            return (tokens - available) / self.rate
+
+    class GCRA(RateLimiter):
+        """
+        通用信元速率算法（GCRA），效果等同令牌桶，每个键只保存一个理论到达时间
+        """
+
+        def __init__(
+            self,
+            rate: float,
+            burst: int = 1,
+            max_keys: int = 10000,
+            clock: Callable[[], float] = time.monotonic,
+        ):
+            """
+            初始化GCRA限流器
+
+            Args:
+                rate: 每秒允许的请求数
+                burst: 允许的最大突发请求数
+                max_keys: 最多保留的键状态数量
+                clock: 单调时钟函数
+            """
+            super().__init__(max_keys, clock)
+            if rate <= 0 or burst < 1:
+                raise ValueError("rate must be positive and burst at least 1")
+            self.rate = rate
+            self.burst = burst
+            self.interval = 1.0 / rate
+
+        def _new_state(self, now: float) -> List[float]:
+            # [理论到达时间]
+            return [now]
+
+        def _check_tokens(self, tokens: float) -> None:
+            if tokens > self.burst:
+                raise ValueError(f"tokens exceeds burst {self.burst}")
+
+        def _attempt(self, state: List[float], tokens: float, now: float) -> float:
+            tat = max(state[0], now)
+            new_tat = tat + tokens * self.interval
+            allow_at = new_tat - self.burst * self.interval
+            if now < allow_at:
+                return allow_at - now
+            state[0] = new_tat
+            return 0.0
+
+    class SlidingWindowCounter(RateLimiter):
+        """
+        滑动窗口计数器限流器
+
+        只保存当前和上一个窗口的计数，按上一个窗口在滑动窗口中的剩余比例估算请求数，
+        内存和计算量与limit无关。
+        """
+
+        def __init__(
+            self,
+            limit: int,
+            window: float,
+            max_keys: int = 10000,
+            clock: Callable[[], float] = time.monotonic,
+        ):
+            """
+            初始化滑动窗口计数器
+
+            Args:
+                limit: 窗口内允许的最大请求数
+                window: 窗口长度（秒）
+                max_keys: 最多保留的键状态数量
+                clock: 单调时钟函数
+            """
+            super().__init__(max_keys, clock)
+            if limit < 1 or window <= 0:
+                raise ValueError("limit must be at least 1 and window positive")
+            self.limit = limit
+            self.window = window
+
+        def _new_state(self, now: float) -> List[float]:
+            # [当前窗口起点, 当前窗口计数, 上一个窗口计数]
+            return [now, 0, 0]
+
+        def _check_tokens(self, tokens: float) -> None:
+            if tokens > self.limit:
+                raise ValueError(f"tokens exceeds limit {self.limit}")
+
+        def _attempt(self, state: List[float], tokens: float, now: float) -> float:
+            window = self.window
+            passed = math.floor((now - state[0]) / window)
+            if passed >= 1:
+                state[2] = state[1] if passed == 1 else 0
+                state[1] = 0
+                state[0] += passed * window
+            elapsed = now - state[0]
+            previous, current = state[2], state[1]
+            estimated = previous * (1 - elapsed / window) + current
+            # 容忍浮点误差，避免在计算出的等待时间到达时仍被拒绝
+            if estimated + tokens <= self.limit + 1e-9:
+                state[1] = current + tokens
+                return 0.0
+            room = self.limit - current - tokens
+            if room < 0 or previous <= 0:
+                # 当前窗口内无法满足，等到下一个窗口再判断
+                return max(state[0] + window - now, 1e-6)
+            # 上一个窗口的权重下降到 room / previous 的时刻
+            return max(state[0] + window * (1 - room / previous) - now, 1e-6)
+
+    @staticmethod
+    def create(
+        algorithm: str = "token_bucket", **options: Any
+    ) -> "RateLimitUtils.RateLimiter":
+        """
+        按名称创建限流器
+
+        Args:
+            algorithm: 算法名称，"token_bucket"、"gcra" 或 "sliding_window"
+            **options: 限流器参数
+
+        Returns:
+            RateLimiter: 限流器
+        """
+        classes = {
+            "token_bucket": RateLimitUtils.TokenBucket,
+            "gcra": RateLimitUtils.GCRA,
+            "sliding_window": RateLimitUtils.SlidingWindowCounter,
+        }
+        if algorithm not in classes:
+            raise ValueError(f"Unsupported rate limit algorithm: {algorithm}")
+        return classes[algorithm](**options)
+
+    @staticmethod
+    def limit(
+        limiter: "RateLimitUtils.RateLimiter",
+        key: Optional[Callable[..., Hashable]] = None,
+        block: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Callable:
+        """
+        创建限流装饰器，支持异步函数
+
+        Args:
+            limiter: 限流器
+            key: 根据调用参数计算限流键的函数，None表示所有调用共用一个限制
+            block: 超过限制时是否等待，False表示抛出RateLimitError
+            timeout: 等待的最长时间（秒），超时后抛出RateLimitError
+
+        Returns:
+            Callable: 限流装饰器
+        """
+        import functools
+        import inspect
+
+        def timeout_error() -> RateLimitError:
+            return RateLimitError(f"等待 {timeout} 秒后仍超过速率限制")
+
+        def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    limit_key = key(*args, **kwargs) if key else None
+                    if not block:
+                        limiter.check(limit_key)
+                    elif not await limiter.acquire_async(limit_key, timeout=timeout):
+                        raise timeout_error()
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                limit_key = key(*args, **kwargs) if key else None
+                if not block:
+                    limiter.check(limit_key)
+                elif not limiter.acquire(limit_key, timeout=timeout):
+                    raise timeout_error()
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
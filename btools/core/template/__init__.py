@@ -1,5 +1,17 @@
 # Template utilities
-from .i18nutils import I18nUtils
-from .templateutils import TemplateUtils
+from typing import TYPE_CHECKING
+
+from ..._lazy import attach
+
+_EXPORTS = {
+    "I18nUtils": ".i18nutils",
+    "TemplateUtils": ".templateutils",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .i18nutils import I18nUtils
+    from .templateutils import TemplateUtils
 
 __all__ = ["TemplateUtils", "I18nUtils"]
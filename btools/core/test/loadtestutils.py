@@ -6,10 +6,14 @@
 提供负载测试工具，模拟并发请求等功能
 """
 
+import asyncio
 import concurrent.futures
+import functools
+import math
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 class LoadTestUtils:
@@ -17,9 +21,749 @@ class LoadTestUtils:
     负载测试工具类
     """
 
+    class RateProfile:
+        """
+        到达速率曲线，由若干速率线性变化的阶段组成，用于开环负载测试计算请求的计划发起时间
+        """
+
+        def __init__(self, segments: List[tuple]):
+            """
+            初始化到达速率曲线
+
+            Args:
+                segments: 阶段列表，每项为 (开始时间, 结束时间, 开始速率, 结束速率)，时间单位为秒，速率单位为请求/秒
+            """
+            self.segments = [seg for seg in segments if seg[1] > seg[0]]
+            self.duration = self.segments[-1][1] if self.segments else 0.0
+
+        @classmethod
+        def constant(
+            cls, rate: float, duration: float, ramp_up: float = 0
+        ) -> "LoadTestUtils.RateProfile":
+            """
+            创建恒定速率曲线
+
+            Args:
+                rate: 目标到达速率（请求/秒）
+                duration: 总持续时间（秒），包含启动时间
+                ramp_up: 启动时间（秒），期间速率从0线性增加到rate
+
+            Returns:
+                到达速率曲线
+            """
+            ramp_up = min(ramp_up, duration)
+            return cls([(0.0, ramp_up, 0.0, rate), (ramp_up, duration, rate, rate)])
+
+        @classmethod
+        def from_stages(
+            cls, stages: List[Dict[str, float]], start_rate: float = 0
+        ) -> "LoadTestUtils.RateProfile":
+            """
+            根据阶段列表创建速率曲线，每个阶段内速率从上一阶段的目标值线性变化到本阶段的目标值
+
+            Args:
+                stages: 阶段列表，如 [{"duration": 10, "target": 100}, {"duration": 30, "target": 100}]
+                start_rate: 第一个阶段的起始速率
+
+            Returns:
+                到达速率曲线
+            """
+            segments = []
+            start, rate = 0.0, float(start_rate)
+            for stage in stages:
+                end = start + stage["duration"]
+                target = float(stage["target"])
+                segments.append((start, end, rate, target))
+                start, rate = end, target
+            return cls(segments)
+
+        def rate_at(self, t: float) -> float:
+            """
+            获取指定时间点的到达速率
+
+            Args:
+                t: 距测试开始的时间（秒）
+
+            Returns:
+                到达速率（请求/秒）
+            """
+            for start, end, r0, r1 in self.segments:
+                if start <= t < end:
+                    return r0 + (r1 - r0) * (t - start) / (end - start)
+            return 0.0
+
+        def expected_requests(self) -> float:
+            """
+            获取整个曲线的期望请求数
+
+            Returns:
+                速率曲线下的面积
+            """
+            return sum(
+                (r0 + r1) / 2 * (end - start) for start, end, r0, r1 in self.segments
+            )
+
+        def next_arrival(self, t: float) -> Optional[float]:
+            """
+            计算下一个请求的计划发起时间，即从t开始速率积分达到1的时间点
+
+            Args:
+                t: 上一个请求的计划发起时间
+
+            Returns:
+                下一个请求的计划发起时间，超出曲线范围时返回None
+            """
+            need = 1.0
+            for start, end, r0, r1 in self.segments:
+                if end <= t:
+                    continue
+                t = max(t, start)
+                slope = (r1 - r0) / (end - start)
+                rate = r0 + slope * (t - start)
+                area = (rate + r1) / 2 * (end - t)
+                if area >= need - 1e-9:
+                    # 求解 rate*d + slope*d^2/2 = need，使用数值稳定的形式
+                    root = math.sqrt(max(rate * rate + 2 * slope * need, 0.0))
+                    return t + 2 * need / (rate + root)
+                need -= area
+                t = end
+            return None
+
+    class LatencyHistogram:
+        """
+        HDR风格的响应时间直方图
+
+        按对数线性分桶，在指定有效数字精度内记录任意数量的样本，内存占用只与桶数量有关。
+        直方图可以合并，各工作线程或进程分别记录后再汇总。
+        """
+
+        def __init__(
+            self,
+            significant_figures: int = 3,
+            resolution: float = 1e-6,
+            max_value: float = 3600.0,
+        ):
+            """
+            初始化直方图
+
+            Args:
+                significant_figures: 有效数字位数（1-5），决定分桶的相对误差
+                resolution: 最小可区分的时间（秒），默认1微秒
+                max_value: 可记录的最大时间（秒），超出的样本计入最大桶
+            """
+            if not 1 <= significant_figures <= 5:
+                raise ValueError("significant_figures must be between 1 and 5")
+            self.significant_figures = significant_figures
+            self.resolution = resolution
+            self.max_value = max_value
+            self._magnitude = math.ceil(math.log2(2 * 10**significant_figures))
+            self._half = 1 << (self._magnitude - 1)
+            self._max_units = max(int(max_value / resolution), 1)
+            self.counts: Dict[int, int] = {}
+            self.total = 0
+            self.sum = 0.0
+            self.min: Optional[float] = None
+            self.max: Optional[float] = None
+
+        def _index(self, units: int) -> int:
+            """
+            计算整数单位值所在的桶序号
+            """
+            if units < self._half << 1:
+                return units
+            shift = units.bit_length() - self._magnitude
+            return shift * self._half + (units >> shift)
+
+        def _highest_equivalent(self, index: int) -> int:
+            """
+            计算桶内最大的整数单位值
+            """
+            if index < self._half << 1:
+                return index
+            shift = index // self._half - 1
+            sub_bucket = index - shift * self._half
+            return ((sub_bucket + 1) << shift) - 1
+
+        def record(self, value: float, count: int = 1):
+            """
+            记录样本
+
+            Args:
+                value: 响应时间（秒）
+                count: 样本数量
+            """
+            units = min(max(int(value / self.resolution), 0), self._max_units)
+            index = self._index(units)
+            self.counts[index] = self.counts.get(index, 0) + count
+            self.total += count
+            self.sum += value * count
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+        def merge(
+            self, other: "LoadTestUtils.LatencyHistogram"
+        ) -> "LoadTestUtils.LatencyHistogram":
+            """
+            合并另一个直方图
+
+            Args:
+                other: 相同精度配置的直方图
+
+            Returns:
+                合并后的自身
+            """
+            if (
+                other.significant_figures != self.significant_figures
+                or other.resolution != self.resolution
+                or other.max_value != self.max_value
+            ):
+                raise ValueError("Cannot merge histograms with different settings")
+            for index, count in list(other.counts.items()):
+                self.counts[index] = self.counts.get(index, 0) + count
+            self.total += other.total
+            self.sum += other.sum
+            if other.min is not None and (self.min is None or other.min < self.min):
+                self.min = other.min
+            if other.max is not None and (self.max is None or other.max > self.max):
+                self.max = other.max
+            return self
+
+        def mean(self) -> float:
+            """
+            获取平均值
+
+            Returns:
+                平均响应时间（秒）
+            """
+            return self.sum / self.total if self.total else 0
+
+        def percentile(self, p: float) -> float:
+            """
+            获取百分位值，结果为所在桶的上界，不超过记录的最大值
+
+            Args:
+                p: 百分位（0-100）
+
+            Returns:
+                响应时间（秒）
+            """
+            if not self.total:
+                return 0
+            target = max(1, math.ceil(p / 100 * self.total - 1e-9))
+            running = 0
+            for index in sorted(self.counts):
+                running += self.counts[index]
+                if running >= target:
+                    break
+            value = (self._highest_equivalent(index) + 1) * self.resolution
+            return max(min(value, self.max), self.min)
+
+        def percentiles(self, percentiles: List[float]) -> Dict[str, float]:
+            """
+            获取多个百分位值
+
+            Args:
+                percentiles: 百分位列表（如 [50, 90, 95, 99]）
+
+            Returns:
+                百分位结果字典，如 {"p50": 0.01}
+            """
+            if not self.total:
+                return {}
+            return {f"p{p}": self.percentile(p) for p in percentiles}
+
+        def to_dict(self) -> Dict[str, Any]:
+            """
+            转换为可JSON序列化的字典
+
+            Returns:
+                直方图数据字典
+            """
+            return {
+                "significant_figures": self.significant_figures,
+                "resolution": self.resolution,
+                "max_value": self.max_value,
+                "counts": sorted(self.counts.items()),
+                "total": self.total,
+                "sum": self.sum,
+                "min": self.min,
+                "max": self.max,
+            }
+
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> "LoadTestUtils.LatencyHistogram":
+            """
+            从字典恢复直方图
+
+            Args:
+                data: to_dict返回的字典
+
+            Returns:
+                直方图
+            """
+            histogram = cls(
+                data["significant_figures"], data["resolution"], data["max_value"]
+            )
+            histogram.counts = {int(index): count for index, count in data["counts"]}
+            histogram.total = data["total"]
+            histogram.sum = data["sum"]
+            histogram.min = data["min"]
+            histogram.max = data["max"]
+            return histogram
+
+    class MetricsRecorder:
+        """
+        负载测试指标记录器
+
+        记录响应时间直方图、按异常类型的错误统计和按秒的时间序列。每个工作线程使用独立的记录器，
+        结束后通过merge汇总，记录过程无需加锁。
+        """
+
+        def __init__(
+            self,
+            start_time: Optional[float] = None,
+            keep_results: bool = True,
+            significant_figures: int = 3,
+        ):
+            """
+            初始化记录器
+
+            Args:
+                start_time: 测试开始的时间戳（time.time()），用于计算时间序列的秒序号
+                keep_results: 是否保留每个请求的返回值、响应时间和错误信息
+                significant_figures: 直方图的有效数字位数
+            """
+            self.start_time = time.time() if start_time is None else start_time
+            self.keep_results = keep_results
+            self.significant_figures = significant_figures
+            self.histogram = LoadTestUtils.LatencyHistogram(significant_figures)
+            self.success = 0
+            self.failures = 0
+            self.error_types: Dict[str, int] = {}
+            self.error_samples: Dict[str, str] = {}
+            self.intervals: Dict[int, list] = {}
+            self.results = []
+            self.execution_times = []
+            self.errors = []
+
+        def _interval(self, second: int) -> list:
+            """
+            获取指定秒的 [直方图, 错误数]
+            """
+            interval = self.intervals.get(second)
+            if interval is None:
+                interval = [LoadTestUtils.LatencyHistogram(self.significant_figures), 0]
+                self.intervals[second] = interval
+            return interval
+
+        def record_success(self, latency: float, result: Any = None):
+            """
+            记录成功的请求
+
+            Args:
+                latency: 响应时间（秒）
+                result: 函数返回值
+            """
+            self.success += 1
+            self.histogram.record(latency)
+            self._interval(int(time.time() - self.start_time))[0].record(latency)
+            if self.keep_results:
+                self.results.append(result)
+                self.execution_times.append(latency)
+
+        def record_error(self, latency: float, error: BaseException):
+            """
+            记录失败的请求
+
+            Args:
+                latency: 响应时间（秒）
+                error: 捕获的异常
+            """
+            self.failures += 1
+            self.histogram.record(latency)
+            interval = self._interval(int(time.time() - self.start_time))
+            interval[0].record(latency)
+            interval[1] += 1
+            error_type = type(error).__name__
+            self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+            self.error_samples.setdefault(error_type, str(error))
+            if self.keep_results:
+                self.errors.append(str(error))
+                self.execution_times.append(latency)
+
+        def merge(
+            self, other: "LoadTestUtils.MetricsRecorder"
+        ) -> "LoadTestUtils.MetricsRecorder":
+            """
+            合并另一个记录器，时间序列按各自的开始时间对齐
+
+            Args:
+                other: 其他记录器
+
+            Returns:
+                合并后的自身
+            """
+            self.success += other.success
+            self.failures += other.failures
+            self.histogram.merge(other.histogram)
+            for error_type, count in list(other.error_types.items()):
+                self.error_types[error_type] = (
+                    self.error_types.get(error_type, 0) + count
+                )
+            for error_type, message in list(other.error_samples.items()):
+                self.error_samples.setdefault(error_type, message)
+            offset = int(round(other.start_time - self.start_time))
+            for second, (histogram, errors) in list(other.intervals.items()):
+                interval = self._interval(second + offset)
+                interval[0].merge(histogram)
+                interval[1] += errors
+            self.results.extend(other.results)
+            self.execution_times.extend(other.execution_times)
+            self.errors.extend(other.errors)
+            return self
+
+        def add_interval(
+            self,
+            second: int,
+            histogram: "LoadTestUtils.LatencyHistogram",
+            errors: int,
+        ):
+            """
+            合并一秒内的统计，用于汇总其他进程实时上报的数据
+
+            Args:
+                second: 秒序号，相对于本记录器的开始时间
+                histogram: 该秒完成请求的响应时间直方图
+                errors: 该秒的错误数
+            """
+            interval = self._interval(second)
+            interval[0].merge(histogram)
+            interval[1] += errors
+            self.histogram.merge(histogram)
+            self.success += histogram.total - errors
+            self.failures += errors
+
+        def completed_intervals(
+            self, since: int, until: int
+        ) -> List[Tuple[int, "LoadTestUtils.LatencyHistogram", int]]:
+            """
+            获取指定范围内各秒的统计
+
+            Args:
+                since: 起始秒序号（包含）
+                until: 结束秒序号（不包含）
+
+            Returns:
+                (秒序号, 直方图, 错误数) 列表
+            """
+            return [
+                (second, histogram, errors)
+                for second, (histogram, errors) in sorted(list(self.intervals.items()))
+                if since <= second < until
+            ]
+
+        def to_dict(self) -> Dict[str, Any]:
+            """
+            转换为字典，用于在进程间传输
+
+            Returns:
+                记录器数据字典
+            """
+            return {
+                "start_time": self.start_time,
+                "keep_results": self.keep_results,
+                "significant_figures": self.significant_figures,
+                "histogram": self.histogram.to_dict(),
+                "success": self.success,
+                "failures": self.failures,
+                "error_types": dict(self.error_types),
+                "error_samples": dict(self.error_samples),
+                "intervals": [
+                    (second, histogram.to_dict(), errors)
+                    for second, (histogram, errors) in self.intervals.items()
+                ],
+                "results": self.results,
+                "execution_times": self.execution_times,
+                "errors": self.errors,
+            }
+
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> "LoadTestUtils.MetricsRecorder":
+            """
+            从字典恢复记录器
+
+            Args:
+                data: to_dict返回的字典
+
+            Returns:
+                记录器
+            """
+            recorder = cls(
+                data["start_time"], data["keep_results"], data["significant_figures"]
+            )
+            recorder.histogram = LoadTestUtils.LatencyHistogram.from_dict(
+                data["histogram"]
+            )
+            recorder.success = data["success"]
+            recorder.failures = data["failures"]
+            recorder.error_types = dict(data["error_types"])
+            recorder.error_samples = dict(data["error_samples"])
+            recorder.intervals = {
+                second: [LoadTestUtils.LatencyHistogram.from_dict(histogram), errors]
+                for second, histogram, errors in data["intervals"]
+            }
+            recorder.results = list(data["results"])
+            recorder.execution_times = list(data["execution_times"])
+            recorder.errors = list(data["errors"])
+            return recorder
+
+        def time_series(self) -> List[Dict[str, Any]]:
+            """
+            获取按秒汇总的时间序列
+
+            Returns:
+                每秒的请求数、错误数、平均响应时间和p50/p95/p99
+            """
+            series = []
+            for second in sorted(self.intervals):
+                histogram, errors = self.intervals[second]
+                series.append(
+                    {
+                        "second": second,
+                        "requests": histogram.total,
+                        "errors": errors,
+                        "avg_response_time": histogram.mean(),
+                        "p50": histogram.percentile(50),
+                        "p95": histogram.percentile(95),
+                        "p99": histogram.percentile(99),
+                    }
+                )
+            return series
+
+        def summary(self) -> Dict[str, Any]:
+            """
+            生成结果字典中与请求统计相关的部分
+
+            Returns:
+                包含请求数、响应时间、百分位、错误分类和时间序列的字典
+            """
+            histogram = self.histogram
+            return {
+                "total_requests": self.success + self.failures,
+                "success_requests": self.success,
+                "error_requests": self.failures,
+                "execution_times": self.execution_times,
+                "avg_response_time": histogram.mean(),
+                "min_response_time": histogram.min or 0,
+                "max_response_time": histogram.max or 0,
+                "percentiles": histogram.percentiles([50, 90, 95, 99]),
+                "error_types": dict(self.error_types),
+                "error_samples": dict(self.error_samples),
+                "time_series": self.time_series(),
+                "histogram": histogram,
+                "results": self.results,
+                "errors": self.errors,
+            }
+
+    class LiveMonitor:
+        """
+        负载测试实时监控
+
+        定期汇总已完成秒的统计，生成区间RPS、错误率和p50/p95/p99等实时指标并回调，
+        同时按阈值检查实时指标，连续超出阈值时通知测试提前结束。
+        """
+
+        def __init__(
+            self,
+            thresholds: Optional[Dict[str, float]] = None,
+            on_metrics: Optional[Callable[[Dict[str, Any]], Any]] = None,
+            abort_after: int = 1,
+            warmup: float = 0,
+        ):
+            """
+            初始化实时监控
+
+            Args:
+                thresholds: 阈值字典，支持的键见check_thresholds，如 {"p99": 0.5, "max_error_rate": 1.0}
+                on_metrics: 每个统计区间结束后以实时指标字典调用
+                abort_after: 连续多少个区间超出阈值后提前结束测试
+                warmup: 预热时间（秒），期间只统计不检查阈值
+            """
+            self.thresholds = thresholds or {}
+            self.on_metrics = on_metrics
+            self.abort_after = abort_after
+            self.warmup = warmup
+            self.reported = 0
+            self.history: List[Dict[str, Any]] = []
+            self.aborted = False
+            self.abort_reason: Optional[str] = None
+            self._consecutive_breaches = 0
+            self._percentiles = sorted(
+                {50.0, 95.0, 99.0}
+                | {
+                    float(name[1:])
+                    for name in self.thresholds
+                    if LoadTestUtils._is_percentile_name(name)
+                }
+            )
+
+        def observe(
+            self, recorders: List[Any], start_time: float, lag: int = 0
+        ) -> bool:
+            """
+            汇总记录器中尚未统计的已完成秒，生成一个区间的实时指标
+
+            Args:
+                recorders: MetricsRecorder列表
+                start_time: 记录器的开始时间戳
+                lag: 额外等待的秒数，用于等待远端节点上报
+
+            Returns:
+                是否应提前结束测试
+            """
+            until = int(time.time() - start_time) - lag
+            if until <= self.reported:
+                return self.aborted
+            intervals = [
+                item
+                for recorder in recorders
+                for item in recorder.completed_intervals(self.reported, until)
+            ]
+            return self.update(until, intervals)
+
+        def update(self, until: int, intervals: List[tuple]) -> bool:
+            """
+            根据 [reported, until) 范围内各秒的统计生成实时指标
+
+            Args:
+                until: 区间结束的秒序号（不包含）
+                intervals: (秒序号, 直方图, 错误数) 列表，同一秒可以出现多次
+
+            Returns:
+                是否应提前结束测试
+            """
+            histogram = LoadTestUtils.LatencyHistogram()
+            errors = 0
+            for _, interval_histogram, interval_errors in intervals:
+                histogram.merge(interval_histogram)
+                errors += interval_errors
+            seconds = until - self.reported
+            requests = histogram.total
+            error_rate = errors / requests * 100 if requests else 0
+            snapshot = {
+                "start_second": self.reported,
+                "end_second": until,
+                "requests": requests,
+                "errors": errors,
+                "requests_per_second": requests / seconds,
+                "error_rate": error_rate,
+                "success_rate": 100 - error_rate if requests else 0,
+                "avg_response_time": histogram.mean(),
+                "percentiles": {
+                    f"p{p:g}": histogram.percentile(p) for p in self._percentiles
+                },
+            }
+            for p in (50, 95, 99):
+                snapshot[f"p{p}"] = snapshot["percentiles"][f"p{p}"]
+            breaches = []
+            if self.thresholds and until > self.warmup:
+                breaches = LoadTestUtils._evaluate_thresholds(snapshot, self.thresholds)
+            snapshot["breaches"] = breaches
+            self.reported = until
+            self.history.append(snapshot)
+
+            if breaches:
+                self._consecutive_breaches += 1
+                if self._consecutive_breaches >= self.abort_after:
+                    self.aborted = True
+                    self.abort_reason = "; ".join(breaches)
+            else:
+                self._consecutive_breaches = 0
+            if self.on_metrics is not None:
+                self.on_metrics(snapshot)
+            return self.aborted
+
+        def report(self) -> Dict[str, Any]:
+            """
+            生成结果字典中与实时监控相关的部分
+
+            Returns:
+                包含是否提前结束、原因和各区间实时指标的字典
+            """
+            return {
+                "aborted": self.aborted,
+                "abort_reason": self.abort_reason,
+                "live_metrics": self.history,
+            }
+
+    class WorkerAgent:
+        """
+        分布式负载测试的工作节点代理，在远端主机上监听协调者的连接并执行下发的负载测试
+
+        警告：下发的任务通过pickle传输，代理会执行任何持有认证密钥的连接方发来的代码。
+        请使用足够随机的密钥，并只在可信网络中监听对外地址。
+        """
+
+        def __init__(
+            self, host: str = "127.0.0.1", port: int = 9500, *, authkey: bytes
+        ):
+            """
+            初始化工作节点代理并开始监听
+
+            Args:
+                host: 监听地址，默认只接受本机连接，接受远端协调者时需指定对外地址
+                port: 监听端口，0表示随机端口
+                authkey: 与协调者通信的认证密钥，必须显式指定
+
+            Raises:
+                ValueError: 认证密钥为空
+            """
+            from multiprocessing.connection import Listener
+
+            if not authkey:
+                raise ValueError("必须指定认证密钥authkey")
+
+            self._listener = Listener((host, port), authkey=authkey)
+            self.address = self._listener.address
+            self._closed = False
+
+        def serve_forever(self, max_sessions: Optional[int] = None):
+            """
+            依次处理协调者的连接，每个连接执行一次负载测试
+
+            Args:
+                max_sessions: 处理的最大连接数，None表示一直运行直到close
+            """
+            from multiprocessing import AuthenticationError
+
+            served = 0
+            while max_sessions is None or served < max_sessions:
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    if self._closed:
+                        break
+                    continue
+                LoadTestUtils._serve_session(conn)
+                served += 1
+
+        def close(self):
+            """
+            停止监听
+            """
+            self._closed = True
+            self._listener.close()
+
     @staticmethod
     def concurrent_execution(
-        func: Callable, concurrency: int, iterations: int = 1, *args, **kwargs
+        func: Callable,
+        concurrency: int,
+        iterations: int = 1,
+        *args,
+        keep_results: bool = True,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         并发执行函数
@@ -29,55 +773,56 @@ class LoadTestUtils:
             concurrency: 并发数
             iterations: 每个线程执行次数
             *args: 函数参数
+            keep_results: 是否保留每个请求的返回值、响应时间和错误信息，长时间测试可关闭以固定内存占用
             **kwargs: 函数关键字参数
 
         Returns:
             包含执行结果的字典
         """
-        results = []
-        errors = []
-        execution_times = []
+        start_time = time.time()
+        recorders = [
+            LoadTestUtils.MetricsRecorder(start_time, keep_results)
+            for _ in range(concurrency)
+        ]
 
-        def worker():
+        def worker(recorder):
             for _ in range(iterations):
-                start_time = time.time()
+                started = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    results.append(result)
                 except Exception as e:
-                    errors.append(str(e))
-                finally:
-                    end_time = time.time()
-                    execution_times.append(end_time - start_time)
+                    recorder.record_error(time.perf_counter() - started, e)
+                else:
+                    recorder.record_success(time.perf_counter() - started, result)
 
-        # 使用线程池执行
+        # 使用线程池执行，每个线程独立记录，结束后合并
         with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = [executor.submit(worker) for _ in range(concurrency)]
+            futures = [executor.submit(worker, recorder) for recorder in recorders]
             concurrent.futures.wait(futures)
 
-        total_requests = concurrency * iterations
-        success_requests = len(results)
-        error_requests = len(errors)
+        metrics = LoadTestUtils.MetricsRecorder(start_time, keep_results)
+        for recorder in recorders:
+            metrics.merge(recorder)
 
-        return {
-            "concurrency": concurrency,
-            "iterations": iterations,
-            "total_requests": total_requests,
-            "success_requests": success_requests,
-            "error_requests": error_requests,
-            "execution_times": execution_times,
-            "avg_response_time": (
-                sum(execution_times) / len(execution_times) if execution_times else 0
-            ),
-            "min_response_time": min(execution_times) if execution_times else 0,
-            "max_response_time": max(execution_times) if execution_times else 0,
-            "results": results,
-            "errors": errors,
-        }
+        result = {"concurrency": concurrency, "iterations": iterations}
+        result.update(metrics.summary())
+        result["total_requests"] = concurrency * iterations
+        return result
 
     @staticmethod
     def load_test(
-        func: Callable, concurrency: int, duration: int = 10, *args, **kwargs
+        func: Callable,
+        concurrency: int,
+        duration: int = 10,
+        *args,
+        ramp_up: float = 0,
+        keep_results: bool = True,
+        thresholds: Optional[Dict[str, float]] = None,
+        on_metrics: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        metrics_interval: float = 1.0,
+        abort_after: int = 1,
+        warmup: Optional[float] = None,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         负载测试
@@ -87,66 +832,141 @@ class LoadTestUtils:
             concurrency: 并发数
             duration: 测试持续时间（秒）
             *args: 函数参数
+            ramp_up: 启动时间（秒），各线程在此时间内均匀错开启动
+            keep_results: 是否保留每个请求的返回值、响应时间和错误信息，长时间测试可关闭以固定内存占用
+            thresholds: 实时指标的阈值，如 {"p99": 0.5, "max_error_rate": 1.0}，超出时提前结束测试
+            on_metrics: 运行期间每个统计区间结束后以实时指标字典调用
+            metrics_interval: 实时指标的统计间隔（秒）
+            abort_after: 连续多少个区间超出阈值后提前结束测试
+            warmup: 预热时间（秒），期间只统计实时指标、不检查阈值，None表示与ramp_up相同
             **kwargs: 函数关键字参数
 
         Returns:
             包含测试结果的字典
         """
-        results = []
-        errors = []
-        execution_times = []
         start_time = time.time()
-        stop_event = threading.Event()
+        monitor = LoadTestUtils.LiveMonitor(
+            thresholds,
+            on_metrics,
+            abort_after,
+            ramp_up if warmup is None else warmup,
+        )
+        on_tick = None
+        if thresholds or on_metrics:
+
+            def on_tick(recorders):
+                return monitor.observe(recorders, start_time)
+
+        metrics, actual_duration = LoadTestUtils._run_thread_workers(
+            func,
+            concurrency,
+            duration,
+            args,
+            kwargs,
+            ramp_up,
+            keep_results,
+            start_time,
+            on_tick,
+            metrics_interval,
+        )
+        total_requests = metrics.success + metrics.failures
+        rps = total_requests / actual_duration if actual_duration > 0 else 0
+
+        result = {
+            "concurrency": concurrency,
+            "duration": duration,
+            "actual_duration": actual_duration,
+            "requests_per_second": rps,
+        }
+        result.update(metrics.summary())
+        result.update(monitor.report())
+        return result
+
+    @staticmethod
+    def _run_thread_workers(
+        func: Callable,
+        concurrency: int,
+        duration: float,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        ramp_up: float = 0,
+        keep_results: bool = True,
+        start_time: Optional[float] = None,
+        on_tick: Optional[Callable[[List[Any]], bool]] = None,
+        tick_interval: float = 1.0,
+    ) -> Tuple["LoadTestUtils.MetricsRecorder", float]:
+        """
+        使用线程运行闭环虚拟用户，每个线程独立记录指标，结束后合并
 
-        def worker():
+        Args:
+            func: 要测试的函数
+            concurrency: 并发数
+            duration: 测试持续时间（秒）
+            args: 函数参数
+            kwargs: 函数关键字参数
+            ramp_up: 启动时间（秒），各线程在此时间内均匀错开启动
+            keep_results: 是否保留逐条结果
+            start_time: 测试开始的时间戳（time.time()），默认为当前时间
+            on_tick: 运行期间每隔tick_interval秒以各线程的记录器列表调用，返回True时提前结束
+            tick_interval: on_tick的调用间隔（秒）
+
+        Returns:
+            (合并后的记录器, 实际持续时间)
+        """
+        kwargs = kwargs or {}
+        start_time = time.time() if start_time is None else start_time
+        stop_event = threading.Event()
+        recorders = [
+            LoadTestUtils.MetricsRecorder(start_time, keep_results)
+            for _ in range(concurrency)
+        ]
+
+        def worker(index):
+            if ramp_up > 0 and stop_event.wait(ramp_up * index / concurrency):
+                return
+            recorder = recorders[index]
             while not stop_event.is_set():
-                worker_start_time = time.time()
+                worker_start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    results.append(result)
                 except Exception as e:
-                    errors.append(str(e))
-                finally:
-                    worker_end_time = time.time()
-                    execution_times.append(worker_end_time - worker_start_time)
+                    recorder.record_error(time.perf_counter() - worker_start_time, e)
+                else:
+                    recorder.record_success(
+                        time.perf_counter() - worker_start_time, result
+                    )
 
         # 启动线程
         threads = []
-        for _ in range(concurrency):
-            thread = threading.Thread(target=worker, daemon=True)
+        for index in range(concurrency):
+            thread = threading.Thread(target=worker, args=(index,), daemon=True)
             threads.append(thread)
             thread.start()
 
-        # 等待指定时间
-        time.sleep(duration)
+        # 等待指定时间，期间定期回调
+        deadline = start_time + duration
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            wait = min(tick_interval, remaining) if on_tick else remaining
+            if stop_event.wait(wait):
+                break
+            if on_tick is not None and on_tick(recorders):
+                break
 
         # 停止测试
         stop_event.set()
         for thread in threads:
             thread.join(timeout=1)
 
-        end_time = time.time()
-        actual_duration = end_time - start_time
-        total_requests = len(results) + len(errors)
-        rps = total_requests / actual_duration if actual_duration > 0 else 0
+        actual_duration = time.time() - start_time
 
-        return {
-            "concurrency": concurrency,
-            "duration": duration,
-            "actual_duration": actual_duration,
-            "total_requests": total_requests,
-            "requests_per_second": rps,
-            "success_requests": len(results),
-            "error_requests": len(errors),
-            "execution_times": execution_times,
-            "avg_response_time": (
-                sum(execution_times) / len(execution_times) if execution_times else 0
-            ),
-            "min_response_time": min(execution_times) if execution_times else 0,
-            "max_response_time": max(execution_times) if execution_times else 0,
-            "results": results,
-            "errors": errors,
-        }
+        # 合并各线程的记录
+        metrics = LoadTestUtils.MetricsRecorder(start_time, keep_results)
+        for recorder in recorders:
+            metrics.merge(recorder)
+        return metrics, actual_duration
 
     @staticmethod
     def step_load_test(
@@ -156,11 +976,17 @@ class LoadTestUtils:
         step: int,
         duration_per_step: int = 5,
         *args,
+        stop_on_saturation: bool = False,
+        saturation_gain: float = 0.05,
+        on_step: Optional[Callable[[Dict[str, Any]], Any]] = None,
         **kwargs,
     ) -> List[Dict[str, Any]]:
         """
         阶梯负载测试
 
+        启用stop_on_saturation时，某一阶梯的实时指标超出阈值（通过thresholds传给load_test）而提前结束，
+        或吞吐量相比之前的最大值提升不足saturation_gain时，认为服务已饱和并停止后续阶梯。
+
         Args:
             func: 要测试的函数
             start_concurrency: 起始并发数
@@ -168,22 +994,102 @@ class LoadTestUtils:
             step: 步长
             duration_per_step: 每步持续时间（秒）
             *args: 函数参数
-            **kwargs: 函数关键字参数
+            stop_on_saturation: 是否在服务饱和后停止
+            saturation_gain: 判断饱和的最小吞吐量提升比例
+            on_step: 每个阶梯结束后以该阶梯的测试结果调用
+            **kwargs: 函数关键字参数，以及load_test的thresholds、on_metrics等参数
 
         Returns:
-            各阶梯测试结果列表
+            各阶梯测试结果列表，启用stop_on_saturation时每项包含saturated和saturation_reason
         """
         results = []
+        best_throughput = None
 
         for concurrency in range(start_concurrency, max_concurrency + 1, step):
-            print(f"Running load test with concurrency: {concurrency}")
             test_result = LoadTestUtils.load_test(
                 func, concurrency, duration_per_step, *args, **kwargs
             )
             results.append(test_result)
 
+            if stop_on_saturation:
+                reason = None
+                throughput = test_result["requests_per_second"]
+                if test_result["aborted"]:
+                    reason = f"SLO breached: {test_result['abort_reason']}"
+                elif best_throughput is not None and throughput < best_throughput * (
+                    1 + saturation_gain
+                ):
+                    reason = (
+                        f"Throughput {throughput:.2f} rps did not increase by "
+                        f"{saturation_gain:.0%} over {best_throughput:.2f} rps"
+                    )
+                test_result["saturated"] = reason is not None
+                test_result["saturation_reason"] = reason
+                if best_throughput is None or throughput > best_throughput:
+                    best_throughput = throughput
+
+            if on_step is not None:
+                on_step(test_result)
+            if stop_on_saturation and test_result["saturated"]:
+                break
+
         return results
 
+    @staticmethod
+    def find_saturation_point(
+        func: Callable,
+        start_concurrency: int,
+        max_concurrency: int,
+        step: int,
+        duration_per_step: int = 5,
+        *args,
+        saturation_gain: float = 0.05,
+        on_step: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        逐步增加并发数，找出服务的饱和点
+
+        Args:
+            func: 要测试的函数
+            start_concurrency: 起始并发数
+            max_concurrency: 最大并发数
+            step: 步长
+            duration_per_step: 每步持续时间（秒）
+            *args: 函数参数
+            saturation_gain: 判断饱和的最小吞吐量提升比例
+            on_step: 每个阶梯结束后以该阶梯的测试结果调用
+            **kwargs: 函数关键字参数，以及load_test的thresholds、on_metrics等参数
+
+        Returns:
+            饱和点结果，包含是否饱和、饱和时的并发数、原因、最大吞吐量及各阶梯结果
+        """
+        steps = LoadTestUtils.step_load_test(
+            func,
+            start_concurrency,
+            max_concurrency,
+            step,
+            duration_per_step,
+            *args,
+            stop_on_saturation=True,
+            saturation_gain=saturation_gain,
+            on_step=on_step,
+            **kwargs,
+        )
+        best = max(steps, key=lambda x: x["requests_per_second"])
+        last = steps[-1]
+
+        return {
+            "saturated": last["saturated"],
+            "saturation_concurrency": (
+                last["concurrency"] if last["saturated"] else None
+            ),
+            "reason": last["saturation_reason"],
+            "max_throughput": best["requests_per_second"],
+            "max_throughput_concurrency": best["concurrency"],
+            "steps": steps,
+        }
+
     @staticmethod
     def stress_test(
         func: Callable,
@@ -192,6 +1098,7 @@ class LoadTestUtils:
         duration_per_level: int = 10,
         max_errors: int = 5,
         *args,
+        on_step: Optional[Callable[[Dict[str, Any]], Any]] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -204,7 +1111,9 @@ class LoadTestUtils:
             duration_per_level: 每个并发级别持续时间（秒）
             max_errors: 最大错误数
             *args: 函数参数
-            **kwargs: 函数关键字参数
+            on_step: 每个并发级别结束后以该级别的测试结果调用
+            **kwargs: 函数关键字参数，以及load_test的thresholds、on_metrics等参数，
+                某一级别超出阈值时停止
 
         Returns:
             压力测试结果
@@ -214,14 +1123,15 @@ class LoadTestUtils:
         total_errors = 0
 
         while total_errors < max_errors:
-            print(f"Running stress test with concurrency: {concurrency}")
             test_result = LoadTestUtils.load_test(
                 func, concurrency, duration_per_level, *args, **kwargs
             )
             test_results.append(test_result)
+            if on_step is not None:
+                on_step(test_result)
 
             total_errors += test_result["error_requests"]
-            if total_errors >= max_errors:
+            if total_errors >= max_errors or test_result["aborted"]:
                 break
 
             concurrency += increment
@@ -324,82 +1234,554 @@ class LoadTestUtils:
 
         return LoadTestUtils.load_test(make_request, concurrency, duration)
 
+    @staticmethod
+    async def async_load_test(
+        func: Callable,
+        duration: float = 10,
+        rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        ramp_up: float = 0,
+        stages: Optional[List[Dict[str, float]]] = None,
+        max_in_flight: int = 10000,
+        *args,
+        keep_results: bool = True,
+        thresholds: Optional[Dict[str, float]] = None,
+        on_metrics: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        metrics_interval: float = 1.0,
+        abort_after: int = 1,
+        warmup: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        基于asyncio的负载测试，单线程即可维持数万个进行中的请求
+
+        指定rate或stages时为开环模式：按到达速率在计划时间发起请求，不等待之前的请求完成，
+        响应时间从计划发起时间开始计算，被测服务变慢造成的排队时间也会计入，避免协调遗漏。
+        指定concurrency时为闭环模式：每个虚拟用户在上一个请求完成后立即发起下一个请求。
+
+        Args:
+            func: 要测试的函数，协程函数直接在事件循环中执行，普通函数在默认线程池中执行
+            duration: 测试持续时间（秒），包含启动时间，指定stages时忽略
+            rate: 目标到达速率（请求/秒）
+            concurrency: 虚拟用户数
+            ramp_up: 启动时间（秒），开环模式下速率从0线性增加到rate，闭环模式下用户均匀错开启动
+            stages: 速率阶段列表，如 [{"duration": 10, "target": 100}, {"duration": 30, "target": 100}]
+            max_in_flight: 开环模式下同时进行的请求上限，超出的请求排队等待，排队时间计入响应时间
+            *args: 函数参数
+            keep_results: 是否保留每个请求的返回值、响应时间和错误信息，长时间测试可关闭以固定内存占用
+            thresholds: 实时指标的阈值，如 {"p99": 0.5, "max_error_rate": 1.0}，超出时提前结束测试
+            on_metrics: 运行期间每个统计区间结束后以实时指标字典调用
+            metrics_interval: 实时指标的统计间隔（秒）
+            abort_after: 连续多少个区间超出阈值后提前结束测试
+            warmup: 预热时间（秒），期间只统计实时指标、不检查阈值，None表示与ramp_up相同
+            **kwargs: 函数关键字参数
+
+        Returns:
+            包含测试结果的字典
+        """
+        if rate is None and stages is None and concurrency is None:
+            raise ValueError("One of rate, stages or concurrency must be specified")
+
+        loop = asyncio.get_running_loop()
+        if asyncio.iscoroutinefunction(func):
+
+            def call():
+                return func(*args, **kwargs)
+
+        else:
+            call = functools.partial(
+                loop.run_in_executor, None, functools.partial(func, *args, **kwargs)
+            )
+
+        metrics = LoadTestUtils.MetricsRecorder(keep_results=keep_results)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def execute(started: float):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            try:
+                result = await call()
+            except Exception as e:
+                metrics.record_error(time.perf_counter() - started, e)
+            else:
+                metrics.record_success(time.perf_counter() - started, result)
+            finally:
+                in_flight -= 1
+
+        start_time = time.perf_counter()
+        monitor = LoadTestUtils.LiveMonitor(
+            thresholds,
+            on_metrics,
+            abort_after,
+            ramp_up if warmup is None else warmup,
+        )
+        watcher = None
+        if thresholds or on_metrics:
+
+            async def watch():
+                while not monitor.aborted:
+                    await asyncio.sleep(metrics_interval)
+                    monitor.observe([metrics], metrics.start_time)
+
+            watcher = loop.create_task(watch())
+
+        if concurrency is not None and rate is None and stages is None:
+            mode = "closed"
+            profile = None
+            stop_at = start_time + duration
+
+            async def user(index: int):
+                if ramp_up > 0:
+                    await asyncio.sleep(ramp_up * index / concurrency)
+                while time.perf_counter() < stop_at and not monitor.aborted:
+                    await execute(time.perf_counter())
+
+            await asyncio.gather(*(user(i) for i in range(concurrency)))
+        else:
+            mode = "open"
+            if stages is not None:
+                profile = LoadTestUtils.RateProfile.from_stages(stages)
+            else:
+                profile = LoadTestUtils.RateProfile.constant(rate, duration, ramp_up)
+            semaphore = asyncio.Semaphore(max_in_flight)
+            pending = set()
+
+            async def fire(intended: float):
+                async with semaphore:
+                    await execute(intended)
+
+            spawned = 0
+            offset = profile.next_arrival(0.0)
+            while offset is not None and not monitor.aborted:
+                intended = start_time + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif spawned % 100 == 0:
+                    # 落后于计划时间时仍需定期让出事件循环
+                    await asyncio.sleep(0)
+                task = loop.create_task(fire(intended))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                spawned += 1
+                offset = profile.next_arrival(offset)
+
+            if pending:
+                await asyncio.gather(*pending)
+
+        if watcher is not None:
+            watcher.cancel()
+        actual_duration = time.perf_counter() - start_time
+        total_requests = metrics.success + metrics.failures
+
+        result = {
+            "mode": mode,
+            "target_rate": rate,
+            "concurrency": concurrency,
+            "duration": profile.duration if profile else duration,
+            "actual_duration": actual_duration,
+            "expected_requests": profile.expected_requests() if profile else None,
+            "requests_per_second": (
+                total_requests / actual_duration if actual_duration > 0 else 0
+            ),
+            "peak_in_flight": peak_in_flight,
+        }
+        result.update(metrics.summary())
+        result.update(monitor.report())
+        return result
+
+    @staticmethod
+    def run_async_load_test(func: Callable, *args, **kwargs) -> Dict[str, Any]:
+        """
+        在新的事件循环中运行async_load_test
+
+        Args:
+            func: 要测试的函数
+            *args: async_load_test的其他位置参数
+            **kwargs: async_load_test的其他关键字参数
+
+        Returns:
+            包含测试结果的字典
+        """
+        return asyncio.run(LoadTestUtils.async_load_test(func, *args, **kwargs))
+
+    @staticmethod
+    async def simulate_async_api_load(
+        url: str,
+        duration: float,
+        rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        method: str = "GET",
+        headers: Dict = None,
+        data: Dict = None,
+        ramp_up: float = 0,
+        stages: Optional[List[Dict[str, float]]] = None,
+        max_in_flight: int = 10000,
+        max_connections: int = 1000,
+        keep_results: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        使用AsyncHTTPClient模拟API负载
+
+        Args:
+            url: API URL
+            duration: 持续时间（秒）
+            rate: 目标到达速率（请求/秒），开环模式
+            concurrency: 虚拟用户数，闭环模式
+            method: HTTP 方法
+            headers: 请求头
+            data: 请求数据，以JSON发送
+            ramp_up: 启动时间（秒）
+            stages: 速率阶段列表
+            max_in_flight: 同时进行的请求上限
+            max_connections: 连接池总连接数上限
+            keep_results: 是否保留每个请求的返回值、响应时间和错误信息
+
+        Returns:
+            负载测试结果
+        """
+        from ..network.asynchttputils import AsyncHTTPClient
+
+        async with AsyncHTTPClient(
+            headers=headers,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections,
+        ) as client:
+
+            async def make_request():
+                response = await client.request(method.upper(), url, json=data)
+                response.raise_for_status()
+                return response.status
+
+            return await LoadTestUtils.async_load_test(
+                make_request,
+                duration,
+                rate,
+                concurrency,
+                ramp_up,
+                stages,
+                max_in_flight,
+                keep_results=keep_results,
+            )
+
     @staticmethod
     def distributed_load_test(
         func: Callable,
-        workers: List[str],
+        workers: Union[int, List[str]],
         concurrency_per_worker: int,
         duration: int,
         *args,
+        ramp_up: float = 0,
+        keep_results: bool = False,
+        thresholds: Optional[Dict[str, float]] = None,
+        on_metrics: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        metrics_interval: float = 1.0,
+        abort_after: int = 1,
+        warmup: Optional[float] = None,
+        authkey: Optional[bytes] = None,
+        start_delay: float = 0.5,
         **kwargs,
     ) -> Dict[str, Any]:
         """
         分布式负载测试
 
+        协调者连接所有工作节点，待全部就绪后约定同一开始时间并行施压。工作节点在运行期间按秒上报
+        已完成的统计，结束后上报完整的直方图，由协调者合并。"local"节点为本机的独立进程，
+        可以让受GIL限制的测试函数利用多个CPU核心；"host:port"节点为远端运行WorkerAgent的主机。
+
+        func及其参数需要可被pickle序列化（如模块级函数），远端主机需能导入相同的模块。
+        远端WorkerAgent会执行任何持有认证密钥的连接方下发的pickle数据，密钥需妥善保管。
+
         Args:
             func: 要测试的函数
-            workers: 工作节点列表
+            workers: 工作节点列表，每项为"local"或"host:port"，整数n表示n个本机进程
             concurrency_per_worker: 每个工作节点的并发数
             duration: 测试持续时间（秒）
             *args: 函数参数
+            ramp_up: 每个工作节点的启动时间（秒）
+            keep_results: 是否回传逐条结果，默认关闭以减少传输量
+            thresholds: 实时指标的阈值，超出时通知所有工作节点提前结束
+            on_metrics: 运行期间每个统计区间结束后以汇总的实时指标字典调用
+            metrics_interval: 工作节点上报和协调者统计实时指标的间隔（秒）
+            abort_after: 连续多少个区间超出阈值后提前结束测试
+            warmup: 预热时间（秒），期间只统计实时指标、不检查阈值，None表示与ramp_up相同
+            authkey: 与远端WorkerAgent通信的认证密钥，包含"host:port"节点时必须指定
+            start_delay: 所有节点就绪后到开始施压的等待时间（秒）
             **kwargs: 函数关键字参数
 
         Returns:
             分布式测试结果
-        """
-        # 注意：此功能需要在分布式环境中实现
-        # 这里仅提供框架，实际实现需要根据具体的分布式架构调整
-        results = []
 
-        # 模拟分布式执行
-        for worker in workers:
-            print(f"Running load test on worker: {worker}")
-            # 在实际实现中，这里应该通过网络调用远程执行测试
-            # 这里仅模拟结果
-            worker_result = LoadTestUtils.load_test(
-                func, concurrency_per_worker, duration, *args, **kwargs
+        Raises:
+            ValueError: 包含远端节点但未指定认证密钥
+        """
+        import multiprocessing
+        from multiprocessing.connection import Client, wait
+
+        if isinstance(workers, int):
+            workers = ["local"] * workers
+        if not authkey and any(worker != "local" for worker in workers):
+            raise ValueError("连接远端WorkerAgent时必须指定认证密钥authkey")
+
+        connections = []
+        processes = []
+        try:
+            # 连接所有工作节点并下发任务
+            for worker in workers:
+                if worker == "local":
+                    parent_conn, child_conn = multiprocessing.Pipe()
+                    process = multiprocessing.Process(
+                        target=LoadTestUtils._serve_session,
+                        args=(child_conn,),
+                        daemon=True,
+                    )
+                    process.start()
+                    child_conn.close()
+                    processes.append(process)
+                    connections.append(parent_conn)
+                else:
+                    host, port = worker.rsplit(":", 1)
+                    connections.append(Client((host, int(port)), authkey=authkey))
+
+            job = {
+                "type": "job",
+                "func": func,
+                "args": args,
+                "kwargs": kwargs,
+                "concurrency": concurrency_per_worker,
+                "duration": duration,
+                "ramp_up": ramp_up,
+                "keep_results": keep_results,
+                "report_interval": metrics_interval,
+            }
+            for conn in connections:
+                conn.send(job)
+            for worker, conn in zip(workers, connections):
+                LoadTestUtils._expect_message(conn, worker, "ready")
+
+            # 约定统一的开始时间
+            start_at = time.time() + start_delay
+            for conn in connections:
+                conn.send({"type": "start", "start_at": start_at})
+
+            live = LoadTestUtils.MetricsRecorder(start_at, keep_results=False)
+            monitor = LoadTestUtils.LiveMonitor(
+                thresholds,
+                on_metrics,
+                abort_after,
+                ramp_up if warmup is None else warmup,
             )
-            worker_result["worker"] = worker
-            results.append(worker_result)
+            watching = bool(thresholds or on_metrics)
+            # 等待远端节点上报已完成秒的统计
+            lag = math.ceil(metrics_interval)
+            owners = {conn: index for index, conn in enumerate(connections)}
+            worker_results = {}
+            stop_sent = False
+            while len(worker_results) < len(connections):
+                pending = [c for c in connections if owners[c] not in worker_results]
+                ready = wait(pending, timeout=metrics_interval if watching else None)
+                for conn in ready:
+                    message = LoadTestUtils._expect_message(
+                        conn, workers[owners[conn]], "progress", "result"
+                    )
+                    if message["type"] == "progress":
+                        for second, histogram, errors in message["intervals"]:
+                            live.add_interval(
+                                second,
+                                LoadTestUtils.LatencyHistogram.from_dict(histogram),
+                                errors,
+                            )
+                    else:
+                        worker_results[owners[conn]] = message
+                if (
+                    watching
+                    and not stop_sent
+                    and monitor.observe([live], start_at, lag)
+                ):
+                    for conn in connections:
+                        if owners[conn] not in worker_results:
+                            try:
+                                conn.send({"type": "stop"})
+                            except OSError:
+                                pass
+                    stop_sent = True
+        finally:
+            for conn in connections:
+                conn.close()
+            for process in processes:
+                process.join(timeout=5)
 
         # 汇总结果
-        total_requests = sum(r["total_requests"] for r in results)
-        total_success = sum(r["success_requests"] for r in results)
-        total_errors = sum(r["error_requests"] for r in results)
-        all_execution_times = [t for r in results for t in r["execution_times"]]
+        metrics = LoadTestUtils.MetricsRecorder(start_at, keep_results)
+        results = []
+        for index, worker in enumerate(workers):
+            message = worker_results[index]
+            recorder = LoadTestUtils.MetricsRecorder.from_dict(message["metrics"])
+            metrics.merge(recorder)
+            worker_result = {
+                "worker": worker,
+                "host": message["host"],
+                "pid": message["pid"],
+                "actual_duration": message["actual_duration"],
+                "requests_per_second": (
+                    (recorder.success + recorder.failures) / message["actual_duration"]
+                    if message["actual_duration"] > 0
+                    else 0
+                ),
+            }
+            worker_result.update(recorder.summary())
+            results.append(worker_result)
 
-        return {
+        actual_duration = max(r["actual_duration"] for r in results) if results else 0
+        summary = metrics.summary()
+        result = {
             "workers": workers,
             "concurrency_per_worker": concurrency_per_worker,
             "duration": duration,
-            "total_requests": total_requests,
-            "total_success": total_success,
-            "total_errors": total_errors,
-            "avg_response_time": (
-                sum(all_execution_times) / len(all_execution_times)
-                if all_execution_times
+            "actual_duration": actual_duration,
+            "total_success": summary["success_requests"],
+            "total_errors": summary["error_requests"],
+            "requests_per_second": (
+                summary["total_requests"] / actual_duration
+                if actual_duration > 0
                 else 0
             ),
-            "min_response_time": min(all_execution_times) if all_execution_times else 0,
-            "max_response_time": max(all_execution_times) if all_execution_times else 0,
-            "requests_per_second": total_requests / duration if duration > 0 else 0,
             "worker_results": results,
         }
+        result.update(summary)
+        result.update(monitor.report())
+        return result
+
+    @staticmethod
+    def _expect_message(conn: Any, worker: str, *types: str) -> Dict[str, Any]:
+        """
+        接收工作节点的消息并检查类型
+
+        Args:
+            conn: 与工作节点的连接
+            worker: 工作节点名称，用于错误信息
+            *types: 允许的消息类型
+
+        Returns:
+            消息字典
+        """
+        try:
+            message = conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Worker {worker} disconnected unexpectedly")
+        if message.get("type") == "error":
+            raise RuntimeError(f"Worker {worker} failed: {message['message']}")
+        if message.get("type") not in types:
+            raise RuntimeError(
+                f"Unexpected message {message.get('type')!r} from worker {worker}"
+            )
+        return message
+
+    @staticmethod
+    def _serve_session(conn: Any):
+        """
+        在工作节点上执行一次协调者下发的负载测试
+
+        接收任务后回复ready，等待start消息中的开始时间，运行期间按秒上报已完成的统计，
+        协调者发送stop消息时提前结束，最后上报完整的记录器数据。
+
+        Args:
+            conn: 与协调者的连接（multiprocessing.connection.Connection）
+        """
+        import os
+        import socket
+        import traceback
+
+        try:
+            job = conn.recv()
+            conn.send({"type": "ready"})
+            message = conn.recv()
+            if message.get("type") != "start":
+                return
+            start_at = message["start_at"]
+            delay = start_at - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+            reported = [0]
+
+            def on_tick(recorders):
+                current = int(time.time() - start_at)
+                intervals = {}
+                for recorder in recorders:
+                    for second, histogram, errors in recorder.completed_intervals(
+                        reported[0], current
+                    ):
+                        merged = intervals.setdefault(
+                            second, [LoadTestUtils.LatencyHistogram(), 0]
+                        )
+                        merged[0].merge(histogram)
+                        merged[1] += errors
+                reported[0] = max(reported[0], current)
+                if intervals:
+                    conn.send(
+                        {
+                            "type": "progress",
+                            "intervals": [
+                                (second, histogram.to_dict(), errors)
+                                for second, (histogram, errors) in sorted(
+                                    intervals.items()
+                                )
+                            ],
+                        }
+                    )
+                return conn.poll() and conn.recv().get("type") == "stop"
+
+            metrics, actual_duration = LoadTestUtils._run_thread_workers(
+                job["func"],
+                job["concurrency"],
+                job["duration"],
+                job["args"],
+                job["kwargs"],
+                job["ramp_up"],
+                job["keep_results"],
+                start_at,
+                on_tick,
+                job["report_interval"],
+            )
+            conn.send(
+                {
+                    "type": "result",
+                    "host": socket.gethostname(),
+                    "pid": os.getpid(),
+                    "actual_duration": actual_duration,
+                    "metrics": metrics.to_dict(),
+                }
+            )
+        except (EOFError, OSError):
+            pass
+        except Exception:
+            try:
+                conn.send({"type": "error", "message": traceback.format_exc()})
+            except (EOFError, OSError):
+                pass
+        finally:
+            conn.close()
 
     @staticmethod
     def calculate_percentiles(
-        times: List[float], percentiles: List[float]
+        times: Union[List[float], "LoadTestUtils.LatencyHistogram"],
+        percentiles: List[float],
     ) -> Dict[str, float]:
         """
         计算响应时间百分位
 
         Args:
-            times: 响应时间列表
+            times: 响应时间列表，或测试结果中的histogram
             percentiles: 要计算的百分位列表（如 [50, 90, 95, 99]）
 
         Returns:
             百分位结果字典
         """
+        if isinstance(times, LoadTestUtils.LatencyHistogram):
+            return times.percentiles(percentiles)
         if not times:
             return {}
 
@@ -430,14 +1812,94 @@ class LoadTestUtils:
             func: 要测试的函数
             concurrent_users: 并发用户数
             duration: 测试持续时间（秒）
-            ramp_up: 启动时间（秒）
+            ramp_up: 启动时间（秒），并发用户在此时间内均匀错开启动
             *args: 函数参数
             **kwargs: 函数关键字参数
 
         Returns:
             负载测试结果字典
         """
-        return LoadTestUtils.load_test(func, concurrent_users, duration, *args, **kwargs)
+        return LoadTestUtils.load_test(
+            func, concurrent_users, duration, *args, ramp_up=ramp_up, **kwargs
+        )
+
+    # 依赖响应数据的非百分位阈值，没有请求时跳过
+    _RATE_THRESHOLDS = ("min_success_rate", "max_error_rate", "max_response_time")
+
+    @staticmethod
+    def _is_percentile_name(name: str) -> bool:
+        """
+        判断阈值名称是否为百分位，如p95、p99.9
+        """
+        try:
+            return name.startswith("p") and 0 <= float(name[1:]) <= 100
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _evaluate_thresholds(
+        stats: Dict[str, Any], thresholds: Dict[str, float]
+    ) -> List[str]:
+        """
+        按阈值检查统计数据
+
+        requests为0时没有可用的响应数据，只检查吞吐量，跳过成功率、错误率和响应时间阈值。
+        未知的阈值名称会发出警告并忽略。
+
+        Args:
+            stats: 统计数据，包含success_rate、error_rate、avg_response_time、
+                requests_per_second和percentiles，可选包含请求数requests
+            thresholds: 阈值字典
+
+        Returns:
+            超出阈值的问题描述列表
+        """
+        issues = []
+        no_data = stats.get("requests") == 0
+        # 统一百分位名称，使p99与p99.0等价
+        percentiles = {
+            f"p{float(key[1:]):g}": value
+            for key, value in stats["percentiles"].items()
+            if LoadTestUtils._is_percentile_name(key)
+        }
+        for name, limit in thresholds.items():
+            if limit is None:
+                continue
+            if name == "min_rps":
+                value = stats["requests_per_second"]
+                if value < limit:
+                    issues.append(
+                        f"Throughput {value:.2f} rps is below threshold {limit} rps"
+                    )
+            elif name not in LoadTestUtils._RATE_THRESHOLDS and not (
+                LoadTestUtils._is_percentile_name(name)
+            ):
+                warnings.warn(f"Unknown threshold ignored: {name}", stacklevel=3)
+            elif no_data:
+                continue
+            elif name == "min_success_rate":
+                value = stats["success_rate"]
+                if value < limit:
+                    issues.append(
+                        f"Success rate {value:.2f}% is below threshold {limit}%"
+                    )
+            elif name == "max_error_rate":
+                value = stats["error_rate"]
+                if value > limit:
+                    issues.append(f"Error rate {value:.2f}% exceeds threshold {limit}%")
+            elif name == "max_response_time":
+                value = stats["avg_response_time"]
+                if value > limit:
+                    issues.append(
+                        f"Average response time {value:.2f}s exceeds threshold {limit}s"
+                    )
+            else:
+                value = percentiles.get(f"p{float(name[1:]):g}")
+                if value is not None and value > limit:
+                    issues.append(
+                        f"{name} response time {value:.3f}s exceeds threshold {limit}s"
+                    )
+        return issues
 
     @staticmethod
     def check_thresholds(
@@ -449,15 +1911,16 @@ class LoadTestUtils:
         Args:
             results: 测试结果字典
             thresholds: 阈值字典
-                - min_success_rate: 最小成功率
-                - max_response_time: 最大响应时间
+                - min_success_rate: 最小成功率（%）
+                - max_error_rate: 最大错误率（%）
+                - max_response_time: 最大平均响应时间（秒）
+                - min_rps: 最小吞吐量（请求/秒）
+                - p50/p95/p99/p99.9等: 对应百分位的最大响应时间（秒）
+                未知的阈值名称会发出警告并忽略
 
         Returns:
-            检查结果字典
+            检查结果字典，total_requests为0时no_data为True，且只检查min_rps
         """
-        passed = True
-        issues = []
-
         # 获取成功率
         success_rate = results.get("success_rate")
         if success_rate is None:
@@ -468,27 +1931,38 @@ class LoadTestUtils:
                 (success_requests / total_requests * 100) if total_requests > 0 else 0
             )
 
-        # 检查最小成功率
-        min_success_rate = thresholds.get("min_success_rate")
-        if min_success_rate is not None and success_rate < min_success_rate:
-            passed = False
-            issues.append(
-                f"Success rate {success_rate:.2f}% is below threshold {min_success_rate}%"
-            )
-
-        # 检查最大响应时间
-        max_response_time = thresholds.get("max_response_time")
         avg_response_time = results.get("avg_response_time")
         if avg_response_time is None:
             avg_response_time = results.get("average_response_time", 0)
-        if max_response_time is not None and avg_response_time > max_response_time:
-            passed = False
-            issues.append(
-                f"Average response time {avg_response_time:.2f}s exceeds threshold {max_response_time}s"
-            )
+
+        # 获取阈值中用到的百分位
+        wanted = [
+            float(name[1:])
+            for name in thresholds
+            if LoadTestUtils._is_percentile_name(name)
+        ]
+        source = results.get("histogram")
+        if source is None:
+            source = results.get("execution_times") or []
+        percentiles = dict(results.get("percentiles") or {})
+        percentiles.update(LoadTestUtils.calculate_percentiles(source, wanted))
+
+        requests = results.get("total_requests")
+        issues = LoadTestUtils._evaluate_thresholds(
+            {
+                "requests": requests,
+                "success_rate": success_rate,
+                "error_rate": 100 - success_rate,
+                "avg_response_time": avg_response_time,
+                "requests_per_second": results.get("requests_per_second", 0),
+                "percentiles": percentiles,
+            },
+            thresholds,
+        )
 
         return {
-            "passed": passed,
+            "passed": not issues,
+            "no_data": requests == 0,
             "success_rate": success_rate,
             "avg_response_time": avg_response_time,
             "issues": issues,
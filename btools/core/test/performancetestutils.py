@@ -6,10 +6,22 @@
 提供性能测试工具，测量执行时间、内存使用等功能
 """
 
+import fnmatch
 import gc
+import itertools
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import threading
 import time
+import tracemalloc
+from array import array
+from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import psutil
 
@@ -19,6 +31,646 @@ class PerformanceTestUtils:
     性能测试工具类
     """
 
+    class BenchmarkSuite:
+        """
+        基准测试套件
+
+        注册一组基准测试，统一运行并与保存的基准结果比较，出现显著回归时可作为CI的失败条件。
+        """
+
+        def __init__(
+            self,
+            name: str = "benchmarks",
+            samples: int = 20,
+            min_time: float = 0.01,
+            warmup: int = 2,
+        ):
+            """
+            初始化基准测试套件
+
+            Args:
+                name: 套件名称
+                samples: 默认采样次数
+                min_time: 默认单次采样的最短耗时（秒）
+                warmup: 默认预热采样次数
+            """
+            self.name = name
+            self.samples = samples
+            self.min_time = min_time
+            self.warmup = warmup
+            self.benchmarks: Dict[str, tuple] = {}
+
+        def add(
+            self, name: str, func: Callable, *args, **kwargs
+        ) -> "PerformanceTestUtils.BenchmarkSuite":
+            """
+            注册基准测试
+
+            Args:
+                name: 基准测试名称
+                func: 要测试的函数
+                *args: 函数参数
+                **kwargs: 函数关键字参数
+
+            Returns:
+                返回自身，支持链式调用
+            """
+            if name in self.benchmarks:
+                raise ValueError(f"Benchmark already registered: {name}")
+            self.benchmarks[name] = (func, args, kwargs)
+            return self
+
+        def benchmark(self, name: Optional[str] = None) -> Callable:
+            """
+            以装饰器方式注册无参数的基准测试函数
+
+            Args:
+                name: 基准测试名称，默认为函数名
+
+            Returns:
+                装饰器函数
+            """
+
+            def decorator(func: Callable) -> Callable:
+                self.add(name or func.__name__, func)
+                return func
+
+            return decorator
+
+        def run(
+            self,
+            pattern: Optional[str] = None,
+            samples: Optional[int] = None,
+            min_time: Optional[float] = None,
+            warmup: Optional[int] = None,
+        ) -> Dict[str, Dict[str, Any]]:
+            """
+            运行基准测试
+
+            Args:
+                pattern: 名称匹配模式（支持通配符，如 "cache.*"），默认运行全部
+                samples: 采样次数，默认使用套件设置
+                min_time: 单次采样的最短耗时（秒），默认使用套件设置
+                warmup: 预热采样次数，默认使用套件设置
+
+            Returns:
+                以名称为键的结果字典
+            """
+            results = {}
+            for name, (func, args, kwargs) in self.benchmarks.items():
+                if pattern and not fnmatch.fnmatchcase(name, pattern):
+                    continue
+                results[name] = PerformanceTestUtils.run_benchmark(
+                    func,
+                    *args,
+                    name=name,
+                    samples=samples or self.samples,
+                    min_time=min_time or self.min_time,
+                    warmup=self.warmup if warmup is None else warmup,
+                    **kwargs,
+                )
+            return results
+
+        def check(
+            self,
+            baseline_file: str,
+            threshold: float = 0.1,
+            alpha: float = 0.01,
+            results: Optional[Dict[str, Dict[str, Any]]] = None,
+            **options,
+        ) -> Dict[str, Any]:
+            """
+            运行基准测试并与保存的基准结果比较
+
+            Args:
+                baseline_file: 基准结果文件
+                threshold: 判定回归的最小相对变化（如0.1表示慢10%）
+                alpha: 显著性水平
+                results: 已有的运行结果，为None时调用run
+                **options: 传给run的参数
+
+            Returns:
+                包含结果、比较、回归列表、改进列表、缺少基准的名称和是否通过的字典
+            """
+            if results is None:
+                results = self.run(**options)
+            baseline = PerformanceTestUtils.load_benchmark_results(baseline_file)
+            comparisons = {
+                name: PerformanceTestUtils.compare_benchmarks(
+                    baseline[name], result, alpha, threshold
+                )
+                for name, result in results.items()
+                if name in baseline
+            }
+            regressions = [n for n, c in comparisons.items() if c["regression"]]
+            return {
+                "results": results,
+                "comparisons": comparisons,
+                "regressions": regressions,
+                "improvements": [n for n, c in comparisons.items() if c["improvement"]],
+                "missing": [name for name in results if name not in baseline],
+                "passed": not regressions,
+            }
+
+        def main(
+            self,
+            argv: Optional[List[str]] = None,
+            baseline_file: Optional[str] = None,
+            processes: int = 1,
+        ) -> int:
+            """
+            命令行入口，打印结果表格，出现回归或指定的基准结果文件不存在时返回1
+
+            processes大于1时，在多个独立的子进程中重新执行当前脚本运行全部基准测试，
+            合并后按进程之间的噪声判断回归，避免把进程间的波动误判为回归。
+            子进程通过 `python 脚本` 或 `python -m 模块` 重新执行 `__main__`，
+            因此只适用于在模块级注册基准测试的脚本。
+
+            Args:
+                argv: 命令行参数，默认使用sys.argv
+                baseline_file: 默认的基准结果文件
+                processes: 默认的运行进程数
+
+            Returns:
+                退出码
+            """
+            import argparse
+
+            parser = argparse.ArgumentParser(description=f"Run {self.name}")
+            parser.add_argument("-k", "--filter", help="only run matching benchmarks")
+            parser.add_argument("--baseline", default=baseline_file)
+            parser.add_argument(
+                "--save-baseline",
+                action="store_true",
+                help="store this run as the new baseline",
+            )
+            parser.add_argument("--output", help="also save this run to a JSON file")
+            parser.add_argument("--threshold", type=float, default=0.1)
+            parser.add_argument("--alpha", type=float, default=0.01)
+            parser.add_argument("--samples", type=int)
+            parser.add_argument("--min-time", type=float)
+            parser.add_argument(
+                "--processes",
+                type=int,
+                default=processes,
+                help="run the suite in this many separate processes",
+            )
+            parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+            args = parser.parse_args(argv)
+
+            if args.worker_output:
+                results = self.run(args.filter, args.samples, args.min_time)
+                PerformanceTestUtils.save_benchmark_results(results, args.worker_output)
+                return 0
+
+            baseline_missing = (
+                args.baseline
+                and not args.save_baseline
+                and not os.path.exists(args.baseline)
+            )
+            if baseline_missing:
+                print(
+                    f"ERROR: baseline file not found: {args.baseline}\n"
+                    "Run with --save-baseline on the reference machine to create it.",
+                    file=sys.stderr,
+                )
+                return 1
+
+            if args.processes > 1:
+                results = self._run_processes(args)
+            else:
+                results = self.run(args.filter, args.samples, args.min_time)
+            if args.output:
+                PerformanceTestUtils.save_benchmark_results(results, args.output)
+            if args.save_baseline:
+                if not args.baseline:
+                    parser.error("--save-baseline requires --baseline")
+                PerformanceTestUtils.save_benchmark_results(results, args.baseline)
+
+            report = None
+            if args.baseline and not args.save_baseline:
+                report = self.check(
+                    args.baseline, args.threshold, args.alpha, results=results
+                )
+
+            print(f"{'benchmark':<36}{'median':>12}{'iqr':>12}{'ops/s':>14}  change")
+            for name, result in results.items():
+                line = (
+                    f"{name:<36}{result['median'] * 1e6:>10.3f}us"
+                    f"{result['iqr'] * 1e6:>10.3f}us{result['ops_per_second']:>14,.0f}"
+                )
+                comparison = report["comparisons"].get(name) if report else None
+                if comparison is not None:
+                    status = (
+                        "REGRESSION"
+                        if comparison["regression"]
+                        else "improved" if comparison["improvement"] else ""
+                    )
+                    noise = comparison["noise"]
+                    line += f"  {comparison['change']:+.1%}"
+                    if noise is not None:
+                        line += f" (noise {noise:.1%})"
+                    line += f" {status}".rstrip()
+                print(line)
+
+            if report is None:
+                return 0
+            if report["missing"]:
+                print(
+                    f"WARNING: no baseline for: {', '.join(report['missing'])}",
+                    file=sys.stderr,
+                )
+            if report["regressions"]:
+                print(f"Regressions: {', '.join(report['regressions'])}")
+                return 1
+            return 0
+
+        def _run_processes(self, args: Any) -> Dict[str, Dict[str, Any]]:
+            """
+            在多个子进程中依次重新执行当前脚本，合并各进程的结果
+
+            Args:
+                args: main解析后的命令行参数
+
+            Returns:
+                merge_benchmark_runs合并后的结果
+            """
+            import subprocess
+            import tempfile
+
+            main_module = sys.modules["__main__"]
+            spec = getattr(main_module, "__spec__", None)
+            if spec is not None and spec.name:
+                command = [sys.executable, "-m", spec.name]
+            else:
+                command = [sys.executable, os.path.abspath(main_module.__file__)]
+            for option, value in (
+                ("-k", args.filter),
+                ("--samples", args.samples),
+                ("--min-time", args.min_time),
+            ):
+                if value is not None:
+                    command += [option, str(value)]
+
+            runs = []
+            with tempfile.TemporaryDirectory() as temp_dir:
+                for index in range(args.processes):
+                    output = os.path.join(temp_dir, f"run{index}.json")
+                    subprocess.run(command + ["--worker-output", output], check=True)
+                    runs.append(PerformanceTestUtils.load_benchmark_results(output))
+            return PerformanceTestUtils.merge_benchmark_runs(runs)
+
+    class SamplingProfiler:
+        """
+        采样性能分析器
+
+        后台线程按固定间隔读取 sys._current_frames() 记录各线程的调用栈，
+        被分析的代码无需插桩，开销只与采样频率有关，可在运行中的进程里按时间窗口开启。
+        采样为墙钟时间，阻塞在IO或锁上的线程同样会被记录。
+        """
+
+        def __init__(
+            self,
+            interval: float = 0.005,
+            thread_ids: Optional[set] = None,
+            max_depth: int = 128,
+        ):
+            """
+            初始化采样性能分析器
+
+            Args:
+                interval: 采样间隔（秒）
+                thread_ids: 只采样这些线程标识，None表示采样除分析器外的所有线程；
+                    集合可在运行中修改，为空集合时不采样
+                max_depth: 每个调用栈记录的最大深度，超出部分从栈顶截断
+            """
+            self.interval = interval
+            self.thread_ids = thread_ids
+            self.max_depth = max_depth
+            self.samples = 0
+            self.duration = 0.0
+            self._stacks: Dict[tuple, int] = {}
+            self._frames: Dict[Any, tuple] = {}
+            self._lock = threading.Lock()
+            self._stop_event = threading.Event()
+            self._thread: Optional[threading.Thread] = None
+            self._started_at = 0.0
+
+        @property
+        def running(self) -> bool:
+            """
+            是否正在采样
+            """
+            return self._thread is not None and self._thread.is_alive()
+
+        def start(
+            self, duration: Optional[float] = None
+        ) -> "PerformanceTestUtils.SamplingProfiler":
+            """
+            开始采样，已采集的样本会保留并继续累加
+
+            Args:
+                duration: 采样时长（秒），到时自动停止，None表示直到调用stop
+
+            Returns:
+                SamplingProfiler: 返回自身，支持链式调用
+            """
+            if self.running:
+                return self
+            self._stop_event.clear()
+            self._started_at = time.perf_counter()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(duration,),
+                name="btools-sampling-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+            return self
+
+        def stop(self) -> "PerformanceTestUtils.SamplingProfiler":
+            """
+            停止采样并等待采样线程结束
+
+            Returns:
+                SamplingProfiler: 返回自身，支持链式调用
+            """
+            self._stop_event.set()
+            thread = self._thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join()
+            return self
+
+        def wait(self, timeout: Optional[float] = None) -> bool:
+            """
+            等待按时长开启的采样结束
+
+            Args:
+                timeout: 最长等待时间（秒）
+
+            Returns:
+                bool: 采样是否已结束
+            """
+            if self._thread is not None:
+                self._thread.join(timeout)
+            return not self.running
+
+        def clear(self) -> None:
+            """
+            清空已采集的样本
+            """
+            with self._lock:
+                self._stacks.clear()
+                self.samples = 0
+                self.duration = 0.0
+
+        def __enter__(self):
+            return self.start()
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.stop()
+
+        def _run(self, duration: Optional[float]) -> None:
+            """
+            采样线程主循环
+            """
+            own_id = threading.get_ident()
+            interval = self.interval
+            deadline = None if duration is None else self._started_at + duration
+            next_sample = time.perf_counter()
+            try:
+                while not self._stop_event.is_set():
+                    self._sample(own_id)
+                    next_sample += interval
+                    now = time.perf_counter()
+                    if deadline is not None and now >= deadline:
+                        break
+                    # 采样落后时不补采，从当前时间重新计时
+                    if next_sample < now:
+                        next_sample = now
+                    self._stop_event.wait(next_sample - now)
+            finally:
+                with self._lock:
+                    self.duration += time.perf_counter() - self._started_at
+
+        def _sample(self, own_id: int) -> None:
+            """
+            记录一次所有目标线程的调用栈
+            """
+            thread_ids = self.thread_ids
+            # 目标线程集合为空时（如被装饰函数没有正在执行的调用）跳过本次采样
+            if thread_ids is not None and not thread_ids:
+                return
+            names = {t.ident: t.name for t in threading.enumerate()}
+            frames_cache = self._frames
+            max_depth = self.max_depth
+            captured = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (
+                    thread_ids is not None and thread_id not in thread_ids
+                ):
+                    continue
+                stack = []
+                while frame is not None and len(stack) < max_depth:
+                    code = frame.f_code
+                    label = frames_cache.get(code)
+                    if label is None:
+                        label = frames_cache[code] = (
+                            code.co_name,
+                            code.co_filename,
+                            code.co_firstlineno,
+                        )
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.reverse()
+                captured.append((names.get(thread_id, str(thread_id)), tuple(stack)))
+            del frame
+            with self._lock:
+                for key in captured:
+                    self._stacks[key] = self._stacks.get(key, 0) + 1
+                self.samples += 1
+
+        def stacks(self, by_thread: bool = False) -> Dict[str, int]:
+            """
+            获取折叠格式的调用栈计数
+
+            Args:
+                by_thread: 是否以线程名作为调用栈的根节点
+
+            Returns:
+                dict: "根函数;...;叶函数" 到采样次数的字典
+            """
+            with self._lock:
+                items = list(self._stacks.items())
+            result: Dict[str, int] = {}
+            for (thread_name, stack), count in items:
+                names = [self._label(frame) for frame in stack]
+                if by_thread:
+                    names.insert(0, thread_name)
+                key = ";".join(names)
+                result[key] = result.get(key, 0) + count
+            return result
+
+        @staticmethod
+        def _label(frame: tuple) -> str:
+            """
+            生成调用栈中单个函数的名称
+            """
+            name, filename, line = frame
+            return f"{name} ({os.path.basename(filename)}:{line})"
+
+        def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+            """
+            按自身采样次数统计最耗时的函数
+
+            Args:
+                limit: 返回数量
+
+            Returns:
+                list: 包含function、self、total及对应占比的字典列表
+            """
+            with self._lock:
+                items = list(self._stacks.items())
+            total_samples = sum(count for _, count in items) or 1
+            self_counts: Dict[tuple, int] = {}
+            total_counts: Dict[tuple, int] = {}
+            for (_, stack), count in items:
+                if not stack:
+                    continue
+                self_counts[stack[-1]] = self_counts.get(stack[-1], 0) + count
+                # 递归调用在同一调用栈中只计一次
+                for frame in set(stack):
+                    total_counts[frame] = total_counts.get(frame, 0) + count
+            ranked = sorted(
+                total_counts, key=lambda f: (-self_counts.get(f, 0), -total_counts[f])
+            )
+            return [
+                {
+                    "function": self._label(frame),
+                    "self": self_counts.get(frame, 0),
+                    "total": total_counts[frame],
+                    "self_percent": self_counts.get(frame, 0) / total_samples * 100,
+                    "total_percent": total_counts[frame] / total_samples * 100,
+                }
+                for frame in ranked[:limit]
+            ]
+
+        def to_collapsed(self, by_thread: bool = False) -> str:
+            """
+            导出折叠调用栈文本，可直接用于flamegraph.pl、speedscope等工具
+
+            Args:
+                by_thread: 是否以线程名作为调用栈的根节点
+
+            Returns:
+                str: 每行为 "调用栈 采样次数" 的文本
+            """
+            lines = [
+                f"{stack} {count}"
+                for stack, count in sorted(self.stacks(by_thread).items())
+            ]
+            return "\n".join(lines) + "\n" if lines else ""
+
+        def to_speedscope(self, name: str = "btools profile") -> Dict[str, Any]:
+            """
+            导出speedscope格式的分析结果，每个线程对应一个profile
+
+            Args:
+                name: 分析结果名称
+
+            Returns:
+                dict: speedscope文件内容
+            """
+            with self._lock:
+                items = list(self._stacks.items())
+            frame_index: Dict[tuple, int] = {}
+            shared_frames = []
+            threads: Dict[str, tuple] = {}
+            for (thread_name, stack), count in sorted(items):
+                indexes = []
+                for frame in stack:
+                    if frame not in frame_index:
+                        frame_index[frame] = len(shared_frames)
+                        shared_frames.append(
+                            {"name": frame[0], "file": frame[1], "line": frame[2]}
+                        )
+                    indexes.append(frame_index[frame])
+                samples, weights = threads.setdefault(thread_name, ([], []))
+                samples.append(indexes)
+                weights.append(count * self.interval)
+
+            profiles = [
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+                for thread_name, (samples, weights) in threads.items()
+            ]
+            return {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "shared": {"frames": shared_frames},
+                "profiles": profiles,
+                "name": name,
+                "activeProfileIndex": 0,
+                "exporter": "btools",
+            }
+
+        def save(self, file_path: str, by_thread: bool = False) -> str:
+            """
+            保存分析结果，.json文件保存为speedscope格式，其他文件保存为折叠调用栈
+
+            Args:
+                file_path: 文件路径
+                by_thread: 折叠调用栈是否以线程名作为根节点
+
+            Returns:
+                str: 保存的文件路径
+            """
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(file_path, "w", encoding="utf-8") as f:
+                if file_path.endswith(".json"):
+                    json.dump(self.to_speedscope(), f)
+                else:
+                    f.write(self.to_collapsed(by_thread))
+            return file_path
+
+        def enable_on_signal(
+            self, signum: int, duration: float = 30.0, file_path: Optional[str] = None
+        ) -> None:
+            """
+            注册信号处理函数，进程收到信号后采样一段时间，可用于分析运行中的服务
+
+            须在主线程中调用。收到信号时清空之前的样本，采样结束后保存到file_path。
+
+            Args:
+                signum: 信号编号，如 signal.SIGUSR2
+                duration: 每次采样时长（秒）
+                file_path: 保存路径，None表示不保存
+            """
+            import signal
+
+            def finish() -> None:
+                self.wait()
+                if file_path:
+                    self.save(file_path)
+
+            def handler(received, frame):
+                if self.running:
+                    return
+                self.clear()
+                self.start(duration)
+                if file_path:
+                    threading.Thread(target=finish, daemon=True).start()
+
+            signal.signal(signum, handler)
+
     @staticmethod
     def measure_execution_time(func: Callable, *args, **kwargs) -> Dict[str, Any]:
         """
@@ -32,9 +684,9 @@ class PerformanceTestUtils:
         Returns:
             包含执行时间和结果的字典
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         return {"execution_time": execution_time, "result": result}
@@ -50,19 +702,34 @@ class PerformanceTestUtils:
             **kwargs: 函数关键字参数
 
         Returns:
-            包含内存使用和结果的字典
+            包含内存使用和结果的字典。memory_used为进程常驻内存的变化，
+            受分配器碎片影响；peak_memory和retained_memory由tracemalloc统计，
+            分别为调用期间Python分配的峰值和调用后仍存活的内存，单位均为MB
         """
         # 清理垃圾回收
         gc.collect()
 
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+
         # 获取初始内存使用
         process = psutil.Process()
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
 
-        result = func(*args, **kwargs)
+        try:
+            result = func(*args, **kwargs)
+            peak_traced = tracemalloc.get_traced_memory()[1]
 
-        # 清理垃圾回收
-        gc.collect()
+            # 清理垃圾回收
+            gc.collect()
+            traced_after = tracemalloc.get_traced_memory()[0]
+        finally:
+            if started:
+                tracemalloc.stop()
 
         # 获取最终内存使用
         final_memory = process.memory_info().rss / 1024 / 1024  # MB
@@ -72,6 +739,8 @@ class PerformanceTestUtils:
             "initial_memory": initial_memory,
             "final_memory": final_memory,
             "memory_used": memory_used,
+            "peak_memory": max(peak_traced - traced_before, 0) / 1024 / 1024,
+            "retained_memory": (traced_after - traced_before) / 1024 / 1024,
             "result": result,
         }
 
@@ -92,7 +761,7 @@ class PerformanceTestUtils:
         gc.collect()
 
         # 获取初始状态
-        start_time = time.time()
+        start_time = time.perf_counter()
         process = psutil.Process()
         initial_memory = process.memory_info().rss / 1024 / 1024  # MB
 
@@ -102,7 +771,7 @@ class PerformanceTestUtils:
         gc.collect()
 
         # 获取最终状态
-        end_time = time.time()
+        end_time = time.perf_counter()
         final_memory = process.memory_info().rss / 1024 / 1024  # MB
 
         execution_time = end_time - start_time
@@ -116,46 +785,6 @@ class PerformanceTestUtils:
             "result": result,
         }
 
-    @staticmethod
-    def benchmark(
-        func: Callable, iterations: int = 1000, *args, **kwargs
-    ) -> Dict[str, Any]:
-        """
-        基准测试函数
-
-        Args:
-            func: 要测试的函数
-            iterations: 执行次数
-            *args: 函数参数
-            **kwargs: 函数关键字参数
-
-        Returns:
-            包含基准测试结果的字典
-        """
-        times = []
-        results = []
-
-        for _ in range(iterations):
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            end_time = time.time()
-            times.append(end_time - start_time)
-            results.append(result)
-
-        avg_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
-
-        return {
-            "iterations": iterations,
-            "avg_time": avg_time,
-            "min_time": min_time,
-            "max_time": max_time,
-            "total_time": sum(times),
-            "times": times,
-            "results": results,
-        }
-
     @staticmethod
     def performance_decorator(measure_memory: bool = False):
         """
@@ -190,18 +819,44 @@ class PerformanceTestUtils:
         return decorator
 
     @staticmethod
-    def profile_function(func: Callable, *args, **kwargs) -> Dict[str, Any]:
+    def profile_function(
+        func: Callable,
+        *args,
+        sampling: bool = False,
+        interval: float = 0.001,
+        **kwargs,
+    ) -> Dict[str, Any]:
         """
         分析函数性能
 
+        默认使用cProfile确定性分析，结果精确但会使被分析代码明显变慢；
+        sampling为True时使用采样分析，只采样调用线程，开销低但短函数可能采样不到。
+
         Args:
             func: 要分析的函数
             *args: 函数参数
+            sampling: 是否使用采样分析
+            interval: 采样间隔（秒）
             **kwargs: 函数关键字参数
 
         Returns:
-            包含分析结果的字典
+            包含分析结果的字典。采样分析时profile_output为折叠调用栈文本，
+            并包含samples、top和profiler
         """
+        if sampling:
+            profiler = PerformanceTestUtils.SamplingProfiler(
+                interval=interval, thread_ids={threading.get_ident()}
+            )
+            with profiler:
+                result = func(*args, **kwargs)
+            return {
+                "result": result,
+                "profile_output": profiler.to_collapsed(),
+                "samples": profiler.samples,
+                "top": profiler.top(),
+                "profiler": profiler,
+            }
+
         try:
             import cProfile
             import io
@@ -273,14 +928,32 @@ class PerformanceTestUtils:
 
     @staticmethod
     def compare_functions(
-        functions: Dict[str, Callable], *args, **kwargs
+        functions: Dict[str, Callable],
+        *args,
+        baseline: Optional[str] = None,
+        baseline_file: Optional[str] = None,
+        save_path: Optional[str] = None,
+        alpha: float = 0.05,
+        threshold: float = 0.05,
+        samples: int = 20,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         比较多个函数的性能
 
+        每个函数使用run_benchmark测量，再用Mann-Whitney U检验判断差异是否显著。
+        指定baseline_file时与之前保存的同名结果比较，用于发现跨版本的性能回归；
+        否则与本次运行中的基准函数比较。
+
         Args:
             functions: 函数字典，键为函数名称，值为函数对象
             *args: 函数参数
+            baseline: 本次运行中作为基准的函数名称，默认为第一个函数
+            baseline_file: 之前保存的基准测试结果文件
+            save_path: 保存本次结果的JSON文件路径
+            alpha: 显著性水平
+            threshold: 认为性能有变化的最小相对变化（如0.05表示5%）
+            samples: 每个函数的采样次数
             **kwargs: 函数关键字参数
 
         Returns:
@@ -289,9 +962,34 @@ class PerformanceTestUtils:
         comparisons = {}
 
         for name, func in functions.items():
-            result = PerformanceTestUtils.measure_performance(func, *args, **kwargs)
+            result = PerformanceTestUtils.run_benchmark(
+                func, *args, name=name, samples=samples, **kwargs
+            )
+            result["execution_time"] = result["median"]
             comparisons[name] = result
 
+        if baseline_file is not None:
+            references = PerformanceTestUtils.load_benchmark_results(baseline_file)
+            baseline = None
+        else:
+            baseline = baseline or next(iter(comparisons))
+            references = {name: comparisons[baseline] for name in comparisons}
+
+        regressions = []
+        for name, result in comparisons.items():
+            reference = references.get(name)
+            if reference is None or name == baseline:
+                continue
+            comparison = PerformanceTestUtils.compare_benchmarks(
+                reference, result, alpha, threshold
+            )
+            result["comparison"] = comparison
+            if comparison["regression"]:
+                regressions.append(name)
+
+        if save_path is not None:
+            PerformanceTestUtils.save_benchmark_results(comparisons, save_path)
+
         # 找出最快的函数
         fastest = min(comparisons.items(), key=lambda x: x[1]["execution_time"])
 
@@ -299,56 +997,253 @@ class PerformanceTestUtils:
             "comparisons": comparisons,
             "fastest": fastest[0],
             "fastest_time": fastest[1]["execution_time"],
+            "baseline": baseline,
+            "regressions": regressions,
         }
 
     @staticmethod
     def memory_leak_test(
-        func: Callable, iterations: int = 100, *args, **kwargs
+        func: Callable,
+        iterations: int = 100,
+        *args,
+        mode: str = "tracemalloc",
+        warmup: int = 5,
+        min_growth: int = 64,
+        min_r_squared: float = 0.5,
+        top: int = 10,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         内存泄漏测试
 
+        每次调用后执行垃圾回收并记录内存占用，对占用序列做线性回归：
+        每次调用平均增长超过 min_growth 字节且拟合优度不低于 min_r_squared 时判定为泄漏。
+        tracemalloc模式只统计Python分配器上仍存活的内存，不受分配器碎片和内存归还策略影响，
+        并报告增长最多的分配位置；rss模式统计进程常驻内存，可发现C扩展的泄漏，但噪声较大。
+
         Args:
             func: 要测试的函数
             iterations: 执行次数
             *args: 函数参数
+            mode: 测量方式，"tracemalloc" 或 "rss"
+            warmup: 预热次数，预热调用不计入统计，用于排除缓存、惰性初始化等一次性分配
+            min_growth: 判定为泄漏的每次调用最小平均增长（字节）
+            min_r_squared: 判定为泄漏的最小拟合优度
+            top: 返回的分配位置和对象类型数量
             **kwargs: 函数关键字参数
 
         Returns:
-            包含内存泄漏测试结果的字典
+            包含内存泄漏测试结果的字典，内存占用单位为MB，bytes_per_iteration单位为字节
         """
-        import psutil
+        if mode not in ("tracemalloc", "rss"):
+            raise ValueError(f"Unsupported mode: {mode}")
 
-        process = psutil.Process()
-        memory_usages = []
+        for _ in range(warmup):
+            func(*args, **kwargs)
 
-        for i in range(iterations):
-            # 清理垃圾回收
-            gc.collect()
+        use_tracemalloc = mode == "tracemalloc"
+        started = use_tracemalloc and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            if use_tracemalloc:
 
-            # 获取内存使用
-            memory = process.memory_info().rss / 1024 / 1024  # MB
-            memory_usages.append(memory)
+                def current_memory() -> int:
+                    return tracemalloc.get_traced_memory()[0]
 
-            # 执行函数
-            func(*args, **kwargs)
+                snapshot_before = tracemalloc.take_snapshot()
+            else:
+                process = psutil.Process()
+
+                def current_memory() -> int:
+                    return process.memory_info().rss
+
+            # 预先分配样本数组，避免记录样本本身造成内存增长
+            samples = array("q", bytes(8 * (iterations + 1)))
+            top_allocations = []
+            gc.collect()
+            objects_before = PerformanceTestUtils.count_objects_by_type()
+            samples[0] = current_memory()
+            for i in range(1, iterations + 1):
+                func(*args, **kwargs)
+                gc.collect()
+                samples[i] = current_memory()
+
+            if use_tracemalloc:
+                snapshot_after = tracemalloc.take_snapshot()
+                top_allocations = PerformanceTestUtils._allocation_stats(
+                    snapshot_after.compare_to(snapshot_before, "lineno"), top
+                )
+                del snapshot_before, snapshot_after
+        finally:
+            if started:
+                tracemalloc.stop()
 
-        # 清理垃圾回收
         gc.collect()
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
+        objects_after = PerformanceTestUtils.count_objects_by_type()
+        object_growth = {
+            name: count - objects_before.get(name, 0)
+            for name, count in objects_after.items()
+            if count > objects_before.get(name, 0)
+        }
+        object_growth = dict(
+            sorted(object_growth.items(), key=lambda item: -item[1])[:top]
+        )
 
-        # 检查内存是否持续增长
-        is_leaking = memory_usages[-1] > memory_usages[0] * 1.1  # 增长超过10%认为有泄漏
+        slope, r_squared = PerformanceTestUtils._linear_trend(list(samples))
+        memory_usages = [value / 1024 / 1024 for value in samples]
 
         return {
+            "mode": mode,
             "iterations": iterations,
             "initial_memory": memory_usages[0],
-            "final_memory": final_memory,
-            "memory_growth": final_memory - memory_usages[0],
+            "final_memory": memory_usages[-1],
+            "memory_growth": memory_usages[-1] - memory_usages[0],
             "memory_usages": memory_usages,
-            "is_leaking": is_leaking,
+            "bytes_per_iteration": slope,
+            "r_squared": r_squared,
+            "is_leaking": slope > min_growth and r_squared >= min_r_squared,
+            "object_growth": object_growth,
+            "top_allocations": top_allocations,
+        }
+
+    @staticmethod
+    def profile_allocations(
+        func: Callable,
+        *args,
+        iterations: int = 1,
+        top: int = 10,
+        nframes: int = 1,
+        key_type: str = "lineno",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        使用tracemalloc分析函数的内存分配
+
+        Args:
+            func: 要分析的函数
+            *args: 函数参数
+            iterations: 调用次数
+            top: 返回的分配位置数量
+            nframes: 每个分配记录的调用栈深度，tracemalloc已在运行时沿用其设置
+            key_type: 分配位置的分组方式，"lineno"、"filename" 或 "traceback"
+            **kwargs: 函数关键字参数
+
+        Returns:
+            包含每次调用峰值内存、调用后仍存活的内存和分配最多的位置的字典，单位为字节
+        """
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(nframes)
+        reset_peak = getattr(tracemalloc, "reset_peak", None)
+        peaks = []
+        result = None
+        try:
+            gc.collect()
+            snapshot_before = tracemalloc.take_snapshot()
+            initial = tracemalloc.get_traced_memory()[0]
+            for _ in range(iterations):
+                # Python 3.8没有reset_peak，此时峰值为开始跟踪以来的最大值
+                if reset_peak is not None:
+                    reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                result = func(*args, **kwargs)
+                peaks.append(max(tracemalloc.get_traced_memory()[1] - current, 0))
+            gc.collect()
+            final = tracemalloc.get_traced_memory()[0]
+            snapshot_after = tracemalloc.take_snapshot()
+            top_allocations = PerformanceTestUtils._allocation_stats(
+                snapshot_after.compare_to(snapshot_before, key_type), top
+            )
+        finally:
+            if started:
+                tracemalloc.stop()
+
+        return {
+            "iterations": iterations,
+            "peak_per_call": peaks,
+            "peak_memory": max(peaks) if peaks else 0,
+            "avg_peak_memory": statistics.fmean(peaks) if peaks else 0.0,
+            "memory_retained": final - initial,
+            "top_allocations": top_allocations,
+            "result": result,
         }
 
+    @staticmethod
+    def count_objects_by_type() -> Dict[str, int]:
+        """
+        按类型统计垃圾回收器跟踪的存活对象数量
+
+        Returns:
+            类型名称到对象数量的字典，内置类型只使用类型名称
+        """
+        counts: Dict[str, int] = {}
+        for obj in gc.get_objects():
+            cls = type(obj)
+            module = cls.__module__
+            name = (
+                cls.__qualname__
+                if module == "builtins"
+                else f"{module}.{cls.__qualname__}"
+            )
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    @staticmethod
+    def _allocation_stats(stats: List[Any], top: int) -> List[Dict[str, Any]]:
+        """
+        将tracemalloc的统计差异转换为字典，排除tracemalloc和本模块自身的分配
+
+        Args:
+            stats: Snapshot.compare_to返回的StatisticDiff列表
+            top: 返回数量
+
+        Returns:
+            按增长量降序排列的分配位置列表
+        """
+        excluded = (tracemalloc.__file__, __file__)
+        allocations = []
+        for stat in stats:
+            frame = stat.traceback[0]
+            if frame.filename in excluded:
+                continue
+            allocations.append(
+                {
+                    "location": f"{frame.filename}:{frame.lineno}",
+                    "size": stat.size,
+                    "size_diff": stat.size_diff,
+                    "count": stat.count,
+                    "count_diff": stat.count_diff,
+                    "traceback": [f"{f.filename}:{f.lineno}" for f in stat.traceback],
+                }
+            )
+            if len(allocations) >= top:
+                break
+        return allocations
+
+    @staticmethod
+    def _linear_trend(values: List[float]) -> Tuple[float, float]:
+        """
+        对等间隔样本做最小二乘线性回归
+
+        Args:
+            values: 样本序列
+
+        Returns:
+            (斜率, 拟合优度R²)，样本无变化时拟合优度为0
+        """
+        n = len(values)
+        if n < 2:
+            return 0.0, 0.0
+        mean_x = (n - 1) / 2
+        mean_y = statistics.fmean(values)
+        sxx = sum((i - mean_x) ** 2 for i in range(n))
+        sxy = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+        syy = sum((v - mean_y) ** 2 for v in values)
+        slope = sxy / sxx
+        r_squared = sxy * sxy / (sxx * syy) if syy else 0.0
+        return slope, r_squared
+
     @staticmethod
     def measure_time(
         func: Callable,
@@ -377,10 +1272,10 @@ class PerformanceTestUtils:
         # 测量
         times = []
         for _ in range(iterations):
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            end_time = time.time()
-            times.append(end_time - start_time)
+            end_time = time.perf_counter_ns()
+            times.append((end_time - start_time) / 1e9)
 
         avg_time = sum(times) / len(times) if times else 0
         min_time = min(times) if times else 0
@@ -428,3 +1323,334 @@ class PerformanceTestUtils:
             results[name] = result
 
         return results
+
+    @staticmethod
+    def run_benchmark(
+        func: Callable,
+        *args,
+        name: Optional[str] = None,
+        samples: int = 20,
+        min_time: float = 0.01,
+        warmup: int = 2,
+        loops: Optional[int] = None,
+        disable_gc: bool = True,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        微基准测试
+
+        自动校准每次采样的循环次数，使单次采样耗时不少于min_time，以降低计时误差；
+        预热后进行多次采样，每次采样记录单次调用的平均耗时，不保留函数返回值。
+
+        Args:
+            func: 要测试的函数
+            *args: 函数参数
+            name: 基准测试名称，默认为函数名
+            samples: 采样次数
+            min_time: 单次采样的最短耗时（秒）
+            warmup: 预热采样次数，结果不计入统计
+            loops: 每次采样的循环次数，默认自动校准
+            disable_gc: 采样期间是否关闭垃圾回收
+            **kwargs: 函数关键字参数
+
+        Returns:
+            包含中位数、四分位距、置信区间和离群值等统计结果的字典
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+
+        def timed(count: int) -> int:
+            start = time.perf_counter_ns()
+            for _ in itertools.repeat(None, count):
+                func(*args, **kwargs)
+            return time.perf_counter_ns() - start
+
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        if disable_gc:
+            gc.disable()
+        try:
+            if loops is None:
+                loops = PerformanceTestUtils._calibrate_loops(timed, min_time)
+            for _ in range(warmup):
+                timed(loops)
+            times = [timed(loops) / loops / 1e9 for _ in range(samples)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        result = {
+            "name": name or getattr(func, "__name__", repr(func)),
+            "loops": loops,
+            "samples": samples,
+            "warmup": warmup,
+            "gc_disabled": disable_gc,
+        }
+        result.update(PerformanceTestUtils.summarize_times(times))
+        result["ops_per_second"] = 1 / result["median"] if result["median"] else 0
+        result["times"] = times
+        return result
+
+    @staticmethod
+    def _calibrate_loops(timed: Callable[[int], int], min_time: float) -> int:
+        """
+        校准循环次数，使一次采样的耗时不少于min_time
+
+        Args:
+            timed: 以循环次数为参数、返回耗时（纳秒）的函数
+            min_time: 单次采样的最短耗时（秒）
+
+        Returns:
+            循环次数
+        """
+        target = min_time * 1e9
+        loops = 1
+        while True:
+            elapsed = timed(loops)
+            if elapsed >= target:
+                return loops
+            # 按已测耗时估算，至少翻倍，避免极快函数多次试探
+            estimate = int(loops * target / max(elapsed, 1) * 1.1) + 1
+            loops = max(loops * 2, min(estimate, loops * 100))
+
+    @staticmethod
+    def summarize_times(times: List[float], confidence: float = 0.95) -> Dict[str, Any]:
+        """
+        计算耗时样本的统计量
+
+        中位数置信区间使用基于次序统计量的非参数方法，离群值使用Tukey围栏
+        （超出四分位数1.5倍四分位距为离群，3倍为严重离群）。
+
+        Args:
+            times: 耗时样本（秒）
+            confidence: 置信水平，支持0.9、0.95、0.99
+
+        Returns:
+            统计结果字典
+        """
+        z = {0.9: 1.645, 0.95: 1.96, 0.99: 2.576}[confidence]
+        ordered = sorted(times)
+        n = len(ordered)
+        if n >= 2:
+            q1, median, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+        else:
+            q1 = median = q3 = ordered[0]
+        iqr = q3 - q1
+
+        # 中位数置信区间的次序统计量位置（从1开始）
+        half_width = z * math.sqrt(n) / 2
+        low_rank = max(1, math.floor(n / 2 - half_width))
+        high_rank = min(n, math.ceil(1 + n / 2 + half_width))
+
+        mild = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+        severe = (q1 - 3 * iqr, q3 + 3 * iqr)
+        outliers = [t for t in ordered if not mild[0] <= t <= mild[1]]
+
+        return {
+            "mean": statistics.fmean(ordered),
+            "stdev": statistics.stdev(ordered) if n >= 2 else 0.0,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "median": median,
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "confidence": confidence,
+            "ci_low": ordered[low_rank - 1],
+            "ci_high": ordered[high_rank - 1],
+            "outliers": len(outliers),
+            "severe_outliers": len(
+                [t for t in outliers if not severe[0] <= t <= severe[1]]
+            ),
+        }
+
+    @staticmethod
+    def mann_whitney_u(a: List[float], b: List[float]) -> float:
+        """
+        Mann-Whitney U检验（双侧，正态近似，含结值校正），不要求样本服从正态分布
+
+        Args:
+            a: 第一组样本
+            b: 第二组样本
+
+        Returns:
+            p值
+        """
+        n1, n2 = len(a), len(b)
+        if not n1 or not n2:
+            return 1.0
+        combined = sorted(
+            itertools.chain(((v, 0) for v in a), ((v, 1) for v in b)),
+            key=lambda item: item[0],
+        )
+        n = n1 + n2
+        rank_sum = 0.0
+        tie_term = 0.0
+        i = 0
+        while i < n:
+            j = i
+            while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+                j += 1
+            average_rank = (i + j) / 2 + 1
+            ties = j - i + 1
+            tie_term += ties**3 - ties
+            rank_sum += average_rank * sum(
+                1 for k in range(i, j + 1) if combined[k][1] == 0
+            )
+            i = j + 1
+
+        u = rank_sum - n1 * (n1 + 1) / 2
+        mean = n1 * n2 / 2
+        variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+        if variance <= 0:
+            return 1.0
+        z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+        return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+    @staticmethod
+    def compare_benchmarks(
+        baseline: Dict[str, Any],
+        current: Dict[str, Any],
+        alpha: float = 0.05,
+        threshold: float = 0.05,
+    ) -> Dict[str, Any]:
+        """
+        比较两次基准测试结果
+
+        单次运行的结果用Mann-Whitney U检验比较进程内的采样，无法反映不同进程之间的差异
+        （如哈希随机化、内存布局和机器负载）。两边都是merge_benchmark_runs合并的多进程结果时，
+        改为比较各进程中位数的中位数，并以各进程中位数的相对极差作为噪声，
+        变化超过threshold和噪声中的较大者才认为显著，此时alpha不参与判定。
+
+        Args:
+            baseline: 基准结果（run_benchmark的返回值或load_benchmark_results中的一项）
+            current: 当前结果
+            alpha: 显著性水平
+            threshold: 认为性能有变化的最小相对变化
+
+        Returns:
+            包含中位数变化、p值、噪声、是否显著、是否回归或改进的字典
+        """
+        change = (
+            current["median"] / baseline["median"] - 1 if baseline["median"] else 0.0
+        )
+        baseline_runs = baseline.get("run_medians") or []
+        current_runs = current.get("run_medians") or []
+        if len(baseline_runs) >= 2 and len(current_runs) >= 2:
+            noise = max(
+                PerformanceTestUtils._relative_range(baseline_runs),
+                PerformanceTestUtils._relative_range(current_runs),
+            )
+            p_value = PerformanceTestUtils.mann_whitney_u(baseline_runs, current_runs)
+            significant = abs(change) >= max(threshold, noise)
+        else:
+            noise = None
+            p_value = PerformanceTestUtils.mann_whitney_u(
+                baseline["times"], current["times"]
+            )
+            significant = p_value < alpha and abs(change) >= threshold
+        return {
+            "baseline_median": baseline["median"],
+            "current_median": current["median"],
+            "change": change,
+            "p_value": p_value,
+            "noise": noise,
+            "significant": significant,
+            "regression": significant and change > 0,
+            "improvement": significant and change < 0,
+        }
+
+    @staticmethod
+    def _relative_range(values: List[float]) -> float:
+        """
+        计算样本极差相对于中位数的比例
+        """
+        median = statistics.median(values)
+        return (max(values) - min(values)) / median if median else 0.0
+
+    @staticmethod
+    def merge_benchmark_runs(
+        runs: List[Dict[str, Dict[str, Any]]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        合并多个进程分别运行同一组基准测试的结果
+
+        中位数取各进程中位数的中位数，并保留各进程的中位数（run_medians），
+        供compare_benchmarks估计进程之间的噪声；其余统计量基于全部采样计算。
+
+        Args:
+            runs: 每个进程以名称为键的结果字典
+
+        Returns:
+            以名称为键的合并结果，只包含所有进程都运行了的基准测试
+        """
+        if not runs:
+            return {}
+        merged = {}
+        for name, first in runs[0].items():
+            if not all(name in run for run in runs):
+                continue
+            times = [t for run in runs for t in run[name]["times"]]
+            run_medians = [run[name]["median"] for run in runs]
+            result = {
+                "name": name,
+                "loops": first["loops"],
+                "samples": len(times),
+                "warmup": first["warmup"],
+                "gc_disabled": first["gc_disabled"],
+            }
+            result.update(PerformanceTestUtils.summarize_times(times))
+            result["median"] = statistics.median(run_medians)
+            result["run_medians"] = run_medians
+            result["ops_per_second"] = 1 / result["median"] if result["median"] else 0
+            result["times"] = times
+            merged[name] = result
+        return merged
+
+    @staticmethod
+    def save_benchmark_results(
+        results: Union[Dict[str, Dict[str, Any]], List[Dict[str, Any]]],
+        file_path: str,
+    ) -> str:
+        """
+        将基准测试结果保存为JSON文件
+
+        Args:
+            results: 以名称为键的结果字典，或包含name字段的结果列表
+            file_path: 文件路径
+
+        Returns:
+            文件路径
+        """
+        if isinstance(results, list):
+            results = {result["name"]: result for result in results}
+        data = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "benchmarks": {
+                name: {k: v for k, v in result.items() if k != "comparison"}
+                for name, result in results.items()
+            },
+        }
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return file_path
+
+    @staticmethod
+    def load_benchmark_results(file_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        读取save_benchmark_results保存的结果
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            以名称为键的结果字典
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)["benchmarks"]
@@ -25,6 +25,7 @@ setup(
         'requests-toolbelt~=1.0.0',
         'requests-cache~=1.3.0',
         'urllib3~=2.2.0',
+        'aiohttp~=3.14.5',
         'openpyxl~=3.1.2',
         'selenium~=4.26.0',
         'playwright~=1.44.0',
@@ -12,6 +12,7 @@ from btools.core.api.fastapiutils import (
     FastAPIUtils,
     add_cors,
     add_exception_handler,
+    add_metrics_endpoint,
     add_middleware,
     create_app,
     create_error_response,
@@ -149,6 +150,25 @@ class TestFastAPIUtils(unittest.TestCase):
         error_response = create_error_response()
         self.assertIsInstance(error_response, JSONResponse)
 
+    def test_add_metrics_endpoint(self):
+        """
+        测试添加指标抓取接口
+        """
+        import asyncio
+
+        from btools.core.system.metricsutils import MetricsUtils
+
+        registry = MetricsUtils.Registry()
+        registry.counter("requests_total").inc(2)
+        app = add_metrics_endpoint(FastAPI(), registry=registry)
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/metrics")
+        self.assertEqual(route.methods, {"GET"})
+
+        response = asyncio.run(route.endpoint())
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("requests_total 2", response.body.decode("utf-8"))
+        self.assertTrue(response.media_type.startswith("text/plain"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,8 +6,11 @@
 测试DecoratorUtil的功能
 """
 
+import os
+import tempfile
 import time
 import unittest
+from unittest import mock
 
 from btools.core.basic.decoratorutils import DecoratorUtil, RateLimitError
 
@@ -203,6 +206,13 @@ class TestDecoratorUtil(unittest.TestCase):
         with self.assertRaises(RateLimitError):
             test_function()
 
+        # 经过一个周期后额度完全恢复
+        time.sleep(1.05)
+        self.assertEqual(test_function(), "success")
+        self.assertEqual(test_function(), "success")
+        with self.assertRaises(RateLimitError):
+            test_function()
+
     def test_combine_decorators(self):
         """
         测试组合多个装饰器
@@ -324,6 +334,80 @@ class TestDecoratorUtil(unittest.TestCase):
         self.assertEqual(result2, 14)
         self.assertEqual(call_count, 1)
 
+    def test_sampling_profiler_decorator(self):
+        """
+        测试采样性能分析装饰器
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = os.path.join(temp_dir, "profile.txt")
+
+            @DecoratorUtil.profiler(sampling=True, interval=0.001, output=output)
+            def busy_function():
+                end = time.perf_counter() + 0.05
+                while time.perf_counter() < end:
+                    pass
+                return "done"
+
+            profiler = busy_function.profiler
+            self.addCleanup(profiler.stop)
+            self.assertEqual(busy_function(), "done")
+            sampler = profiler._thread
+            self.assertEqual(busy_function(), "done")
+            # 采样线程常驻，调用之间不重新创建，没有正在执行的调用时不采样
+            self.assertTrue(profiler.running)
+            self.assertIs(profiler._thread, sampler)
+            self.assertEqual(profiler.thread_ids, set())
+            self.assertGreater(profiler.samples, 10)
+            samples = profiler.samples
+            time.sleep(0.05)
+            self.assertEqual(profiler.samples, samples)
+
+            # 未到自动保存间隔时不写文件，可随时手动保存
+            self.assertFalse(os.path.exists(output))
+            self.assertEqual(busy_function.save_profile(), output)
+            with open(output, encoding="utf-8") as f:
+                self.assertIn("busy_function", f.read())
+
+            autosave = os.path.join(temp_dir, "autosave.txt")
+            saved = DecoratorUtil.profiler(
+                sampling=True, interval=0.001, output=autosave, save_interval=0
+            )(busy_function.__wrapped__)
+            self.addCleanup(saved.profiler.stop)
+            self.assertEqual(saved(), "done")
+            self.assertTrue(os.path.exists(autosave))
+
+        # cProfile报告通过logger输出
+        messages = []
+        quiet = DecoratorUtil.profiler(logger=messages.append)(lambda: 1)
+        self.assertEqual(quiet(), 1)
+        self.assertIn("[性能分析]", messages[0])
+
+        # logger为None时不输出报告
+        silent = DecoratorUtil.profiler(logger=None)(lambda: 2)
+        with mock.patch("builtins.print") as patched_print:
+            self.assertEqual(silent(), 2)
+        patched_print.assert_not_called()
+
+    def test_timer_records_metrics(self):
+        """
+        测试计时装饰器记录到指标注册表
+        """
+        from btools.core.system.metricsutils import MetricsUtils
+
+        registry = MetricsUtils.Registry()
+
+        @DecoratorUtil.timer(registry=registry)
+        def timed_function():
+            return "test"
+
+        self.assertEqual(timed_function(), "test")
+        self.assertEqual(timed_function(), "test")
+        histogram = registry.histogram(
+            "function_duration_seconds",
+            {"function": f"{__name__}.{timed_function.__qualname__}"},
+        )
+        self.assertEqual(histogram.snapshot()["count"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
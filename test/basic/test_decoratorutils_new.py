@@ -5,10 +5,13 @@
 """
 
 import asyncio
+import shutil
+import tempfile
 import time
 import unittest
 
 from btools.core.basic.decoratorutils import DecoratorUtil
+from btools.core.cache.cacheutils import CacheUtils
 
 
 class TestDecoratorUtilNewFeatures(unittest.TestCase):
@@ -82,6 +85,161 @@ class TestDecoratorUtilNewFeatures(unittest.TestCase):
         self.assertEqual(result3, 3)
         self.assertEqual(call_count, 2)
 
+    def test_cached_decorator(self):
+        """
+        测试基于缓存后端的缓存装饰器
+        """
+        calls = []
+
+        @DecoratorUtil.cached(ttl=60)
+        def add(x, y=1):
+            calls.append((x, y))
+            return x + y
+
+        # 位置参数、关键字参数和默认值生成相同的缓存键
+        self.assertEqual(add(1), 2)
+        self.assertEqual(add(1, 1), 2)
+        self.assertEqual(add(x=1, y=1), 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(add(2), 3)
+        self.assertEqual(len(calls), 2)
+
+        # 使缓存失效后重新计算
+        add.invalidate(1)
+        self.assertEqual(add(1), 2)
+        self.assertEqual(len(calls), 3)
+
+    def test_cached_decorator_file_backend(self):
+        """
+        测试缓存装饰器使用文件缓存后端并缓存None结果
+        """
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        calls = []
+
+        @DecoratorUtil.cached(cache=CacheUtils.create_file_cache(temp_dir))
+        def lookup(name):
+            calls.append(name)
+            return None
+
+        self.assertIsNone(lookup("a"))
+        self.assertIsNone(lookup("a"))
+        self.assertEqual(calls, ["a"])
+
+    def test_cached_decorator_stale_while_revalidate(self):
+        """
+        测试过期后先返回旧值并在后台刷新
+        """
+        counter = {"value": 0}
+
+        @DecoratorUtil.cached(ttl=1, stale_ttl=60, ttl_param="cache_ttl")
+        def current():
+            counter["value"] += 1
+            return counter["value"]
+
+        self.assertEqual(current(), 1)
+        # 单次调用覆盖过期时间，使结果立即变为旧值
+        current.invalidate()
+        self.assertEqual(current(cache_ttl=0.05), 2)
+        time.sleep(0.1)
+        self.assertEqual(current(), 2)
+
+        deadline = time.time() + 2
+        while time.time() < deadline and current() != 3:
+            time.sleep(0.01)
+        self.assertEqual(current(), 3)
+
+    def test_cached_decorator_refresh_error(self):
+        """
+        测试后台刷新失败时保留旧值并记录错误
+        """
+        counter = {"value": 0}
+        messages = []
+
+        with self.assertRaises(ValueError):
+            DecoratorUtil.cached(stale_ttl=60)
+
+        @DecoratorUtil.cached(
+            ttl=1, stale_ttl=60, ttl_param="cache_ttl", logger=messages.append
+        )
+        def current():
+            counter["value"] += 1
+            if counter["value"] > 1:
+                raise RuntimeError("backend down")
+            return counter["value"]
+
+        self.assertEqual(current(cache_ttl=0.05), 1)
+        time.sleep(0.1)
+        self.assertEqual(current(), 1)
+
+        deadline = time.time() + 2
+        while time.time() < deadline and current.refresh_stats["errors"] == 0:
+            time.sleep(0.01)
+        self.assertEqual(current.refresh_stats["errors"], 1)
+        self.assertIsInstance(current.refresh_stats["last_error"], RuntimeError)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("backend down", messages[0])
+        self.assertEqual(current(), 1)
+
+    def test_cached_decorator_ttl_param(self):
+        """
+        测试未指定ttl_param时不占用被装饰函数的关键字参数
+        """
+
+        @DecoratorUtil.cached(ttl=60)
+        def describe(name, cache_ttl=None):
+            return f"{name}:{cache_ttl}"
+
+        self.assertEqual(describe("a", cache_ttl=5), "a:5")
+        self.assertEqual(describe("a", cache_ttl=6), "a:6")
+
+        with self.assertRaises(ValueError):
+            DecoratorUtil.cached(ttl_param="cache_ttl")(describe.__wrapped__)
+
+    def test_cached_decorator_async_stale_refresh(self):
+        """
+        测试异步函数的后台刷新任务完成后更新缓存
+        """
+        counter = {"value": 0}
+
+        @DecoratorUtil.cached(ttl=1, stale_ttl=60, ttl_param="cache_ttl")
+        async def current():
+            counter["value"] += 1
+            return counter["value"]
+
+        async def run_async():
+            self.assertEqual(await current(cache_ttl=0.01), 1)
+            await asyncio.sleep(0.05)
+            self.assertEqual(await current(), 1)
+            for _ in range(100):
+                if await current() == 2:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(await current(), 2)
+
+        asyncio.run(run_async())
+
+    def test_cached_decorator_async(self):
+        """
+        测试缓存装饰器用于异步函数
+        """
+        calls = []
+
+        @DecoratorUtil.cached(ttl=60)
+        async def fetch(item_id):
+            calls.append(item_id)
+            await asyncio.sleep(0.01)
+            return {"id": item_id}
+
+        async def run_async():
+            first = await fetch(1)
+            second = await fetch(1)
+            self.assertEqual(first, {"id": 1})
+            self.assertEqual(second, {"id": 1})
+
+        asyncio.run(run_async())
+        self.assertEqual(calls, [1])
+
     def test_context_manager_decorator(self):
         """
         测试上下文管理装饰器
@@ -117,45 +275,49 @@ class TestDecoratorUtilNewFeatures(unittest.TestCase):
         """
         测试指标收集装饰器
         """
-        # 记录指标
-        metrics = []
-
-        # 自定义指标收集函数
-        def custom_metric_logger(msg):
-            metrics.append(msg)
+        from btools.core.system.metricsutils import MetricsUtils
 
-        # 临时替换print函数
-        import builtins
-
-        original_print = builtins.print
-        builtins.print = custom_metric_logger
+        registry = MetricsUtils.Registry()
+        metrics = []
 
-        try:
-            # 创建指标收集装饰器
-            metric_decorator = DecoratorUtil.metric_collector(
-                "test_metric", tags={"test": "value"}
-            )
+        # 创建指标收集装饰器
+        metric_decorator = DecoratorUtil.metric_collector(
+            "test_metric",
+            tags={"test": "value"},
+            registry=registry,
+            logger=metrics.append,
+        )
 
-            # 使用装饰器
-            @metric_decorator
-            def metric_function():
-                time.sleep(0.1)
-                return "metric_result"
+        # 使用装饰器
+        @metric_decorator
+        def metric_function(fail=False):
+            if fail:
+                raise ValueError("failed")
+            return "metric_result"
 
-            # 执行函数
-            result = metric_function()
-            self.assertEqual(result, "metric_result")
-
-            # 检查指标是否被收集
-            self.assertTrue(len(metrics) > 0)
-            # 检查指标格式
-            self.assertIn("[指标] test_metric", metrics[0])
-            self.assertIn("耗时=", metrics[0])
-            self.assertIn("成功=True", metrics[0])
-            self.assertIn("标签={'test': 'value'}", metrics[0])
-        finally:
-            # 恢复原始print函数
-            builtins.print = original_print
+        # 执行函数
+        self.assertEqual(metric_function(), "metric_result")
+        with self.assertRaises(ValueError):
+            metric_function(fail=True)
+
+        # 检查指标是否记录到注册表
+        success = registry.histogram(
+            "test_metric", {"test": "value", "success": "true"}
+        )
+        failure = registry.histogram(
+            "test_metric", {"test": "value", "success": "false"}
+        )
+        self.assertEqual(success.snapshot()["count"], 1)
+        self.assertEqual(failure.snapshot()["count"], 1)
+        self.assertIn(
+            'test_metric_count{success="true",test="value"} 1',
+            registry.to_prometheus(),
+        )
+
+        # 检查日志格式
+        self.assertIn("[指标] test_metric", metrics[0])
+        self.assertIn("成功=True", metrics[0])
+        self.assertIn("成功=False", metrics[1])
 
     def test_profiler_decorator(self):
         """
@@ -2,6 +2,8 @@
 
 import os
 import tempfile
+import threading
+import time
 import unittest
 
 from btools.core.cache.cacheutils import CacheUtils
@@ -98,6 +100,301 @@ class TestCacheUtils(unittest.TestCase):
         self.assertIsNone(self.file_cache.get("file_key1"))
         self.assertIsNone(self.file_cache.get("file_key2"))
 
+    def test_memory_cache_lru_eviction(self):
+        """测试LRU淘汰"""
+        cache = CacheUtils.create_memory_cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # 访问a后，b成为最久未使用的键
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_memory_cache_lfu_eviction(self):
+        """测试LFU淘汰"""
+        cache = CacheUtils.create_memory_cache(max_entries=2, eviction_policy="lfu")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.size(), 2)
+
+    def test_lfu_policy_min_frequency_after_remove(self):
+        """测试LFU删除最低频次的键后仍能找到下一个最低频次"""
+        policy = CacheUtils.LFUPolicy()
+        for key in ("a", "b", "c"):
+            policy.on_insert(key)
+        for _ in range(3):
+            policy.on_access("c")
+        policy.on_access("b")
+        self.assertEqual(policy.victim(), "a")
+        policy.on_remove("a")
+        self.assertEqual(policy.victim(), "b")
+        policy.on_remove("b")
+        self.assertEqual(policy.victim(), "c")
+        policy.on_insert("d")
+        self.assertEqual(policy.victim(), "d")
+        policy.on_remove("d")
+        policy.on_remove("c")
+        self.assertIsNone(policy.victim())
+
+    def test_memory_cache_tinylfu_admission(self):
+        """测试TinyLFU准入过滤保护热点数据"""
+        cache = CacheUtils.create_memory_cache(max_entries=2, eviction_policy="tinylfu")
+        cache.set("hot1", 1)
+        cache.set("hot2", 2)
+        for _ in range(5):
+            cache.get("hot1")
+            cache.get("hot2")
+        # 只访问一次的新键无法挤掉热点键
+        cache.set("cold", 3)
+        self.assertIsNone(cache.get("cold"))
+        self.assertEqual(cache.get("hot1"), 1)
+        self.assertEqual(cache.get("hot2"), 2)
+        # 准入拒绝单独计数，不计为淘汰
+        self.assertEqual(cache.stats()["rejections"], 1)
+        self.assertEqual(cache.stats()["evictions"], 0)
+
+    def test_memory_cache_max_bytes(self):
+        """测试按字节数限制容量"""
+        cache = CacheUtils.MemoryCache(max_bytes=10, sizeof=len)
+        cache.set("a", "12345")
+        cache.set("b", "12345")
+        cache.set("c", "123")
+        self.assertIsNone(cache.get("a"))
+        self.assertLessEqual(cache.memory_usage(), 10)
+        # 超过总容量的值不会被写入
+        cache.set("big", "x" * 11)
+        self.assertIsNone(cache.get("big"))
+
+    def test_memory_cache_max_bytes_oversize_update(self):
+        """测试覆盖写入超过总容量的值时只删除该键"""
+        cache = CacheUtils.MemoryCache(max_bytes=10000, sizeof=len)
+        for i in range(20):
+            cache.set(f"k{i}", "x" * 100)
+        cache.set("k5", "y" * 50000)
+        self.assertIsNone(cache.get("k5"))
+        self.assertEqual(cache.size(), 19)
+        self.assertEqual(cache.get("k6"), "x" * 100)
+        self.assertEqual(cache.memory_usage(), 1900)
+        self.assertEqual(cache.stats()["rejections"], 1)
+        self.assertEqual(cache.stats()["evictions"], 0)
+
+    def test_memory_cache_expiry_index(self):
+        """测试过期项通过堆索引清理"""
+        cache = CacheUtils.create_memory_cache()
+        cache.set("short", 1, ttl=0.05)
+        cache.set("long", 2)
+        time.sleep(0.1)
+        self.assertEqual(cache.size(), 1)
+        self.assertFalse(cache.exists("short"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_memory_cache_stats(self):
+        """测试命中统计"""
+        self.memory_cache.set("key1", "value1")
+        self.memory_cache.get("key1")
+        self.memory_cache.get("missing")
+        stats = self.memory_cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.memory_cache.reset_stats()
+        self.assertEqual(self.memory_cache.hits, 0)
+
+    def test_sharded_memory_cache_basic(self):
+        """测试分片内存缓存基本操作"""
+        cache = CacheUtils.create_sharded_memory_cache(shards=4)
+        for i in range(20):
+            cache.set(f"key{i}", i)
+        self.assertEqual(cache.size(), 20)
+        self.assertEqual(cache.get("key7"), 7)
+        self.assertTrue(cache.exists("key7"))
+        cache.delete("key7")
+        self.assertIsNone(cache.get("key7"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+    def test_sharded_memory_cache_capacity(self):
+        """测试分片容量之和不超过总容量"""
+        cache = CacheUtils.create_sharded_memory_cache(shards=16, max_entries=4)
+        for i in range(100):
+            cache.set(f"key{i}", i)
+        self.assertLessEqual(cache.size(), 4)
+
+        cache = CacheUtils.create_sharded_memory_cache(shards=4, max_entries=10)
+        limits = [shard._max_entries for shard in cache._shards]
+        self.assertEqual(sum(limits), 10)
+        self.assertEqual(max(limits) - min(limits), 1)
+
+    def test_sharded_memory_cache_single_flight(self):
+        """测试并发未命中时只执行一次加载函数"""
+        cache = CacheUtils.create_sharded_memory_cache()
+        calls = []
+        results = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return "loaded"
+
+        def worker():
+            results.append(cache.get_or_load("hot", loader))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["loaded"] * 10)
+        self.assertEqual(cache.get("hot"), "loaded")
+
+    def test_sharded_memory_cache_loader_error(self):
+        """测试加载函数异常不会写入缓存"""
+        cache = CacheUtils.create_sharded_memory_cache()
+
+        def loader():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_load("key", loader)
+        self.assertFalse(cache.exists("key"))
+        self.assertEqual(cache.get_or_load("key", lambda: 1), 1)
+
+    def test_binary_file_cache_set_and_get(self):
+        """测试二进制文件缓存读写复杂对象"""
+        cache = CacheUtils.create_binary_file_cache(self.temp_dir)
+        data = {"name": "John", "tags": ("a", "b"), "raw": b"\x00\x01"}
+        cache.set("user", data)
+        cache.set("count", 1)
+        self.assertEqual(cache.get("user"), data)
+        self.assertTrue(cache.exists("count"))
+        cache.delete("count")
+        self.assertIsNone(cache.get("count"))
+        self.assertEqual(cache.size(), 1)
+        cache.close()
+
+    def test_binary_file_cache_reopen(self):
+        """测试重新打开后从日志恢复索引"""
+        cache = CacheUtils.create_binary_file_cache(self.temp_dir)
+        cache.set("key1", "value1")
+        cache.set("key1", "value2")
+        cache.set("key2", [1, 2, 3])
+        cache.delete("key2")
+        cache.close()
+
+        # 模拟崩溃时写了一半的尾部记录
+        with open(os.path.join(self.temp_dir, "cache.log"), "ab") as f:
+            f.write(b"\x01\x00\x00")
+
+        reopened = CacheUtils.create_binary_file_cache(self.temp_dir)
+        self.assertEqual(reopened.get("key1"), "value2")
+        self.assertIsNone(reopened.get("key2"))
+        self.assertEqual(reopened.size(), 1)
+        reopened.close()
+
+    def test_binary_file_cache_exclusive_lock(self):
+        """测试缓存目录被占用时拒绝打开，关闭后释放"""
+        cache = CacheUtils.create_binary_file_cache(self.temp_dir)
+        cache.set("key", "value")
+        with self.assertRaises(RuntimeError):
+            CacheUtils.create_binary_file_cache(self.temp_dir)
+        cache.close()
+
+        reopened = CacheUtils.create_binary_file_cache(self.temp_dir)
+        self.assertEqual(reopened.get("key"), "value")
+        reopened.close()
+
+    def test_binary_file_cache_expiry_and_compact(self):
+        """测试过期清理和日志压缩"""
+        cache = CacheUtils.create_binary_file_cache(self.temp_dir)
+        cache.set("short", "x", ttl=0.05)
+        for i in range(10):
+            cache.set("long", i)
+        time.sleep(0.1)
+        self.assertEqual(cache.size(), 1)
+
+        log_path = os.path.join(self.temp_dir, "cache.log")
+        before = os.path.getsize(log_path)
+        cache.compact()
+        self.assertLess(os.path.getsize(log_path), before)
+        self.assertEqual(cache.get("long"), 9)
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+        cache.close()
+
+
+class TestTieredCache(unittest.TestCase):
+    """测试TieredCache类"""
+
+    def setUp(self):
+        """设置测试环境"""
+        try:
+            import fakeredis
+        except ImportError:
+            self.skipTest(
+                "fakeredis library not installed, skipping tiered cache tests"
+            )
+
+        server = fakeredis.FakeServer()
+        self.client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        self.other_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        self.tiered = CacheUtils.create_tiered_cache(
+            CacheUtils.RedisCache(client=self.client)
+        )
+        self.other = CacheUtils.create_tiered_cache(
+            CacheUtils.RedisCache(client=self.other_client)
+        )
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.tiered.close()
+        self.other.close()
+
+    def wait_for(self, condition, timeout=2.0):
+        """等待条件成立"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_near_cache_hit(self):
+        """测试读取回填近端缓存"""
+        self.tiered.set("key1", {"a": 1})
+        self.assertEqual(self.other.get("key1"), {"a": 1})
+        # 直接修改Redis后，近端缓存仍返回本地副本
+        self.other_client.set("key1", '{"a": 2}')
+        self.assertEqual(self.other.get("key1"), {"a": 1})
+        self.assertEqual(self.other.stats()["hits"], 1)
+
+    def test_mget_mset(self):
+        """测试批量读写"""
+        self.tiered.mset({"k1": 1, "k2": "two", "k3": [3]})
+        self.assertGreater(self.client.ttl("k1"), 0)
+        result = self.other.mget(["k1", "k2", "k3", "missing"])
+        self.assertEqual(result, {"k1": 1, "k2": "two", "k3": [3]})
+
+    def test_pubsub_invalidation(self):
+        """测试通过发布订阅失效其他进程的近端缓存"""
+        self.tiered.set("key1", "v1")
+        self.assertEqual(self.other.get("key1"), "v1")
+        self.tiered.set("key1", "v2")
+        self.assertTrue(self.wait_for(lambda: self.other.get("key1") == "v2"))
+        self.tiered.delete("key1")
+        self.assertTrue(self.wait_for(lambda: self.other.get("key1") is None))
+
 
 if __name__ == "__main__":
     unittest.main()
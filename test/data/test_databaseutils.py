@@ -0,0 +1,231 @@
+"""测试DatabaseUtils类"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from btools.core.data.databaseutils import DatabaseUtils
+
+
+class TestSQLiteDatabase(unittest.TestCase):
+    """测试SQLiteDatabase类"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "test.db")
+        self.db = DatabaseUtils.create_sqlite_database(self.db_path)
+        self.db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.db.disconnect()
+        shutil.rmtree(self.temp_dir)
+
+    def test_crud(self):
+        """测试增删改查"""
+        row_id = self.db.insert("users", {"name": "Tom"})
+        self.assertEqual(
+            self.db.fetch_one("SELECT name FROM users WHERE id = ?", (row_id,)),
+            {"name": "Tom"},
+        )
+        self.assertEqual(
+            self.db.update("users", {"name": "Amy"}, "id = ?", (row_id,)), 1
+        )
+        self.assertEqual(self.db.fetch_all("SELECT name FROM users"), [{"name": "Amy"}])
+        self.assertEqual(self.db.delete("users", "id = ?", (row_id,)), 1)
+        self.assertTrue(self.db.table_exists("users"))
+
+    def test_insert_many_generator(self):
+        """测试批量插入生成器数据"""
+        rows = ({"id": i, "name": f"user{i}"} for i in range(2500))
+        self.assertEqual(self.db.insert_many("users", rows, batch_size=1000), 2500)
+        count = self.db.fetch_one("SELECT COUNT(*) AS n FROM users")["n"]
+        self.assertEqual(count, 2500)
+        self.assertEqual(self.db.insert_many("users", []), 0)
+
+    def test_upsert_many(self):
+        """测试批量插入或更新"""
+        self.db.insert_many(
+            "users", [{"id": 1, "name": "Tom"}, {"id": 2, "name": "Amy"}]
+        )
+        written = self.db.upsert_many(
+            "users",
+            [{"id": 2, "name": "Bob"}, {"id": 3, "name": "Joe"}],
+            conflict_columns=["id"],
+        )
+        self.assertEqual(written, 2)
+        names = [
+            r["name"] for r in self.db.fetch_all("SELECT name FROM users ORDER BY id")
+        ]
+        self.assertEqual(names, ["Tom", "Bob", "Joe"])
+
+        # 冲突时忽略
+        self.db.upsert_many(
+            "users",
+            [{"id": 1, "name": "X"}],
+            conflict_columns=["id"],
+            update_columns=[],
+        )
+        self.assertEqual(
+            self.db.fetch_one("SELECT name FROM users WHERE id = 1")["name"], "Tom"
+        )
+
+    def test_transaction(self):
+        """测试事务内暂停逐条提交，异常时回滚"""
+        with self.assertRaises(ValueError):
+            with self.db.transaction():
+                self.db.insert("users", {"name": "Tom"})
+                self.db.insert("users", {"name": "Amy"})
+                raise ValueError("boom")
+        self.assertEqual(self.db.fetch_all("SELECT * FROM users"), [])
+
+        with self.db.transaction():
+            self.db.insert("users", {"name": "Tom"})
+            with self.db.transaction():
+                self.db.insert("users", {"name": "Amy"})
+        other = DatabaseUtils.create_sqlite_database(self.db_path)
+        self.assertEqual(len(other.fetch_all("SELECT * FROM users")), 2)
+        other.disconnect()
+
+    def test_bulk_load_pragmas(self):
+        """测试批量导入的PRAGMA设置"""
+        db = DatabaseUtils.create_sqlite_database(
+            self.db_path, DatabaseUtils.SQLiteDatabase.BULK_LOAD_PRAGMAS
+        )
+        self.assertEqual(db.fetch_one("PRAGMA journal_mode")["journal_mode"], "wal")
+        # NORMAL对应的数值为1
+        self.assertEqual(db.fetch_one("PRAGMA synchronous")["synchronous"], 1)
+        db.disconnect()
+
+    def test_pool_checkout(self):
+        """测试连接池借出与多线程共享"""
+        self.db.disconnect()
+        db = DatabaseUtils.create_sqlite_database(self.db_path)
+        pool = db.create_pool(min_size=1, max_size=3)
+
+        # 未借出连接时不允许直接操作
+        with self.assertRaises(RuntimeError):
+            db.fetch_all("SELECT * FROM users")
+
+        errors = []
+
+        def worker(i):
+            try:
+                with db.checkout():
+                    db.insert("users", {"name": f"user{i}"})
+                    time.sleep(0.01)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        with db.checkout():
+            self.assertEqual(db.fetch_one("SELECT COUNT(*) AS n FROM users")["n"], 10)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics["checkouts"], 11)
+        self.assertLessEqual(metrics["size"], 3)
+        self.assertEqual(metrics["in_use"], 0)
+        db.disconnect()
+
+    def test_pool_precreated_connection_cross_thread(self):
+        """测试连接池预先创建的连接可以在其他线程中使用"""
+        self.db.disconnect()
+        db = DatabaseUtils.create_sqlite_database(self.db_path)
+        pool = db.create_pool(min_size=1, max_size=1, health_check=False)
+        results = []
+
+        def worker():
+            try:
+                with db.checkout():
+                    results.append(db.fetch_one("SELECT COUNT(*) AS n FROM users"))
+            except Exception as e:
+                results.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(results, [{"n": 0}])
+        self.assertEqual(pool.metrics()["size"], 1)
+        db.disconnect()
+
+    def test_pool_rejects_memory_database(self):
+        """测试内存数据库不能启用连接池"""
+        for db_path in (":memory:", ""):
+            db = DatabaseUtils.create_sqlite_database(db_path)
+            with self.assertRaises(ValueError):
+                db.create_pool()
+            # 未启用连接池时仍可正常使用
+            db.create_table("t", {"id": "INTEGER PRIMARY KEY"})
+            self.assertTrue(db.table_exists("t"))
+            db.disconnect()
+
+
+class TestConnectionPool(unittest.TestCase):
+    """测试ConnectionPool类"""
+
+    class FakeConnection:
+        """模拟数据库连接"""
+
+        def __init__(self):
+            self.closed = False
+            self.healthy = True
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    def test_timeout_and_wait_metrics(self):
+        """测试连接耗尽时等待与超时"""
+        pool = DatabaseUtils.ConnectionPool(
+            self.FakeConnection, min_size=0, max_size=1, timeout=0.05
+        )
+        conn = pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+
+        threading.Timer(0.05, pool.release, args=(conn,)).start()
+        self.assertIs(pool.acquire(timeout=1), conn)
+        metrics = pool.metrics()
+        self.assertEqual(metrics["waits"], 2)
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertGreater(metrics["wait_time_total"], 0)
+
+    def test_health_check_and_idle_timeout(self):
+        """测试健康检查和空闲超时回收"""
+        pool = DatabaseUtils.ConnectionPool(
+            self.FakeConnection,
+            min_size=0,
+            max_size=2,
+            idle_timeout=0.05,
+            health_check=lambda c: c.healthy,
+        )
+        with pool.connection() as conn:
+            conn.healthy = False
+        with pool.connection() as new_conn:
+            self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.metrics()["health_check_failures"], 1)
+
+        time.sleep(0.1)
+        with pool.connection() as newest:
+            self.assertIsNot(newest, new_conn)
+        self.assertTrue(new_conn.closed)
+        pool.close()
+        self.assertEqual(pool.metrics()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 """测试Logger类"""
 
+import glob
+import gzip
+import logging
 import os
+import queue
 import tempfile
+import threading
 import unittest
 
 from btools.core.log.logutils import Logger
@@ -79,6 +84,136 @@ class TestLogger(unittest.TestCase):
         self.assertNotIn("Info message", content)
         self.assertIn("Error message", content)
 
+    def test_queue_mode(self):
+        """测试队列模式由后台线程写入日志"""
+        log_file_path = os.path.join(self.temp_dir, "queue.log")
+        logger = Logger(
+            name="test_queue_logger", file_path=log_file_path, use_queue=True
+        )
+        self.loggers.append(logger)
+        self.assertIsInstance(logger.logger.handlers[0], Logger.QueueHandler)
+        for i in range(100):
+            logger.info(f"queued message {i}")
+        logger.flush()
+        with open(log_file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("queued message 99", content)
+        # 文件名和行号仍然是调用方的位置
+        self.assertIn("test_logger.py", content)
+
+        logger.close()
+        logger.close()
+        self.assertEqual(logger.logger.handlers, [])
+
+    def test_replace_same_name(self):
+        """测试同名Logger替换时停止旧的后台线程并关闭文件"""
+        log_file_path = os.path.join(self.temp_dir, "replace.log")
+        first = Logger(name="test_replace", file_path=log_file_path, use_queue=True)
+        self.loggers.append(first)
+        first_handlers = list(first._listener.handlers)
+        thread_count = threading.active_count()
+
+        for _ in range(5):
+            logger = Logger(
+                name="test_replace", file_path=log_file_path, use_queue=True
+            )
+            self.loggers.append(logger)
+        self.assertEqual(threading.active_count(), thread_count)
+        self.assertIsNone(first._listener._thread)
+        self.assertIsNone(first_handlers[-1].stream)
+
+        # 旧实例的close不影响新实例
+        first.close()
+        logger.info("still works")
+        logger.flush()
+        with open(log_file_path, "r", encoding="utf-8") as f:
+            self.assertIn("still works", f.read())
+
+    def test_queue_overflow(self):
+        """测试队列已满时的丢弃和阻塞策略"""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+
+        handler = Logger.QueueHandler(queue.Queue(maxsize=2), overflow="drop")
+        for _ in range(5):
+            handler.emit(record)
+        self.assertEqual(handler.queue.qsize(), 2)
+        self.assertEqual(handler.dropped, 3)
+
+        handler = Logger.QueueHandler(queue.Queue(maxsize=1), overflow="block")
+        handler.emit(record)
+        thread = threading.Thread(target=handler.emit, args=(record,))
+        thread.start()
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        handler.queue.get()
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(handler.dropped, 0)
+
+        with self.assertRaises(ValueError):
+            Logger(name="test_logger", overflow="wait")
+        with self.assertRaises(ValueError):
+            Logger(name="test_logger", max_bytes=100, when="H")
+
+    def test_size_rotation_with_compression(self):
+        """测试按大小轮转并在后台压缩轮转文件"""
+        log_file_path = os.path.join(self.temp_dir, "size.log")
+        logger = Logger(
+            name="test_size_logger",
+            file_path=log_file_path,
+            use_queue=True,
+            max_bytes=500,
+            backup_count=2,
+            compress=True,
+        )
+        self.loggers.append(logger)
+        for i in range(50):
+            logger.info(f"rotating message {i:03d}")
+        logger.close()
+
+        backups = sorted(glob.glob(log_file_path + ".*"))
+        self.assertEqual(backups, [log_file_path + ".1.gz", log_file_path + ".2.gz"])
+        with gzip.open(log_file_path + ".1.gz", "rt", encoding="utf-8") as f:
+            self.assertIn("rotating message", f.read())
+        with open(log_file_path, "r", encoding="utf-8") as f:
+            self.assertIn("rotating message 049", f.read())
+
+    def test_time_rotation_with_compression(self):
+        """测试按时间轮转并压缩轮转文件"""
+        log_file_path = os.path.join(self.temp_dir, "time.log")
+        logger = Logger(
+            name="test_time_logger",
+            file_path=log_file_path,
+            when="midnight",
+            compress=True,
+        )
+        self.loggers.append(logger)
+        handler = logger.logger.handlers[1]
+        self.assertIsInstance(handler, Logger.TimedRotatingFileHandler)
+        logger.info("before rollover")
+        handler.doRollover()
+        logger.info("after rollover")
+        logger.close()
+
+        backups = glob.glob(log_file_path + ".*")
+        self.assertEqual(len(backups), 1)
+        self.assertTrue(backups[0].endswith(".gz"))
+        with gzip.open(backups[0], "rt", encoding="utf-8") as f:
+            self.assertIn("before rollover", f.read())
+
+    def test_default_name_cached(self):
+        """测试默认名称按调用方文件缓存"""
+        Logger._find_project_name.cache_clear()
+        first = Logger(level=Logger.INFO)
+        second = Logger(level=Logger.INFO)
+        self.loggers.extend([first, second])
+        root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(first.name, os.path.basename(root))
+        self.assertEqual(second.name, first.name)
+        self.assertEqual(Logger._find_project_name.cache_info().hits, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+"""测试AsyncHTTPClient类"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from btools.core.network.asynchttputils import AsyncHTTPClient
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(
+    web is None, "aiohttp library not installed, skipping async http tests"
+)
+class TestAsyncHTTPClient(unittest.IsolatedAsyncioTestCase):
+    """测试AsyncHTTPClient类"""
+
+    async def asyncSetUp(self):
+        """启动本地测试服务器"""
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.flaky_calls = 0
+
+        async def user(request):
+            return web.json_response(
+                {
+                    "id": request.match_info["user_id"],
+                    "page": request.query.get("page"),
+                    "token": request.headers.get("X-Token"),
+                }
+            )
+
+        async def echo(request):
+            return web.json_response(await request.json())
+
+        async def slow(request):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+            return web.Response(text="ok")
+
+        async def flaky(request):
+            self.flaky_calls += 1
+            if self.flaky_calls < 3:
+                return web.Response(status=503)
+            return web.Response(text="recovered")
+
+        async def download(request):
+            return web.Response(body=b"x" * 200000)
+
+        app = web.Application()
+        app.router.add_get("/users/{user_id}", user)
+        app.router.add_post("/echo", echo)
+        app.router.add_get("/slow", slow)
+        app.router.add_get("/flaky", flaky)
+        app.router.add_get("/download", download)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url(""))
+
+    async def asyncTearDown(self):
+        """关闭本地测试服务器"""
+        await self.server.close()
+
+    async def test_get_with_path_params_and_headers(self):
+        """测试路径参数替换与请求头合并"""
+        async with AsyncHTTPClient(self.base_url, headers={"X-Token": "t"}) as client:
+            response = await client.get(
+                "/users/{user_id}", params={"user_id": 7, "page": 2}
+            )
+            self.assertEqual(response.status, 200)
+            self.assertEqual(
+                await response.json(), {"id": "7", "page": "2", "token": "t"}
+            )
+
+    async def test_post_json(self):
+        """测试发送JSON数据"""
+        async with AsyncHTTPClient(self.base_url) as client:
+            response = await client.post("/echo", json={"name": "John"})
+            self.assertEqual(await response.json(), {"name": "John"})
+
+    async def test_gather_requests_with_concurrency_limit(self):
+        """测试批量请求受全局并发上限约束"""
+        async with AsyncHTTPClient(self.base_url, max_concurrency=3) as client:
+            responses = await client.gather_requests(
+                [{"method": "GET", "url": "/slow"} for _ in range(10)]
+            )
+        self.assertEqual([r.status for r in responses], [200] * 10)
+        self.assertLessEqual(self.max_in_flight, 3)
+
+    async def test_host_limits_above_default(self):
+        """测试指定主机的上限可以高于默认的每主机连接数"""
+        port = self.server.port
+        async with AsyncHTTPClient(
+            max_connections_per_host=2, host_limits={"127.0.0.1": 6}
+        ) as client:
+            await client.gather_requests(
+                [
+                    {"method": "GET", "url": f"http://127.0.0.1:{port}/slow"}
+                    for _ in range(12)
+                ]
+            )
+            self.assertEqual(self.max_in_flight, 6)
+
+            # 未列出的主机仍使用默认上限
+            self.max_in_flight = 0
+            await client.gather_requests(
+                [
+                    {"method": "GET", "url": f"http://localhost:{port}/slow"}
+                    for _ in range(6)
+                ]
+            )
+            self.assertEqual(self.max_in_flight, 2)
+
+    async def test_retry(self):
+        """测试遇到5xx错误时重试"""
+        async with AsyncHTTPClient(
+            self.base_url, retry_enabled=True, retry_backoff_factor=0.01
+        ) as client:
+            response = await client.get("/flaky")
+            self.assertEqual(await response.text(), "recovered")
+        self.assertEqual(self.flaky_calls, 3)
+
+    async def test_rate_limiter(self):
+        """测试请求前异步等待限流许可"""
+        from btools.core.system.ratelimitutils import RateLimitUtils
+
+        limiter = RateLimitUtils.TokenBucket(rate=50, capacity=1)
+        async with AsyncHTTPClient(self.base_url, rate_limiter=limiter) as client:
+            start = asyncio.get_running_loop().time()
+            await client.gather_requests(
+                [{"method": "GET", "url": "/users/1"} for _ in range(6)]
+            )
+            self.assertGreaterEqual(asyncio.get_running_loop().time() - start, 0.09)
+
+    async def test_download_file(self):
+        """测试下载文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = os.path.join(temp_dir, "sub", "file.bin")
+            async with AsyncHTTPClient(self.base_url) as client:
+                result = await client.download_file("/download", save_path)
+            self.assertEqual(result, save_path)
+            self.assertEqual(os.path.getsize(save_path), 200000)
+
+
+if __name__ == "__main__":
+    unittest.main()
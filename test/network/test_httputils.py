@@ -0,0 +1,266 @@
+"""测试HTTPClient类"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from btools.core.network.httputils import HTTPClient
+
+FILE_CONTENT = os.urandom(300000)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """本地测试服务器请求处理器，/file 支持Range请求"""
+
+    protocol_version = "HTTP/1.1"
+    # 为True时拒绝起始位置不为0的分段请求
+    fail_offset_ranges = False
+    # 为True时拒绝HEAD请求
+    reject_head = False
+    served_bytes = 0
+
+    def do_HEAD(self):
+        if _Handler.reject_head:
+            self.send_response(405)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(FILE_CONTENT)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path != "/file":
+            self._send(200, b"ok")
+            return
+
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if not match:
+            self._send(200, FILE_CONTENT)
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        if start > 0 and _Handler.fail_offset_ranges:
+            self._send(500, b"error")
+            return
+        _Handler.served_bytes += end - start + 1
+        self._send(206, FILE_CONTENT[start : end + 1])
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHTTPClient(unittest.TestCase):
+    """测试HTTPClient类"""
+
+    @classmethod
+    def setUpClass(cls):
+        """启动本地测试服务器"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """关闭本地测试服务器"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_build_url(self):
+        """测试构建URL与路径参数替换"""
+        client = HTTPClient("https://api.example.com/")
+        self.assertEqual(
+            client._build_url("/users/{user_id}", {"user_id": 1, "page": 2}),
+            "https://api.example.com/users/1?page=2",
+        )
+        client.close()
+
+    def test_connection_reuse_stats(self):
+        """测试连接复用统计"""
+        with HTTPClient(self.base_url) as client:
+            for _ in range(5):
+                self.assertEqual(client.get("/ping").text, "ok")
+            stats = client.get_stats()
+
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertEqual(stats["connections_reused"], 4)
+        self.assertEqual(stats["latency"]["histogram"][float("inf")], 5)
+
+    def test_pool_size_with_threads(self):
+        """测试多线程共享客户端时的连接池大小"""
+        with HTTPClient(self.base_url, pool_maxsize=4, pool_block=True) as client:
+            threads = [
+                threading.Thread(target=lambda: [client.get("/ping") for _ in range(5)])
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            stats = client.get_stats()
+
+        self.assertEqual(stats["requests"], 40)
+        # 阻塞模式下新建连接数不超过连接池大小
+        self.assertLessEqual(stats["connections_created"], 4)
+
+        client.reset_stats()
+        self.assertEqual(client.get_stats()["requests"], 0)
+
+    def test_rate_limiter(self):
+        """测试限流器限制请求速率"""
+        from btools.core.basic.decoratorutils import RateLimitError
+        from btools.core.system.ratelimitutils import RateLimitUtils
+
+        limiter = RateLimitUtils.GCRA(rate=50, burst=1)
+        with HTTPClient(self.base_url, rate_limiter=limiter) as client:
+            start = time.monotonic()
+            for _ in range(6):
+                client.get("/ping")
+            self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        limiter = RateLimitUtils.TokenBucket(rate=0.1, capacity=1)
+        with HTTPClient(
+            self.base_url,
+            rate_limiter=limiter,
+            rate_limit_by_host=True,
+            rate_limit_timeout=0.05,
+        ) as client:
+            client.get("/ping")
+            with self.assertRaises(RateLimitError):
+                client.get("/ping")
+        self.assertEqual(list(limiter._states), ["127.0.0.1"])
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.mkdtemp()
+        _Handler.fail_offset_ranges = False
+        _Handler.served_bytes = 0
+
+    def tearDown(self):
+        """清理测试环境"""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_download_file_with_checksum(self):
+        """测试单连接下载并校验"""
+        save_path = os.path.join(self.temp_dir, "single.bin")
+        checksum = f"{zlib.crc32(FILE_CONTENT):08x}"
+        with HTTPClient(self.base_url) as client:
+            client.download_file("/file", save_path, checksum=checksum)
+            with open(save_path, "rb") as f:
+                self.assertEqual(f.read(), FILE_CONTENT)
+            with self.assertRaises(ValueError):
+                client.download_file("/file", save_path, checksum="00000000")
+        self.assertFalse(os.path.exists(save_path))
+
+    def test_download_file_parallel_segments(self):
+        """测试分段并行下载"""
+        save_path = os.path.join(self.temp_dir, "parallel.bin")
+        checksum = f"{zlib.crc32(FILE_CONTENT):08x}"
+        with HTTPClient(self.base_url) as client:
+            client.download_file(
+                "/file", save_path, segments=4, chunk_size=4096, checksum=checksum
+            )
+        with open(save_path, "rb") as f:
+            self.assertEqual(f.read(), FILE_CONTENT)
+        self.assertFalse(os.path.exists(save_path + ".part"))
+        self.assertFalse(os.path.exists(save_path + ".part.json"))
+
+    def test_download_file_head_rejected(self):
+        """测试服务器拒绝HEAD请求时退化为单连接下载"""
+        save_path = os.path.join(self.temp_dir, "nohead.bin")
+        _Handler.reject_head = True
+        _Handler.served_bytes = 0
+        try:
+            with HTTPClient(self.base_url) as client:
+                client.download_file("/file", save_path, segments=3, resume=True)
+        finally:
+            _Handler.reject_head = False
+        with open(save_path, "rb") as f:
+            self.assertEqual(f.read(), FILE_CONTENT)
+        # 没有发送Range请求
+        self.assertEqual(_Handler.served_bytes, 0)
+
+    def test_download_file_resume_hashlib_checksum(self):
+        """测试单段断点续传可使用hashlib算法校验，多段下载只支持crc32"""
+        import hashlib
+
+        save_path = os.path.join(self.temp_dir, "sha256.bin")
+        checksum = hashlib.sha256(FILE_CONTENT).hexdigest()
+        with HTTPClient(self.base_url) as client:
+            client.download_file(
+                "/file",
+                save_path,
+                resume=True,
+                checksum=checksum,
+                checksum_algorithm="sha256",
+            )
+            with open(save_path, "rb") as f:
+                self.assertEqual(f.read(), FILE_CONTENT)
+
+            with self.assertRaises(ValueError):
+                client.download_file(
+                    "/file",
+                    save_path,
+                    resume=True,
+                    checksum="0" * 64,
+                    checksum_algorithm="sha256",
+                )
+            self.assertFalse(os.path.exists(save_path))
+
+            with self.assertRaises(ValueError):
+                client.download_file(
+                    "/file",
+                    save_path,
+                    segments=2,
+                    checksum=checksum,
+                    checksum_algorithm="sha256",
+                )
+
+    def test_download_file_resume(self):
+        """测试中断后从断点继续下载"""
+        save_path = os.path.join(self.temp_dir, "resume.bin")
+        with HTTPClient(self.base_url) as client:
+            _Handler.fail_offset_ranges = True
+            with self.assertRaises(Exception):
+                client.download_file(
+                    "/file", save_path, segments=3, resume=True, max_retries=0
+                )
+            self.assertTrue(os.path.exists(save_path + ".part.json"))
+            first_pass = _Handler.served_bytes
+
+            _Handler.fail_offset_ranges = False
+            _Handler.served_bytes = 0
+            client.download_file(
+                "/file",
+                save_path,
+                segments=3,
+                resume=True,
+                checksum=f"{zlib.crc32(FILE_CONTENT):08x}",
+            )
+
+        # 第二次只下载第一次未完成的分段
+        self.assertEqual(_Handler.served_bytes, len(FILE_CONTENT) - first_pass)
+        with open(save_path, "rb") as f:
+            self.assertEqual(f.read(), FILE_CONTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
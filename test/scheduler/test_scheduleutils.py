@@ -3,8 +3,13 @@
 定时任务工具测试
 """
 
+import asyncio
+import os
+import tempfile
+import threading
 import time
 import unittest
+from datetime import datetime, timezone
 
 from btools.core.scheduler.scheduleutils import (
     ScheduleUtils,
@@ -18,6 +23,30 @@ from btools.core.scheduler.scheduleutils import (
     stop_scheduler,
 )
 
+# 持久化任务需要可以按模块路径导入的函数
+EXECUTED = []
+EXECUTED_LOCK = threading.Lock()
+
+
+def record_execution(value):
+    """
+    记录一次执行
+    """
+    with EXECUTED_LOCK:
+        EXECUTED.append(value)
+
+
+class FakeClock:
+    """
+    可手动推进的时钟
+    """
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
 
 class TestScheduleUtils(unittest.TestCase):
     """
@@ -305,6 +334,423 @@ class TestScheduleUtils(unittest.TestCase):
         # 取消任务
         self.scheduler.cancel_task(task_id)
 
+    def test_unique_task_ids(self):
+        """
+        测试同一个函数多次安排时任务ID不冲突
+        """
+
+        def test_func():
+            self.counter += 1
+
+        first = self.scheduler.schedule_once(0.05, test_func)
+        second = self.scheduler.schedule_once(0.05, test_func)
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.scheduler.get_task_count(), 2)
+
+        time.sleep(0.2)
+        self.assertEqual(self.counter, 2)
+
+    def test_task_stats(self):
+        """
+        测试任务延迟与运行时间统计
+        """
+
+        def test_func():
+            time.sleep(0.02)
+
+        task_id = self.scheduler.schedule_interval(0.05, test_func)
+        time.sleep(0.25)
+        stats = self.scheduler.get_task_stats(task_id)
+        self.scheduler.cancel_task(task_id)
+
+        self.assertGreaterEqual(stats["runs"], 2)
+        self.assertEqual(stats["failures"], 0)
+        self.assertGreaterEqual(stats["avg_runtime"], 0.02)
+        self.assertGreaterEqual(stats["max_lateness"], 0)
+        self.assertLess(stats["max_lateness"], 0.05)
+        self.assertEqual(stats["name"], test_func.__qualname__)
+        self.assertIsNone(self.scheduler.get_task_stats(task_id))
+        self.assertGreaterEqual(self.scheduler.get_stats()["runs"], stats["runs"])
+
+    def test_failing_task_keeps_running(self):
+        """
+        测试周期任务抛出异常后继续执行并记录失败
+        """
+        errors = []
+        scheduler = ScheduleUtils(
+            error_handler=lambda task_id, error: errors.append((task_id, error))
+        )
+        scheduler.start()
+
+        def test_func():
+            self.counter += 1
+            raise RuntimeError("boom")
+
+        try:
+            task_id = scheduler.schedule_interval(0.05, test_func)
+            time.sleep(0.22)
+            stats = scheduler.get_task_stats(task_id)
+        finally:
+            scheduler.stop()
+
+        self.assertGreaterEqual(self.counter, 2)
+        self.assertEqual(stats["failures"], stats["runs"])
+        self.assertIsInstance(stats["last_error"], RuntimeError)
+        self.assertEqual(errors[0][0], task_id)
+
+    def test_slow_task_does_not_block_others(self):
+        """
+        测试慢任务在工作线程中执行，不影响其他任务按时执行
+        """
+        executed = []
+        start = time.time()
+
+        self.scheduler.schedule_once(0.01, time.sleep, 0.3)
+        self.scheduler.schedule_once(0.05, lambda: executed.append(time.time()))
+        time.sleep(0.15)
+
+        self.assertEqual(len(executed), 1)
+        self.assertLess(executed[0] - start, 0.12)
+
+    def test_coroutine_task(self):
+        """
+        测试协程任务在事件循环中执行
+        """
+        done = threading.Event()
+
+        async def test_func(value):
+            await asyncio.sleep(0.01)
+            self.counter = value
+            done.set()
+
+        self.scheduler.schedule_once(0.02, test_func, 7)
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual(self.counter, 7)
+
+    def test_many_timers(self):
+        """
+        测试大量定时器
+        """
+        lock = threading.Lock()
+        done = threading.Event()
+        total = 10000
+
+        def test_func():
+            with lock:
+                self.counter += 1
+                if self.counter == total:
+                    done.set()
+
+        for i in range(total):
+            self.scheduler.schedule_once(0.05 + (i % 100) / 1000, test_func)
+        cancelled = self.scheduler.schedule_once(0.05, test_func)
+        self.scheduler.cancel_task(cancelled)
+
+        self.assertTrue(done.wait(5.0))
+        time.sleep(0.05)
+        self.assertEqual(self.counter, total)
+        self.assertEqual(self.scheduler.get_task_count(), 0)
+
+    def test_fixed_rate_does_not_drift(self):
+        """
+        测试固定速率任务按绝对时间执行，不因执行时间漂移
+        """
+
+        def test_func():
+            self.counter += 1
+            time.sleep(0.03)
+
+        task_id = self.scheduler.schedule_at_fixed_rate(0.05, test_func, jitter=0.01)
+        first_run = self.scheduler.get_task_stats(task_id)["next_run"]
+        time.sleep(0.52)
+        stats = self.scheduler.get_task_stats(task_id)
+        self.scheduler.cancel_task(task_id)
+
+        # 按完成后再等待的方式只能执行约6次
+        self.assertGreaterEqual(self.counter, 8)
+        periods = (stats["next_run"] - first_run) / 0.05
+        self.assertAlmostEqual(periods, round(periods), places=6)
+
+    def test_max_instances(self):
+        """
+        测试单任务的并发实例上限
+        """
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def test_func():
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.12)
+            with lock:
+                running[0] -= 1
+
+        task_id = self.scheduler.schedule_at_fixed_rate(0.03, test_func)
+        time.sleep(0.3)
+        stats = self.scheduler.get_task_stats(task_id)
+        self.scheduler.cancel_task(task_id)
+        self.assertEqual(running[1], 1)
+        self.assertGreater(stats["skipped"], 0)
+
+        running[1] = 0
+        task_id = self.scheduler.schedule_at_fixed_rate(
+            0.03, test_func, max_instances=3
+        )
+        time.sleep(0.3)
+        self.scheduler.cancel_task(task_id)
+        self.assertGreater(running[1], 1)
+        self.assertLessEqual(running[1], 3)
+
+    def test_misfire_policies(self):
+        """
+        测试错过触发的处理策略
+        """
+        expected = {"coalesce": 1, "catch_up": 3, "skip": 0}
+        for policy, runs in expected.items():
+            with self.subTest(policy=policy):
+                clock = FakeClock()
+                scheduler = ScheduleUtils(clock=clock)
+                task_id = scheduler.schedule_at_fixed_rate(
+                    1, lambda: None, misfire_policy=policy, misfire_grace_time=1.0
+                )
+                # 调度器启动时已经错过了101、102、103三次触发
+                clock.now = 103.5
+                scheduler.start()
+                try:
+                    time.sleep(0.1)
+                    stats = scheduler.get_task_stats(task_id)
+                finally:
+                    scheduler.stop()
+                self.assertEqual(stats["runs"], runs)
+                self.assertEqual(stats["next_run"], 104)
+                if policy == "skip":
+                    self.assertEqual(stats["skipped"], 1)
+
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule_at_fixed_rate(1, print, misfire_policy="later")
+
+    def test_schedule_at_and_cron(self):
+        """
+        测试按指定时间和cron表达式安排任务
+        """
+        clock = FakeClock(1700000000.5)
+        scheduler = ScheduleUtils(clock=clock)
+        executed = []
+        once_id = scheduler.schedule_at(1700000003, executed.append, "at")
+        cron_id = scheduler.schedule_cron("* * * * * *", executed.append, "cron")
+        self.assertEqual(scheduler.get_task_stats(cron_id)["next_run"], 1700000001)
+
+        clock.now = 1700000001.9
+        scheduler.start()
+        try:
+            time.sleep(0.1)
+            self.assertEqual(executed, ["cron"])
+            self.assertEqual(scheduler.get_task_stats(cron_id)["next_run"], 1700000002)
+            # 调度线程最多再等待0.1秒后按推进后的时钟重新计算
+            clock.now = 1700000003
+            time.sleep(0.3)
+            self.assertEqual(sorted(executed), ["at", "cron", "cron"])
+            self.assertIsNone(scheduler.get_task_stats(once_id))
+        finally:
+            scheduler.stop()
+
+    def test_cron_trigger(self):
+        """
+        测试cron表达式的下一次触发时间
+        """
+
+        def next_after(expression, value):
+            trigger = ScheduleUtils.CronTrigger(expression, timezone.utc)
+            start = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+            timestamp = trigger.next_after(start.timestamp())
+            if timestamp is None:
+                return None
+            return datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+
+        cases = [
+            ("*/15 9-17 * * mon-fri", "2024-03-08T17:50:00", "2024-03-11 09:00:00"),
+            ("0 * * * *", "2024-12-31T23:00:00", "2025-01-01 00:00:00"),
+            ("@daily", "2024-01-01T00:00:00", "2024-01-02 00:00:00"),
+            ("0 0 29 2 *", "2024-03-01T00:00:00", "2028-02-29 00:00:00"),
+            ("0 0 31 * *", "2024-04-01T00:00:00", "2024-05-31 00:00:00"),
+            # 日和周都被限制时满足其一即可
+            ("0 12 1 * 1", "2024-04-02T00:00:00", "2024-04-08 12:00:00"),
+            ("0 0 * * 7", "2024-01-01T00:00:00", "2024-01-07 00:00:00"),
+            ("30 */10 * * * *", "2024-01-01T00:00:31", "2024-01-01 00:10:30"),
+            ("0 0 30 2 *", "2024-01-01T00:00:00", None),
+        ]
+        for expression, start, expected in cases:
+            with self.subTest(expression=expression):
+                self.assertEqual(next_after(expression, start), expected)
+
+        for expression in ("* * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *"):
+            with self.assertRaises(ValueError):
+                ScheduleUtils.CronTrigger(expression)
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule_cron("0 0 30 2 *", print)
+
+
+class TestScheduleUtilsJobStore(unittest.TestCase):
+    """
+    定时任务持久化测试类
+    """
+
+    def setUp(self):
+        """
+        测试前设置
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "jobs.db")
+        self.stores = []
+        self.schedulers = []
+        del EXECUTED[:]
+
+    def tearDown(self):
+        """
+        测试后清理
+        """
+        for scheduler in self.schedulers:
+            scheduler.stop()
+        for store in self.stores:
+            store.close()
+        self.temp_dir.cleanup()
+
+    def create_scheduler(self, **options):
+        """
+        创建使用SQLite任务存储的调度器
+        """
+        store = ScheduleUtils.SQLiteJobStore(self.db_path)
+        self.stores.append(store)
+        scheduler = ScheduleUtils(job_store=store, **options)
+        self.schedulers.append(scheduler)
+        return scheduler
+
+    def wait_for(self, condition, timeout=2.0):
+        """
+        等待条件满足
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return condition()
+
+    def test_recover_after_restart(self):
+        """
+        测试重启后恢复错过的一次性任务和周期任务
+        """
+        clock = FakeClock(1700000000)
+        scheduler = self.create_scheduler(clock=clock)
+        scheduler.schedule_once(5, record_execution, "once", job_id="report")
+        scheduler.schedule_cron(
+            "0 * * * *", record_execution, "hourly", tz=timezone.utc, job_id="hourly"
+        )
+        scheduler.schedule_once(7200, record_execution, "later")
+        with self.assertRaises(ValueError):
+            scheduler.schedule_once(5, lambda: None)
+        store = scheduler.job_store
+        self.assertEqual(len(store.get_due_jobs(float("inf"))), 3)
+
+        # 模拟重新部署：新的调度器只通过任务存储获知任务
+        clock.now = 1700003000
+        restarted = self.create_scheduler(clock=clock)
+        restarted.start()
+        self.assertTrue(self.wait_for(lambda: len(EXECUTED) == 2))
+        self.assertEqual(sorted(EXECUTED), ["hourly", "once"])
+        self.assertIsNone(store.get_job("report"))
+        self.assertEqual(store.get_job("hourly")[0], 1700006400)
+        # 两小时后的任务不在同步窗口内，不会被加载
+        self.assertEqual(restarted.get_task_count(), 1)
+
+        restarted.cancel_task("hourly")
+        self.assertIsNone(store.get_job("hourly"))
+
+    def test_lease_prevents_double_firing(self):
+        """
+        测试多个调度器共享任务存储时每次触发只执行一次
+        """
+        first = self.create_scheduler()
+        second = self.create_scheduler()
+        for i in range(20):
+            first.schedule_once(0.2, record_execution, i)
+        first.schedule_at_fixed_rate(0.05, record_execution, "rate", job_id="rate")
+        first.start()
+        second.start()
+
+        self.assertTrue(self.wait_for(lambda: len(EXECUTED) >= 25))
+        time.sleep(0.1)
+        first.cancel_task("rate")
+        time.sleep(0.1)
+        with EXECUTED_LOCK:
+            once = [value for value in EXECUTED if value != "rate"]
+        self.assertEqual(sorted(once), list(range(20)))
+        store = first.job_store
+        self.assertEqual(store.get_due_jobs(float("inf")), [])
+
+    def test_store_lease(self):
+        """
+        测试租约与按下次执行时间查询
+        """
+        store = ScheduleUtils.SQLiteJobStore(self.db_path)
+        self.stores.append(store)
+        store.add_job("b", 200.0, "{}")
+        store.add_job("a", 100.0, "{}")
+        store.add_job("c", 300.0, "{}")
+        self.assertEqual([job[0] for job in store.get_due_jobs(250)], ["a", "b"])
+        self.assertEqual(len(store.get_due_jobs(250, limit=1)), 1)
+        self.assertEqual(store.get_next_run_time(), 100.0)
+
+        self.assertTrue(store.acquire("a", "p1", 100.0, 150.0, 10, now=100))
+        # 计划时间已被推进，重复认领失败
+        self.assertFalse(store.acquire("a", "p2", 100.0, 150.0, 10, now=100))
+        # 租约有效期内其他进程不能认领下一次触发
+        self.assertFalse(store.acquire("a", "p2", 150.0, 200.0, 10, now=105))
+        self.assertTrue(store.acquire("a", "p2", 150.0, 200.0, 10, now=111))
+        store.release("a", "p1", remove=True)
+        self.assertIsNotNone(store.get_job("a"))
+        store.release("a", "p2", remove=True)
+        self.assertIsNone(store.get_job("a"))
+
+        plan = store._db.fetch_all
+        with store._db.checkout():
+            rows = plan(
+                "EXPLAIN QUERY PLAN SELECT id, next_run, state FROM scheduled_jobs "
+                "WHERE next_run <= ? ORDER BY next_run",
+                (250,),
+            )
+        self.assertIn("idx_scheduled_jobs_next_run", str(rows))
+
+    def test_redis_job_store(self):
+        """
+        测试Redis任务存储
+        """
+        try:
+            import fakeredis
+        except ImportError:
+            self.skipTest("fakeredis library not installed")
+
+        client = fakeredis.FakeRedis(decode_responses=True)
+        store = ScheduleUtils.RedisJobStore(client=client, prefix="test:jobs")
+        store.add_job("b", 200.0, "state-b")
+        store.add_job("a", 100.0, "state-a")
+        self.assertEqual(
+            store.get_due_jobs(250), [("a", 100.0, "state-a"), ("b", 200.0, "state-b")]
+        )
+        self.assertEqual(store.get_next_run_time(), 100.0)
+        self.assertTrue(store.acquire("a", "p1", 100.0, 150.0, 10, now=0))
+        self.assertFalse(store.acquire("a", "p2", 150.0, 200.0, 10, now=0))
+        store.release("a", "p1", next_run=160.0)
+        self.assertEqual(store.get_job("a"), (160.0, "state-a"))
+        self.assertTrue(store.acquire("a", "p2", 160.0, None, 10, now=0))
+        store.release("a", "p2", remove=True)
+        self.assertIsNone(store.get_job("a"))
+        store.remove_all_jobs()
+        self.assertEqual(store.get_due_jobs(float("inf")), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+指标工具测试
+"""
+
+import threading
+import unittest
+import urllib.request
+
+from btools.core.system.metricsutils import MetricsUtils
+
+
+class TestMetricsUtils(unittest.TestCase):
+    """
+    指标工具测试类
+    """
+
+    def setUp(self):
+        """
+        测试前设置
+        """
+        self.registry = MetricsUtils.Registry()
+
+    def test_counter_across_threads(self):
+        """
+        测试多线程累加计数器
+        """
+        counter = self.registry.counter("jobs_total", {"queue": "default"})
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.value, 80000)
+        self.assertIs(
+            self.registry.counter("jobs_total", {"queue": "default"}), counter
+        )
+        self.assertIsNot(self.registry.counter("jobs_total", {"queue": "x"}), counter)
+        with self.assertRaises(ValueError):
+            counter.inc(-1)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("jobs_total")
+
+    def test_gauge(self):
+        """
+        测试仪表
+        """
+        gauge = self.registry.gauge("in_flight")
+        gauge.set(5)
+        gauge.inc(2)
+        gauge.dec()
+        self.assertEqual(gauge.value, 6)
+        with gauge.track_inprogress():
+            self.assertEqual(gauge.value, 7)
+        gauge.set_function(lambda: 42)
+        self.assertEqual(gauge.value, 42)
+
+    def test_histogram(self):
+        """
+        测试直方图分桶
+        """
+        histogram = self.registry.histogram("latency_seconds", buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["buckets"], [(0.1, 2), (1.0, 3), (float("inf"), 4)])
+        self.assertEqual(snapshot["count"], 4)
+        self.assertAlmostEqual(snapshot["sum"], 2.65)
+        with self.assertRaises(ValueError):
+            MetricsUtils.Histogram([1, 0.5])
+
+    def test_to_prometheus(self):
+        """
+        测试导出Prometheus文本格式
+        """
+        self.registry.counter("http.requests", {"path": '/a"b'}, "请求总数").inc(3)
+        self.registry.histogram("db_seconds", buckets=[0.5]).observe(0.25)
+        text = self.registry.to_prometheus()
+        self.assertIn("# HELP http_requests 请求总数", text)
+        self.assertIn("# TYPE http_requests counter", text)
+        self.assertIn('http_requests{path="/a\\"b"} 3', text)
+        self.assertIn('db_seconds_bucket{le="0.5"} 1', text)
+        self.assertIn('db_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("db_seconds_sum 0.25", text)
+        self.assertIn("db_seconds_count 1", text)
+
+    def test_timed_and_http_server(self):
+        """
+        测试计时装饰器与抓取接口
+        """
+
+        @MetricsUtils.timed("work_seconds", {"kind": "test"}, registry=self.registry)
+        def work():
+            return "done"
+
+        self.assertEqual(work(), "done")
+        server = MetricsUtils.start_http_server(port=0, registry=self.registry)
+        try:
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                body = response.read().decode("utf-8")
+                self.assertIn("text/plain", response.headers["Content-Type"])
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('work_seconds_count{kind="test"} 1', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+限流工具测试
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from btools.core.basic.decoratorutils import RateLimitError
+from btools.core.system.ratelimitutils import RateLimitUtils
+
+
+class FakeClock:
+    """
+    可手动推进的时钟
+    """
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimitUtils(unittest.TestCase):
+    """
+    限流工具测试类
+    """
+
+    def test_token_bucket(self):
+        """
+        测试令牌桶的突发与补充
+        """
+        clock = FakeClock()
+        bucket = RateLimitUtils.TokenBucket(rate=2, capacity=3, clock=clock)
+        self.assertEqual([bucket.try_acquire() for _ in range(4)], [True] * 3 + [False])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        clock.now += 0.5
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        clock.now += 10
+        self.assertEqual(sum(bucket.try_acquire() for _ in range(5)), 3)
+        with self.assertRaises(ValueError):
+            bucket.try_acquire(tokens=4)
+
+    def test_gcra(self):
+        """
+        测试GCRA的突发与匀速放行
+        """
+        clock = FakeClock()
+        limiter = RateLimitUtils.GCRA(rate=10, burst=2, clock=clock)
+        self.assertTrue(limiter.try_acquire())
+        self.assertTrue(limiter.try_acquire())
+        self.assertAlmostEqual(limiter.reserve(), 0.1)
+        clock.now += 0.1
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+
+    def test_sliding_window_counter(self):
+        """
+        测试滑动窗口计数器按上一个窗口的剩余比例估算
+        """
+        clock = FakeClock()
+        limiter = RateLimitUtils.SlidingWindowCounter(limit=10, window=1, clock=clock)
+        self.assertEqual(sum(limiter.try_acquire() for _ in range(12)), 10)
+
+        # 进入下一个窗口的一半：上一个窗口按50%计入，还可以通过5个
+        clock.now += 1.5
+        self.assertEqual(sum(limiter.try_acquire() for _ in range(10)), 5)
+        self.assertAlmostEqual(limiter.reserve(), 0.1)
+        clock.now += 0.1
+        self.assertTrue(limiter.try_acquire())
+
+        # 超过两个窗口后计数清零
+        clock.now += 5
+        self.assertEqual(sum(limiter.try_acquire() for _ in range(12)), 10)
+
+    def test_keyed_limits(self):
+        """
+        测试按键分别限流与淘汰
+        """
+        clock = FakeClock()
+        limiter = RateLimitUtils.TokenBucket(
+            rate=1, capacity=1, max_keys=2, clock=clock
+        )
+        self.assertTrue(limiter.try_acquire("a"))
+        self.assertTrue(limiter.try_acquire("b"))
+        self.assertFalse(limiter.try_acquire("a"))
+        limiter.try_acquire("c")
+        self.assertEqual(len(limiter), 2)
+        with self.assertRaises(RateLimitError) as context:
+            limiter.check("a")
+        self.assertAlmostEqual(context.exception.retry_after, 1.0)
+
+        # 最久未使用的键被淘汰，再次出现时从空闲状态重新开始
+        self.assertTrue(limiter.try_acquire("b"))
+
+    def test_blocking_acquire_across_threads(self):
+        """
+        测试多线程阻塞获取许可时总速率受限
+        """
+        limiter = RateLimitUtils.GCRA(rate=100, burst=1)
+        acquired = []
+
+        def worker():
+            for _ in range(10):
+                limiter.acquire()
+                acquired.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(acquired), 40)
+        self.assertGreaterEqual(max(acquired) - start, 0.38)
+        self.assertFalse(limiter.acquire(timeout=0))
+
+    def test_acquire_async(self):
+        """
+        测试异步获取许可
+        """
+        limiter = RateLimitUtils.TokenBucket(rate=50, capacity=1)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(6):
+                self.assertTrue(await limiter.acquire_async())
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+    def test_limit_decorator(self):
+        """
+        测试限流装饰器
+        """
+        limiter = RateLimitUtils.create("sliding_window", limit=2, window=60)
+
+        @RateLimitUtils.limit(limiter, key=lambda user: user)
+        def handle(user):
+            return user
+
+        self.assertEqual(handle("alice"), "alice")
+        self.assertEqual(handle("alice"), "alice")
+        self.assertEqual(handle("bob"), "bob")
+        with self.assertRaises(RateLimitError):
+            handle("alice")
+
+        waiting = RateLimitUtils.GCRA(rate=20)
+
+        @RateLimitUtils.limit(waiting, block=True, timeout=1)
+        async def fetch():
+            return "ok"
+
+        async def run():
+            return [await fetch() for _ in range(3)]
+
+        self.assertEqual(asyncio.run(run()), ["ok"] * 3)
+        with self.assertRaises(ValueError):
+            RateLimitUtils.create("leaky")
+
+
+if __name__ == "__main__":
+    unittest.main()
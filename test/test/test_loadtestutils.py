@@ -1,10 +1,27 @@
 """测试LoadTestUtils类"""
 
+import asyncio
+import json
+import random
+import threading
 import time
 import unittest
 
 from btools.core.test.loadtestutils import LoadTestUtils
 
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+
+def cpu_task(n):
+    """受GIL限制的测试函数，需定义在模块级别以便在工作进程中导入"""
+    if n < 0:
+        raise ValueError("negative")
+    return sum(range(n))
+
 
 class TestLoadTestUtils(unittest.TestCase):
     """测试LoadTestUtils类"""
@@ -23,6 +40,353 @@ class TestLoadTestUtils(unittest.TestCase):
         self.assertIsInstance(results, dict)
         self.assertIn("total_requests", results)
 
+    def test_load_test_ramp_up(self):
+        """测试启动时间内线程错开启动"""
+        started = []
+
+        def test_func():
+            started.append(time.perf_counter())
+            time.sleep(0.01)
+
+        begin = time.perf_counter()
+        LoadTestUtils.run_load_test(
+            func=test_func, concurrent_users=4, duration=1, ramp_up=0.8
+        )
+        first_calls = (
+            sorted(started)[:1] + [t for t in sorted(started) if t - begin > 0.55][:1]
+        )
+        self.assertLess(first_calls[0] - begin, 0.1)
+        self.assertEqual(len(first_calls), 2)
+
+    def test_rate_profile(self):
+        """测试到达速率曲线"""
+        profile = LoadTestUtils.RateProfile.constant(rate=100, duration=2, ramp_up=1)
+        self.assertAlmostEqual(profile.expected_requests(), 150)
+        self.assertAlmostEqual(profile.rate_at(0.5), 50)
+
+        arrivals = []
+        offset = profile.next_arrival(0.0)
+        while offset is not None:
+            arrivals.append(offset)
+            offset = profile.next_arrival(offset)
+        self.assertEqual(len(arrivals), 150)
+        self.assertEqual(len([t for t in arrivals if t < 1 + 1e-9]), 50)
+
+        stages = LoadTestUtils.RateProfile.from_stages(
+            [{"duration": 1, "target": 10}, {"duration": 1, "target": 0}]
+        )
+        self.assertAlmostEqual(stages.expected_requests(), 10)
+        self.assertAlmostEqual(stages.rate_at(1.5), 5)
+
+    def test_async_open_loop(self):
+        """测试开环模式按速率发起请求，不受响应时间影响"""
+
+        async def test_func():
+            await asyncio.sleep(0.2)
+            return True
+
+        results = LoadTestUtils.run_async_load_test(test_func, duration=1, rate=200)
+        self.assertEqual(results["mode"], "open")
+        self.assertEqual(results["total_requests"], 200)
+        self.assertEqual(results["success_requests"], 200)
+        # 闭环模式下单个用户只能发起5个请求，开环模式下会同时有约40个请求进行中
+        self.assertGreater(results["peak_in_flight"], 20)
+        self.assertLess(results["actual_duration"], 1.5)
+
+    def test_async_open_loop_coordinated_omission(self):
+        """测试响应时间从计划发起时间开始计算"""
+
+        async def test_func():
+            await asyncio.sleep(0.05)
+
+        results = LoadTestUtils.run_async_load_test(
+            test_func, duration=0.5, rate=100, max_in_flight=1
+        )
+        # 服务每秒只能处理20个请求，排队时间计入响应时间
+        self.assertGreater(results["max_response_time"], 1.0)
+        self.assertGreater(results["percentiles"]["p50"], 0.5)
+
+    def test_async_closed_loop(self):
+        """测试闭环模式的虚拟用户"""
+        errors = []
+
+        def test_func(fail):
+            if fail and not errors:
+                errors.append(1)
+                raise ValueError("boom")
+            time.sleep(0.01)
+
+        results = LoadTestUtils.run_async_load_test(
+            test_func, 0.3, None, 2, 0, None, 10000, True
+        )
+        self.assertEqual(results["mode"], "closed")
+        self.assertEqual(results["error_requests"], 1)
+        self.assertEqual(results["errors"], ["boom"])
+        self.assertGreater(results["success_requests"], 10)
+
+    def test_async_requires_rate_or_concurrency(self):
+        """测试未指定速率和并发数时报错"""
+
+        async def test_func():
+            return None
+
+        with self.assertRaises(ValueError):
+            LoadTestUtils.run_async_load_test(test_func, duration=1)
+
+    def test_latency_histogram(self):
+        """测试直方图百分位精度与合并"""
+        rng = random.Random(1)
+        samples = [rng.lognormvariate(-4, 1) for _ in range(20000)]
+        first = LoadTestUtils.LatencyHistogram()
+        second = LoadTestUtils.LatencyHistogram()
+        for i, value in enumerate(samples):
+            (first if i % 2 else second).record(value)
+        merged = first.merge(second)
+
+        ordered = sorted(samples)
+        approx = LoadTestUtils.calculate_percentiles(merged, [50, 99, 99.9])
+        for p in (50, 99, 99.9):
+            value = ordered[int(len(ordered) * p / 100 + 0.5) - 1]
+            self.assertAlmostEqual(approx[f"p{p}"], value, delta=value * 0.002 + 2e-6)
+        self.assertEqual(merged.total, 20000)
+        self.assertEqual(merged.max, max(samples))
+        self.assertEqual(merged.percentile(100), max(samples))
+        self.assertAlmostEqual(merged.mean(), sum(samples) / len(samples))
+        # 内存占用只与桶数量有关
+        self.assertLess(len(merged.counts), 6000)
+
+        restored = LoadTestUtils.LatencyHistogram.from_dict(
+            json.loads(json.dumps(merged.to_dict()))
+        )
+        self.assertEqual(restored.percentiles([50, 99]), merged.percentiles([50, 99]))
+
+        with self.assertRaises(ValueError):
+            merged.merge(LoadTestUtils.LatencyHistogram(significant_figures=2))
+
+    def test_metrics_without_results(self):
+        """测试关闭结果保留后的统计"""
+
+        def test_func(fail):
+            if fail():
+                raise KeyError("missing")
+            return "ok"
+
+        flags = iter([True, False] * 50)
+        results = LoadTestUtils.concurrent_execution(
+            test_func, 4, 25, lambda: next(flags), keep_results=False
+        )
+        self.assertEqual(results["total_requests"], 100)
+        self.assertEqual(results["success_requests"], 50)
+        self.assertEqual(results["error_types"], {"KeyError": 50})
+        self.assertEqual(results["error_samples"], {"KeyError": "'missing'"})
+        self.assertEqual(results["results"], [])
+        self.assertEqual(results["execution_times"], [])
+        self.assertEqual(results["histogram"].total, 100)
+        self.assertEqual(sum(p["requests"] for p in results["time_series"]), 100)
+        self.assertIn("p99", results["percentiles"])
+
+    def test_time_series(self):
+        """测试按秒的时间序列"""
+
+        async def test_func():
+            return None
+
+        results = LoadTestUtils.run_async_load_test(test_func, duration=2, rate=50)
+        series = results["time_series"]
+        self.assertEqual([p["second"] for p in series], [0, 1, 2][: len(series)])
+        self.assertEqual(sum(p["requests"] for p in series), 100)
+        self.assertEqual(sum(p["errors"] for p in series), 0)
+
+    def test_distributed_local_processes(self):
+        """测试本机多进程分布式负载测试"""
+        progress = []
+        results = LoadTestUtils.distributed_load_test(
+            cpu_task, 2, 2, 3.2, 20000, on_metrics=progress.append
+        )
+        self.assertEqual(len(results["worker_results"]), 2)
+        self.assertEqual(len({r["pid"] for r in results["worker_results"]}), 2)
+        self.assertEqual(
+            results["total_requests"],
+            sum(r["total_requests"] for r in results["worker_results"]),
+        )
+        self.assertEqual(results["histogram"].total, results["total_requests"])
+        self.assertEqual(results["total_errors"], 0)
+        self.assertEqual(results["results"], [])
+        # 运行期间收到了按秒上报的统计
+        self.assertTrue(progress)
+        self.assertGreater(progress[0]["requests"], 0)
+        self.assertLessEqual(
+            sum(p["requests"] for p in progress), results["total_requests"]
+        )
+        self.assertFalse(results["aborted"])
+
+    def test_distributed_with_agent(self):
+        """测试通过TCP连接远端工作节点"""
+        agent = LoadTestUtils.WorkerAgent("127.0.0.1", 0, authkey=b"secret")
+        thread = threading.Thread(target=agent.serve_forever, args=(1,), daemon=True)
+        thread.start()
+        try:
+            host, port = agent.address
+            results = LoadTestUtils.distributed_load_test(
+                cpu_task,
+                [f"{host}:{port}", "local"],
+                1,
+                1,
+                -1,
+                authkey=b"secret",
+                keep_results=True,
+            )
+        finally:
+            thread.join(timeout=5)
+            agent.close()
+        self.assertEqual(results["workers"], [f"{host}:{port}", "local"])
+        self.assertEqual(results["total_success"], 0)
+        self.assertEqual(
+            results["error_types"], {"ValueError": results["total_errors"]}
+        )
+        self.assertEqual(len(results["errors"]), results["total_errors"])
+        self.assertEqual(
+            results["worker_results"][0]["error_samples"], {"ValueError": "negative"}
+        )
+
+    def test_distributed_requires_authkey(self):
+        """测试远端节点必须显式指定认证密钥"""
+        with self.assertRaises(TypeError):
+            LoadTestUtils.WorkerAgent("127.0.0.1", 0)
+        with self.assertRaises(ValueError):
+            LoadTestUtils.WorkerAgent("127.0.0.1", 0, authkey=b"")
+        with self.assertRaises(ValueError):
+            LoadTestUtils.distributed_load_test(cpu_task, ["127.0.0.1:9500"], 1, 1, 1)
+
+        agent = LoadTestUtils.WorkerAgent(port=0, authkey=b"secret")
+        try:
+            self.assertEqual(agent.address[0], "127.0.0.1")
+        finally:
+            agent.close()
+
+    def test_distributed_slo_abort(self):
+        """测试分布式测试在错误率超出阈值时提前结束"""
+        started = time.perf_counter()
+        results = LoadTestUtils.distributed_load_test(
+            cpu_task, 1, 1, 30, -1, thresholds={"max_error_rate": 1.0}
+        )
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertTrue(results["aborted"])
+        self.assertIn("Error rate", results["abort_reason"])
+
+    def test_live_metrics(self):
+        """测试运行期间的实时指标回调"""
+        snapshots = []
+
+        def test_func():
+            time.sleep(0.01)
+
+        results = LoadTestUtils.load_test(
+            test_func, 2, 2.5, on_metrics=snapshots.append, keep_results=False
+        )
+        self.assertGreaterEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[0]["start_second"], 0)
+        self.assertEqual(snapshots[1]["start_second"], snapshots[0]["end_second"])
+        for key in ("requests_per_second", "error_rate", "p50", "p95", "p99"):
+            self.assertIn(key, snapshots[0])
+        self.assertGreater(snapshots[0]["requests_per_second"], 50)
+        self.assertEqual(results["live_metrics"], snapshots)
+        self.assertFalse(results["aborted"])
+
+    def test_slo_abort(self):
+        """测试实时百分位超出阈值时提前结束"""
+
+        def test_func():
+            time.sleep(0.05)
+
+        results = LoadTestUtils.load_test(test_func, 2, 30, thresholds={"p95": 0.01})
+        self.assertTrue(results["aborted"])
+        self.assertIn("p95", results["abort_reason"])
+        self.assertLess(results["actual_duration"], 5)
+        self.assertTrue(results["live_metrics"][-1]["breaches"])
+
+    def test_slo_abort_after_warmup(self):
+        """测试预热期间不检查阈值"""
+
+        def test_func():
+            time.sleep(0.05)
+
+        results = LoadTestUtils.load_test(
+            test_func, 2, 30, thresholds={"p95": 0.01}, warmup=2
+        )
+        self.assertTrue(results["aborted"])
+        self.assertEqual(
+            [bool(m["breaches"]) for m in results["live_metrics"]], [False, False, True]
+        )
+
+    def test_async_slo_abort(self):
+        """测试开环模式在错误率超出阈值时停止发起请求"""
+
+        async def test_func():
+            raise ConnectionError("refused")
+
+        results = LoadTestUtils.run_async_load_test(
+            test_func,
+            duration=30,
+            rate=100,
+            thresholds={"max_error_rate": 10},
+            abort_after=2,
+        )
+        self.assertTrue(results["aborted"])
+        self.assertEqual(len(results["live_metrics"]), 2)
+        self.assertLess(results["total_requests"], 500)
+        self.assertEqual(
+            results["error_types"], {"ConnectionError": results["total_requests"]}
+        )
+
+    def test_find_saturation_point(self):
+        """测试阶梯负载测试自动找出饱和点"""
+        capacity = threading.Semaphore(2)
+        steps = []
+
+        def test_func():
+            with capacity:
+                time.sleep(0.02)
+
+        result = LoadTestUtils.find_saturation_point(
+            test_func, 1, 6, 1, 1, on_step=steps.append
+        )
+        self.assertTrue(result["saturated"])
+        self.assertEqual(result["saturation_concurrency"], 3)
+        # 3个并发时吞吐量提升不足5%，可能略高于2个并发
+        self.assertIn(result["max_throughput_concurrency"], (2, 3))
+        self.assertIn("did not increase", result["reason"])
+        self.assertEqual([s["concurrency"] for s in steps], [1, 2, 3])
+
+    def test_check_thresholds_percentiles(self):
+        """测试按百分位和错误率检查阈值"""
+        results = {
+            "total_requests": 100,
+            "success_requests": 90,
+            "execution_times": [0.01] * 98 + [1.0] * 2,
+        }
+        check_result = LoadTestUtils.check_thresholds(
+            results, {"p95": 0.5, "p99": 0.5, "max_error_rate": 5}
+        )
+        self.assertFalse(check_result["passed"])
+        self.assertEqual(len(check_result["issues"]), 2)
+        self.assertTrue(check_result["issues"][0].startswith("p99"))
+        with self.assertWarns(UserWarning):
+            check_result = LoadTestUtils.check_thresholds(results, {"p99_latency": 1})
+        self.assertTrue(check_result["passed"])
+
+    def test_check_thresholds_no_data(self):
+        """测试没有请求时不按错误率判定失败"""
+        results = {"total_requests": 0, "success_requests": 0, "requests_per_second": 0}
+        check_result = LoadTestUtils.check_thresholds(
+            results, {"max_error_rate": 1, "min_success_rate": 99, "p99": 0.5}
+        )
+        self.assertTrue(check_result["passed"])
+        self.assertTrue(check_result["no_data"])
+
+        check_result = LoadTestUtils.check_thresholds(results, {"min_rps": 10})
+        self.assertFalse(check_result["passed"])
+
     def test_check_thresholds(self):
         """测试检查阈值"""
         results = {"success_rate": 95.0, "average_response_time": 1.5}
@@ -31,5 +395,41 @@ class TestLoadTestUtils(unittest.TestCase):
         self.assertTrue(check_result["passed"])
 
 
+@unittest.skipIf(
+    web is None, "aiohttp library not installed, skipping async load tests"
+)
+class TestAsyncApiLoad(unittest.IsolatedAsyncioTestCase):
+    """测试基于aiohttp的API负载"""
+
+    async def asyncSetUp(self):
+        """启动本地回显服务器"""
+
+        async def echo(request):
+            return web.json_response(await request.json())
+
+        app = web.Application()
+        app.router.add_post("/echo", echo)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        """关闭本地回显服务器"""
+        await self.server.close()
+
+    async def test_simulate_async_api_load(self):
+        """测试按固定速率压测回显服务器"""
+        results = await LoadTestUtils.simulate_async_api_load(
+            str(self.server.make_url("/echo")),
+            duration=1,
+            rate=300,
+            ramp_up=0.5,
+            method="POST",
+            data={"k": "v"},
+        )
+        self.assertEqual(results["error_requests"], 0)
+        self.assertEqual(results["total_requests"], 225)
+        self.assertEqual(set(results["results"]), {200})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,10 @@
 """测试PerformanceTestUtils类"""
 
+import os
+import tempfile
+import threading
 import time
+import tracemalloc
 import unittest
 
 from btools.core.test.performancetestutils import PerformanceTestUtils
@@ -45,6 +49,214 @@ class TestPerformanceTestUtils(unittest.TestCase):
         self.assertIn("Func1", results)
         self.assertIn("Func2", results)
 
+    def test_run_benchmark(self):
+        """测试自动校准的微基准测试"""
+        result = PerformanceTestUtils.run_benchmark(
+            sum, range(100), samples=15, min_time=0.002
+        )
+        self.assertEqual(result["name"], "sum")
+        self.assertGreater(result["loops"], 1)
+        self.assertEqual(len(result["times"]), 15)
+        self.assertLessEqual(result["q1"], result["median"])
+        self.assertLessEqual(result["median"], result["q3"])
+        self.assertLessEqual(result["ci_low"], result["median"])
+        self.assertGreaterEqual(result["ci_high"], result["median"])
+        self.assertGreater(result["ops_per_second"], 0)
+        self.assertNotIn("results", result)
+
+    def test_summarize_times_outliers(self):
+        """测试离群值检测"""
+        stats = PerformanceTestUtils.summarize_times([1.0, 1.1, 0.9, 1.0] * 5 + [2.0])
+        self.assertEqual(stats["median"], 1.0)
+        self.assertEqual(stats["outliers"], 1)
+        self.assertEqual(stats["severe_outliers"], 1)
+        self.assertEqual(stats["max"], 2.0)
+
+    def test_mann_whitney_u(self):
+        """测试显著性检验"""
+        a = [1.0 + i * 0.01 for i in range(20)]
+        self.assertLess(
+            PerformanceTestUtils.mann_whitney_u(a, [x + 1 for x in a]), 0.001
+        )
+        self.assertGreater(PerformanceTestUtils.mann_whitney_u(a, list(a)), 0.9)
+
+    def test_compare_functions(self):
+        """测试函数A/B比较与跨运行的回归检测"""
+
+        def fast():
+            return sum(range(50))
+
+        def slow():
+            return sum(range(2000))
+
+        result = PerformanceTestUtils.compare_functions(
+            {"fast": fast, "slow": slow}, samples=10
+        )
+        self.assertEqual(result["fastest"], "fast")
+        self.assertEqual(result["baseline"], "fast")
+        comparison = result["comparisons"]["slow"]["comparison"]
+        self.assertTrue(comparison["significant"])
+        self.assertTrue(comparison["regression"])
+        self.assertGreater(comparison["change"], 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench", "baseline.json")
+            PerformanceTestUtils.compare_functions({"work": fast}, save_path=path)
+            stored = PerformanceTestUtils.load_benchmark_results(path)
+            self.assertIn("work", stored)
+
+            # 同名函数变慢后与之前保存的结果比较
+            result = PerformanceTestUtils.compare_functions(
+                {"work": slow}, baseline_file=path
+            )
+        self.assertEqual(result["regressions"], ["work"])
+
+    def test_benchmark_suite(self):
+        """测试基准测试套件与基准结果比较"""
+        suite = PerformanceTestUtils.BenchmarkSuite(samples=8, min_time=0.002, warmup=1)
+        suite.add("math.sum", sum, range(50))
+
+        @suite.benchmark()
+        def text_join():
+            return ",".join(["a"] * 20)
+
+        self.assertEqual(list(suite.run("text*")), ["text_join"])
+        with self.assertRaises(ValueError):
+            suite.add("math.sum", sum, range(10))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "baseline.json")
+            self.assertEqual(suite.main(["--baseline", path, "--save-baseline"]), 0)
+
+            # 同名基准测试变慢后应判定为回归
+            slower = PerformanceTestUtils.BenchmarkSuite(samples=8, min_time=0.002)
+            slower.add("math.sum", sum, range(5000))
+            slower.add("new_case", sum, range(10))
+            report = slower.check(path)
+            self.assertFalse(report["passed"])
+            self.assertEqual(report["regressions"], ["math.sum"])
+            self.assertEqual(report["missing"], ["new_case"])
+            self.assertEqual(slower.main(["--baseline", path, "-k", "math.*"]), 1)
+
+            # 指定的基准结果文件不存在时不能静默通过
+            missing = os.path.join(temp_dir, "missing.json")
+            self.assertEqual(suite.main(["--baseline", missing]), 1)
+
+    def test_compare_benchmark_runs(self):
+        """测试合并多进程结果并按进程间噪声判断回归"""
+
+        def make_run(median):
+            times = [median * 0.99, median, median, median, median * 1.01]
+            result = {"loops": 10, "warmup": 1, "gc_disabled": True, "times": times}
+            result.update(PerformanceTestUtils.summarize_times(times))
+            return {"work": result}
+
+        baseline = PerformanceTestUtils.merge_benchmark_runs(
+            [make_run(m) for m in (1.0, 1.3, 1.0, 0.9, 1.1)]
+        )["work"]
+        self.assertEqual(baseline["median"], 1.0)
+        self.assertEqual(len(baseline["run_medians"]), 5)
+        self.assertEqual(baseline["samples"], 25)
+
+        # 变化小于进程间噪声时不判定为回归
+        noisy = PerformanceTestUtils.merge_benchmark_runs(
+            [make_run(m) for m in (1.2, 1.3, 1.1, 1.25, 1.2)]
+        )["work"]
+        comparison = PerformanceTestUtils.compare_benchmarks(baseline, noisy)
+        self.assertAlmostEqual(comparison["noise"], 0.4)
+        self.assertFalse(comparison["regression"])
+
+        slower = PerformanceTestUtils.merge_benchmark_runs(
+            [make_run(m) for m in (2.0, 2.1, 1.9, 2.0, 2.2)]
+        )["work"]
+        comparison = PerformanceTestUtils.compare_benchmarks(baseline, slower)
+        self.assertTrue(comparison["regression"])
+
+    def test_memory_leak_test(self):
+        """测试基于tracemalloc的内存泄漏检测"""
+        leaked = []
+
+        class Leaked:
+            pass
+
+        def leaky():
+            leaked.append((Leaked(), bytearray(2048)))
+
+        def clean():
+            return [bytearray(2048) for _ in range(10)]
+
+        result = PerformanceTestUtils.memory_leak_test(leaky, 20, warmup=2)
+        self.assertTrue(result["is_leaking"])
+        self.assertGreater(result["bytes_per_iteration"], 2048)
+        self.assertEqual(len(result["memory_usages"]), 21)
+        self.assertEqual(
+            [v for k, v in result["object_growth"].items() if k.endswith("Leaked")],
+            [20],
+        )
+        self.assertIn(__file__, result["top_allocations"][0]["location"])
+
+        result = PerformanceTestUtils.memory_leak_test(clean, 20)
+        self.assertFalse(result["is_leaking"])
+        self.assertLess(abs(result["bytes_per_iteration"]), 64)
+
+        with self.assertRaises(ValueError):
+            PerformanceTestUtils.memory_leak_test(clean, 5, mode="heap")
+
+    def test_profile_allocations(self):
+        """测试分配分析报告峰值内存和分配位置"""
+
+        def build():
+            temp = [bytearray(1000) for _ in range(100)]
+            del temp
+            return bytearray(5000)
+
+        result = PerformanceTestUtils.profile_allocations(build, iterations=3)
+        self.assertEqual(len(result["peak_per_call"]), 3)
+        self.assertGreater(result["peak_memory"], 100000)
+        self.assertGreaterEqual(result["memory_retained"], 0)
+        self.assertEqual(len(result["result"]), 5000)
+        self.assertTrue(result["top_allocations"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+        usage = PerformanceTestUtils.measure_memory_usage(build)
+        self.assertGreater(usage["peak_memory"], 0.09)
+
+    def test_sampling_profiler(self):
+        """测试采样分析器的时间窗口与导出格式"""
+
+        def spin(seconds):
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                pass
+
+        worker = threading.Thread(target=spin, args=(0.3,), name="spinner")
+        worker.start()
+        profiler = PerformanceTestUtils.SamplingProfiler(interval=0.002)
+        profiler.start(duration=0.1)
+        self.assertTrue(profiler.wait(2))
+        worker.join()
+
+        self.assertGreater(profiler.samples, 10)
+        self.assertTrue(any("spin" in stack for stack in profiler.stacks()))
+        self.assertTrue(
+            any(s.startswith("spinner;") for s in profiler.stacks(by_thread=True))
+        )
+        self.assertTrue(profiler.top(5)[0]["function"].startswith("spin "))
+
+        speedscope = profiler.to_speedscope()
+        names = [frame["name"] for frame in speedscope["shared"]["frames"]]
+        self.assertIn("spin", names)
+        self.assertIn("spinner", [p["name"] for p in speedscope["profiles"]])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collapsed = profiler.save(os.path.join(temp_dir, "out.collapsed"))
+            with open(collapsed, encoding="utf-8") as f:
+                line = f.readline().rstrip()
+            self.assertTrue(line.rsplit(" ", 1)[1].isdigit())
+
+        result = PerformanceTestUtils.profile_function(spin, 0.05, sampling=True)
+        self.assertIn("spin", result["profile_output"])
+        self.assertGreater(result["samples"], 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+包级别延迟导入测试
+"""
+
+import subprocess
+import sys
+import types
+import unittest
+
+import btools
+import btools.core
+from btools._lazy import attach
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    延迟导入测试类
+    """
+
+    def test_import_btools_loads_no_submodules(self):
+        """
+        测试 import btools 不加载任何工具模块和第三方依赖
+        """
+        code = (
+            "import sys, btools\n"
+            "print(','.join(sorted(m for m in sys.modules if m.startswith('btools'))))\n"
+            "print(','.join(sorted(m for m in ('requests', 'PIL', 'paramiko', "
+            "'fastapi', 'selenium', 'psutil', 'pyzbar') if m in sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        loaded, heavy = result.stdout.split("\n")[:2]
+        self.assertEqual(loaded, "btools,btools._lazy")
+        self.assertEqual(heavy, "")
+
+    def test_public_names(self):
+        """
+        测试公开名称与原先一致且首次访问后写回命名空间
+        """
+        self.assertEqual(set(btools.__all__), set(btools.core.__all__))
+        self.assertTrue(set(btools.core.__all__) <= set(btools.core._EXPORTS))
+        self.assertTrue(set(btools.__all__) <= set(dir(btools)))
+
+        from btools import StringUtils
+        from btools.core.basic.stringutils import StringUtils as Original
+
+        self.assertIs(StringUtils, Original)
+        self.assertIs(btools.core.basic.StringUtils, Original)
+        self.assertIs(vars(btools)["StringUtils"], Original)
+
+        with self.assertRaises(AttributeError):
+            btools.NoSuchUtils
+        with self.assertRaises(ImportError):
+            from btools import NoSuchUtils  # noqa: F401
+
+    def test_attach(self):
+        """
+        测试可选导出在依赖缺失时返回None
+        """
+        module = types.ModuleType("btools_lazy_fake")
+        module.__getattr__, module.__dir__ = attach(
+            module.__name__,
+            {"dumps": "json", "Missing": "btools_no_such_module"},
+            optional=["Missing"],
+        )
+        sys.modules[module.__name__] = module
+        try:
+            import json
+
+            self.assertIs(module.dumps, json.dumps)
+            self.assertIsNone(module.Missing)
+            self.assertIn("Missing", dir(module))
+        finally:
+            del sys.modules[module.__name__]
+
+
+if __name__ == "__main__":
+    unittest.main()